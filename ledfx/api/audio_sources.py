@@ -0,0 +1,102 @@
+import logging
+
+import voluptuous as vol
+from aiohttp import web
+
+from ledfx.api import RestEndpoint
+from ledfx.config import save_config
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AudioSourcesEndpoint(RestEndpoint):
+    """REST end-point for named audio sources that virtuals can bind to"""
+
+    ENDPOINT_PATH = "/api/audio/sources"
+
+    async def get(self) -> web.Response:
+        """
+        Get the configured audio sources and their state
+
+        Returns:
+            web.Response: The response containing every audio source by name.
+        """
+        return await self.bare_request_success(
+            {"sources": self._ledfx.audio_sources.get_stats()}
+        )
+
+    async def put(self, body) -> web.Response:
+        """
+        Create or update a named audio source.
+
+        Args:
+            body (dict): {"name": str, "config": dict} where config takes the
+                same keys as the core "audio" config
+
+        Returns:
+            web.Response: The HTTP response object.
+        """
+        if not isinstance(body, dict):
+            return await self.json_decode_error()
+
+        name = body.get("name")
+        if not name:
+            return await self.invalid_request(
+                "Required attribute 'name' was not provided"
+            )
+
+        try:
+            self._ledfx.audio_sources.update_source(
+                name, body.get("config", {})
+            )
+        except (ValueError, vol.Invalid) as e:
+            error_message = f"Error updating audio source {name}: {e}"
+            _LOGGER.warning(error_message)
+            return await self.invalid_request(error_message)
+
+        save_config(
+            config=self._ledfx.config,
+            config_dir=self._ledfx.config_dir,
+        )
+        return await self.request_success(
+            "success", f"Audio source {name} updated"
+        )
+
+    async def post(self, body) -> web.Response:
+        """
+        Create a named audio source, or update it if it exists.
+
+        Args:
+            body (dict): {"name": str, "config": dict}, see put
+
+        Returns:
+            web.Response: The HTTP response object.
+        """
+        return await self.put(body)
+
+    async def delete(self, body) -> web.Response:
+        """
+        Remove a named audio source. Virtuals bound to it fall back to the
+        default audio source.
+
+        Args:
+            body (dict): {"name": str}
+
+        Returns:
+            web.Response: The HTTP response object.
+        """
+        name = body.get("name") if isinstance(body, dict) else None
+        try:
+            self._ledfx.audio_sources.remove_source(name)
+        except KeyError:
+            return await self.invalid_request(
+                f"Audio source {name} does not exist"
+            )
+
+        save_config(
+            config=self._ledfx.config,
+            config_dir=self._ledfx.config_dir,
+        )
+        return await self.request_success(
+            "success", f"Audio source {name} removed"
+        )
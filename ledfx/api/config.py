@@ -287,6 +287,10 @@ class ConfigEndpoint(RestEndpoint):
             self._ledfx.audio.melbanks.update_config(
                 self._ledfx.config["melbanks"]
             )
+        audio_sources = getattr(self._ledfx, "audio_sources", None)
+        if audio_sources is not None and melbanks_config:
+            # named sources have their own melbanks
+            audio_sources.update_melbanks(self._ledfx.config["melbanks"])
 
         self._ledfx.events.fire_event(BaseConfigUpdateEvent(config))
 
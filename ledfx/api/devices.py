@@ -29,6 +29,7 @@ class DevicesEndpoint(RestEndpoint):
                 "online": device.online,
                 "virtuals": device.virtuals,
                 "active_virtuals": device.active_virtuals,
+                "stats": device.stats,
             }
         return await self.bare_request_success(response)
 
@@ -1,10 +1,10 @@
 import logging
 from json import JSONDecodeError
 
-import requests
 from aiohttp import web
 
 from ledfx.api import RestEndpoint
+from ledfx.libraries.http_client import DeviceHttpError, device_http
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,8 +49,8 @@ class GetNanoleadTokenEndpoint(RestEndpoint):
         _LOGGER.info("Getting Nanoleaf token from %s:%s", ip, port)
 
         try:
-            response = requests.post(
-                f"http://{ip}:{port}/api/v1/new", timeout=(3, 3)
+            response = await device_http.request(
+                "POST", f"http://{ip}:{port}/api/v1/new", timeout=6
             )
             # TODO: See if we can just check the response is None - no nanoleaf to test with
             if response.text == "":
@@ -60,7 +60,7 @@ class GetNanoleadTokenEndpoint(RestEndpoint):
                 _LOGGER.warning(error_message)
                 return await self.internal_error(error_message, "error")
             data = response.json()
-        except requests.exceptions.RequestException as msg:
+        except DeviceHttpError as msg:
             error_message = (
                 f"Error getting Nanoleaf token from {ip}:{port}: {msg}"
             )
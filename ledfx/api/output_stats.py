@@ -0,0 +1,36 @@
+import logging
+
+from aiohttp import web
+
+from ledfx.api import RestEndpoint
+from ledfx.devices.utils.socket_singleton import udp_sender
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class OutputStatsEndpoint(RestEndpoint):
+    """REST end-point for the output statistics of devices and virtuals"""
+
+    ENDPOINT_PATH = "/api/stats/output"
+
+    async def get(self) -> web.Response:
+        """
+        Get the output statistics: the shared UDP sender, each device's
+        output worker and encoder, and each virtual's synchronised output
+        and oneshots
+
+        Returns:
+            web.Response: The response containing the statistics.
+        """
+        response = {
+            "udp": udp_sender.get_stats(),
+            "devices": {
+                device.id: device.stats
+                for device in self._ledfx.devices.values()
+            },
+            "virtuals": {
+                virtual.id: virtual.stats
+                for virtual in self._ledfx.virtuals.values()
+            },
+        }
+        return await self.bare_request_success(response)
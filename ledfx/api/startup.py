@@ -0,0 +1,24 @@
+import logging
+
+from aiohttp import web
+
+from ledfx.api import RestEndpoint
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StartupEndpoint(RestEndpoint):
+    ENDPOINT_PATH = "/api/startup"
+
+    async def get(self) -> web.Response:
+        """
+        Retrieves the startup timeline: when each step and device began
+        and how long it took, in milliseconds from the start.
+
+        Returns:
+            web.Response: The response containing the timeline.
+        """
+        timeline = getattr(self._ledfx, "startup_timeline", None)
+        if timeline is None:
+            return await self.invalid_request("LedFx has not started yet")
+        return await self.bare_request_success(timeline.get_timeline())
@@ -22,6 +22,7 @@ def make_virtual_response(virtual):
         "active": virtual.active,
         "streaming": virtual.streaming,
         "last_effect": virtual.virtual_cfg.get("last_effect", None),
+        "stats": virtual.stats,
         "effect": {},
     }
     # Protect from DummyEffect
@@ -184,7 +184,12 @@ class EffectsEndpoint(RestEndpoint):
                     virtual.set_effect(effect, fallback=fallback)
                 else:
                     effect = virtual.active_effect
-                    virtual.active_effect.update_config(effect_config)
+                    try:
+                        effect.queue_config_update(effect_config)
+                    except vol.Invalid as err:
+                        return await self.invalid_request(
+                            f"Invalid effect config: {err}"
+                        )
 
             # handling a new effect
             else:
@@ -147,6 +147,7 @@ CORE_CONFIG_SCHEMA = vol.Schema(
         vol.Optional("devices", default=[]): list,
         vol.Optional("virtuals", default=[]): list,
         vol.Optional("audio", default={}): dict,
+        vol.Optional("audio_sources", default={}): dict,
         vol.Optional("melbank_collection", default=[]): list,
         vol.Optional("melbanks", default={}): dict,
         vol.Optional("ledfx_presets", default={}): dict,
@@ -195,6 +196,9 @@ CORE_CONFIG_SCHEMA = vol.Schema(
         vol.Optional("sendspin_servers", default={}): dict,
         vol.Optional("sendspin_always_on", default=False): bool,
         vol.Optional("now_playing", default={}): dict,
+        vol.Optional("udp_send_buffer", default=0): vol.All(
+            int, vol.Range(min=0, max=16 * 1024 * 1024)
+        ),
     },
     extra=vol.ALLOW_EXTRA,
 )
@@ -30,8 +30,9 @@ from ledfx.config import (
 )
 from ledfx.consts import PROJECT_VERSION
 from ledfx.devices import Devices
+from ledfx.devices.utils.socket_singleton import udp_sender
 from ledfx.effects import Effects
-from ledfx.effects.audio import AudioInputSource
+from ledfx.effects.audio import AudioInputSource, AudioSources
 from ledfx.events import (
     AudioDeviceListChangedEvent,
     Event,
@@ -41,6 +42,9 @@ from ledfx.events import (
 )
 from ledfx.http_manager import HttpServer
 from ledfx.integrations import Integrations
+from ledfx.libraries.frame_bus import FrameBus
+from ledfx.libraries.http_client import device_http
+from ledfx.libraries.startup_timeline import StartupTimeline
 from ledfx.mdns_manager import ZeroConfRunner
 from ledfx.nowplaying import NowPlayingService
 from ledfx.nowplaying.providers.smtc import SMTCNowPlayingProvider
@@ -56,6 +60,7 @@ from ledfx.utils import (
     async_fire_and_forget,
     currently_frozen,
     get_sorted_physical_ips,
+    init_frame_cache,
     init_image_cache,
     pixels_boost,
     resize_pixels,
@@ -217,6 +222,11 @@ class LedFxCore:
         Delegates all audio recovery logic to AudioInputSource.handle_device_list_change()
         to keep audio lifecycle management in one place.
         """
+        # Named sources must release their streams before PortAudio is reset
+        audio_sources = getattr(self, "audio_sources", None)
+        if audio_sources:
+            audio_sources.suspend()
+
         # Let AudioInputSource handle the full lifecycle: stop, refresh, recover, restart
         if hasattr(self, "audio") and self.audio:
             self.audio.handle_device_list_change()
@@ -224,6 +234,9 @@ class LedFxCore:
             # If no audio instance yet, just refresh the device list
             AudioInputSource.refresh_device_list()
 
+        if audio_sources:
+            audio_sources.resume()
+
         # Fire LedFx event for any listeners (e.g., websocket notifications)
         self.events.fire_event(AudioDeviceListChangedEvent())
 
@@ -483,6 +496,7 @@ class LedFxCore:
         return self.exit_code
 
     async def async_start(self, open_ui=False, pause_all=False):
+        self.startup_timeline = StartupTimeline()
         _LOGGER.info(
             "Starting LedFx, listening on %s:%s", self.host, self.port
         )
@@ -503,6 +517,13 @@ class LedFxCore:
             max_size_mb=cache_config.get("max_size_mb", 500),
             max_items=cache_config.get("max_items", 500),
         )
+        frame_cache_config = self.config.get("frame_cache", {})
+        init_frame_cache(
+            self.config_dir,
+            max_memory_mb=frame_cache_config.get("max_memory_mb", 256),
+            disk_tier=frame_cache_config.get("disk_tier", False),
+            max_disk_mb=frame_cache_config.get("max_disk_mb", 1024),
+        )
 
         # Initialize Now Playing Service
         self.now_playing = NowPlayingService(self)
@@ -511,8 +532,11 @@ class LedFxCore:
         self._smtc_now_playing = SMTCNowPlayingProvider(self)
         self._smtc_now_playing.start()
 
+        udp_sender.configure(self.config.get("udp_send_buffer", 0))
         self.devices = Devices(self)
         self.effects = Effects(self)
+        self.audio_sources = AudioSources(self)
+        self.frame_bus = FrameBus()
         self.virtuals = Virtuals(self)
         # Ensure we start with a fresh virtual registry when reusing the
         # Virtuals singleton across LedFxCore lifecycles.
@@ -536,9 +560,8 @@ class LedFxCore:
             parse_gradient,
         )
 
-        # TODO: Deferr
-        self.devices.create_from_config(self.config["devices"])
-        await self.devices.async_initialize_devices()
+        with self.startup_timeline.phase("create devices"):
+            self.devices.create_from_config(self.config["devices"])
 
         # Load Sendspin server configurations into audio system BEFORE
         # virtuals, since virtuals with active effects trigger audio
@@ -553,10 +576,10 @@ class LedFxCore:
             _LOGGER.warning("Failed to eagerly start Sendspin audio: %s", e)
 
         self.zeroconf = ZeroConfRunner(ledfx=self)
-        self.virtuals.create_from_config(
-            self.config["virtuals"], pause_all=pause_all
-        )
-        self.integrations.create_from_config(self.config["integrations"])
+        with self.startup_timeline.phase("initialize devices and virtuals"):
+            await self.start_devices_and_virtuals(pause_all)
+        with self.startup_timeline.phase("create integrations"):
+            self.integrations.create_from_config(self.config["integrations"])
 
         # Start the HTTP server once internal registries are initialized so
         # websockets and REST endpoints are fully ready before the UI opens.
@@ -565,6 +588,9 @@ class LedFxCore:
         # Start audio device monitor for OS-level device change notifications
         self._start_audio_device_monitor()
 
+        self.startup_timeline.finish()
+        self.startup_timeline.log_summary()
+
         # Only open the UI once devices and virtuals have been initialized
         if open_ui:
             self.open_ui()
@@ -655,6 +681,51 @@ class LedFxCore:
                     pid,
                 )
 
+    async def start_devices_and_virtuals(self, pause_all=False):
+        """
+        Initialises the devices concurrently, and creates each virtual as
+        soon as all of its own devices are ready, so virtuals on fast or
+        warm started devices render while slower ones are still coming up
+        """
+        waiting = list(self.config["virtuals"])
+        pending = {device.id for device in self.devices.values()}
+
+        def create_ready_virtuals():
+            nonlocal waiting
+            ready = [
+                virtual_cfg
+                for virtual_cfg in waiting
+                if not self.virtuals.device_ids_of(virtual_cfg) & pending
+            ]
+            if not ready:
+                return
+            ready_ids = {virtual_cfg["id"] for virtual_cfg in ready}
+            waiting = [cfg for cfg in waiting if cfg["id"] not in ready_ids]
+            self.virtuals.create_from_config(ready, pause_all=pause_all)
+            for virtual_cfg in ready:
+                self.startup_timeline.mark(f"virtual {virtual_cfg['id']}")
+
+        def on_device_ready(device):
+            pending.discard(device.id)
+            create_ready_virtuals()
+
+        # virtuals without devices, or only on devices with nothing to
+        # initialise, don't have to wait for the others
+        pending -= {
+            device.id
+            for device in self.devices.values()
+            if not hasattr(device, "async_initialize")
+        }
+        create_ready_virtuals()
+        await self.devices.async_initialize_devices(
+            on_ready=on_device_ready, timeline=self.startup_timeline
+        )
+        pending.clear()
+        create_ready_virtuals()
+        self.virtuals.reorder(
+            virtual_cfg["id"] for virtual_cfg in self.config["virtuals"]
+        )
+
     def stop(self, exit_code):
         async_fire_and_forget(self.async_stop(exit_code), self.loop)
 
@@ -685,6 +756,8 @@ class LedFxCore:
 
             _LOGGER.info("Stopping HTTP Server...")
             await self.http.stop()
+            await device_http.close()
+            udp_sender.close()
 
             # Cancel all the remaining task and wait
             tasks = [
@@ -1,7 +1,8 @@
 import asyncio
 import logging
-import socket
+import os
 import threading
+import time
 from abc import abstractmethod
 from functools import cached_property, partial
 
@@ -11,7 +12,17 @@ import serial.tools.list_ports
 import voluptuous as vol
 from sacn.sending.sender_socket_base import DEFAULT_PORT
 
+from ledfx.color import parse_color, validate_color
 from ledfx.config import save_config
+from ledfx.devices.utils.color_correction import ColorCorrection
+from ledfx.devices.utils.frame_sync import FrameSync
+from ledfx.devices.utils.layers import DeviceLayer, composite
+from ledfx.devices.utils.metadata_cache import (
+    CACHE_FILE,
+    DeviceMetadataCache,
+)
+from ledfx.devices.utils.output_worker import OutputWorker
+from ledfx.devices.utils.socket_singleton import udp_sender
 from ledfx.events import (
     DeviceCreatedEvent,
     DevicesUpdatedEvent,
@@ -72,16 +83,38 @@ class Device(BaseRegistry):
                         list(AVAILABLE_FPS)[-1],
                     ),
                 ): fps_validator,
+                vol.Optional(
+                    "async_output",
+                    description="Send frames to the device on its own thread, so a slow device cannot hold back rendering. Frames are dropped if the device falls behind",
+                ): bool,
+                vol.Optional(
+                    "gamma",
+                    description="Gamma correction of the output, 1 is off",
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.2, max=4.0)),
+                vol.Optional(
+                    "white_point",
+                    description="Color the device shows for full white, scaling each channel",
+                ): validate_color,
+                vol.Optional(
+                    "dither",
+                    description="Temporal dithering of the corrected output, smoothing low brightness fades",
+                ): bool,
             }
         )
 
     _active = False
+    _output_worker = None
+    _color_correction = None
+    # devices that are slow to send can default to the output worker,
+    # async_output in the config overrides it
+    ASYNC_OUTPUT = False
 
     def __init__(self, ledfx, config):
         self._ledfx = ledfx
         self._config = config
         self._segments = []
         self._pixels = None
+        self._layers = {}
         self._silence_start = None
         self._device_type = ""
         self._online = True
@@ -101,6 +134,9 @@ class Device(BaseRegistry):
 
             validated_config = type(self).schema()(config)
             self._config = validated_config
+            self._update_color_correction()
+            if self._active:
+                self._update_output_worker()
 
             # Iterate all the base classes and check to see if there is a custom
             # implementation of config updates. If to notify the base class.
@@ -150,6 +186,49 @@ class Device(BaseRegistry):
             )
             return
 
+        if self._layer_mode(virtual_id) is not None:
+            # layer virtuals render apart, composited in assemble_frame
+            layer = self._layers.get(virtual_id)
+            if layer is None:
+                layer = self._layers[virtual_id] = DeviceLayer(
+                    self.pixel_count
+                )
+            layer.write(data)
+        else:
+            self._write_pixels(data)
+
+        # Only the priority virtual should flush to prevent multiple virtuals
+        # from fighting over the device buffer
+        if self.priority_virtual:
+            if virtual_id == self.priority_virtual.id:
+                # Priority virtual flushes after all virtuals have updated their pixels
+                frame = self.assemble_frame()
+                output = frame
+                if self._color_correction is not None:
+                    output = self._color_correction.apply(frame)
+                frame_sync = FrameSync.current()
+                if frame_sync is not None and frame_sync.add(self, output):
+                    # sent with the other devices of the frame
+                    pass
+                elif self._output_worker is not None:
+                    if output is self._pixels:
+                        # the worker sends later, while the virtuals keep
+                        # writing into the device pixels
+                        output = np.copy(output)
+                    self._output_worker.submit(output)
+                else:
+                    self.flush(output)
+
+                self._ledfx.events.fire_event(
+                    DeviceUpdateEvent(self.id, frame)
+                )
+        else:
+            _LOGGER.warning(
+                "Flush skipped as %s has no priority_virtual", self.id
+            )
+
+    def _write_pixels(self, data):
+        """Writes the segments of a virtual into the device pixels"""
         for item in data:
             if len(item) == 2:
                 # New scatter mode: (pixels, dst_indices)
@@ -177,29 +256,27 @@ class Device(BaseRegistry):
                     ) == np.shape(pixels):
                         self._pixels[start : end + 1] = pixels
 
-        # Only the priority virtual should flush to prevent multiple virtuals
-        # from fighting over the device buffer
-        if self.priority_virtual:
-            if virtual_id == self.priority_virtual.id:
-                # Priority virtual flushes after all virtuals have updated their pixels
-                frame = self.assemble_frame()
-                self.flush(frame)
-
-                self._ledfx.events.fire_event(
-                    DeviceUpdateEvent(self.id, frame)
-                )
-        else:
-            _LOGGER.warning(
-                "Flush skipped as %s has no priority_virtual", self.id
-            )
-
     def assemble_frame(self):
         """
-        Assembles the frame to be flushed. Currently this will just return
-        the active channels pixels, but will eventually handle things like
-        merging multiple segments segments and alpha blending channels
+        Assembles the frame to be flushed: the pixels of the virtuals
+        written straight to the device, with the layer virtuals blended
+        on top in the order they started rendering
         """
         frame = self._pixels
+        if self._layers:
+            layers = []
+            for virtual_id, layer in list(self._layers.items()):
+                mode = self._layer_mode(virtual_id)
+                if mode is None:
+                    # stopped, or no longer a layer
+                    del self._layers[virtual_id]
+                    continue
+                opacity = self._ledfx.virtuals.get(virtual_id).config.get(
+                    "layer_opacity", 1.0
+                )
+                layers.append((layer, mode, opacity))
+            if layers:
+                frame = composite(frame, layers)
 
         if self._config["center_offset"]:
             frame = np.roll(frame, self._config["center_offset"], axis=0)
@@ -207,10 +284,15 @@ class Device(BaseRegistry):
 
     def activate(self):
         self._pixels = np.zeros((self.pixel_count, 3))
+        self._layers = {}
+        self._update_color_correction()
         self._active = True
+        self._update_output_worker()
 
     def deactivate(self):
+        self._stop_output_worker()
         self._pixels = None
+        self._layers = {}
         self._active = False
         # self.flush(np.zeros((self.pixel_count, 3)))
 
@@ -219,6 +301,76 @@ class Device(BaseRegistry):
         self._online = False
         self._ledfx.events.fire_event(DevicesUpdatedEvent(self.id))
 
+    def _update_color_correction(self):
+        """Builds the output correction from the config, if it has any"""
+        gamma = self._config.get("gamma", 1.0)
+        gains = tuple(
+            channel / 255.0
+            for channel in parse_color(
+                self._config.get("white_point", "#ffffff")
+            )
+        )
+        correction = ColorCorrection(
+            gamma, gains, self._config.get("dither", False)
+        )
+        if correction.is_identity and not correction.dither:
+            correction = None
+        self._color_correction = correction
+
+    def _update_output_worker(self):
+        """Starts or stops the output worker to follow the config"""
+        if self._config.get("async_output", self.ASYNC_OUTPUT):
+            if self._output_worker is None:
+                self._output_worker = OutputWorker(self.name, self.flush)
+                self._output_worker.start()
+        else:
+            self._stop_output_worker()
+
+    def _stop_output_worker(self):
+        """
+        Stops the output worker once it has sent the frame still waiting.
+        Devices that close their transport when deactivated call this
+        first, so the last frame goes out before the transport closes.
+        """
+        worker = self._output_worker
+        self._output_worker = None
+        if worker is not None:
+            worker.stop()
+
+    def _flush_failed(self, error):
+        """
+        Activates the device again after a flush found it torn down. On
+        the output worker the error is raised instead, the worker counts
+        it: the device is being deactivated when the worker finds it torn
+        down, and activating it from there would start it again.
+        """
+        if OutputWorker.current() is not None:
+            raise error
+        self.activate()
+
+    @property
+    def output_stats(self):
+        """
+        Send counters and latency of the output worker, or None if frames
+        are sent on the rendering thread
+        """
+        worker = self._output_worker
+        return worker.get_stats() if worker is not None else None
+
+    @property
+    def stats(self):
+        """Output statistics of the device, for the API"""
+        return {"output": self.output_stats}
+
+    def sync_packets(self, data):
+        """
+        Builds the UDP packets of a frame for synchronised output, as
+        (packets, latches) lists of (payload, (address, port)). The latches
+        make the device show the data and are sent once every device of
+        the frame has its data. None if the device does not support it.
+        """
+        return None
+
     @abstractmethod
     def flush(self, data):
         """
@@ -282,6 +434,20 @@ class Device(BaseRegistry):
             virtual.id for virtual in self._virtuals_objs if virtual.active
         )
 
+    def _is_layer_virtual(self, virtual_id):
+        virtual = self._ledfx.virtuals.get(virtual_id)
+        return (
+            virtual is not None
+            and virtual.config.get("layer_blend") is not None
+        )
+
+    def _layer_mode(self, virtual_id):
+        """Blend mode of an active layer virtual, None for other virtuals"""
+        virtual = self._ledfx.virtuals.get(virtual_id)
+        if virtual is None or not virtual.active:
+            return None
+        return virtual.config.get("layer_blend")
+
     @property
     def online(self):
         """
@@ -306,10 +472,19 @@ class Device(BaseRegistry):
 
         # If the device's own virtual is activating, deactivate all external virtuals
         # streaming to this device (exit streaming mode)
-        if virtual_id == self.id:
+        # Layer virtuals are composited over the others, so they neither
+        # stop nor are stopped by the virtuals they overlap
+        incoming_layer = self._is_layer_virtual(virtual_id)
+        if incoming_layer:
+            _LOGGER.debug(
+                "Device %s: layer virtual '%s' added", self.id, virtual_id
+            )
+        elif virtual_id == self.id:
             external_virtuals = set()
             for _virtual_id, _, _ in self._segments:
-                if _virtual_id != self.id:
+                if _virtual_id != self.id and not self._is_layer_virtual(
+                    _virtual_id
+                ):
                     external_virtuals.add(_virtual_id)
 
             if external_virtuals:
@@ -342,13 +517,15 @@ class Device(BaseRegistry):
         overlapping_virtuals = set()
 
         # Skip overlap checking for gap devices (they are placeholders, not real hardware)
-        if is_gap_device(self):
+        if is_gap_device(self) or incoming_layer:
             overlapping_virtuals = set()
         else:
             # Group existing segments by virtual_id and sort by start position
             existing_by_virtual = {}
             for _virtual_id, segment_start, segment_end in self._segments:
-                if _virtual_id == virtual_id:
+                if _virtual_id == virtual_id or self._is_layer_virtual(
+                    _virtual_id
+                ):
                     continue
                 if _virtual_id not in existing_by_virtual:
                     existing_by_virtual[_virtual_id] = []
@@ -434,6 +611,7 @@ class Device(BaseRegistry):
             self.invalidate_cached_props()
 
     def clear_virtual_segments(self, virtual_id):
+        self._layers.pop(virtual_id, None)
         new_segments = []
         for segment in self._segments:
             if segment[0] != virtual_id:
@@ -630,7 +808,33 @@ class NetworkedDevice(Device):
 
     async def async_initialize(self):
         self._destination = None
-        await self.resolve_address()
+        self._resolving = None
+        cached = self.cached_metadata()
+        if "destination" in cached:
+            # warm start on the last known address, and confirm it in the
+            # background as a hostname lookup can take seconds
+            self._destination = cached["destination"]
+            self._online = True
+            self._resolving = asyncio.ensure_future(self.resolve_address())
+        else:
+            await self.resolve_address()
+
+    async def address_resolved(self):
+        """Waits for the background lookup of a warm start to finish"""
+        resolving = getattr(self, "_resolving", None)
+        if resolving is not None:
+            await asyncio.shield(resolving)
+
+    def cached_metadata(self):
+        """What was learnt about this device on a previous start"""
+        return self._ledfx.devices.metadata_cache.get(
+            self.id, self._config["ip_address"]
+        )
+
+    def cache_metadata(self, **metadata):
+        self._ledfx.devices.metadata_cache.update(
+            self.id, self._config["ip_address"], **metadata
+        )
 
     async def resolve_address(self, success_callback=None):
         try:
@@ -644,6 +848,7 @@ class NetworkedDevice(Device):
                 self.name,
                 self._destination,
             )
+            self.cache_metadata(destination=self._destination)
             self._online = True
             if success_callback:
                 success_callback()
@@ -664,6 +869,60 @@ class NetworkedDevice(Device):
             self._online = True
             super().activate(*args, **kwargs)
 
+    @property
+    def udp_address(self):
+        """
+        (address, port) the device's UDP output is sent to, None if it
+        sends none
+        """
+        return None
+
+    def _start_udp_sender(self):
+        # devices share one socket, see UDPSender
+        self._sock = udp_sender
+        udp_sender.add_listener(self._send_state_changed)
+
+    def _stop_udp_sender(self):
+        udp_sender.remove_listener(self._send_state_changed)
+        address = self.udp_address
+        if address is not None:
+            udp_sender.forget(address)
+        self._sock = None
+
+    @property
+    def stats(self):
+        stats = super().stats
+        address = self.udp_address
+        stats["udp"] = (
+            udp_sender.destination_stats(address)
+            if address is not None
+            else None
+        )
+        return stats
+
+    def _send_state_changed(self, address, error):
+        """Follows send errors to the device's UDP address"""
+        if address != self.udp_address:
+            return
+        if error is None:
+            # If we have reconnected, log it, come back online, and fire an event to the frontend
+            _LOGGER.info(
+                "%s connection to %s re-established.",
+                self._device_type,
+                self.name,
+            )
+            self._online = True
+        else:
+            # If we have lost connection, log it, go offline, and fire an event to the frontend
+            _LOGGER.warning(
+                "Error in %s connection to %s: %s",
+                self._device_type,
+                self.name,
+                error,
+            )
+            self._online = False
+        self._ledfx.events.fire_event(DevicesUpdatedEvent(self.id))
+
     @property
     def destination(self):
         if self._destination is None:
@@ -689,8 +948,14 @@ class UDPDevice(NetworkedDevice):
         }
     )
 
+    @property
+    def udp_address(self):
+        if self._destination is None:
+            return None
+        return (self._destination, self._config["port"])
+
     def activate(self):
-        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._start_udp_sender()
         _LOGGER.debug(
             "%s sender for %s started.",
             self._device_type,
@@ -705,7 +970,7 @@ class UDPDevice(NetworkedDevice):
             self._device_type,
             self._config["name"],
         )
-        self._sock = None
+        self._stop_udp_sender()
 
 
 class AvailableCOMPorts:
@@ -764,12 +1029,19 @@ class Devices(RegistryLoader):
     """Thin wrapper around the device registry that manages devices"""
 
     PACKAGE_NAME = "ledfx.devices"
+    # devices brought up at once during startup
+    STARTUP_CONCURRENCY = 16
 
     def __init__(self, ledfx):
         super().__init__(ledfx, Device, self.PACKAGE_NAME)
+        config_dir = getattr(ledfx, "config_dir", None)
+        self.metadata_cache = DeviceMetadataCache(
+            os.path.join(config_dir, CACHE_FILE) if config_dir else None
+        )
 
         def on_shutdown(e):
             self.deactivate_devices()
+            self.metadata_cache.save(device.id for device in self.values())
 
         self._ledfx.events.add_listener(on_shutdown, Event.LEDFX_SHUTDOWN)
 
@@ -801,19 +1073,54 @@ class Devices(RegistryLoader):
                 return device
         return None
 
-    async def async_initialize_devices(self):
-        tasks = [
-            device.async_initialize()
-            for device in self.values()
-            if hasattr(device, "async_initialize")
-        ]
+    async def async_initialize_devices(
+        self, on_ready=None, timeline=None, max_concurrent=None
+    ):
+        """
+        Initialises every device concurrently, at most max_concurrent at a
+        time so a large config doesn't flood the network or the executor.
+
+        Args:
+            on_ready: called with each device as soon as it has finished
+                initialising, whether or not that succeeded
+            timeline: StartupTimeline to record each device's time in
+            max_concurrent: defaults to STARTUP_CONCURRENCY
+        """
+        limit = asyncio.Semaphore(max_concurrent or self.STARTUP_CONCURRENCY)
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async def initialize(device):
+            start = time.perf_counter()
+            warm = False
+            try:
+                if hasattr(device, "async_initialize"):
+                    async with limit:
+                        start = time.perf_counter()
+                        if hasattr(device, "cached_metadata"):
+                            warm = bool(device.cached_metadata())
+                        await device.async_initialize()
+            finally:
+                if timeline is not None:
+                    timeline.record(
+                        f"device {device.id}",
+                        start,
+                        time.perf_counter(),
+                        type=device.type,
+                        warm=warm,
+                    )
+                if on_ready is not None:
+                    on_ready(device)
+
+        results = await asyncio.gather(
+            *(initialize(device) for device in list(self.values())),
+            return_exceptions=True,
+        )
 
         for result in results:
-            if type(result) is ValueError:
+            if isinstance(result, Exception):
                 _LOGGER.warning(result)
 
+        self.metadata_cache.save(device.id for device in self.values())
+
     async def add_new_device(self, device_type, device_config):
         """
         Creates a new device.
@@ -970,15 +1277,38 @@ class Devices(RegistryLoader):
         return device
 
     async def set_wleds_sync_mode(self, mode):
-        for device in self.values():
-            if (
-                device.type == "wled"
-                and device.pixel_count > 480
-                and device.config["sync_mode"] != mode
-            ):
-                device.wled.set_sync_mode(mode)
-                await device.wled.flush_sync_settings()
-                device.update_config({"sync_mode": mode})
+        """
+        Switches the large WLEDs to a sync mode. The devices are updated
+        concurrently, bounded by the device HTTP client's connections per
+        host, and only those that took the new settings change their
+        config.
+        """
+        devices = [
+            device
+            for device in self.values()
+            if device.type == "wled"
+            and device.pixel_count > 480
+            and device.config["sync_mode"] != mode
+        ]
+
+        async def set_sync_mode(device):
+            device.wled.set_sync_mode(mode)
+            await device.wled.flush_sync_settings()
+
+        results = await asyncio.gather(
+            *(set_sync_mode(device) for device in devices),
+            return_exceptions=True,
+        )
+        for device, result in zip(devices, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning(
+                    "Device %s: failed to set sync mode %s: %s",
+                    device.name,
+                    mode,
+                    result,
+                )
+                continue
+            device.update_config({"sync_mode": mode})
 
     def generate_device_ip_tests(self, new_type, new_config, pre_device):
         """
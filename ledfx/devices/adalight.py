@@ -3,7 +3,9 @@ import logging
 import serial
 import voluptuous as vol
 
-from ledfx.devices import SerialDevice, packets
+from ledfx.devices import SerialDevice
+from ledfx.devices.packets import AdalightEncoder
+from ledfx.devices.utils.serial_writer import SerialWriter
 from ledfx.events import DevicesUpdatedEvent
 
 _LOGGER = logging.getLogger(__name__)
@@ -41,17 +43,77 @@ class AdalightDevice(SerialDevice):
         super().__init__(ledfx, config)
         self._device_type = "Adalight"
         self.color_order = self._config["color_order"]
+        self._writer = None
+        self._write_failing = False
+
+    def activate(self):
+        super().activate()
+        if self._active and self._writer is None:
+            self._start_writer()
+
+    def deactivate(self):
+        # send the waiting frame, then stop writing before the port closes
+        self._stop_output_worker()
+        self._stop_writer()
+        super().deactivate()
+
+    def config_updated(self, config):
+        self.color_order = config["color_order"]
+        if self._writer is not None:
+            # rebuild the packets for the new colour order and pixel count
+            self._stop_writer()
+            self._start_writer()
+
+    def _start_writer(self):
+        self._writer = SerialWriter(
+            self.name,
+            self._write_packet,
+            AdalightEncoder(self.pixel_count, self.color_order),
+            on_error=self._write_failed,
+        )
+        self._writer.start()
+
+    def _stop_writer(self):
+        writer = self._writer
+        self._writer = None
+        if writer is not None:
+            writer.stop()
+
+    @property
+    def output_stats(self):
+        """Write counters, latency and throughput of the serial writer"""
+        writer = self._writer
+        if writer is not None:
+            return writer.get_stats()
+        return super().output_stats
 
     def flush(self, data):
-        try:
-            self.serial.write(
-                packets.build_adalight_packet(data, self.color_order)
-            )
-
-        except serial.SerialException:
-            # If we have lost connection, log it, go offline, and fire an event to the frontend
-            _LOGGER.warning(
-                "Serial Connection Interrupted. Please check connections and ensure your device is functioning correctly."
-            )
-            self.deactivate()
-            self._ledfx.events.fire_event(DevicesUpdatedEvent(self.id))
+        writer = self._writer
+        if writer is not None:
+            writer.submit(data)
+
+    def _write_packet(self, packet):
+        self.serial.write(packet)
+        # wait for the port to send it, so the next packet is the latest
+        # frame instead of queueing up behind this one
+        self.serial.flush()
+        self._write_failing = False
+
+    def _write_failed(self, error):
+        if not isinstance(error, serial.SerialException):
+            # warn once until a write succeeds again
+            if not self._write_failing:
+                self._write_failing = True
+                _LOGGER.warning(
+                    "Adalight %s failed to write: %s", self.name, error
+                )
+            return
+        if not self._active:
+            # the final packet written while stopping
+            return
+        # If we have lost connection, log it, go offline, and fire an event to the frontend
+        _LOGGER.warning(
+            "Serial Connection Interrupted. Please check connections and ensure your device is functioning correctly."
+        )
+        self.deactivate()
+        self._ledfx.events.fire_event(DevicesUpdatedEvent(self.id))
@@ -166,6 +166,24 @@ class ArtNetDevice(NetworkedDevice):
             self.dmx_start_address + total_pixels_per_device * self.num_devices
         )
         self.universe_count = math.ceil(self.channel_count / self.packet_size)
+
+        # the DMX data of every universe, zero padded to whole packets, with
+        # the ambles written once and the pixels written in place each flush
+        self.dmx_data = np.zeros(
+            self.universe_count * self.packet_size, dtype=np.uint8
+        )
+        devices_data = self.dmx_data[
+            self.dmx_start_address : self.channel_count
+        ].reshape(self.num_devices, total_pixels_per_device)
+        pixels_start = self.pre_amble.size
+        pixels_end = total_pixels_per_device - self.post_amble.size
+        devices_data[:, :pixels_start] = self.pre_amble
+        devices_data[:, pixels_end:] = self.post_amble
+        self.pixel_data = devices_data[:, pixels_start:pixels_end].reshape(
+            self.num_devices,
+            self.use_pixels_per_device,
+            self.output_mode.channels_per_pixel,
+        )
         self.init = False
 
     def flush(self, data):
@@ -178,52 +196,19 @@ class ArtNetDevice(NetworkedDevice):
         # devices and virtuals protections
         if self.lock.acquire(blocking=False):
             try:
-                data = self.output_mode.apply(data)
-                data = data.flatten()[
-                    : self.data_max * self.output_mode.channels_per_pixel
-                ]
-
-                # pre allocate the space
-                devices_data = np.empty(self.channel_count, dtype=np.uint8)
-                reshaped_data = data.reshape(
-                    (
-                        self.num_devices,
-                        self.use_pixels_per_device
-                        * self.output_mode.channels_per_pixel,
-                    )
-                )
-
-                # Create the pre_amble and post_amble arrays to match the device count
-                pre_amble_repeated = np.tile(
-                    self.pre_amble, (self.num_devices, 1)
-                )
-                post_amble_repeated = np.tile(
-                    self.post_amble, (self.num_devices, 1)
+                self.output_mode.apply_into(
+                    data[: self.data_max].reshape(
+                        self.num_devices, self.use_pixels_per_device, 3
+                    ),
+                    self.pixel_data,
                 )
 
-                # Concatenate the pre_amble, reshaped data, and post_amble along the second axis
-                full_device_data = np.concatenate(
-                    (pre_amble_repeated, reshaped_data, post_amble_repeated),
-                    axis=1,
-                )
-
-                devices_data[0 : self.dmx_start_address] = 0
-                devices_data[self.dmx_start_address :] = (
-                    full_device_data.ravel()
-                )
-
-                # TODO: Handle the data transformation outside of the loop and just use loop to set universe and send packets
-
                 if self._artnet is not None:
                     for i in range(self.universe_count):
                         start = i * self.packet_size
                         end = start + self.packet_size
-                        packet = np.zeros(self.packet_size, dtype=np.uint8)
-                        packet[
-                            : min(self.packet_size, self.channel_count - start)
-                        ] = devices_data[start:end]
                         self._artnet.set_universe(i + self._config["universe"])
-                        self._artnet.set(packet)
+                        self._artnet.set(self.dmx_data[start:end])
                         self._artnet.show()
             finally:
                 self.lock.release()
@@ -8,7 +8,6 @@ import voluptuous as vol
 from numpy import ndarray
 
 from ledfx.devices import UDPDevice
-from ledfx.events import DevicesUpdatedEvent
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -60,7 +59,6 @@ class DDPDevice(UDPDevice):
         super().__init__(ledfx, config)
         self._device_type = "DDP"
         self.frame_count = 0
-        self.connection_warning = False
         self.destination_port = self._config["port"]
         self.destination_id = self._config["destination_id"]
 
@@ -76,13 +74,11 @@ class DDPDevice(UDPDevice):
         Args:
             data (ndarray): The LED data to be flushed.
 
-        Raises:
-            AttributeError: If an attribute error occurs during the flush.
-            OSError: If an OS error occurs during the flush.
+        Send errors are tracked per destination by the shared UDP sender,
+        which takes the device offline and back, see UDPDevice.
         """
         self.frame_count += 1
         try:
-
             DDPDevice.send_out(
                 self._sock,
                 self.destination,
@@ -91,24 +87,67 @@ class DDPDevice(UDPDevice):
                 self.frame_count,
                 self.destination_id,
             )
-            if self.connection_warning:
-                # If we have reconnected, log it, come back online, and fire an event to the frontend
-                _LOGGER.info("DDP connection to %s re-established.", self.name)
-                self.connection_warning = False
-                self._online = True
-                self._ledfx.events.fire_event(DevicesUpdatedEvent(self.id))
-        except AttributeError:
-            self.activate()
-        except OSError as e:
-            # print warning only once until it clears
-            if not self.connection_warning:
-                # If we have lost connection, log it, go offline, and fire an event to the frontend
-                _LOGGER.warning(
-                    "Error in DDP connection to %s: %s", self.name, e
-                )
-                self.connection_warning = True
-                self._online = False
-                self._ledfx.events.fire_event(DevicesUpdatedEvent(self.id))
+        except AttributeError as e:
+            self._flush_failed(e)
+
+    def sync_packets(self, data: ndarray):
+        """
+        Packets of the frame without the push flag, and the push as a
+        separate empty packet so the frame is shown with the other devices
+        """
+        destination = self.destination
+        if destination is None or self._sock is None:
+            return None
+        self.frame_count += 1
+        address = (destination, self.destination_port)
+        sequence = self.frame_count % 15 + 1
+        packets = DDPDevice.build_packets(
+            data, sequence, self.destination_id, push=False
+        )
+        push = struct.pack(
+            "!BBBBLH",
+            DDPDevice.VER1 | DDPDevice.PUSH,
+            sequence,
+            DDPDevice.DATATYPE,
+            self.destination_id,
+            0,
+            0,
+        )
+        return [(packet, address) for packet in packets], [(push, address)]
+
+    @staticmethod
+    def build_packets(
+        data: ndarray, sequence: int, destination_id: int, push: bool = True
+    ) -> list:
+        """
+        Builds the DDP packets of a frame, with the push flag on the last
+        packet when push is set.
+
+        Args:
+            data (ndarray): The data to be sent.
+            sequence (int): The sequence number of the frame, 1-15.
+            destination_id (int): The DDP destination ID (1-255).
+            push (bool): Whether the last packet shows the frame.
+
+        Returns:
+            list: The packets as bytes.
+        """
+        byteData = data.astype(np.uint8).tobytes()
+        packets = []
+        for offset in range(0, max(len(byteData), 1), DDPDevice.MAX_DATALEN):
+            chunk = byteData[offset : offset + DDPDevice.MAX_DATALEN]
+            last = offset + DDPDevice.MAX_DATALEN >= len(byteData)
+            header = struct.pack(
+                "!BBBBLH",
+                DDPDevice.VER1 | (DDPDevice.PUSH if push and last else 0),
+                sequence,
+                DDPDevice.DATATYPE,
+                destination_id,
+                offset,
+                len(chunk),
+            )
+            packets.append(header + chunk)
+        return packets
 
     @staticmethod
     def send_out(
@@ -1,9 +1,13 @@
 import logging
+import random
 import threading
 
 import numpy as np
 import sacn
 import voluptuous as vol
+from sacn.messages.data_packet import calculate_multicast_addr
+from sacn.messages.sync_packet import SyncPacket
+from sacn.sending.sender_socket_base import DEFAULT_PORT
 
 from ledfx.devices import NetworkedDevice
 
@@ -35,6 +39,10 @@ class E131Device(NetworkedDevice):
                 description="Channel offset within the DMX universe",
                 default=0,
             ): vol.All(int, vol.Range(min=0)),
+            vol.Optional(
+                "sync_universe",
+                description="Universe of the E1.31 sync packets when a virtual synchronises its output, defaults to the first universe",
+            ): vol.All(int, vol.Range(min=1, max=63999)),
             vol.Optional(
                 "packet_priority",
                 description="Priority given to the sACN packets for this device",
@@ -70,6 +78,8 @@ class E131Device(NetworkedDevice):
             self._config["universe_end"] -= 1
 
         self._sacn = None
+        self._cid = tuple(random.randrange(256) for _ in range(16))
+        self._sync_sequence = 0
         self.device_lock = threading.Lock()
 
     def activate(self):
@@ -86,7 +96,7 @@ class E131Device(NetworkedDevice):
 
             # Configure sACN and start the dedicated thread to flush the buffer
             # Some variables are immutable and must be called here
-            self._sacn = sacn.sACNsender(source_name=self.name)
+            self._sacn = sacn.sACNsender(source_name=self.name, cid=self._cid)
 
             for universe in range(
                 self._config["universe"], self._config["universe_end"] + 1
@@ -124,49 +134,91 @@ class E131Device(NetworkedDevice):
 
         with self.device_lock:
             if self._sacn is not None:
-                if data.size != self._config["channel_count"]:
-                    raise Exception(
-                        f"Invalid buffer size. {data.size} != {self._config['channel_count']}"
-                    )
-
-                data = data.flatten()
-                current_index = 0
-                for universe in range(
-                    self._config["universe"], self._config["universe_end"] + 1
-                ):
-                    # Calculate offset into the provide input buffer for the channel. There are some
-                    # cleaner ways this can be done... This is just the quick and dirty
-                    universe_start = (
-                        universe - self._config["universe"]
-                    ) * self._config["universe_size"]
-                    universe_end = (
-                        universe - self._config["universe"] + 1
-                    ) * self._config["universe_size"]
-
-                    dmx_start = (
-                        max(universe_start, self._config["channel_offset"])
-                        % self._config["universe_size"]
-                    )
-                    dmx_end = (
-                        min(
-                            universe_end,
-                            self._config["channel_offset"]
-                            + self._config["channel_count"],
-                        )
-                        % self._config["universe_size"]
-                    )
-                    if dmx_end == 0:
-                        dmx_end = self._config["universe_size"]
-
-                    input_start = current_index
-                    input_end = current_index + dmx_end - dmx_start
-                    current_index = input_end
-
-                    dmx_data = np.array(self._sacn[universe].dmx_data)
-                    dmx_data[dmx_start:dmx_end] = data[input_start:input_end]
-
-                    # Because the sACN library checks for data to be of int type, we have to
-                    # convert the numpy array into a python list of ints using tolist()
-                    self._sacn[universe].dmx_data = dmx_data.tolist()
-
+                self._update_universes(data)
                 self._sacn.flush()
+
+    def sync_packets(self, data):
+        """
+        Data packets of every universe pointing at the sync universe, and
+        the sync packet that makes the receivers show them
+        """
+        with self.device_lock:
+            if self._sacn is None:
+                return None
+            self._update_universes(data)
+            sync_universe = self._config.get(
+                "sync_universe", self._config["universe"]
+            )
+            packets = []
+            for universe in range(
+                self._config["universe"], self._config["universe_end"] + 1
+            ):
+                output = self._sacn[universe]
+                # sacn keeps the universe's packet and sequence on the
+                # output, so sends from either path stay in sequence
+                packet = output._packet
+                packet.syncAddr = sync_universe
+                payload = bytes(packet.getBytes())
+                packet.syncAddr = 0
+                packet.sequence_increase()
+                address = (
+                    calculate_multicast_addr(universe)
+                    if output.multicast
+                    else output.destination
+                )
+                packets.append((payload, (address, DEFAULT_PORT)))
+
+            sync = SyncPacket(self._cid, sync_universe, self._sync_sequence)
+            self._sync_sequence = (self._sync_sequence + 1) % 256
+            address = (
+                calculate_multicast_addr(sync_universe)
+                if output.multicast
+                else output.destination
+            )
+            return packets, [(bytes(sync.getBytes()), (address, DEFAULT_PORT))]
+
+    def _update_universes(self, data):
+        if data.size != self._config["channel_count"]:
+            raise Exception(
+                f"Invalid buffer size. {data.size} != {self._config['channel_count']}"
+            )
+
+        data = data.flatten()
+        current_index = 0
+        for universe in range(
+            self._config["universe"], self._config["universe_end"] + 1
+        ):
+            # Calculate offset into the provide input buffer for the channel. There are some
+            # cleaner ways this can be done... This is just the quick and dirty
+            universe_start = (
+                universe - self._config["universe"]
+            ) * self._config["universe_size"]
+            universe_end = (
+                universe - self._config["universe"] + 1
+            ) * self._config["universe_size"]
+
+            dmx_start = (
+                max(universe_start, self._config["channel_offset"])
+                % self._config["universe_size"]
+            )
+            dmx_end = (
+                min(
+                    universe_end,
+                    self._config["channel_offset"]
+                    + self._config["channel_count"],
+                )
+                % self._config["universe_size"]
+            )
+            if dmx_end == 0:
+                dmx_end = self._config["universe_size"]
+
+            input_start = current_index
+            input_end = current_index + dmx_end - dmx_start
+            current_index = input_end
+
+            dmx_data = np.array(self._sacn[universe].dmx_data)
+            dmx_data[dmx_start:dmx_end] = data[input_start:input_end]
+
+            # Because the sACN library checks for data to be of int type, we have to
+            # convert the numpy array into a python list of ints using tolist()
+            self._sacn[universe].dmx_data = dmx_data.tolist()
@@ -120,6 +120,7 @@ class Govee(NetworkedDevice):
 
     def deactivate(self):
         _LOGGER.info("Govee %s deactivate", self.name)
+        self._stop_output_worker()
         if self.udp_server is not None:
             self.send_deactivate()
             self.udp_server.close()
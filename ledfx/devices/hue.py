@@ -16,6 +16,8 @@ except ImportError:
     MBEDTLS_AVAILABLE = False
 
 from ledfx.devices import NetworkedDevice
+from ledfx.devices.packets import HueStreamEncoder
+from ledfx.libraries.http_client import device_http
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,6 +43,7 @@ class HueDevice(NetworkedDevice):
 
     status: dict[int, tuple[int, int, int]]
     _sock: Optional[socket.socket] = None
+    _encoder: Optional[HueStreamEncoder] = None
 
     def __init__(self, ledfx, config):
         super().__init__(ledfx, config)
@@ -130,8 +133,26 @@ class HueDevice(NetworkedDevice):
 
         return response.json(), response.headers
 
-    def _entertainment_groups(self):
-        response, _ = self._hue_request(
+    async def _async_hue_request(
+        self, method, api_endpoint, data=None, ssl=False
+    ):
+        """_hue_request through the shared client, without blocking the loop"""
+        url = f"{'https' if ssl else 'http'}://{self._config['ip_address']}/{api_endpoint}"
+
+        headers = {}
+        if self._config.get("username") is not None:
+            headers["hue-application-key"] = self._config["username"]
+
+        kwargs = {"json": data, "headers": headers}
+        if ssl:
+            # the bridge certificate can't be verified, as for _hue_request
+            kwargs["ssl"] = False
+        response = await device_http.request(method, url, **kwargs)
+
+        return response.json(), response.headers
+
+    async def _entertainment_groups(self):
+        response, _ = await self._async_hue_request(
             "GET", "/clip/v2/resource/entertainment_configuration", ssl=True
         )
 
@@ -145,8 +166,8 @@ class HueDevice(NetworkedDevice):
 
         return {group["id"]: group for group in all_groups}
 
-    def _lights_from_entertainment_group(self, entertainment_id):
-        response, _ = self._hue_request(
+    async def _lights_from_entertainment_group(self, entertainment_id):
+        response, _ = await self._async_hue_request(
             "GET",
             f"/clip/v2/resource/entertainment_configuration/{entertainment_id}",
             ssl=True,
@@ -170,8 +191,8 @@ class HueDevice(NetworkedDevice):
 
         return lights
 
-    def _get_application_id(self):
-        _, headers = self._hue_request("GET", "/auth/v1", ssl=True)
+    async def _get_application_id(self):
+        _, headers = await self._async_hue_request("GET", "/auth/v1", ssl=True)
         return headers.get("hue-application-id")
 
     def activate(self):
@@ -215,6 +236,8 @@ class HueDevice(NetworkedDevice):
         super().activate()
 
     def deactivate(self):
+        # the last frame goes out before the stream is stopped
+        self._stop_output_worker()
         if self._sock is not None:
             self._sock.close()
             self._sock = None
@@ -232,40 +255,35 @@ class HueDevice(NetworkedDevice):
     def flush(self, data):
         # TODO: maybe use the position of the channel to make more sense of the effect
 
-        pixels = [[int(r), int(g), int(b)] for r, g, b in data]
-        send_data = bytearray(b"HueStream")
-        send_data.append(2)  # Major version
-        send_data.append(0)  # Minor version
-        send_data.append(0)  # Sequence ID
-        send_data.append(0)  # Reserved
-        send_data.append(0)  # Reserved
-        send_data.append(0)  # Color Mode (0=RGB, 1=XY)
-        send_data.append(0)  # Reserved
-        send_data.extend(self._config["entertainment_id"].encode("utf-8"))
-        for i in range(len(pixels)):
-            send_data.append(i)  # channel ID
-            send_data.append(pixels[i][0])  # Red
-            send_data.append(pixels[i][0])  # Red
-            send_data.append(pixels[i][1])  # Green
-            send_data.append(pixels[i][1])  # Green
-            send_data.append(pixels[i][2])  # Blue
-            send_data.append(pixels[i][2])  # Blue
+        encoder = self._encoder
+        if (
+            encoder is None
+            or encoder.channel_count != len(data)
+            or encoder.entertainment_id != self._config["entertainment_id"]
+        ):
+            encoder = self._encoder = HueStreamEncoder(
+                self._config["entertainment_id"], len(data)
+            )
+        send_data = encoder.encode(data)
 
         try:
             self._sock.send(send_data)
-        except Exception:
-            self.activate()
+        except Exception as e:
+            self._flush_failed(e)
 
     async def async_initialize(self):
         await super().async_initialize()
 
         # see "self.__init__" why we do this.
         if "hue_application_id" in self._config:
-            self._hue_register()
-            self._check_hue_bridge()
+            # both run blocking requests, as they are also used by __init__
+            await self._ledfx.loop.run_in_executor(None, self._hue_register)
+            await self._ledfx.loop.run_in_executor(
+                None, self._check_hue_bridge
+            )
             hue_application_id = self._config["hue_application_id"]
         else:
-            hue_application_id = self._get_application_id()
+            hue_application_id = await self._get_application_id()
             self._dtls_client_context = tls.ClientContext(
                 tls.DTLSConfiguration(
                     pre_shared_key=(
@@ -276,7 +294,7 @@ class HueDevice(NetworkedDevice):
                 )
             )
 
-        entertainment_groups = self._entertainment_groups()
+        entertainment_groups = await self._entertainment_groups()
         entertainment_id = next(
             id
             for id in entertainment_groups
@@ -286,7 +304,7 @@ class HueDevice(NetworkedDevice):
         entertainment_group = entertainment_groups[entertainment_id]
         group_id = re.findall(r"\d+", entertainment_group["id_v1"])[0]
 
-        lights = self._lights_from_entertainment_group(entertainment_id)
+        lights = await self._lights_from_entertainment_group(entertainment_id)
 
         config = {
             "group_id": group_id,
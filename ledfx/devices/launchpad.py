@@ -177,6 +177,7 @@ class LaunchpadDevice(MidiDevice):
 
     def deactivate(self):
         _LOGGER.info("Deactivating Launchpad")
+        self._stop_output_worker()
         if self.lp is not None:
             self.lp.flush(
                 zeros((self.pixel_count, 3)),
@@ -49,12 +49,27 @@ LIFX_CLASS_MAP = {
 }
 
 
-def numpy_rgb_to_hsbk(rgb_array: np.ndarray, kelvin: int = 3500) -> list:
+# protocol-ready colour, as send_frame() takes it
+HSBK_DTYPE = np.dtype(
+    [
+        ("hue", np.uint16),
+        ("saturation", np.uint16),
+        ("brightness", np.uint16),
+        ("kelvin", np.uint16),
+    ]
+)
+
+
+def numpy_rgb_to_hsbk(
+    rgb_array: np.ndarray, kelvin: int = 3500, pixel_count: int = None
+) -> list:
     """Convert NumPy RGB array to protocol-ready HSBK list.
 
     Args:
         rgb_array: Shape (N, 3) with RGB values 0-255
         kelvin: Color temperature
+        pixel_count: Length of the list, padded with black at 3500K.
+            Defaults to N
 
     Returns:
         List of (hue, sat, bright, kelvin) tuples for send_frame()
@@ -70,28 +85,26 @@ def numpy_rgb_to_hsbk(rgb_array: np.ndarray, kelvin: int = 3500) -> list:
     s = np.zeros_like(maxc)
     np.divide(delta, maxc, out=s, where=maxc > 0)  # Saturation
 
-    h = np.zeros_like(r)
-    mask = delta > 0
-
-    red_max = mask & (maxc == r)
-    h[red_max] = ((g[red_max] - b[red_max]) / delta[red_max]) % 6
-
-    green_max = mask & (maxc == g)
-    h[green_max] = (b[green_max] - r[green_max]) / delta[green_max] + 2
-
-    blue_max = mask & (maxc == b)
-    h[blue_max] = (r[blue_max] - g[blue_max]) / delta[blue_max] + 4
+    # the last matching channel wins, as blue, then green, then red
+    with np.errstate(divide="ignore", invalid="ignore"):
+        h = np.where(
+            maxc == b,
+            (r - g) / delta + 4,
+            np.where(maxc == g, (b - r) / delta + 2, ((g - b) / delta) % 6),
+        )
+    h[delta == 0] = 0
 
     h = h / 6  # Normalize to 0-1
 
-    hue_proto = (h * 65535).astype(np.uint16)
-    sat_proto = (s * 65535).astype(np.uint16)
-    bright_proto = (v * 65535).astype(np.uint16)
-
-    return [
-        (int(hue_proto[i]), int(sat_proto[i]), int(bright_proto[i]), kelvin)
-        for i in range(len(rgb_array))
-    ]
+    count = len(rgb_array)
+    hsbk = np.zeros(max(count, pixel_count or 0), dtype=HSBK_DTYPE)
+    hsbk["kelvin"] = 3500
+    hsbk["kelvin"][:count] = kelvin
+    hsbk["hue"][:count] = h * 65535
+    hsbk["saturation"][:count] = s * 65535
+    hsbk["brightness"][:count] = v * 65535
+    # tolist() of a structured array gives the tuples of python ints
+    return hsbk.tolist()
 
 
 class LifxDevice(NetworkedDevice):
@@ -590,6 +603,7 @@ class LifxDevice(NetworkedDevice):
             )
 
     def deactivate(self):
+        self._stop_output_worker()
         if self._animator:
             self._animator.close()
             self._animator = None
@@ -655,11 +669,11 @@ class LifxDevice(NetworkedDevice):
             try:
                 pixels = data.astype(np.dtype("B")).reshape(-1, 3)
                 pixel_count = min(len(pixels), self._animator.pixel_count)
-                hsbk_data = numpy_rgb_to_hsbk(pixels[:pixel_count])
-
-                # Pad if needed
-                while len(hsbk_data) < self._animator.pixel_count:
-                    hsbk_data.append((0, 0, 0, 3500))
+                # padded with black if needed
+                hsbk_data = numpy_rgb_to_hsbk(
+                    pixels[:pixel_count],
+                    pixel_count=self._animator.pixel_count,
+                )
 
                 self._animator.send_frame(hsbk_data)
             except (LifxError, LifxTimeoutError, OSError, ValueError) as e:
@@ -1,6 +1,5 @@
 import logging
-import socket
-import struct
+from concurrent.futures import Future
 from typing import Optional
 
 import requests
@@ -8,6 +7,9 @@ import voluptuous as vol
 from requests import ConnectTimeout, ReadTimeout
 
 from ledfx.devices import NetworkedDevice
+from ledfx.devices.packets import NanoleafUDPEncoder
+from ledfx.devices.utils.socket_singleton import UDPSender
+from ledfx.libraries.http_client import device_http
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,7 +45,9 @@ class NanoleafDevice(NetworkedDevice):
     )
 
     status: dict[int, tuple[int, int, int]]
-    _sock: Optional[socket.socket] = None
+    _sock: Optional[UDPSender] = None
+    _tcp_request: Optional[Future] = None
+    _udp_encoder: Optional[NanoleafUDPEncoder] = None
 
     def __init__(self, ledfx, config):
         super().__init__(ledfx, config)
@@ -63,6 +67,7 @@ class NanoleafDevice(NetworkedDevice):
     def setup_subdevice(self):
         _LOGGER.debug("setup_subdevice")
         self.status = {}
+        self._udp_encoder = None
         self.deactivate()
         self.activate()
 
@@ -99,69 +104,68 @@ class NanoleafDevice(NetworkedDevice):
                 self.set_offline()
                 return
 
-            self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self._sock.connect(
-                (self._config["ip_address"], self._config["udp_port"])
-            )
+            self._start_udp_sender()
 
         super().activate()
 
     def deactivate(self):
         _LOGGER.debug("deactivate")
-        if self._sock is not None:
-            self._sock.close()
-            self._sock = None
+        self._stop_output_worker()
+        self._stop_udp_sender()
 
         super().deactivate()
 
-    def write_udp(self):
-        if self._config["model"] == LightPanelModel:
-            send_data = struct.pack(">B", len(self.status.items()))
-            w = 0
-            transition = 1
-
-            for panel_id, (r, g, b) in self.status.items():
-                send_data += struct.pack(
-                    ">BBBBBH", panel_id, w, r, g, b, transition
-                )
-        else:
-            send_data = struct.pack(">H", len(self.status))
-            w = 0
-            transition = 0
-
-            for panel_id, (r, g, b) in self.status.items():
-                send_data += struct.pack(
-                    ">HBBBBH", panel_id, r, g, b, w, transition
-                )
-
-        self._sock.send(send_data)
+    @property
+    def udp_address(self):
+        if self._config["sync_mode"] != "UDP":
+            return None
+        return (self._config["ip_address"], self._config["udp_port"])
+
+    def write_udp(self, data):
+        encoder = self._udp_encoder
+        if encoder is None:
+            encoder = self._udp_encoder = NanoleafUDPEncoder(
+                [panel["panelId"] for panel in self.config["pixel_layout"]],
+                light_panels=self._config["model"] == LightPanelModel,
+            )
+        self._sock.sendto(encoder.encode(data), self.udp_address)
 
     def write_tcp(self):
         """Syncs the digital twin's changes to the real Nanoleaf device.
 
-        :returns: True if success, otherwise False
+        The request runs on the event loop so the flush never waits on
+        the device. While one is in flight further frames are skipped,
+        the next flush after it completes sends the latest status.
         """
+        if self._tcp_request is not None and not self._tcp_request.done():
+            return
+
         anim_data = str(len(self.status))
 
         for key, (r, g, b) in self.status.items():
             anim_data += f" {str(key)} 1 {r} {g} {b} 0 0"
 
-        try:
-            response = requests.put(
-                self.url(self._config["auth_token"]) + "/effects",
-                json={
-                    "write": {
-                        "command": "display",
-                        "animType": "custom",
-                        "loop": True,
-                        "palette": [],
-                        "animData": anim_data,
-                    }
-                },
-                timeout=2.0,
-            )
-        except (ConnectTimeout, ReadTimeout) as e:
+        self._tcp_request = device_http.request_threadsafe(
+            self._ledfx.loop,
+            "PUT",
+            self.url(self._config["auth_token"]) + "/effects",
+            json={
+                "write": {
+                    "command": "display",
+                    "animType": "custom",
+                    "loop": True,
+                    "palette": [],
+                    "animData": anim_data,
+                }
+            },
+            timeout=2.0,
+        )
+        self._tcp_request.add_done_callback(self._write_tcp_done)
 
+    def _write_tcp_done(self, future):
+        try:
+            response = future.result()
+        except Exception as e:
             _LOGGER.warning(
                 "%s WriteTCP failure, Is Nanoleaf powered? %s", self.name, e
             )
@@ -171,24 +175,22 @@ class NanoleafDevice(NetworkedDevice):
         if response.status_code == 400:
             _LOGGER.warning("%s Bad Request Response", self.name)
             self.set_offline()
-            return
 
     def flush(self, data):
-        for panel, col in zip(
-            self.config["pixel_layout"], data.astype(int).clip(0, 255)
-        ):
-            self.status[panel["panelId"]] = col.tolist()
-
         if self.config["sync_mode"] == "TCP":
+            for panel, col in zip(
+                self.config["pixel_layout"], data.astype(int).clip(0, 255)
+            ):
+                self.status[panel["panelId"]] = col.tolist()
             self.write_tcp()
         elif self.config["sync_mode"] == "UDP":
-            self.write_udp()
+            self.write_udp(data)
 
-    def get_token(self):
+    async def get_token(self):
         _LOGGER.info("acquiring nanoleaf auth token...")
-        response = requests.post(self.url("new"))
+        response = await device_http.request("POST", self.url("new"))
 
-        if response and response.status_code == 200:
+        if response.status_code == 200:
             data = response.json()
             if "auth_token" in data:
                 return data["auth_token"]
@@ -201,14 +203,15 @@ class NanoleafDevice(NetworkedDevice):
         auth_token = self.config.get("auth_token")
 
         if not auth_token:
-            auth_token = self.get_token()
+            auth_token = await self.get_token()
             self.update_config({"auth_token": auth_token})
 
         _LOGGER.info("fetching nanoleaf's device info...")
 
-        nanoleaf_config = requests.get(
-            self.url(self.config["auth_token"])
-        ).json()
+        response = await device_http.request(
+            "GET", self.url(self.config["auth_token"])
+        )
+        nanoleaf_config = response.json()
 
         _LOGGER.debug("nanoleaf config response: %s", nanoleaf_config)
         _LOGGER.info("parsing panel layout...")
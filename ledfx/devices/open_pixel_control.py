@@ -1,5 +1,4 @@
 import logging
-import socket
 import struct
 
 import voluptuous as vol
@@ -27,8 +26,16 @@ class OpenPixelControl(NetworkedDevice):
         }
     )
 
+    PORT = 7890
+
+    @property
+    def udp_address(self):
+        if self._destination is None:
+            return None
+        return (self._destination, self.PORT)
+
     def activate(self):
-        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._start_udp_sender()
         _LOGGER.info(
             "Open Pixel Control sender for %s started.", self.config["name"]
         )
@@ -39,7 +46,7 @@ class OpenPixelControl(NetworkedDevice):
         _LOGGER.info(
             "Open Pixel Control sender for %s stopped.", self.config["name"]
         )
-        self._sock = None
+        self._stop_udp_sender()
 
     def flush(self, data):
         try:
@@ -47,11 +54,11 @@ class OpenPixelControl(NetworkedDevice):
                 self,
                 self._sock,
                 self.destination,
-                7890,
+                self.PORT,
                 data,
             )
-        except AttributeError:
-            self.activate()
+        except AttributeError as e:
+            self._flush_failed(e)
 
     @staticmethod
     def send_out(
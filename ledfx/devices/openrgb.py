@@ -144,8 +144,8 @@ class OpenRGB(NetworkedDevice):
                 data,
                 self.openrgb_device.id,
             )
-        except AttributeError:
-            self.activate()
+        except AttributeError as e:
+            self._flush_failed(e)
 
         except (
             ConnectionAbortedError,
@@ -151,8 +151,8 @@ class OSCServerDevice(NetworkedDevice):
         for message in messages:
             try:
                 self._client.send(message.build())
-            except AttributeError:
-                self.activate()
+            except AttributeError as e:
+                self._flush_failed(e)
                 continue
 
         self.last_frame = np.copy(data)
@@ -1,7 +1,10 @@
 import struct
+import time
 
 import numpy as np
 
+OPENRGB_HEADER = struct.Struct("ccccIIIIH")
+
 
 def build_warls_packet(data: np.ndarray, timeout: int, last_frame: np.array):
     """
@@ -134,34 +137,59 @@ def build_adalight_packet(data: np.ndarray, color_order: str):
     5 + n*3 	Green Value
     6 + n*3 	Blue Value
     """
-    pixel_length = len(data)
-    packet = bytearray(
-        [
-            ord("A"),
-            ord("d"),
-            ord("a"),
-            (pixel_length >> 8),
-            (pixel_length & 0x00FF),
-        ]
-    )  # high byte, then low byte
-    packet.extend([packet[3] ^ packet[4] ^ 0x55])  # checksum
+    return AdalightEncoder(len(data), color_order).encode(data)
 
-    byteData = data.astype(np.dtype("B"))
-    # if color_order == "RGB": pass
-    if color_order == "GRB":
-        byteData[:, [1, 0]] = byteData[:, [0, 1]]  # swap columns
-    elif color_order == "BGR":
-        byteData[:, [2, 0]] = byteData[:, [0, 2]]
-    elif color_order == "RBG":
-        byteData[:, [2, 1]] = byteData[:, [1, 2]]
-    elif color_order == "BRG":
-        byteData[:, [2, 0]] = byteData[:, [0, 2]]
-        byteData[:, [2, 1]] = byteData[:, [1, 2]]
-    elif color_order == "GBR":
-        byteData[:, [2, 0]] = byteData[:, [0, 2]]
-        byteData[:, [1, 0]] = byteData[:, [0, 1]]
-    packet.extend(byteData.flatten().tobytes())
-    return packet
+
+class AdalightEncoder:
+    """
+    Encodes frames as Adalight serial packets for a fixed pixel count.
+
+    The header is computed once and the colour order is a channel
+    permutation, so encoding a frame is a single cast of the pixels into
+    the body of a preallocated packet. Packets from new_packet can be
+    filled again with encode_into every frame.
+    """
+
+    HEADER_LEN = 6
+
+    def __init__(self, pixel_count: int, color_order: str = "RGB"):
+        self.pixel_count = pixel_count
+        self.color_order = color_order
+        # the input channel sent in each position, GRB is [1, 0, 2]
+        permutation = ["RGB".index(channel) for channel in color_order]
+        self._permutation = (
+            None if permutation == [0, 1, 2] else np.array(permutation)
+        )
+        self.header = bytes(
+            [
+                ord("A"),
+                ord("d"),
+                ord("a"),
+                pixel_count >> 8,  # high byte, then low byte
+                pixel_count & 0xFF,
+                (pixel_count >> 8) ^ (pixel_count & 0xFF) ^ 0x55,  # checksum
+            ]
+        )
+        self.packet_size = self.HEADER_LEN + pixel_count * 3
+
+    def new_packet(self) -> bytearray:
+        packet = bytearray(self.packet_size)
+        packet[: self.HEADER_LEN] = self.header
+        return packet
+
+    def encode_into(self, packet: bytearray, data: np.ndarray):
+        """Writes the pixels of data into a packet from new_packet"""
+        body = np.frombuffer(
+            packet, dtype=np.uint8, offset=self.HEADER_LEN
+        ).reshape(-1, 3)
+        if self._permutation is not None:
+            data = data[:, self._permutation]
+        body[...] = data
+
+    def encode(self, data: np.ndarray) -> bytearray:
+        packet = self.new_packet()
+        self.encode_into(packet, data)
+        return packet
 
 
 def build_openrgb_packet(
@@ -180,25 +208,302 @@ def build_openrgb_packet(
     """
     frame_size = len(data)
 
-    # header
-    packet = bytearray(
-        # fmt: off
-        struct.pack(
-            "ccccIIIIH",
-            b"O", b"R", b"G", b"B",
-            device_id,
-            1050,  # RGBCONTROLLER_UPDATELEDS packet
-            struct.calcsize(f"IH{3 * frame_size}b{frame_size}x"),   # total packet length
-            # body length inlcuding self should match packet total packet length
-            # openRGB 0.9 ignored this field, but 0.91 enforces it
-            (frame_size * 4 + 2 + 4),
-            frame_size,  # number of pixels
-        )
-        # fmt: on
+    # header and body in one buffer
+    packet = bytearray(OPENRGB_HEADER.size + frame_size * 4)
+    OPENRGB_HEADER.pack_into(
+        packet,
+        0,
+        b"O",
+        b"R",
+        b"G",
+        b"B",
+        device_id,
+        1050,  # RGBCONTROLLER_UPDATELEDS packet
+        struct.calcsize(
+            f"IH{3 * frame_size}b{frame_size}x"
+        ),  # total packet length
+        # body length inlcuding self should match packet total packet length
+        # openRGB 0.9 ignored this field, but 0.91 enforces it
+        (frame_size * 4 + 2 + 4),
+        frame_size,  # number of pixels
     )
 
-    # body
-    out = np.zeros((frame_size, 4), dtype="B")
-    out[:, 0:3] = data.astype(np.dtype("B"))
-    packet.extend(out.flatten().tobytes())
+    # body, the 4th byte of each pixel is padding
+    body = np.frombuffer(packet, dtype=np.uint8, offset=OPENRGB_HEADER.size)
+    body.reshape(frame_size, 4)[:, :3] = data
     return packet
+
+
+class RealtimeEncoder:
+    """
+    Encodes frames for WLED's UDP realtime protocol in whichever format
+    needs the fewest bytes on the wire for the frame.
+
+    Full frames go out as DRGB, or as DNRGB chunks for longer strips. When
+    only some pixels changed since the last frame, they go out as WARLS
+    index and colour pairs for strips of up to 255 pixels, or as DNRGB
+    chunks covering just the changed span. Pixels left out of a partial
+    update keep their last value on the device, so a full frame is also
+    sent every FULL_FRAME_INTERVAL seconds in case a packet was lost.
+
+    Packets are built in one reused buffer. Each packet returned by
+    encode() is only valid until the next one is requested.
+    """
+
+    WARLS_MAX_PIXELS = 255
+    DRGB_MAX_PIXELS = 490
+    DNRGB_CHUNK_PIXELS = 489
+    FULL_FRAME_INTERVAL = 1.0
+
+    FORMATS = ("DRGB", "DNRGB", "WARLS", "DNRGB delta")
+
+    def __init__(self):
+        self._buffer = np.zeros(
+            max(
+                2 + self.WARLS_MAX_PIXELS * 4,
+                2 + self.DRGB_MAX_PIXELS * 3,
+                4 + self.DNRGB_CHUNK_PIXELS * 3,
+            ),
+            dtype=np.uint8,
+        )
+        self._view = memoryview(self._buffer)
+        self._pixels = np.zeros((0, 3), dtype=np.uint8)
+        self._last = None
+        self._last_full_time = 0.0
+        self.full_frame = True
+        self.changed = 0
+        self.frames = 0
+        self.bytes_total = 0
+        self.last_bytes = 0
+        self.format_counts = dict.fromkeys(self.FORMATS, 0)
+
+    def _dnrgb_cost(self, pixel_count):
+        chunks = -(-pixel_count // self.DNRGB_CHUNK_PIXELS)
+        return 4 * chunks + 3 * pixel_count
+
+    def choose(self, pixel_count, changed, full_frame):
+        """
+        The cheapest format for a frame, with the bytes it would take.
+
+        Args:
+            pixel_count: pixels in the frame
+            changed: sorted indexes of the pixels that changed
+            full_frame: whether every pixel must be sent
+
+        Returns:
+            (format, bytes)
+        """
+        if pixel_count <= self.DRGB_MAX_PIXELS:
+            options = [("DRGB", 2 + 3 * pixel_count)]
+        else:
+            options = [("DNRGB", self._dnrgb_cost(pixel_count))]
+        if not full_frame:
+            if pixel_count <= self.WARLS_MAX_PIXELS:
+                options.append(("WARLS", 2 + 4 * len(changed)))
+            # an unchanged frame still sends one pixel, to keep the
+            # realtime timeout from expiring
+            span = changed[-1] - changed[0] + 1 if len(changed) else 1
+            options.append(("DNRGB delta", self._dnrgb_cost(span)))
+        return min(options, key=lambda option: option[1])
+
+    def encode(self, data, timeout, now=None):
+        """
+        Yields the packets of a frame of (pixel_count, 3) 0-255 values.
+        """
+        if now is None:
+            now = time.monotonic()
+        pixel_count = len(data)
+        if self._pixels.shape != data.shape:
+            self._pixels = np.zeros(data.shape, dtype=np.uint8)
+            self._last = None
+        pixels = self._pixels
+        np.copyto(pixels, data, casting="unsafe")
+
+        self.full_frame = (
+            self._last is None
+            or now - self._last_full_time >= self.FULL_FRAME_INTERVAL
+        )
+        if self.full_frame:
+            changed = np.arange(pixel_count)
+            self._last = np.empty_like(pixels)
+            self._last_full_time = now
+        else:
+            changed = np.flatnonzero(np.any(pixels != self._last, axis=1))
+        np.copyto(self._last, pixels)
+        self.changed = len(changed)
+
+        packet_format, size = self.choose(
+            pixel_count, changed, self.full_frame
+        )
+        self.frames += 1
+        self.last_bytes = size
+        self.bytes_total += size
+        self.format_counts[packet_format] += 1
+
+        timeout = timeout or 1
+        buffer = self._buffer
+        if packet_format == "DRGB":
+            buffer[:2] = (2, timeout)
+            buffer[2 : 2 + 3 * pixel_count] = pixels.ravel()
+            yield self._view[: 2 + 3 * pixel_count]
+        elif packet_format == "WARLS":
+            buffer[:2] = (1, timeout)
+            body = buffer[2 : 2 + 4 * len(changed)].reshape(-1, 4)
+            body[:, 0] = changed
+            body[:, 1:] = pixels[changed]
+            yield self._view[: 2 + 4 * len(changed)]
+        else:
+            if packet_format == "DNRGB":
+                start, stop = 0, pixel_count
+            elif len(changed):
+                start, stop = changed[0], changed[-1] + 1
+            else:
+                start, stop = 0, 1
+            for chunk in range(start, stop, self.DNRGB_CHUNK_PIXELS):
+                chunk_stop = min(stop, chunk + self.DNRGB_CHUNK_PIXELS)
+                size = 4 + 3 * (chunk_stop - chunk)
+                buffer[:4] = (4, timeout, chunk >> 8, chunk & 0xFF)
+                buffer[4:size] = pixels[chunk:chunk_stop].ravel()
+                yield self._view[:size]
+
+    def get_stats(self) -> dict:
+        return {
+            "frames": self.frames,
+            "bytes_total": self.bytes_total,
+            "last_bytes": self.last_bytes,
+            "avg_bytes": self.bytes_total / self.frames if self.frames else 0,
+            "formats": dict(self.format_counts),
+        }
+
+
+# Hue entertainment channel: id and 16 bit big endian RGB
+HUE_CHANNEL = np.dtype([("id", "u1"), ("color", ">u2", (3,))])
+
+
+class HueStreamEncoder:
+    """
+    Encodes frames as Hue entertainment API v2 HueStream messages, one
+    channel per pixel with 16 bit colours.
+
+    The header and channel ids are written once, each frame only fills in
+    the colours of the preallocated message.
+    """
+
+    def __init__(self, entertainment_id: str, channel_count: int):
+        self.entertainment_id = entertainment_id
+        self.channel_count = channel_count
+        header = bytearray(b"HueStream")
+        # version 2.0, sequence, reserved, RGB colour mode, reserved
+        header.extend((2, 0, 0, 0, 0, 0, 0))
+        header.extend(entertainment_id.encode("utf-8"))
+        self._buffer = bytearray(
+            len(header) + channel_count * HUE_CHANNEL.itemsize
+        )
+        self._buffer[: len(header)] = header
+        self._channels = np.frombuffer(
+            self._buffer, dtype=HUE_CHANNEL, offset=len(header)
+        )
+        self._channels["id"] = np.arange(channel_count)
+
+    def encode(self, data: np.ndarray) -> bytes:
+        # 8 bit values to 16 bit, 0xAB becomes 0xABAB
+        np.multiply(
+            data.astype(np.uint16),
+            257,
+            out=self._channels["color"],
+            casting="unsafe",
+        )
+        return bytes(self._buffer)
+
+
+# Nanoleaf external control panel records. The fields are in the order
+# LedFx has always sent them for each protocol version.
+NANOLEAF_V1_PANEL = np.dtype(
+    [
+        ("panel_id", "u1"),
+        ("w", "u1"),
+        ("rgb", "u1", (3,)),
+        ("transition", ">u2"),
+    ]
+)
+NANOLEAF_V2_PANEL = np.dtype(
+    [
+        ("panel_id", ">u2"),
+        ("rgb", "u1", (3,)),
+        ("w", "u1"),
+        ("transition", ">u2"),
+    ]
+)
+
+
+class NanoleafUDPEncoder:
+    """
+    Encodes frames for Nanoleaf external control streaming, one panel
+    record per pixel in layout order. Light Panels use the v1 format, the
+    other models v2.
+
+    The panel count and ids are written once, each frame only fills in
+    the colours of the preallocated message.
+    """
+
+    def __init__(self, panel_ids, light_panels: bool = False):
+        self.panel_ids = list(panel_ids)
+        count = len(self.panel_ids)
+        if light_panels:
+            header, dtype, transition = (
+                struct.pack(">B", count),
+                NANOLEAF_V1_PANEL,
+                1,
+            )
+        else:
+            header, dtype, transition = (
+                struct.pack(">H", count),
+                NANOLEAF_V2_PANEL,
+                0,
+            )
+        self._buffer = bytearray(len(header) + count * dtype.itemsize)
+        self._buffer[: len(header)] = header
+        self._panels = np.frombuffer(
+            self._buffer, dtype=dtype, offset=len(header)
+        )
+        self._panels["panel_id"] = self.panel_ids
+        self._panels["transition"] = transition
+
+    def encode(self, data: np.ndarray) -> bytes:
+        """data is clipped to 0-255, pixels past the layout are ignored"""
+        count = min(len(data), len(self._panels))
+        self._panels["rgb"][:count] = np.clip(data[:count], 0, 255)
+        return bytes(self._buffer)
+
+
+class WS281XEncoder:
+    """
+    Packs frames into the 32 bit colour words of the rpi_ws281x library,
+    W << 24 | R << 16 | G << 8 | B, with the channels already in the
+    strip's order.
+
+    Colours are rounded and clipped to 0-255 and written straight into
+    the bytes of a preallocated word array, little endian B, G, R, W.
+    """
+
+    def __init__(self, pixel_count: int, white: bool = False):
+        self.pixel_count = pixel_count
+        self.channels = 4 if white else 3
+        self._bytes = np.zeros((pixel_count, 4), dtype=np.uint8)
+        self._words = self._bytes.view("<u4")[:, 0]
+        self._rounded = np.empty((pixel_count, self.channels))
+
+    def encode(self, data: np.ndarray) -> np.ndarray:
+        """
+        Returns the words of the pixels of data, which must be used before
+        the next frame is encoded. Pixels past the strip are ignored.
+        """
+        count = min(len(data), self.pixel_count)
+        rounded = self._rounded[:count]
+        np.rint(data[:count, : self.channels], out=rounded)
+        np.clip(rounded, 0, 255, out=rounded)
+        # R, G, B to bytes 2, 1, 0
+        self._bytes[:count, 2::-1] = rounded[:, :3]
+        if self.channels == 4:
+            self._bytes[:count, 3] = rounded[:, 3]
+        return self._words[:count]
@@ -1,8 +1,10 @@
 import logging
 
+import numpy as np
 import voluptuous as vol
 
 from ledfx.devices import Device
+from ledfx.devices.packets import WS281XEncoder
 from ledfx.devices.utils.rgbw_conversion import (
     RGB_MAPPING,
     WHITE_FUNCS_MAPPING,
@@ -34,6 +36,10 @@ class DeviceWrapper(Device):
 class RPI_WS281X(DeviceWrapper):
     """RPi WS281X/SK6812 device support"""
 
+    # show() blocks while the strip is clocked out. The worker shows the
+    # frame still waiting when it stops, so a cleared strip goes dark
+    ASYNC_OUTPUT = True
+
     CONFIG_SCHEMA = vol.Schema(
         {
             vol.Required(
@@ -109,6 +115,11 @@ class RPI_WS281X(DeviceWrapper):
         )
 
         self.strip.begin()
+        self._encoder = WS281XEncoder(
+            self.pixel_count, white=self.white_mode != "None"
+        )
+        # the strip starts out dark
+        self._shown = np.zeros(self.pixel_count, dtype=np.uint32)
         super().activate()
 
     def deactivate(self):
@@ -119,24 +130,15 @@ class RPI_WS281X(DeviceWrapper):
 
         # Apply color mapping function
         data = self.output_mode.apply(data)
-
-        # Switch between 24bit (RGB) and 32bit (RGBW) output
-        if self.white_mode == "None":
-            # RGB: R, G, B
-            def color_func(c):
-                return (round(c[0]) << 16) | (round(c[1]) << 8) | round(c[2])
-
-        else:
-            # RGBW: W, R, G, B
-            def color_func(c):
-                return (
-                    (round(c[3]) << 24)
-                    | (round(c[0]) << 16)
-                    | (round(c[1]) << 8)
-                    | round(c[2])
-                )
-
-        for idx, color in enumerate(data):
-            self.strip.setPixelColor(idx, color_func(color))
+        words = self._encoder.encode(data)
+
+        # the library has no bulk setter, so only the pixels that changed
+        # since the last frame are set
+        shown = self._shown[: len(words)]
+        changed = np.flatnonzero(words != shown)
+        set_pixel = self.strip.setPixelColor
+        for index, word in zip(changed.tolist(), words[changed].tolist()):
+            set_pixel(index, word)
+        shown[:] = words
 
         self.strip.show()
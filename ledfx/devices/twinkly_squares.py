@@ -119,6 +119,7 @@ class TwinklySquaresDevice(NetworkedDevice):
         super().activate()
 
     def deactivate(self):
+        self._stop_output_worker()
         if self.ctrl:
             self.ctrl.set_mode("movie")
         self.ctrl = None
@@ -57,6 +57,18 @@ class UDPRealtimeDevice(UDPDevice):
         self._device_type = "UDP Realtime"
         self.last_frame = np.full((config["pixel_count"], 3), -1)
         self.last_frame_sent_time = 0
+        self._encoder = packets.RealtimeEncoder()
+
+    @property
+    def encoder_stats(self):
+        """Formats and bytes sent by the adaptive_smallest encoder"""
+        return self._encoder.get_stats()
+
+    @property
+    def stats(self):
+        stats = super().stats
+        stats["encoder"] = self.encoder_stats
+        return stats
 
     def flush(self, data):
         try:
@@ -65,8 +77,8 @@ class UDPRealtimeDevice(UDPDevice):
                 self._config["timeout"],
             )
             self.last_frame = np.copy(data)
-        except AttributeError:
-            self.activate()
+        except AttributeError as e:
+            self._flush_failed(e)
 
     def choose_and_send_packet(
         self,
@@ -103,22 +115,13 @@ class UDPRealtimeDevice(UDPDevice):
                 )
                 self.transmit_packet(udpData, frame_is_equal_to_last)
 
-        elif (
-            self._config["udp_packet_type"] == "adaptive_smallest"
-            and frame_size <= 255
-        ):
-            # compare potential size of WARLS packet to DRGB packet
-            if (
-                np.count_nonzero(np.any(data != self.last_frame, axis=1)) * 4
-                < len(data) * 3
-            ):
-                udpData = packets.build_warls_packet(
-                    data, timeout, self.last_frame
+        elif self._config["udp_packet_type"] == "adaptive_smallest":
+            # the encoder picks the smallest of full and partial updates
+            for udpData in self._encoder.encode(data, timeout):
+                self.transmit_packet(
+                    udpData,
+                    frame_is_equal_to_last and not self._encoder.full_frame,
                 )
-                self.transmit_packet(udpData, frame_is_equal_to_last)
-            else:
-                udpData = packets.build_drgb_packet(data, timeout)
-                self.transmit_packet(udpData, frame_is_equal_to_last)
 
         elif (
             self._config["udp_packet_type"] == RGB_HYPERHDR_PACKET
@@ -155,12 +158,12 @@ class UDPRealtimeDevice(UDPDevice):
             if timestamp > self.last_frame_sent_time + half_of_timeout:
                 if self._destination is not None:
                     self._sock.sendto(
-                        bytes(packet), (self.destination, self._config["port"])
+                        packet, (self.destination, self._config["port"])
                     )
                     self.last_frame_sent_time = timestamp
         else:
             if self._destination is not None:
                 self._sock.sendto(
-                    bytes(packet), (self.destination, self._config["port"])
+                    packet, (self.destination, self._config["port"])
                 )
                 self.last_frame_sent_time = timestamp
@@ -0,0 +1,127 @@
+import logging
+from functools import lru_cache
+
+import numpy as np
+
+_LOGGER = logging.getLogger(__name__)
+
+# entries per channel, the finer table gives dithering input precision
+LUT_SIZE = 256
+DITHER_LUT_SIZE = 4096
+# fractional bits of the dithering table
+DITHER_BITS = 8
+# added to every pixel's noise each frame, odd so each pixel goes through
+# every noise value once per 1 << DITHER_BITS frames
+DITHER_STEP = 159
+
+
+@lru_cache(maxsize=32)
+def correction_lut(gamma, gains, size, fraction_bits=0):
+    """
+    Output value of each channel for size input levels spread over 0-255,
+    as one flat table of the three channels one after the other.
+
+    Args:
+        gamma: exponent applied to the 0-1 level
+        gains: (red, green, blue) scale of the corrected level, such as a
+            white point, clipped to full output
+        size: entries per channel
+        fraction_bits: extra bits of precision kept below the 0-255 value
+
+    Returns:
+        Read-only (3 * size) uint8 table, or uint16 with fraction bits
+    """
+    levels = np.linspace(0.0, 1.0, size) ** gamma
+    scale = 255 << fraction_bits
+    lut = np.clip(np.outer(gains, levels) * scale + 0.5, 0, scale).astype(
+        np.uint16 if fraction_bits else np.uint8
+    )
+    lut = lut.ravel()
+    lut.flags.writeable = False
+    return lut
+
+
+class ColorCorrection:
+    """
+    Gamma and per channel gain for a device, applied to its frames just
+    before they are built into packets.
+
+    Both are baked into a lookup table, so correcting a frame is a single
+    gather of every channel value into uint8. With dithering the table
+    keeps 8 bits below each output level, and a noise pattern that moves
+    every frame rounds them up or down, so over a few frames the average
+    matches the corrected level. This smooths fades at low brightness,
+    where the gamma curve has the fewest output levels.
+    """
+
+    def __init__(self, gamma=1.0, gains=(1.0, 1.0, 1.0), dither=False):
+        self.gamma = float(gamma)
+        self.gains = tuple(float(gain) for gain in gains)
+        self.dither = dither
+        if dither:
+            self._size = DITHER_LUT_SIZE
+            self._lut = correction_lut(
+                self.gamma, self.gains, self._size, DITHER_BITS
+            )
+        else:
+            self._size = LUT_SIZE
+            self._lut = correction_lut(self.gamma, self.gains, self._size)
+        self._input_scale = (self._size - 1) / 255.0
+        # work buffers, sized to the frame on first use
+        self._levels = np.zeros((0, 3))
+        self._indices = np.zeros((0, 3), dtype=np.intp)
+        self._offsets = np.zeros((0, 3))
+        self._noise = np.zeros((0, 3), dtype=np.uint16)
+        self._frame_noise = np.zeros((0, 3), dtype=np.uint16)
+        self._offset = 0
+
+    @property
+    def is_identity(self):
+        return self.gamma == 1.0 and self.gains == (1.0, 1.0, 1.0)
+
+    def _index(self, frame):
+        """Index into the flat table of every channel value of a frame"""
+        if self._levels.shape != frame.shape:
+            self._levels = np.empty(frame.shape)
+            self._indices = np.empty(frame.shape, dtype=np.intp)
+            # start of each channel's table, plus a half to round by
+            # truncating, laid out like the frame so the add is contiguous
+            self._offsets = np.tile(
+                np.arange(3) * self._size + 0.5, (len(frame), 1)
+            )
+        levels = self._levels
+        np.clip(frame, 0, 255, out=levels)
+        if self._input_scale != 1.0:
+            np.multiply(levels, self._input_scale, out=levels)
+        np.add(levels, self._offsets, out=levels)
+        np.copyto(self._indices, levels, casting="unsafe")
+        return self._indices
+
+    def _dither_noise(self, shape):
+        """Per pixel noise below one output level, moved every frame"""
+        if self._noise.shape != shape:
+            rng = np.random.default_rng(0)
+            self._noise = rng.integers(
+                0, 1 << DITHER_BITS, size=shape, dtype=np.uint16
+            )
+            self._frame_noise = np.empty(shape, dtype=np.uint16)
+        self._offset = (self._offset + DITHER_STEP) % (1 << DITHER_BITS)
+        np.add(self._noise, self._offset, out=self._frame_noise)
+        np.bitwise_and(
+            self._frame_noise, (1 << DITHER_BITS) - 1, out=self._frame_noise
+        )
+        return self._frame_noise
+
+    def apply(self, frame):
+        """
+        Corrects a (pixel_count, 3) frame of 0-255 values.
+
+        Returns:
+            A new (pixel_count, 3) uint8 frame
+        """
+        corrected = self._lut.take(self._index(frame), mode="clip")
+        if not self.dither:
+            return corrected
+        corrected += self._dither_noise(corrected.shape)
+        corrected >>= DITHER_BITS
+        return corrected.astype(np.uint8)
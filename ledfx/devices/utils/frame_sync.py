@@ -0,0 +1,130 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from ledfx.devices.utils.socket_singleton import udp_sender
+
+_local = threading.local()
+
+
+class FrameSync:
+    """
+    Sends the frames of several devices together, so controllers that
+    support it show each frame at the same moment instead of one after
+    another as the virtual flushes them.
+
+    While a batch is open on a thread, devices that can build their
+    packets ahead of time hand them to the batch instead of flushing.
+    When the batch closes the data packets of every device go out back
+    to back from the shared UDP sender, followed by the latch packets,
+    such as the DDP push or the E1.31 sync packet, so receivers hold the
+    data until all devices have theirs. Devices that cannot take part
+    flush as usual. Send errors are reported per destination by the
+    sender.
+
+    The skew is the time between the first and the last latch packet of
+    a frame, or between the first and the last data packet for devices
+    without a latch, and is how far apart the devices show the frame.
+    """
+
+    # weight of each new frame in the averages
+    SMOOTHING = 0.1
+
+    def __init__(self, name):
+        self.name = name
+        self._entries = []
+        self.frames = 0
+        self.devices = 0
+        self.errors = 0
+        self.last_skew_us = 0.0
+        self.avg_skew_us = 0.0
+        self.max_skew_us = 0.0
+        self.avg_send_us = 0.0
+
+    @staticmethod
+    def current():
+        """The batch open on this thread, or None"""
+        return getattr(_local, "batch", None)
+
+    @contextmanager
+    def batch(self):
+        """Collects the device frames flushed inside it and sends them"""
+        previous = FrameSync.current()
+        _local.batch = self
+        try:
+            yield self
+        finally:
+            _local.batch = previous
+            self.send()
+
+    def add(self, device, data):
+        """
+        Builds the device's packets for the frame, returns False if the
+        device does not support synchronised output and must flush itself
+        """
+        packets = device.sync_packets(data)
+        if packets is None:
+            return False
+        self._entries.append((device, *packets))
+        return True
+
+    def send(self):
+        entries = self._entries
+        if not entries:
+            return
+        self._entries = []
+        clock = time.perf_counter
+        failed = {}
+
+        began = clock()
+        data_end = began
+        for device, packets, _ in entries:
+            error = udp_sender.send(packets)
+            if error is not None:
+                failed[device.id] = error
+            data_end = clock()
+
+        latch_start = latch_end = None
+        for device, _, latches in entries:
+            # a device missing part of its data keeps the previous frame
+            if not latches or device.id in failed:
+                continue
+            error = udp_sender.send(latches)
+            if error is not None:
+                failed[device.id] = error
+            latch_end = clock()
+            if latch_start is None:
+                latch_start = latch_end
+
+        if latch_start is None:
+            skew = data_end - began
+        else:
+            skew = latch_end - latch_start
+        self._record(skew * 1e6, (clock() - began) * 1e6, len(entries))
+        self.errors += len(failed)
+
+    def _record(self, skew_us, send_us, devices):
+        if self.frames == 0:
+            self.avg_skew_us = skew_us
+            self.avg_send_us = send_us
+        else:
+            self.avg_skew_us += (skew_us - self.avg_skew_us) * self.SMOOTHING
+            self.avg_send_us += (send_us - self.avg_send_us) * self.SMOOTHING
+        self.frames += 1
+        self.devices = devices
+        self.last_skew_us = skew_us
+        self.max_skew_us = max(self.max_skew_us, skew_us)
+
+    def close(self):
+        self._entries = []
+
+    def get_stats(self):
+        return {
+            "frames": self.frames,
+            "devices": self.devices,
+            "errors": self.errors,
+            "last_skew_us": round(self.last_skew_us, 1),
+            "avg_skew_us": round(self.avg_skew_us, 1),
+            "max_skew_us": round(self.max_skew_us, 1),
+            "avg_send_us": round(self.avg_send_us, 1),
+        }
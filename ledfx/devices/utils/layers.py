@@ -0,0 +1,70 @@
+import numpy as np
+
+BLEND_MODES = ("over", "add", "max", "multiply")
+
+
+class DeviceLayer:
+    """
+    The pixels a layer virtual renders onto a device, kept apart from the
+    device's own buffer so that overlapping virtuals can be composited
+    instead of overwriting each other.
+
+    coverage marks the pixels the virtual has written, pixels it does not
+    cover leave the layers below untouched.
+    """
+
+    def __init__(self, pixel_count):
+        self.pixels = np.zeros((pixel_count, 3))
+        self.coverage = np.zeros(pixel_count, dtype=bool)
+
+    def write(self, data):
+        """Writes update_pixels data, marking the pixels covered"""
+        for item in data:
+            if len(item) == 2:
+                pixels, where = item
+            else:
+                pixels, start, end = item
+                where = slice(start, end + 1)
+            # protect against an empty race condition
+            if pixels.shape[0] == 0:
+                continue
+            try:
+                self.pixels[where] = pixels
+            except (IndexError, ValueError, TypeError):
+                # segments out of step with the device, as in
+                # Device.update_pixels
+                continue
+            self.coverage[where] = True
+
+
+def blend(base, layer, mode):
+    """The layer's colours blended onto base with full opacity"""
+    if mode == "add":
+        return np.minimum(base + layer, 255)
+    if mode == "max":
+        return np.maximum(base, layer)
+    if mode == "multiply":
+        return base * layer / 255
+    return layer.copy()
+
+
+def composite(base, layers):
+    """
+    Composites layers onto a copy of base, bottom first.
+
+    Args:
+        base: (pixel_count, 3) pixels below every layer
+        layers: (DeviceLayer, mode, opacity) from the bottom up
+
+    Returns:
+        The composited (pixel_count, 3) frame
+    """
+    frame = base.copy()
+    for layer, mode, opacity in layers:
+        weight = layer.coverage * opacity
+        # frame + (blended - frame) * weight, in place
+        blended = blend(frame, layer.pixels, mode)
+        blended -= frame
+        blended *= weight[:, np.newaxis]
+        frame += blended
+    return frame
@@ -0,0 +1,76 @@
+import json
+import logging
+import os
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_FILE = "device_cache.json"
+
+
+class DeviceMetadataCache:
+    """
+    Last known metadata of each device, such as its resolved address or
+    what a WLED controller reported about itself, kept on disk so the
+    next start can bring devices up straight away and confirm the details
+    with the device in the background.
+
+    An entry belongs to the ip_address it was learnt from, and is ignored
+    once the device is pointed somewhere else.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._entries = {}
+        self._dirty = False
+        if path is not None:
+            self.load()
+
+    def load(self):
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                entries = json.load(file)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            _LOGGER.warning("Ignoring device cache %s: %s", self.path, e)
+            return
+        if isinstance(entries, dict):
+            self._entries = entries
+
+    def get(self, device_id, ip_address):
+        """Cached metadata of the device at ip_address, or an empty dict"""
+        entry = self._entries.get(device_id)
+        if entry is None or entry.get("ip_address") != ip_address:
+            return {}
+        return entry
+
+    def update(self, device_id, ip_address, **metadata):
+        entry = self._entries.get(device_id)
+        if entry is None or entry.get("ip_address") != ip_address:
+            entry = self._entries[device_id] = {"ip_address": ip_address}
+        for key, value in metadata.items():
+            if entry.get(key) != value:
+                entry[key] = value
+                self._dirty = True
+
+    def save(self, device_ids=None):
+        """
+        Writes the cache if anything changed, keeping only device_ids when
+        given so removed devices don't linger
+        """
+        if device_ids is not None:
+            device_ids = set(device_ids)
+            for device_id in list(self._entries):
+                if device_id not in device_ids:
+                    del self._entries[device_id]
+                    self._dirty = True
+        if self.path is None or not self._dirty:
+            return
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(self._entries, file, sort_keys=True, indent=4)
+            os.replace(temp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            _LOGGER.warning("Failed to save device cache: %s", e)
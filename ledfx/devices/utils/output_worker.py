@@ -0,0 +1,138 @@
+import logging
+import threading
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+class OutputWorker:
+    """
+    Sends a device's frames on its own thread, so a slow output such as a
+    TCP, HTTP or serial device cannot hold back the virtuals rendering to
+    it.
+
+    The mailbox holds a single frame. A frame submitted while the previous
+    one is still waiting replaces it, and the replaced frame is counted as
+    dropped, so the device always sends the latest frame and never falls
+    behind. The frame still waiting when the worker stops is sent before
+    it exits, so the last frame of an effect, such as the black frame
+    flushed when it is cleared, always reaches the device.
+    """
+
+    # weight of each new send in the average send time
+    LATENCY_SMOOTHING = 0.1
+
+    def __init__(self, name, send):
+        """
+        Args:
+            name: name of the device, for the thread name and logs
+            send: called on the worker thread with each frame
+        """
+        self.name = name
+        self._send = send
+        self._condition = threading.Condition()
+        self._frame = None
+        self._running = False
+        self._thread = None
+        self._failing = False
+        self.submitted = 0
+        self.sent = 0
+        self.dropped = 0
+        self.errors = 0
+        self.last_send_ms = 0.0
+        self.avg_send_ms = 0.0
+        self.max_send_ms = 0.0
+
+    @staticmethod
+    def current():
+        """The worker running on this thread, or None"""
+        return getattr(_local, "worker", None)
+
+    @property
+    def running(self):
+        return self._running
+
+    def start(self):
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(
+            name=f"Output: {self.name}", target=self._run, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout=1.0):
+        """Stops the worker once it has sent any frame still waiting"""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+
+    def submit(self, frame):
+        """
+        Hands a frame to the worker without waiting. The frame must not be
+        modified afterwards.
+        """
+        with self._condition:
+            if self._frame is not None:
+                self.dropped += 1
+            self._frame = frame
+            self.submitted += 1
+            self._condition.notify()
+
+    def _run(self):
+        _local.worker = self
+        while True:
+            with self._condition:
+                while self._running and self._frame is None:
+                    self._condition.wait()
+                frame = self._frame
+                self._frame = None
+            if frame is None:
+                # stopped with nothing left to send
+                return
+
+            start = time.perf_counter()
+            try:
+                self._send(frame)
+            except Exception as e:
+                self.errors += 1
+                if not self._failing:
+                    self._failing = True
+                    _LOGGER.warning(
+                        "Output %s failed to send: %s", self.name, e
+                    )
+                else:
+                    _LOGGER.debug("Output %s failed to send: %s", self.name, e)
+                continue
+            send_ms = (time.perf_counter() - start) * 1000.0
+
+            if self._failing:
+                self._failing = False
+                _LOGGER.info("Output %s is sending again", self.name)
+            self.sent += 1
+            self.last_send_ms = send_ms
+            self.max_send_ms = max(self.max_send_ms, send_ms)
+            if self.sent == 1:
+                self.avg_send_ms = send_ms
+            else:
+                self.avg_send_ms += self.LATENCY_SMOOTHING * (
+                    send_ms - self.avg_send_ms
+                )
+
+    def get_stats(self) -> dict:
+        return {
+            "submitted": self.submitted,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "last_send_ms": self.last_send_ms,
+            "avg_send_ms": self.avg_send_ms,
+            "max_send_ms": self.max_send_ms,
+        }
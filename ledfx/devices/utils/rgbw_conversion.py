@@ -34,6 +34,8 @@ class OutputMode:
         self.white_func = getattr(
             self, WHITE_FUNCS_MAPPING[self.white_mode]["func"]
         )
+        # conversion plan for apply_into, built for the pixel shape
+        self._plan = None
 
     def apply(self, rgb_array: np.ndarray) -> np.ndarray:
         """Applies white channel addition and channel reordering."""
@@ -41,6 +43,28 @@ class OutputMode:
         rgbw = self.white_func(reordered)
         return rgbw
 
+    def apply_into(self, rgb: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """
+        Applies channel reordering and white channel addition straight into
+        an output buffer, in wire order, without allocating.
+
+        Args:
+            rgb: (..., 3) pixels with values 0-255
+            out: (..., channels_per_pixel) uint8 buffer with the same
+                leading shape as rgb, such as a view into a packet.
+                Values are truncated like assigning floats to uint8.
+
+        Returns:
+            out
+        """
+        plan = self._plan
+        if plan is None or plan.shape != rgb.shape[:-1]:
+            plan = self._plan = ConversionPlan(
+                rgb.shape[:-1], self.indices, self.white_mode
+            )
+        plan.run(rgb, out)
+        return out
+
     def rgb_reorder(self, rgb: np.ndarray) -> np.ndarray:
         return rgb[:, self.indices]
 
@@ -63,3 +87,40 @@ class OutputMode:
     def add_white_accurate(self, rgb: np.ndarray) -> np.ndarray:
         w = np.min(rgb, axis=1, keepdims=True)
         return np.concatenate([rgb - w, w], axis=1)
+
+
+class ConversionPlan:
+    """
+    Conversion of pixels of one shape to one channel order and white mode,
+    with the scratch space it needs, so running it allocates nothing.
+    """
+
+    def __init__(self, shape, indices, white_mode):
+        self.shape = tuple(shape)
+        self.indices = tuple(indices)
+        self.white_mode = white_mode
+        self.channels = WHITE_FUNCS_MAPPING[white_mode]["channels"]
+        self._white = None
+        self._channel = None
+        if white_mode in ("Brighter", "Accurate"):
+            self._white = np.empty(self.shape)
+        if white_mode == "Accurate":
+            self._channel = np.empty(self.shape)
+
+    def run(self, rgb: np.ndarray, out: np.ndarray):
+        white = self._white
+        if white is not None:
+            np.minimum(rgb[..., 0], rgb[..., 1], out=white)
+            np.minimum(white, rgb[..., 2], out=white)
+
+        for channel, index in enumerate(self.indices):
+            source = rgb[..., index]
+            if self._channel is not None:
+                source = np.subtract(source, white, out=self._channel)
+            np.copyto(out[..., channel], source, casting="unsafe")
+
+        if self.channels == 4:
+            if white is None:
+                out[..., 3] = 0
+            else:
+                np.copyto(out[..., 3], white, casting="unsafe")
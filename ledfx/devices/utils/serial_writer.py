@@ -0,0 +1,186 @@
+import logging
+import threading
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SerialWriter:
+    """
+    Writes a serial device's packets on its own thread, so a write that
+    takes longer than a frame at the configured baud rate cannot hold back
+    the virtuals rendering to the device.
+
+    Frames are encoded on the caller's thread into one of two preallocated
+    packets while the writer thread sends the other. The writer takes the
+    latest packet only once the previous write has completed, a frame
+    submitted while another is still waiting replaces it and is counted as
+    dropped, so the output runs at the rate the link can carry and never
+    falls behind. The packet still waiting when the writer stops is written
+    before it exits, so the last frame, such as the black frame flushed
+    when an effect is cleared, always reaches the device.
+    """
+
+    # weight of each new write in the average write time
+    LATENCY_SMOOTHING = 0.1
+    # seconds over which the throughput is measured
+    RATE_INTERVAL = 1.0
+
+    def __init__(self, name, write, encoder, on_error=None):
+        """
+        Args:
+            name: name of the device, for the thread name and logs
+            write: called on the writer thread with each packet, returning
+                once it has been written
+            encoder: provides new_packet() and encode_into(packet, data)
+            on_error: called on the writer thread with an exception raised
+                by write, instead of logging it
+        """
+        self.name = name
+        self._write = write
+        self._encoder = encoder
+        self._on_error = on_error
+        self._packets = [encoder.new_packet(), encoder.new_packet()]
+        self._condition = threading.Condition()
+        self._writing = None
+        self._pending = None
+        self._running = False
+        self._thread = None
+        self.submitted = 0
+        self.sent = 0
+        self.dropped = 0
+        self.errors = 0
+        self.bytes_sent = 0
+        self.last_write_ms = 0.0
+        self.avg_write_ms = 0.0
+        self.max_write_ms = 0.0
+        self.bytes_per_second = 0.0
+        self.fps = 0.0
+        self._rate_start = None
+        self._rate_frames = 0
+        self._rate_bytes = 0
+
+    @property
+    def running(self):
+        return self._running
+
+    def start(self):
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._rate_start = time.perf_counter()
+        self._thread = threading.Thread(
+            name=f"Serial: {self.name}", target=self._run, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout=1.0):
+        """Stops the writer once it has written any packet still waiting"""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+
+    def submit(self, data):
+        """Encodes a frame and hands it to the writer without waiting"""
+        with self._condition:
+            if self._pending is not None:
+                # take the waiting packet back and reuse it for this frame
+                index = self._pending
+                self._pending = None
+                self.dropped += 1
+            else:
+                index = 1 if self._writing == 0 else 0
+        # the writer only reads the other packet meanwhile
+        self._encoder.encode_into(self._packets[index], data)
+        with self._condition:
+            self._pending = index
+            self.submitted += 1
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._running and self._pending is None:
+                    self._condition.wait()
+                if self._pending is None:
+                    # stopped with nothing left to write
+                    return
+                index = self._writing = self._pending
+                self._pending = None
+
+            packet = self._packets[index]
+            start = time.perf_counter()
+            try:
+                self._write(packet)
+            except Exception as e:
+                self.errors += 1
+                if self._on_error is not None:
+                    self._on_error(e)
+                else:
+                    _LOGGER.warning(
+                        "Serial %s failed to write: %s", self.name, e
+                    )
+            else:
+                self._record(start, len(packet))
+            finally:
+                with self._condition:
+                    self._writing = None
+
+    def _record(self, start, size):
+        now = time.perf_counter()
+        write_ms = (now - start) * 1000.0
+        self.sent += 1
+        self.bytes_sent += size
+        self.last_write_ms = write_ms
+        self.max_write_ms = max(self.max_write_ms, write_ms)
+        if self.sent == 1:
+            self.avg_write_ms = write_ms
+        else:
+            self.avg_write_ms += self.LATENCY_SMOOTHING * (
+                write_ms - self.avg_write_ms
+            )
+
+        self._rate_frames += 1
+        self._rate_bytes += size
+        elapsed = now - self._rate_start
+        if elapsed >= self.RATE_INTERVAL:
+            self.fps = self._rate_frames / elapsed
+            self.bytes_per_second = self._rate_bytes / elapsed
+            self._rate_start = now
+            self._rate_frames = 0
+            self._rate_bytes = 0
+
+    def _rates(self):
+        """
+        Frames and bytes per second, measured over the window still open
+        once it has run past RATE_INTERVAL without a write to close it, so
+        the rates fall to zero after the writes stop
+        """
+        if self._rate_start is not None:
+            elapsed = time.perf_counter() - self._rate_start
+            if elapsed > self.RATE_INTERVAL:
+                return (
+                    self._rate_frames / elapsed,
+                    self._rate_bytes / elapsed,
+                )
+        return self.fps, self.bytes_per_second
+
+    def get_stats(self) -> dict:
+        fps, bytes_per_second = self._rates()
+        return {
+            "submitted": self.submitted,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "bytes_sent": self.bytes_sent,
+            "bytes_per_second": bytes_per_second,
+            "fps": fps,
+            "last_write_ms": self.last_write_ms,
+            "avg_write_ms": self.avg_write_ms,
+            "max_write_ms": self.max_write_ms,
+        }
@@ -0,0 +1,665 @@
+"""
+Loopback receivers that stand in for LED controllers, for load testing
+the device output paths without hardware.
+
+Each receiver decodes one protocol the way a controller would, checks the
+packets against the layout it was set up with, and keeps counters of
+frames, sequence gaps, reordering and end to end latency. A
+SimulatorFarm runs any number of them on the event loop. On Linux the
+whole of 127.0.0.0/8 is loopback, so the farm gives every receiver its
+own address and the protocol's usual port, and devices can be pointed at
+them exactly as at real controllers.
+
+Latency is measured with frame tags: the sender writes a counter into the
+first pixel with write_tag and calls Receiver.sent with it, and the
+receiver matches it when the frame completes.
+"""
+
+import asyncio
+import logging
+import struct
+import time
+
+import numpy as np
+
+_LOGGER = logging.getLogger(__name__)
+
+DDP_PORT = 4048
+E131_PORT = 5568
+ARTNET_PORT = 6454
+WLED_PORT = 21324
+OPENRGB_PORT = 6742
+
+# send times kept per receiver while waiting for their frame
+MAX_PENDING_TAGS = 1024
+
+
+def write_tag(pixels, tag):
+    """Writes a 24 bit frame tag into the first pixel of a frame"""
+    pixels[0, :3] = ((tag >> 16) & 0xFF, (tag >> 8) & 0xFF, tag & 0xFF)
+    return pixels
+
+
+def read_tag(channels):
+    return (
+        (int(channels[0]) << 16) | (int(channels[1]) << 8) | int(channels[2])
+    )
+
+
+class SequenceTracker:
+    """
+    Follows a wrapping sequence number, counting skipped numbers as gaps
+    and numbers from behind the latest as reordered.
+    """
+
+    def __init__(self, modulo):
+        self.modulo = modulo
+        self.last = None
+        self.gaps = 0
+        self.reordered = 0
+
+    def check(self, sequence):
+        if self.last is not None:
+            step = (sequence - self.last) % self.modulo
+            if step == 0 or step > self.modulo // 2:
+                self.reordered += 1
+                return
+            self.gaps += step - 1
+        self.last = sequence
+
+
+class Receiver(asyncio.DatagramProtocol):
+    """
+    Base of the simulated controllers: a frame buffer of the expected
+    number of channels, and the counters.
+
+    Subclasses implement handle(packet, now), writing channel data with
+    _write and calling _complete at the end of each frame.
+    """
+
+    PROTOCOL = ""
+    PORT = 0
+
+    def __init__(self, name, pixel_count, channels_per_pixel=3):
+        self.name = name
+        self.pixel_count = pixel_count
+        self.channels_per_pixel = channels_per_pixel
+        self.channel_count = pixel_count * channels_per_pixel
+        self.address = None
+        self.port = None
+        self.transport = None
+        self.on_frame = None
+        self._buffer = np.zeros(self.channel_count, dtype=np.uint8)
+        self._written = 0
+        self.last_frame = self._buffer.copy()
+        self._sent = {}
+        self._sequences = {}
+        self.packets = 0
+        self.bytes = 0
+        self.frames = 0
+        self.malformed = 0
+        self.layout_errors = 0
+        self.incomplete = 0
+        self.first_frame_at = None
+        self.last_frame_at = None
+        self.latency_count = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.address, self.port = transport.get_extra_info("sockname")[:2]
+
+    def datagram_received(self, data, addr):
+        self.receive(data, time.perf_counter())
+
+    def receive(self, packet, now):
+        self.packets += 1
+        self.bytes += len(packet)
+        try:
+            self.handle(memoryview(packet), now)
+        except (struct.error, ValueError, IndexError):
+            self.malformed += 1
+
+    def handle(self, packet, now):
+        raise NotImplementedError
+
+    def sent(self, tag, at=None):
+        """Records when the frame carrying tag was handed to the device"""
+        if len(self._sent) >= MAX_PENDING_TAGS:
+            # frames that never arrived
+            self._sent.pop(next(iter(self._sent)))
+        self._sent[tag] = time.perf_counter() if at is None else at
+
+    def _track(self, key, sequence, modulo):
+        tracker = self._sequences.get(key)
+        if tracker is None:
+            tracker = self._sequences[key] = SequenceTracker(modulo)
+        tracker.check(sequence)
+
+    def _write(self, start, data):
+        """Copies channel data into the frame, counting what is covered"""
+        end = start + len(data)
+        if start < 0 or end > self.channel_count:
+            self.layout_errors += 1
+            end = min(end, self.channel_count)
+            if start >= end:
+                return
+            data = data[: end - start]
+        self._buffer[start:end] = np.frombuffer(data, dtype=np.uint8)
+        self._written += end - start
+
+    def _complete(self, now, expect_full=True):
+        if expect_full and self._written != self.channel_count:
+            self.incomplete += 1
+        self._written = 0
+        self.frames += 1
+        if self.first_frame_at is None:
+            self.first_frame_at = now
+        self.last_frame_at = now
+        self.last_frame = self._buffer.copy()
+        if self._sent and self.channel_count >= 3:
+            sent_at = self._sent.pop(read_tag(self._buffer), None)
+            if sent_at is not None:
+                latency = now - sent_at
+                self.latency_count += 1
+                self.latency_total += latency
+                self.latency_max = max(self.latency_max, latency)
+        if self.on_frame is not None:
+            self.on_frame(self)
+
+    @property
+    def pixels(self):
+        """The last complete frame as (pixel_count, channels_per_pixel)"""
+        return self.last_frame.reshape(-1, self.channels_per_pixel)
+
+    @property
+    def fps(self):
+        if self.frames < 2 or self.last_frame_at == self.first_frame_at:
+            return 0.0
+        return (self.frames - 1) / (self.last_frame_at - self.first_frame_at)
+
+    def get_stats(self):
+        return {
+            "protocol": self.PROTOCOL,
+            "address": self.address,
+            "port": self.port,
+            "packets": self.packets,
+            "bytes": self.bytes,
+            "frames": self.frames,
+            "fps": round(self.fps, 2),
+            "malformed": self.malformed,
+            "layout_errors": self.layout_errors,
+            "incomplete": self.incomplete,
+            "gaps": sum(s.gaps for s in self._sequences.values()),
+            "reordered": sum(s.reordered for s in self._sequences.values()),
+            "latency_avg_ms": (
+                round(self.latency_total / self.latency_count * 1000, 3)
+                if self.latency_count
+                else None
+            ),
+            "latency_max_ms": round(self.latency_max * 1000, 3),
+        }
+
+    def close(self):
+        if self.transport is not None:
+            self.transport.close()
+            self.transport = None
+
+
+class DDPReceiver(Receiver):
+    """DDP, a frame ends with the packet carrying the push flag"""
+
+    PROTOCOL = "DDP"
+    PORT = DDP_PORT
+    HEADER = struct.Struct("!BBBBLH")
+    VERSION_MASK = 0xC0
+    VERSION_1 = 0x40
+    PUSH = 0x01
+
+    def handle(self, packet, now):
+        flags, sequence, _, _, offset, length = self.HEADER.unpack_from(packet)
+        if flags & self.VERSION_MASK != self.VERSION_1:
+            raise ValueError("not DDP version 1")
+        data = packet[self.HEADER.size :]
+        if len(data) != length:
+            self.layout_errors += 1
+        self._write(offset, data[:length])
+        if flags & self.PUSH:
+            sequence &= 0x0F
+            if sequence:
+                # LedFx counts 1 to 15, 0 means no sequence
+                self._track("push", sequence - 1, 15)
+            self._complete(now)
+
+
+class E131Receiver(Receiver):
+    """
+    E1.31 over consecutive universes, mapped as E131Device lays them out.
+    Without synchronisation a frame ends with its last universe, with it
+    the frame is shown when the sync packet arrives.
+    """
+
+    PROTOCOL = "E1.31"
+    PORT = E131_PORT
+    VECTOR_ROOT_DATA = 0x04
+    VECTOR_ROOT_EXTENDED = 0x08
+    VECTOR_FRAMING_SYNC = 0x01
+
+    def __init__(
+        self,
+        name,
+        pixel_count,
+        universe=1,
+        universe_size=510,
+        channel_offset=0,
+        sync_universe=None,
+    ):
+        super().__init__(name, pixel_count)
+        self.universe = universe
+        self.universe_size = universe_size
+        self.channel_offset = channel_offset
+        self.sync_universe = sync_universe
+        span = channel_offset + self.channel_count - 1
+        self.universe_end = universe + span // universe_size
+        self.synced_frames = 0
+
+    def handle(self, packet, now):
+        (root_vector,) = struct.unpack_from("!I", packet, 18)
+        (framing_vector,) = struct.unpack_from("!I", packet, 40)
+        if root_vector == self.VECTOR_ROOT_EXTENDED:
+            if framing_vector != self.VECTOR_FRAMING_SYNC:
+                # universe discovery
+                return
+            sequence, sync_address = struct.unpack_from("!BH", packet, 44)
+            if sync_address != self.sync_universe:
+                return
+            self._track("sync", sequence, 256)
+            self.synced_frames += 1
+            self._complete(now)
+            return
+        if root_vector != self.VECTOR_ROOT_DATA:
+            raise ValueError("not an E1.31 data packet")
+
+        sync_address, sequence, _, universe = struct.unpack_from(
+            "!HBBH", packet, 109
+        )
+        (count,) = struct.unpack_from("!H", packet, 123)
+        if packet[125] != 0:
+            # not DMX levels, such as a per address priority packet
+            return
+        if not self.universe <= universe <= self.universe_end:
+            self.layout_errors += 1
+            return
+        self._track(universe, sequence, 256)
+
+        data = packet[126 : 125 + count]
+        first = (universe - self.universe) * self.universe_size
+        low = max(first, self.channel_offset) - first
+        high = min(
+            first + self.universe_size,
+            self.channel_offset + self.channel_count,
+        )
+        self._write(
+            first + low - self.channel_offset, data[low : high - first]
+        )
+        if not sync_address and universe == self.universe_end:
+            self._complete(now)
+
+
+class ArtNetReceiver(Receiver):
+    """
+    Art-Net ArtDmx over consecutive universes of packet_size channels,
+    kept as raw DMX channels including any pre and post ambles. A frame
+    ends with its last universe, or with ArtSync when that is used.
+    """
+
+    PROTOCOL = "Art-Net"
+    PORT = ARTNET_PORT
+    ID = b"Art-Net\x00"
+    OP_DMX = 0x5000
+    OP_SYNC = 0x5200
+
+    def __init__(self, name, channel_count, universe=0, packet_size=510):
+        universes = -(-channel_count // packet_size)
+        super().__init__(name, universes * packet_size, channels_per_pixel=1)
+        self.universe = universe
+        self.packet_size = packet_size
+        self.universe_end = universe + universes - 1
+        self._synced = False
+
+    def handle(self, packet, now):
+        if bytes(packet[:8]) != self.ID:
+            raise ValueError("not Art-Net")
+        (opcode,) = struct.unpack_from("<H", packet, 8)
+        if opcode == self.OP_SYNC:
+            self._synced = True
+            self._complete(now)
+            return
+        if opcode != self.OP_DMX:
+            return
+        sequence, _, universe = struct.unpack_from("<BBH", packet, 12)
+        (length,) = struct.unpack_from("!H", packet, 16)
+        if not self.universe <= universe <= self.universe_end:
+            self.layout_errors += 1
+            return
+        if sequence:
+            # one sequence for all the universes, as LedFx sends them
+            self._track("dmx", sequence, 256)
+        data = packet[18 : 18 + length]
+        if len(data) < self.packet_size:
+            self.layout_errors += 1
+        self._write(
+            (universe - self.universe) * self.packet_size,
+            data[: self.packet_size],
+        )
+        if universe == self.universe_end and not self._synced:
+            self._complete(now)
+
+
+class WLEDReceiver(Receiver):
+    """
+    WLED UDP realtime. Like WLED, pixels keep their colour until written
+    again, so WARLS and partial DNRGB packets update part of the frame.
+    Every packet is a frame, except full length DNRGB chunks that stop
+    short of the end of the strip, which the next chunk continues.
+    """
+
+    PROTOCOL = "WLED"
+    PORT = WLED_PORT
+    WARLS = 1
+    DRGB = 2
+    DRGBW = 3
+    DNRGB = 4
+    DNRGB_CHUNK = 489
+
+    def __init__(self, name, pixel_count, rgbw=False):
+        super().__init__(name, pixel_count, 4 if rgbw else 3)
+        self.formats = {}
+
+    def handle(self, packet, now):
+        kind = packet[0]
+        self.formats[kind] = self.formats.get(kind, 0) + 1
+        width = self.channels_per_pixel
+        if kind == self.WARLS:
+            body = np.frombuffer(packet[2:], dtype=np.uint8).reshape(-1, 4)
+            if (body[:, 0] >= self.pixel_count).any():
+                self.layout_errors += 1
+                body = body[body[:, 0] < self.pixel_count]
+            pixels = self._buffer.reshape(-1, width)
+            pixels[body[:, 0], :3] = body[:, 1:]
+            self._complete(now, expect_full=False)
+        elif kind in (self.DRGB, self.DRGBW):
+            if (kind == self.DRGBW) != (width == 4):
+                self.layout_errors += 1
+                return
+            self._write(0, packet[2:])
+            self._complete(now, expect_full=False)
+        elif kind == self.DNRGB:
+            if width != 3:
+                self.layout_errors += 1
+                return
+            (start,) = struct.unpack_from("!H", packet, 2)
+            data = packet[4:]
+            self._write(start * 3, data)
+            end = start + len(data) // 3
+            if len(data) // 3 < self.DNRGB_CHUNK or end >= self.pixel_count:
+                self._complete(now, expect_full=False)
+        else:
+            raise ValueError(f"unknown WLED realtime protocol {kind}")
+
+
+class OpenRGBController(Receiver):
+    """One controller served by an OpenRGBServer, in direct mode"""
+
+    PROTOCOL = "OpenRGB"
+    PORT = OPENRGB_PORT
+
+    def __init__(self, name, pixel_count):
+        super().__init__(name, pixel_count, channels_per_pixel=4)
+
+    def handle(self, packet, now):
+        # RGBCONTROLLER_UPDATELEDS: size, count, then RGBx per pixel
+        (count,) = struct.unpack_from("<H", packet, 4)
+        if count != self.pixel_count:
+            self.layout_errors += 1
+        self._write(0, packet[6 : 6 + count * 4])
+        self._complete(now)
+
+    def controller_data(self, index, version):
+        from openrgb import utils
+
+        leds = [utils.LEDData(f"LED {i}", i) for i in range(self.pixel_count)]
+        data = utils.ControllerData(
+            name=self.name,
+            metadata=utils.MetaData(
+                "LedFx", "Simulated controller", "1", str(index), "loopback"
+            ),
+            device_type=utils.DeviceType.LEDSTRIP,
+            leds=leds,
+            zones=[
+                utils.ZoneData(
+                    "Strip",
+                    utils.ZoneType.LINEAR,
+                    self.pixel_count,
+                    self.pixel_count,
+                    self.pixel_count,
+                    0,
+                    0,
+                    segments=[],
+                )
+            ],
+            modes=[
+                utils.ModeData(
+                    0,
+                    "Direct",
+                    0,
+                    utils.ModeFlags.HAS_PER_LED_COLOR,
+                    None,
+                    None,
+                    None,
+                    None,
+                    None,
+                    None,
+                    None,
+                    None,
+                    None,
+                    utils.ModeColors.PER_LED,
+                    None,
+                )
+            ],
+            colors=[utils.RGBColor(0, 0, 0)] * self.pixel_count,
+            active_mode=0,
+        )
+        return data.pack(version)
+
+
+class OpenRGBServer(asyncio.Protocol):
+    """
+    The OpenRGB SDK server side, enough of it for openrgb-python to
+    connect and list the controllers, and to take their LED updates.
+    """
+
+    HEADER = struct.Struct("<4sIII")
+    MAGIC = b"ORGB"
+    PROTOCOL_VERSION = 3
+    REQUEST_CONTROLLER_COUNT = 0
+    REQUEST_CONTROLLER_DATA = 1
+    REQUEST_PROTOCOL_VERSION = 40
+    SET_CLIENT_NAME = 50
+    REQUEST_PROFILE_LIST = 150
+    UPDATE_LEDS = 1050
+
+    def __init__(self, controllers):
+        self.controllers = controllers
+        self.transport = None
+        self._stream = bytearray()
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data):
+        self._stream += data
+        now = time.perf_counter()
+        while len(self._stream) >= self.HEADER.size:
+            magic, index, kind, size = self.HEADER.unpack_from(self._stream)
+            if magic != self.MAGIC:
+                # lost framing, nothing later in the stream can be trusted
+                self.transport.close()
+                return
+            end = self.HEADER.size + size
+            if len(self._stream) < end:
+                return
+            body = bytes(self._stream[self.HEADER.size : end])
+            del self._stream[:end]
+            self._handle(index, kind, body, now)
+
+    def _reply(self, index, kind, body):
+        self.transport.write(
+            self.HEADER.pack(self.MAGIC, index, kind, len(body)) + body
+        )
+
+    def _handle(self, index, kind, body, now):
+        if kind == self.UPDATE_LEDS:
+            if index < len(self.controllers):
+                controller = self.controllers[index]
+                controller.packets += 1
+                controller.bytes += len(body) + self.HEADER.size
+                try:
+                    controller.handle(memoryview(body), now)
+                except (struct.error, ValueError):
+                    controller.malformed += 1
+        elif kind == self.REQUEST_PROTOCOL_VERSION:
+            self._reply(0, kind, struct.pack("<I", self.PROTOCOL_VERSION))
+        elif kind == self.REQUEST_CONTROLLER_COUNT:
+            self._reply(0, kind, struct.pack("<I", len(self.controllers)))
+        elif kind == self.REQUEST_CONTROLLER_DATA:
+            version = struct.unpack("<I", body)[0] if len(body) >= 4 else 0
+            version = min(version, self.PROTOCOL_VERSION)
+            if index < len(self.controllers):
+                self._reply(
+                    index,
+                    kind,
+                    self.controllers[index].controller_data(index, version),
+                )
+        elif kind == self.REQUEST_PROFILE_LIST:
+            self._reply(0, kind, struct.pack("<IH", 6, 0))
+
+
+class SimulatorFarm:
+    """
+    Runs simulated receivers on the loopback interface.
+
+    By default each receiver gets the next free 127.x.y.z address and its
+    protocol's standard port, as a rack of controllers would have. Pass
+    address="127.0.0.1", port=0 to share one address on ephemeral ports
+    instead, on systems where only 127.0.0.1 is configured.
+    """
+
+    def __init__(self, base_address="127.0.1.1"):
+        self._next_address = int.from_bytes(
+            bytes(int(part) for part in base_address.split(".")), "big"
+        )
+        self.receivers = {}
+        self._servers = []
+
+    def _allocate(self):
+        address = self._next_address
+        self._next_address += 1
+        return ".".join(str(b) for b in address.to_bytes(4, "big"))
+
+    async def add(self, receiver, address=None, port=None):
+        """Starts a UDP receiver and returns it"""
+        loop = asyncio.get_running_loop()
+        await loop.create_datagram_endpoint(
+            lambda: receiver,
+            local_addr=(
+                address or self._allocate(),
+                receiver.PORT if port is None else port,
+            ),
+        )
+        self.receivers[receiver.name] = receiver
+        return receiver
+
+    async def add_ddp(self, name, pixel_count, **kwargs):
+        return await self.add(DDPReceiver(name, pixel_count), **kwargs)
+
+    async def add_e131(
+        self, name, pixel_count, address=None, port=None, **layout
+    ):
+        return await self.add(
+            E131Receiver(name, pixel_count, **layout), address, port
+        )
+
+    async def add_artnet(
+        self, name, channel_count, address=None, port=None, **layout
+    ):
+        return await self.add(
+            ArtNetReceiver(name, channel_count, **layout), address, port
+        )
+
+    async def add_wled(self, name, pixel_count, rgbw=False, **kwargs):
+        return await self.add(WLEDReceiver(name, pixel_count, rgbw), **kwargs)
+
+    async def add_openrgb(self, pixel_counts, address=None, port=None):
+        """
+        Starts an OpenRGB SDK server with one controller per pixel count.
+
+        Returns:
+            The OpenRGBController receivers, in device index order
+        """
+        address = address or self._allocate()
+        controllers = [
+            OpenRGBController(f"openrgb {address} #{index}", pixel_count)
+            for index, pixel_count in enumerate(pixel_counts)
+        ]
+        loop = asyncio.get_running_loop()
+        server = await loop.create_server(
+            lambda: OpenRGBServer(controllers),
+            address,
+            OPENRGB_PORT if port is None else port,
+        )
+        bound_port = server.sockets[0].getsockname()[1]
+        for controller in controllers:
+            controller.address = address
+            controller.port = bound_port
+            self.receivers[controller.name] = controller
+        self._servers.append(server)
+        return controllers
+
+    def get_stats(self):
+        return {
+            name: receiver.get_stats()
+            for name, receiver in self.receivers.items()
+        }
+
+    def get_totals(self):
+        stats = self.get_stats().values()
+        totals = {
+            key: sum(s[key] for s in stats)
+            for key in (
+                "packets",
+                "bytes",
+                "frames",
+                "malformed",
+                "layout_errors",
+                "incomplete",
+                "gaps",
+                "reordered",
+            )
+        }
+        totals["receivers"] = len(stats)
+        latencies = [r for r in self.receivers.values() if r.latency_count]
+        totals["latency_max_ms"] = round(
+            max((r.latency_max for r in latencies), default=0) * 1000, 3
+        )
+        return totals
+
+    async def close(self):
+        for receiver in self.receivers.values():
+            receiver.close()
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self.receivers.clear()
+        self._servers.clear()
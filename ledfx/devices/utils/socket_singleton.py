@@ -1,5 +1,149 @@
+import ctypes
+import errno
+import logging
+import os
 import socket
-from threading import Lock
+import struct
+import sys
+from contextlib import contextmanager
+from threading import Lock, local
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+class _SockAddrIn(ctypes.Structure):
+    _fields_ = [
+        ("sin_family", ctypes.c_ushort),
+        ("sin_port", ctypes.c_uint16),
+        ("sin_addr", ctypes.c_ubyte * 4),
+        ("sin_zero", ctypes.c_ubyte * 8),
+    ]
+
+
+def _packed_layout(structure, fields, size=None):
+    """
+    struct.Struct packing the named fields of a ctypes structure at their
+    offsets, padded to size, the size of the structure by default
+    """
+    fmt = "@"
+    position = 0
+    for name, code in fields:
+        offset = getattr(structure, name).offset
+        fmt += f"{offset - position}x{code}"
+        position = offset + struct.calcsize("@" + code)
+    size = ctypes.sizeof(structure) if size is None else size
+    return struct.Struct(f"{fmt}{size - position}x")
+
+
+# the sendmmsg structures, packed with struct as filling in the ctypes
+# structures field by field costs more than the calls save
+_IOVEC = _packed_layout(_IOVec, [("iov_base", "P"), ("iov_len", "N")])
+_MMSGHDR = _packed_layout(
+    _MsgHdr,
+    [
+        ("msg_name", "P"),
+        ("msg_namelen", "I"),
+        ("msg_iov", "P"),
+        ("msg_iovlen", "N"),
+    ],
+    ctypes.sizeof(_MMsgHdr),
+)
+
+
+def _load_sendmmsg():
+    """sendmmsg from the C library on Linux, None elsewhere"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        sendmmsg = ctypes.CDLL(None, use_errno=True).sendmmsg
+    except (OSError, AttributeError):
+        return None
+    sendmmsg.argtypes = [
+        ctypes.c_int,
+        ctypes.c_void_p,
+        ctypes.c_uint,
+        ctypes.c_int,
+    ]
+    sendmmsg.restype = ctypes.c_int
+    return sendmmsg
+
+
+def _sockaddr(address):
+    """sockaddr_in of an (ip, port) address, None if it is not an IPv4 one"""
+    host, port = address
+    try:
+        packed = socket.inet_aton(host)
+    except (OSError, TypeError):
+        return None
+    if not 0 <= port <= 0xFFFF:
+        return None
+    sockaddr = _SockAddrIn()
+    sockaddr.sin_family = socket.AF_INET
+    sockaddr.sin_port = socket.htons(port)
+    sockaddr.sin_addr[:] = packed
+    return sockaddr
+
+
+class _MessageBatch:
+    """
+    sendmmsg headers for the datagrams of a batch. A virtual sends the
+    same sizes to the same destinations frame after frame, so the headers
+    are kept and only the data of each frame is copied in.
+    """
+
+    def __init__(self, sockaddrs, sizes):
+        count = len(sizes)
+        self.sizes = sizes
+        self.size = sum(sizes)
+        # the headers point to these
+        self._sockaddrs = sockaddrs
+        self._payload = ctypes.create_string_buffer(max(self.size, 1))
+        headers_size = count * _MMSGHDR.size
+        buffer = bytearray(headers_size + count * _IOVEC.size)
+        self._headers = (ctypes.c_char * len(buffer)).from_buffer(buffer)
+        self.address = ctypes.addressof(self._headers)
+
+        data = ctypes.addressof(self._payload)
+        for index, size in enumerate(sizes):
+            iovec = headers_size + index * _IOVEC.size
+            _IOVEC.pack_into(buffer, iovec, data, size)
+            _MMSGHDR.pack_into(
+                buffer,
+                index * _MMSGHDR.size,
+                ctypes.addressof(sockaddrs[index]),
+                ctypes.sizeof(_SockAddrIn),
+                self.address + iovec,
+                1,
+            )
+            data += size
+
+    def fill(self, datagrams):
+        """Copies in the data of the datagrams, False if it does not fit"""
+        payload = b"".join([data for data, _ in datagrams])
+        if len(payload) != self.size:
+            return False
+        ctypes.memmove(self._payload, payload, self.size)
+        return True
 
 
 class SocketSingleton:
@@ -75,3 +219,267 @@ class SocketSingleton:
 
     def settimeout(self, timeout):
         self.udp_server.settimeout(timeout)
+
+
+class UDPSender:
+    """
+    One UDP socket for the output of every networked device, instead of a
+    socket per device.
+
+    Datagrams are sent straight away, except while a batch is open on the
+    sending thread: a virtual opens one around each flush, so the packets
+    of all its devices are queued and go out together as the batch
+    closes. On Linux the datagrams of a batch are handed to the kernel in
+    one sendmmsg call instead of a sendto call each; elsewhere, or for
+    destinations that are not IPv4 addresses, they are sent one by one.
+
+    Send errors are tracked per destination rather than per device. A
+    destination is failing from its first error until a send to it
+    succeeds again, and the listeners are told when that changes, so
+    each device can go offline and come back without checking every
+    send itself.
+    """
+
+    # message batches kept for reuse, see _MessageBatch
+    MAX_MESSAGE_BATCHES = 64
+
+    def __init__(self, send_buffer=0):
+        """
+        Args:
+            send_buffer: socket send buffer size in bytes, 0 keeps the
+                system default
+        """
+        self.send_buffer = send_buffer
+        self._sock = None
+        self._lock = Lock()
+        self._local = local()
+        # sends from the virtual threads and the stats readers share these
+        self._destinations_lock = Lock()
+        self._destinations = {}
+        self._listeners = []
+        self._sendmmsg = _load_sendmmsg()
+        self._sockaddrs = {}
+        self._message_batches = {}
+        self._batch_lock = Lock()
+        self.send_calls = 0
+        self.batches = 0
+        self.max_batch = 0
+
+    def _socket(self):
+        with self._lock:
+            if self._sock is None:
+                self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                if self.send_buffer:
+                    self._sock.setsockopt(
+                        socket.SOL_SOCKET, socket.SO_SNDBUF, self.send_buffer
+                    )
+            return self._sock
+
+    def configure(self, send_buffer=0):
+        """Sets the send buffer size, applied to the socket straight away"""
+        self.send_buffer = send_buffer
+        with self._lock:
+            if self._sock is not None and send_buffer:
+                self._sock.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_SNDBUF, send_buffer
+                )
+
+    def add_listener(self, callback):
+        """
+        callback(address, error) is called when a destination starts
+        failing, with the error, and when it recovers, with None
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    @contextmanager
+    def batch(self):
+        """Queues the datagrams sent inside it on this thread"""
+        queue = getattr(self._local, "queue", None)
+        if queue is not None:
+            # already inside a batch on this thread, it sends everything
+            yield
+            return
+        self._local.queue = queue = []
+        try:
+            yield
+        finally:
+            self._local.queue = None
+            if queue:
+                self.batches += 1
+                self.max_batch = max(self.max_batch, len(queue))
+                self.send(queue)
+
+    def sendto(self, data, address):
+        """Sends or queues one datagram, errors are recorded not raised"""
+        queue = getattr(self._local, "queue", None)
+        if queue is not None:
+            # encoders reuse their buffers, keep a copy until it is sent
+            queue.append((bytes(data), address))
+        else:
+            self.send(((data, address),))
+
+    def send(self, datagrams):
+        """
+        Sends (data, address) datagrams now, returns the last error or
+        None if every send succeeded
+        """
+        sock = self._sock or self._socket()
+        if self._sendmmsg is not None and len(datagrams) > 1:
+            with self._batch_lock:
+                batch = self._message_batch(datagrams)
+                if batch is not None:
+                    errors = self._send_messages(sock, batch)
+            if batch is not None:
+                # recorded outside the lock, listeners may send
+                last_error = None
+                for index, (data, address) in enumerate(datagrams):
+                    error = errors.get(index)
+                    if error is not None:
+                        last_error = error
+                    self._record(address, len(data), error)
+                return last_error
+
+        last_error = None
+        for data, address in datagrams:
+            self.send_calls += 1
+            try:
+                sock.sendto(data, address)
+                error = None
+            except OSError as e:
+                error = last_error = e
+            self._record(address, len(data), error)
+        return last_error
+
+    def _message_batch(self, datagrams):
+        """
+        The message batch of the datagrams holding their data, or None if
+        they cannot go out with sendmmsg, as a destination is a hostname
+        """
+        key = tuple([address for _, address in datagrams])
+        sizes = [len(data) for data, _ in datagrams]
+        batch = self._message_batches.get(key)
+        if batch is None or batch.sizes != sizes:
+            sockaddrs = []
+            for address in key:
+                sockaddr = self._sockaddrs.get(address)
+                if sockaddr is None:
+                    sockaddr = _sockaddr(address)
+                    if sockaddr is None:
+                        return None
+                    self._sockaddrs[address] = sockaddr
+                sockaddrs.append(sockaddr)
+            if len(self._message_batches) >= self.MAX_MESSAGE_BATCHES:
+                self._message_batches.clear()
+            batch = _MessageBatch(sockaddrs, sizes)
+            self._message_batches[key] = batch
+        return batch if batch.fill(datagrams) else None
+
+    def _send_messages(self, sock, batch):
+        """
+        Sends a message batch in as few sendmmsg calls as errors allow,
+        returns the errors by datagram index
+        """
+        fd = sock.fileno()
+        count = len(batch.sizes)
+        errors = {}
+        start = 0
+        while start < count:
+            self.send_calls += 1
+            sent = self._sendmmsg(
+                fd, batch.address + start * _MMSGHDR.size, count - start, 0
+            )
+            if sent > 0:
+                start += sent
+                continue
+            error_number = ctypes.get_errno()
+            if error_number == errno.EINTR:
+                continue
+            # sendmmsg stops at the first datagram that fails, carry on
+            # with the ones after it
+            errors[start] = OSError(error_number, os.strerror(error_number))
+            start += 1
+        return errors
+
+    def _record(self, address, size, error):
+        with self._destinations_lock:
+            state = self._destinations.get(address)
+            if state is None:
+                state = self._destinations[address] = {
+                    "packets": 0,
+                    "bytes": 0,
+                    "errors": 0,
+                    "failing": None,
+                }
+            if error is None:
+                state["packets"] += 1
+                state["bytes"] += size
+                changed = state["failing"] is not None
+                state["failing"] = None
+            else:
+                state["errors"] += 1
+                changed = state["failing"] is None
+                if changed:
+                    state["failing"] = str(error)
+        # listeners are called outside the lock, they may read the stats
+        if changed:
+            self._notify(address, error)
+
+    def _notify(self, address, error):
+        for callback in list(self._listeners):
+            try:
+                callback(address, error)
+            except Exception as e:
+                _LOGGER.warning("UDP sender listener failed: %s", e)
+
+    def is_failing(self, address):
+        with self._destinations_lock:
+            state = self._destinations.get(address)
+            return state is not None and state["failing"] is not None
+
+    def destination_stats(self, address):
+        """Counters of one destination, or None if nothing was sent to it"""
+        with self._destinations_lock:
+            state = self._destinations.get(address)
+            return dict(state) if state is not None else None
+
+    def forget(self, address):
+        """Drops the counters of a destination no longer sent to"""
+        with self._destinations_lock:
+            self._destinations.pop(address, None)
+        self._sockaddrs.pop(address, None)
+
+    def close(self):
+        with self._lock:
+            if self._sock is not None:
+                self._sock.close()
+                self._sock = None
+
+    def get_stats(self):
+        with self._destinations_lock:
+            destinations = {
+                f"{address[0]}:{address[1]}": dict(state)
+                for address, state in self._destinations.items()
+            }
+        return {
+            "send_buffer": self.send_buffer,
+            "batches": self.batches,
+            "send_calls": self.send_calls,
+            "max_batch": self.max_batch,
+            "packets": sum(s["packets"] for s in destinations.values()),
+            "errors": sum(s["errors"] for s in destinations.values()),
+            "failing": sorted(
+                name
+                for name, state in destinations.items()
+                if state["failing"] is not None
+            ),
+            "destinations": destinations,
+        }
+
+
+# shared by all devices sending UDP, the send buffer is set from the core
+# config at startup
+udp_sender = UDPSender()
@@ -6,7 +6,7 @@ from ledfx.devices import NetworkedDevice
 from ledfx.devices.ddp import DDPDevice
 from ledfx.devices.e131 import E131Device
 from ledfx.devices.udp import UDPRealtimeDevice
-from ledfx.utils import WLED, wled_support_DDP
+from ledfx.utils import WLED, async_fire_and_forget, wled_support_DDP
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -52,6 +52,7 @@ class WLEDDevice(NetworkedDevice):
     def __init__(self, ledfx, config):
         super().__init__(ledfx, config)
         self.subdevice = None
+        self.wled = None
 
         # moved DEVICE_CONFIGS class var to device_configs instance var as it is manipulated in seperate instances
         # see https://github.com/LedFx/LedFx/pull/237
@@ -110,18 +111,29 @@ class WLEDDevice(NetworkedDevice):
         super().activate()
 
     def deactivate(self):
+        # frames are flushed through the subdevice
+        self._stop_output_worker()
         if self.subdevice is not None:
             self.subdevice.deactivate()
         super().deactivate()
 
     async def resolve_address(self, success_callback=None):
+        previous = self._destination
         await super().resolve_address(success_callback)
+        if self._destination != previous and self.wled is not None:
+            # the client was built on the address in use before
+            self.wled = WLED(self._destination)
         if self.subdevice is not None:
             self.subdevice._destination = self._destination
 
     def flush(self, data):
         self.subdevice.flush(data)
 
+    def sync_packets(self, data):
+        if self.subdevice is None:
+            return None
+        return self.subdevice.sync_packets(data)
+
     async def add_postamble(self):
         _LOGGER.debug("Doing post creation things for WLED...")
         if (
@@ -149,7 +161,36 @@ class WLEDDevice(NetworkedDevice):
         #     self.setup_subdevice()
         #     return
         self.wled = WLED(self._destination)
-        wled_config = await self.wled.get_config()
+
+        cached = self.cached_metadata().get("wled")
+        if cached is not None:
+            # start as the device was last seen, and check with it after
+            self._config.update(cached)
+            self.setup_subdevice()
+            async_fire_and_forget(self._warm_refresh(), loop=self._ledfx.loop)
+            return
+
+        # nothing cached to start on, fetch it from the confirmed address
+        await self.address_resolved()
+        await self.refresh_wled_config()
+
+    async def _warm_refresh(self):
+        """Checks the cached config with the device at its current address"""
+        await self.address_resolved()
+        await self.refresh_wled_config(warm=True)
+
+    async def refresh_wled_config(self, warm=False):
+        """
+        Fetches the LED setup from the device, applying any change since
+        a warm start on cached details
+        """
+        try:
+            wled_config = await self.wled.get_config()
+        except ValueError as e:
+            if not warm:
+                raise
+            _LOGGER.warning("%s: using cached WLED config, %s", self.name, e)
+            return
 
         led_info = wled_config["leds"]
         wled_name = wled_config["name"]
@@ -162,9 +203,14 @@ class WLEDDevice(NetworkedDevice):
             "pixel_count": wled_count,
             "rgbw_led": wled_rgbmode,
         }
+        self.cache_metadata(wled=wled_config)
 
-        self._config.update(wled_config)
-        self.setup_subdevice()
+        if not warm:
+            self._config.update(wled_config)
+            self.setup_subdevice()
+        elif any(self._config.get(k) != v for k, v in wled_config.items()):
+            _LOGGER.info("%s: WLED config changed since last start", self.name)
+            self.update_config(wled_config)
 
         # Currently *assuming* that this PR gets released in 0.13
         # https://github.com/Aircoookie/WLED/pull/1944
@@ -216,6 +216,150 @@ def fast_blur_array(array: NDArray, sigma: float) -> NDArray:
     return np.convolve(array, kernel, mode="same")
 
 
+@lru_cache(maxsize=32)
+def _gaussian_blur_matrix(sigma: float, length: int) -> NDArray:
+    """
+    Produces a banded (length, length) matrix that applies the
+    _gaussian_kernel1d blur, with the zero padding of np.convolve's "same"
+    mode, to a vector of the given length as a single matrix product.
+
+    Args:
+        sigma (float): The standard deviation of the Gaussian kernel.
+        length (int): The length of the vectors to be blurred.
+
+    Returns:
+        Read-only array of shape (length, length).
+    """
+    kernel = _gaussian_kernel1d(sigma, 0, length)
+    radius = len(kernel) // 2
+    offsets = np.subtract.outer(np.arange(length), np.arange(length)) + radius
+    in_band = (offsets >= 0) & (offsets < len(kernel))
+    matrix = np.where(
+        in_band, kernel[np.clip(offsets, 0, len(kernel) - 1)], 0.0
+    )
+    matrix.flags.writeable = False
+    return matrix
+
+
+class PixelBlur:
+    """
+    Gaussian blur for effect pixel arrays, keeping its work buffers between
+    frames.
+
+    Strips and matrix axes up to DENSE_MAX_LENGTH pixels are blurred with a
+    cached blur matrix, so every channel is done in one matrix product.
+    Longer strips fall back to convolving each channel with the cached
+    kernel, which is quicker there. Matrices are blurred separably along
+    their rows and columns instead of as one long line.
+    """
+
+    # Beyond this the dense blur matrix is slower than np.convolve
+    DENSE_MAX_LENGTH = 192
+
+    # Shorter matrix axes are blurred as a 1D strip instead
+    MIN_AXIS_LENGTH = 4
+
+    def __init__(self):
+        self._buffers = {}
+
+    def _work_buffer(self, name: str, shape: tuple) -> NDArray:
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = self._buffers[name] = np.empty(shape)
+        return buffer
+
+    def _blur_last_axis(self, planes: NDArray, sigma: float) -> NDArray:
+        """
+        Blurs every 1D plane along the last axis of planes with one
+        np.convolve call over the zero-padded planes laid end to end.
+
+        Returns:
+            ndarray: A view of the blurred planes, with the shape of planes.
+        """
+        length = planes.shape[-1]
+        kernel = _gaussian_kernel1d(sigma, 0, length)
+        radius = len(kernel) // 2
+        stride = length + 2 * radius
+
+        buffer = self._work_buffer("padded", planes.shape[:-1] + (stride,))
+        buffer[..., :radius] = 0
+        buffer[..., radius + length :] = 0
+        buffer[..., radius : radius + length] = planes
+
+        # In "valid" mode output i is centred on padded input i + radius,
+        # so plane p starts at p * stride and the gaps are skipped over
+        result = np.convolve(buffer.ravel(), kernel, mode="valid")
+        return np.lib.stride_tricks.as_strided(
+            result,
+            shape=(buffer.size // stride, length),
+            strides=(stride * result.itemsize, result.itemsize),
+            writeable=False,
+        ).reshape(planes.shape)
+
+    def _blur_matrix(
+        self, pixels: NDArray, sigma: float, rows: int, cols: int
+    ) -> None:
+        pixel_count, channels = pixels.shape
+        if rows > self.DENSE_MAX_LENGTH or cols > self.DENSE_MAX_LENGTH:
+            matrix = pixels.reshape(rows, cols, channels)
+            matrix = self._blur_last_axis(
+                matrix.transpose(0, 2, 1), sigma
+            ).transpose(0, 2, 1)
+            matrix = self._blur_last_axis(
+                matrix.transpose(1, 2, 0), sigma
+            ).transpose(2, 0, 1)
+            pixels[:] = matrix.reshape(pixel_count, channels)
+            return
+
+        # channel planar (channels, rows, cols), blur along rows then cols
+        planar = self._work_buffer("planar", (channels, rows, cols))
+        work = self._work_buffer("work", (channels, rows, cols))
+        planar[:] = pixels.T.reshape(channels, rows, cols)
+        np.matmul(
+            planar.reshape(channels * rows, cols),
+            _gaussian_blur_matrix(sigma, cols).T,
+            out=work.reshape(channels * rows, cols),
+        )
+        np.matmul(_gaussian_blur_matrix(sigma, rows), work, out=planar)
+        pixels[:] = planar.reshape(channels, pixel_count).T
+
+    def blur(self, pixels: NDArray, sigma: float, rows: int = 1) -> NDArray:
+        """
+        Blurs the pixels in place.
+
+        Args:
+            pixels (ndarray): (pixel_count, channels) array to blur
+            sigma (float): The standard deviation of the Gaussian kernel.
+            rows (int): Rows of the matrix laid out row-major in pixels. The
+                pixels are blurred as a strip if they do not make up a matrix
+                of at least MIN_AXIS_LENGTH pixels each way.
+
+        Returns:
+            ndarray: pixels
+        """
+        pixel_count = len(pixels)
+        cols = pixel_count // rows if rows > 0 else 0
+        if (
+            rows >= self.MIN_AXIS_LENGTH
+            and cols >= self.MIN_AXIS_LENGTH
+            and rows * cols == pixel_count
+        ):
+            self._blur_matrix(pixels, sigma, rows, cols)
+        elif pixel_count <= self.DENSE_MAX_LENGTH:
+            out = self._work_buffer("strip", pixels.shape)
+            np.matmul(
+                _gaussian_blur_matrix(sigma, pixel_count), pixels, out=out
+            )
+            pixels[:] = out
+        else:
+            kernel = _gaussian_kernel1d(sigma, 0, pixel_count)
+            for channel in range(pixels.shape[1]):
+                pixels[:, channel] = np.convolve(
+                    pixels[:, channel], kernel, mode="same"
+                )
+        return pixels
+
+
 def smooth(x, sigma):
     """
     Smooths a 1D array via a Gaussian filter.
@@ -270,6 +414,48 @@ def smooth(x, sigma):
     return y
 
 
+@lru_cache(maxsize=None)
+def _config_key_validators(effect_class) -> dict:
+    """
+    Compiled validator for each key of an effect type's full schema, so a
+    single changed key can be validated without the whole schema
+    """
+    return {
+        str(key): vol.Schema(validator)
+        for key, validator in effect_class.schema().schema.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def _config_updated_hooks(effect_class) -> tuple:
+    """
+    The config_updated implementations to call for an effect type, its
+    direct bases then itself, skipping classes that do not override it.
+    Each comes with the keys it does not read: the RENDER_KEYS of Effect
+    and of the class defining it.
+    """
+    valid_classes = list(effect_class.__bases__)
+    valid_classes.append(effect_class)
+    hooks = []
+    for base in valid_classes:
+        if not hasattr(base, "config_updated") or base.config_updated == (
+            getattr(super(base, base), "config_updated", None)
+        ):
+            continue
+        owner = next(
+            cls for cls in base.__mro__ if "config_updated" in vars(cls)
+        )
+        render_keys = frozenset(Effect.RENDER_KEYS).union(
+            vars(owner).get("RENDER_KEYS", ())
+        )
+        hooks.append((base.config_updated, render_keys))
+    return tuple(hooks)
+
+
+# Effect keys whose derived state is rebuilt when they change
+_BACKGROUND_KEYS = frozenset(("background_color", "background_brightness"))
+
+
 @BaseRegistry.no_registration
 class Effect(BaseRegistry):
     """
@@ -283,9 +469,16 @@ class Effect(BaseRegistry):
     ADVANCED_KEYS = ["diag"]
     # over ride in effect children to allow edit and show others
     PERMITTED_KEYS = None
+    # keys only read from the config while rendering, so queued updates
+    # that change nothing else skip the config_updated hooks. blur is
+    # not one, effects such as Energy derive state from it.
+    # set in effect children to the keys their own config_updated does
+    # not read, the hooks of their bases skip only the keys they declare
+    RENDER_KEYS = ["brightness", "diag"]
     _config = None
     _active = False
     _virtual = None
+    _pending_config = None
 
     # Basic effect properties that can be applied to all effects
     CONFIG_SCHEMA = vol.Schema(
@@ -333,10 +526,13 @@ class Effect(BaseRegistry):
         self._config = {}
         self.lock = threading.Lock()
         self.logsec = LogSecHelper(self)
+        self._blur = PixelBlur()
         self.passed = 0.0
         self._last_frame_time = timeit.default_timer()
         self.now = self._last_frame_time
         self.background_mode = "additive"
+        self._pending_lock = threading.Lock()
+        self._pending_config = {}
         self.update_config(config)
 
     def __del__(self):
@@ -395,6 +591,8 @@ class Effect(BaseRegistry):
 
     def update_config(self, config):
         with self.lock:
+            # updates still queued for the next frame were made first
+            config = {**self._take_pending_config(), **config}
             try:
                 validated_config = type(self).schema()(config)
             except vol.Invalid as err:
@@ -410,6 +608,98 @@ class Effect(BaseRegistry):
             else:
                 self._config = validated_config
 
+            self._update_derived_config()
+
+            # Iterate all the base classes and check to see if there is a custom
+            # implementation of config updates. If to notify the base class.
+            for config_updated, _ in _config_updated_hooks(type(self)):
+                config_updated(self, self._config)
+
+            _LOGGER.debug(
+                "Effect %s config updated to %s.", self.NAME, validated_config
+            )
+
+            if self._virtual:
+                self._ledfx.events.fire_event(
+                    EffectUpdatedEvent(self.id, self._virtual.id)
+                )
+
+    def queue_config_update(self, config):
+        """
+        Updates part of the config without revalidating the whole schema or
+        waiting on the render thread, for frequent changes such as a slider
+        being dragged.
+
+        Only the changed keys are validated. They are applied, along with
+        any other queued changes, when the next frame is rendered. Changes
+        to keys the cached validators do not know fall back to
+        update_config.
+
+        Raises:
+            vol.Invalid: a value is rejected, nothing is queued
+        """
+        validators = _config_key_validators(type(self))
+        if not self._config or not config.keys() <= validators.keys():
+            self.update_config(config)
+            return
+
+        try:
+            validated = {
+                key: validators[key](value) for key, value in config.items()
+            }
+        except vol.Invalid as err:
+            _LOGGER.warning(
+                "Error updating effect %s config: %s", self.NAME, err
+            )
+            raise
+
+        with self._pending_lock:
+            self._pending_config.update(validated)
+
+        if self._virtual:
+            self._ledfx.events.fire_event(
+                EffectUpdatedEvent(self.id, self._virtual.id)
+            )
+
+    @property
+    def config(self) -> dict:
+        """The config, including any queued updates"""
+        if self._pending_config:
+            with self._pending_lock:
+                return {**self._config, **self._pending_config}
+        return self._config
+
+    @config.setter
+    def config(self, _config):
+        BaseRegistry.config.fset(self, _config)
+
+    def _take_pending_config(self) -> dict:
+        with self._pending_lock:
+            pending = self._pending_config
+            self._pending_config = {}
+        return pending
+
+    def _apply_pending_config(self):
+        """Applies queued config updates, called with self.lock held"""
+        changed = {
+            key: value
+            for key, value in self._take_pending_config().items()
+            if self._config.get(key) != value
+        }
+        if not changed:
+            return
+        self._config = {**self._config, **changed}
+        self._update_derived_config(changed.keys())
+        for config_updated, render_keys in _config_updated_hooks(type(self)):
+            if not changed.keys() <= render_keys:
+                config_updated(self, self._config)
+
+    def _update_derived_config(self, keys=None):
+        """
+        Rebuilds the state the base effect derives from its config, only
+        for the given changed keys if any
+        """
+        if keys is None or not _BACKGROUND_KEYS.isdisjoint(keys):
             bg_color = parse_color(self._config["background_color"])
             # if bg color is black then flag we don't need to run at render time
             self.bg_color_use = bg_color != parse_color(LEDFX_COLORS["black"])
@@ -423,32 +713,10 @@ class Effect(BaseRegistry):
                 for c in bg_color
             )
 
-            self.flip = self._config["flip"]
-            self.mirror = self._config["mirror"]
-            self.brightness = self._config["brightness"]
-            self.logsec.diag = self._config.get("diag", False)
-
-            def inherited(cls, method):
-                if hasattr(cls, method) and hasattr(super(cls, cls), method):
-                    return cls.foo == super(cls).foo
-                return False
-
-            # Iterate all the base classes and check to see if there is a custom
-            # implementation of config updates. If to notify the base class.
-            valid_classes = list(type(self).__bases__)
-            valid_classes.append(type(self))
-            for base in valid_classes:
-                if base.config_updated != super(base, base).config_updated:
-                    base.config_updated(self, self._config)
-
-            _LOGGER.debug(
-                "Effect %s config updated to %s.", self.NAME, validated_config
-            )
-
-            if self._virtual:
-                self._ledfx.events.fire_event(
-                    EffectUpdatedEvent(self.id, self._virtual.id)
-                )
+        self.flip = self._config["flip"]
+        self.mirror = self._config["mirror"]
+        self.brightness = self._config["brightness"]
+        self.logsec.diag = self._config.get("diag", False)
 
     def config_updated(self, config):
         """
@@ -463,6 +731,8 @@ class Effect(BaseRegistry):
         with self.lock:
             # its possible we were waiting on the effect being deactivated
             if self._active:
+                if self._pending_config:
+                    self._apply_pending_config()
                 self.log_sec()
                 self.render()
                 self.try_log()
@@ -523,27 +793,14 @@ class Effect(BaseRegistry):
                     # If the configured blur is greater than 0 and pixel_count > 3, apply blur
                     # The matrix math requires > 3 pixels to work properly
                     # And blurring with a less than 3 pixels seems... redundant
+                    # Matrix virtuals are blurred in 2D using their rows
                     # TODO: Handle RGBW properly
                     if config["blur"] != 0.0 and self.pixel_count > 3:
-                        kernel = _gaussian_kernel1d(
-                            config["blur"], 0, len(pixels)
+                        self._blur.blur(
+                            pixels,
+                            config["blur"],
+                            rows=getattr(self._virtual, "rows", 1),
                         )
-
-                        # Blur the R,G,B portions of the pixel array
-                        # Lots of attempts at vectorisation/performance improvements here
-                        # This appears to be optimal from a readability/performance point of view
-                        # TODO: If we ever move to RGBW pixel arrays, uncomment the last line to operate on the W portion
-
-                        pixels[:, 0] = np.convolve(
-                            pixels[:, 0], kernel, mode="same"
-                        )  # R
-                        pixels[:, 1] = np.convolve(
-                            pixels[:, 1], kernel, mode="same"
-                        )  # G
-                        pixels[:, 2] = np.convolve(
-                            pixels[:, 2], kernel, mode="same"
-                        )  # B
-                        # pixels[:, 3] = np.convolve(pixels[:, 3], kernel, mode="same") # W
                 return pixels
 
     @property
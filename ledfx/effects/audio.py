@@ -3,7 +3,7 @@ import queue
 import threading
 import time
 from collections import deque
-from functools import cached_property, lru_cache
+from functools import cached_property, lru_cache, wraps
 
 import aubio
 import numpy as np
@@ -16,7 +16,12 @@ from ledfx.api.websocket import WEB_AUDIO_CLIENTS, WebAudioStream
 from ledfx.config import save_config
 from ledfx.effects import Effect
 from ledfx.effects.math import ExpFilter
-from ledfx.effects.melbank import FFT_SIZE, MIC_RATE, Melbanks
+from ledfx.effects.melbank import (
+    DEFAULT_AUDIO_SOURCE,
+    FFT_SIZE,
+    MIC_RATE,
+    Melbanks,
+)
 from ledfx.events import AudioDeviceChangeEvent, AudioSourceErrorEvent, Event
 from ledfx.sendspin import SENDSPIN_AVAILABLE
 from ledfx.sendspin.config import is_always_on as is_sendspin_always_on
@@ -30,6 +35,34 @@ MIN_MIDI = 21
 MAX_MIDI = 108
 
 
+@lru_cache(maxsize=64)
+def _interp_linspaces(input_length, size):
+    """Sample positions for interpolating a melbank slice to size"""
+    old = np.linspace(0, 1, input_length)
+    new = np.linspace(0, 1, size)
+    return (new, old)
+
+
+def _per_frame(method):
+    """
+    Caches the result of an analysis method on its source until the next
+    audio frame. The analysis feeds aubio and the beat history, so it runs
+    once per frame of each source however many effects ask for it.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def cached(self):
+        with self._frame_cache_lock:
+            try:
+                return self._frame_cache[name]
+            except KeyError:
+                result = self._frame_cache[name] = method(self)
+                return result
+
+    return cached
+
+
 class AudioInputSource:
     _audio_stream_active = False
     _audio = None
@@ -129,7 +162,7 @@ class AudioInputSource:
         """
         if not (hasattr(self, "_ledfx") and self._ledfx):
             return False
-        self._ledfx.config["audio"] = self._config
+        self._sync_config()
         try:
             save_config(
                 config=self._ledfx.config,
@@ -140,6 +173,20 @@ class AudioInputSource:
             _LOGGER.warning("Failed to persist audio config: %s", e)
             return False
 
+    def _sync_config(self):
+        """Write this source's config back into the central LedFx config"""
+        self._ledfx.config["audio"] = self._config
+
+    def _stream_is_active(self):
+        """Returns True if the audio stream feeding this source is running"""
+        return AudioInputSource._audio_stream_active
+
+    def _clear_device_tracking(self):
+        """Forget the last opened device so hotplug won't try to recover it"""
+        with AudioInputSource._class_lock:
+            AudioInputSource._last_device_name = None
+            AudioInputSource._last_active = None
+
     def _update_device_config(self, device_idx):
         """
         Update device index and name in both local and central configs.
@@ -563,9 +610,7 @@ class AudioInputSource:
         self._config["audio_device"] = default_idx
         self._config["audio_device_name"] = ""
         # Clear runtime tracking so hotplug won't try to recover the old device
-        with AudioInputSource._class_lock:
-            AudioInputSource._last_device_name = None
-            AudioInputSource._last_active = None
+        self._clear_device_tracking()
         self._persist_config()
 
     def update_config(self, config):
@@ -599,7 +644,7 @@ class AudioInputSource:
         else:
             old_config = None
 
-        if AudioInputSource._audio_stream_active:
+        if self._stream_is_active():
             if device_changing or pipeline_changing:
                 self.deactivate()
 
@@ -614,7 +659,7 @@ class AudioInputSource:
 
         # Activate outside the lock to avoid deadlock
         if len(self._callbacks) != 0 or self._should_always_keep_active():
-            if not AudioInputSource._audio_stream_active:
+            if not self._stream_is_active():
                 self.activate()
 
         # Check if device changed and fire event if needed
@@ -626,7 +671,7 @@ class AudioInputSource:
                     )
                 )
 
-        self._ledfx.config["audio"] = self._config
+        self._sync_config()
 
     def activate(self):
         # Re-entry guard - must be atomic with _class_lock so concurrent
@@ -642,6 +687,134 @@ class AudioInputSource:
             with AudioInputSource._class_lock:
                 AudioInputSource._activating = False
 
+    def _create_stream(self, device_idx, input_devices, hostapis):
+        """
+        Builds (but does not start) the input stream for a device, and the
+        resampler that downmixes it for analysis.
+
+        Args:
+            device_idx (int): index of the device in input_devices
+            input_devices (tuple): result of query_devices()
+            hostapis (tuple): result of query_hostapis()
+
+        Returns:
+            The unstarted stream object
+        """
+        device = input_devices[device_idx]
+        channels = None
+        if (
+            hostapis[device["hostapi"]]["name"] == "Windows WASAPI"
+            and "Loopback" in device["name"]
+        ):
+            _LOGGER.info(
+                "Loopback device detected: %s with %s channels",
+                device["name"],
+                device["max_input_channels"],
+            )
+        else:
+            # if are not a windows loopback device, we will downmix to mono
+            # issue seen with poor audio behaviour on Mac and Linux
+            # this is similar to the long standing prior implementation
+            channels = 1
+
+        if hostapis[device["hostapi"]]["name"] == "WEB AUDIO":
+            stream = WebAudioStream(
+                device["client"], self._audio_sample_callback
+            )
+        elif (
+            SENDSPIN_AVAILABLE
+            and hostapis[device["hostapi"]]["name"] == "SENDSPIN"
+        ):
+            from ledfx.sendspin.stream import SendspinAudioStream
+
+            _LOGGER.debug(
+                "Opening SendspinAudioStream for '%s'",
+                device["name"],
+            )
+            stream = SendspinAudioStream(
+                device["sendspin_config"],
+                self._audio_sample_callback,
+                instance_id=self._ledfx.config.get("instance_id", ""),
+                ledfx=self._ledfx,
+            )
+        else:
+            stream = self._audio.InputStream(
+                samplerate=int(device["default_samplerate"]),
+                device=device_idx,
+                callback=self._audio_sample_callback,
+                dtype=np.float32,
+                latency="low",
+                blocksize=int(
+                    device["default_samplerate"] / self._config["sample_rate"]
+                ),
+                # only pass channels if we set it to something other than None
+                **({"channels": channels} if channels is not None else {}),
+            )
+
+        self.resampler = samplerate.Resampler("sinc_fastest", channels=1)
+
+        _LOGGER.info(
+            "Audio source opened: %s: %s",
+            hostapis[device["hostapi"]]["name"],
+            device.get("name", device.get("client")),
+        )
+        return stream
+
+    def _setup_pipeline(self):
+        """
+        Builds the per-stream processing objects: pre-emphasis filter,
+        phase vocoder, empty frequency domain and the optional delay queue.
+        """
+        # Setup a pre-emphasis filter to balance the input volume of lows to highs
+        self.pre_emphasis = aubio.digital_filter(3)
+        # depending on the coeffs type, we need to use different pre_emphasis values to make em work better. allegedly.
+        selected_coeff = self._ledfx.config.get("melbanks", {}).get(
+            "coeffs_type", "matt_mel"
+        )
+        if selected_coeff == "matt_mel":
+            _LOGGER.debug("Using matt_mel settings for pre-emphasis.")
+            self.pre_emphasis.set_biquad(
+                0.8268, -1.6536, 0.8268, -1.6536, 0.6536
+            )
+        elif selected_coeff == "scott_mel":
+            _LOGGER.debug("Using scott_mel settings for pre-emphasis.")
+            self.pre_emphasis.set_biquad(
+                1.3662, -1.9256, 0.5621, -1.9256, 0.9283
+            )
+        else:
+            _LOGGER.debug("Using generic settings for pre-emphasis")
+            self.pre_emphasis.set_biquad(
+                0.85870, -1.71740, 0.85870, -1.71605, 0.71874
+            )
+
+        freq_domain_length = (self._config["fft_size"] // 2) + 1
+
+        self._raw_audio_sample = np.zeros(
+            MIC_RATE // self._config["sample_rate"],
+            dtype=np.float32,
+        )
+
+        # Setup the phase vocoder to perform a windowed FFT
+        self._phase_vocoder = aubio.pvoc(
+            self._config["fft_size"],
+            MIC_RATE // self._config["sample_rate"],
+        )
+        self._frequency_domain_null = aubio.cvec(self._config["fft_size"])
+        self._frequency_domain = self._frequency_domain_null
+        self._frequency_domain_x = np.linspace(
+            0,
+            MIC_RATE,
+            freq_domain_length,
+        )
+
+        samples_to_delay = int(
+            0.001 * self._config["delay_ms"] * self._config["sample_rate"]
+        )
+        if samples_to_delay:
+            self.delay_queue = queue.Queue(maxsize=samples_to_delay)
+        else:
+            self.delay_queue = None
+
     def _activate_inner(self):
 
         if self._audio is None:
@@ -745,55 +918,7 @@ class AudioInputSource:
                 )
             device_idx = default_device
 
-        # Setup a pre-emphasis filter to balance the input volume of lows to highs
-        self.pre_emphasis = aubio.digital_filter(3)
-        # depending on the coeffs type, we need to use different pre_emphasis values to make em work better. allegedly.
-        selected_coeff = self._ledfx.config.get("melbanks", {}).get(
-            "coeffs_type", "matt_mel"
-        )
-        if selected_coeff == "matt_mel":
-            _LOGGER.debug("Using matt_mel settings for pre-emphasis.")
-            self.pre_emphasis.set_biquad(
-                0.8268, -1.6536, 0.8268, -1.6536, 0.6536
-            )
-        elif selected_coeff == "scott_mel":
-            _LOGGER.debug("Using scott_mel settings for pre-emphasis.")
-            self.pre_emphasis.set_biquad(
-                1.3662, -1.9256, 0.5621, -1.9256, 0.9283
-            )
-        else:
-            _LOGGER.debug("Using generic settings for pre-emphasis")
-            self.pre_emphasis.set_biquad(
-                0.85870, -1.71740, 0.85870, -1.71605, 0.71874
-            )
-
-        freq_domain_length = (self._config["fft_size"] // 2) + 1
-
-        self._raw_audio_sample = np.zeros(
-            MIC_RATE // self._config["sample_rate"],
-            dtype=np.float32,
-        )
-
-        # Setup the phase vocoder to perform a windowed FFT
-        self._phase_vocoder = aubio.pvoc(
-            self._config["fft_size"],
-            MIC_RATE // self._config["sample_rate"],
-        )
-        self._frequency_domain_null = aubio.cvec(self._config["fft_size"])
-        self._frequency_domain = self._frequency_domain_null
-        self._frequency_domain_x = np.linspace(
-            0,
-            MIC_RATE,
-            freq_domain_length,
-        )
-
-        samples_to_delay = int(
-            0.001 * self._config["delay_ms"] * self._config["sample_rate"]
-        )
-        if samples_to_delay:
-            self.delay_queue = queue.Queue(maxsize=samples_to_delay)
-        else:
-            self.delay_queue = None
+        self._setup_pipeline()
 
         def update_device_tracking(device_idx):
             """
@@ -823,67 +948,13 @@ class AudioInputSource:
             - Starts the audio stream and sets the audio stream active flag to True.
             """
 
-            device = input_devices[device_idx]
-            channels = None
+            stream = self._create_stream(device_idx, input_devices, hostapis)
             if (
-                hostapis[device["hostapi"]]["name"] == "Windows WASAPI"
-                and "Loopback" in device["name"]
-            ):
-                _LOGGER.info(
-                    "Loopback device detected: %s with %s channels",
-                    device["name"],
-                    device["max_input_channels"],
-                )
-            else:
-                # if are not a windows loopback device, we will downmix to mono
-                # issue seen with poor audio behaviour on Mac and Linux
-                # this is similar to the long standing prior implementation
-                channels = 1
-
-            if hostapis[device["hostapi"]]["name"] == "WEB AUDIO":
-                ledfx.api.websocket.ACTIVE_AUDIO_STREAM = (
-                    AudioInputSource._stream
-                ) = WebAudioStream(
-                    device["client"], self._audio_sample_callback
-                )
-            elif (
-                SENDSPIN_AVAILABLE
-                and hostapis[device["hostapi"]]["name"] == "SENDSPIN"
+                hostapis[input_devices[device_idx]["hostapi"]]["name"]
+                == "WEB AUDIO"
             ):
-                from ledfx.sendspin.stream import SendspinAudioStream
-
-                _LOGGER.debug(
-                    "Opening SendspinAudioStream for '%s'",
-                    device["name"],
-                )
-                AudioInputSource._stream = SendspinAudioStream(
-                    device["sendspin_config"],
-                    self._audio_sample_callback,
-                    instance_id=self._ledfx.config.get("instance_id", ""),
-                    ledfx=self._ledfx,
-                )
-            else:
-                AudioInputSource._stream = self._audio.InputStream(
-                    samplerate=int(device["default_samplerate"]),
-                    device=device_idx,
-                    callback=self._audio_sample_callback,
-                    dtype=np.float32,
-                    latency="low",
-                    blocksize=int(
-                        device["default_samplerate"]
-                        / self._config["sample_rate"]
-                    ),
-                    # only pass channels if we set it to something other than None
-                    **({"channels": channels} if channels is not None else {}),
-                )
-
-            self.resampler = samplerate.Resampler("sinc_fastest", channels=1)
-
-            _LOGGER.info(
-                "Audio source opened: %s: %s",
-                hostapis[device["hostapi"]]["name"],
-                device.get("name", device.get("client")),
-            )
+                ledfx.api.websocket.ACTIVE_AUDIO_STREAM = stream
+            AudioInputSource._stream = stream
 
             AudioInputSource._stream.start()
             with AudioInputSource._class_lock:
@@ -1011,10 +1082,7 @@ class AudioInputSource:
     def subscribe(self, callback):
         """Registers a callback with the input source"""
         self._callbacks.append(callback)
-        if (
-            len(self._callbacks) > 0
-            and not AudioInputSource._audio_stream_active
-        ):
+        if len(self._callbacks) > 0 and not self._stream_is_active():
             self.activate()
         if self._timer is not None:
             self._timer.cancel()
@@ -1026,7 +1094,7 @@ class AudioInputSource:
             self._callbacks.remove(callback)
         if (
             len(self._callbacks) <= self._subscriber_threshold
-            and AudioInputSource._audio_stream_active
+            and self._stream_is_active()
         ):
             if self._timer is not None:
                 self._timer.cancel()
@@ -1042,7 +1110,7 @@ class AudioInputSource:
             return
         if (
             len(self._callbacks) <= self._subscriber_threshold
-            and AudioInputSource._audio_stream_active
+            and self._stream_is_active()
         ):
             self.deactivate()
 
@@ -1250,6 +1318,18 @@ class AudioAnalysisSource(AudioInputSource):
 
     def __init__(self, ledfx, config):
         config = self.CONFIG_SCHEMA(config)
+
+        # Per audio frame cache of melbank slices, shared by every effect
+        # subscribed to this source
+        self._melbank_cache = {}
+        self._melbank_cache_lock = threading.Lock()
+        self.melbank_cache_hits = 0
+        self.melbank_cache_misses = 0
+        # per audio frame results of the analysis methods, see _per_frame.
+        # Reentrant as bar_oscillator asks for bpm_beat_now
+        self._frame_cache = {}
+        self._frame_cache_lock = threading.RLock()
+
         super().__init__(ledfx, config)
         self.initialise_analysis()
 
@@ -1347,13 +1427,76 @@ class AudioAnalysisSource(AudioInputSource):
         """Invalidates the cache for all melbank related data"""
         super()._invalidate_caches()
 
-        self.pitch.cache_clear()
-        self.onset.cache_clear()
-        self.bpm_beat_now.cache_clear()
-        self.volume_beat_now.cache_clear()
-        self.bar_oscillator.cache_clear()
+        with self._frame_cache_lock:
+            self._frame_cache.clear()
+        with self._melbank_cache_lock:
+            self._melbank_cache.clear()
 
-    @lru_cache(maxsize=None)
+    def melbank_slice(
+        self, melbank_idx, min_idx, max_idx, size=0, filtered=False
+    ):
+        """
+        Returns a section of one of the melbanks, optionally interpolated
+        to a new size. Results are cached until the next audio frame and
+        shared between all effects asking for the same section, so they
+        are returned read-only.
+
+        melbank_idx, int : index of the melbank to slice
+        min_idx, int     : first melbank bin of the section
+        max_idx, int     : end (exclusive) melbank bin of the section
+        size, int        : interpolate to the target size. 0 is no interpolation
+        filtered, bool   : melbank with smoothed attack and decay
+        """
+        key = (melbank_idx, min_idx, max_idx, size, filtered)
+        with self._melbank_cache_lock:
+            result = self._melbank_cache.get(key)
+            if result is not None:
+                self.melbank_cache_hits += 1
+                return result
+            self.melbank_cache_misses += 1
+
+        if filtered:
+            melbank = self.melbanks.melbanks_filtered[melbank_idx]
+        else:
+            melbank = self.melbanks.melbanks[melbank_idx]
+        melbank = melbank[min_idx:max_idx]
+
+        # Check for NaN values in the melbank array, replace with 0 in place
+        # Difficult to determine why this happens, but it seems to be related to
+        # the audio input device.
+        # TODO: Investigate why NaNs are present in the melbank array for some people/devices
+        if np.isnan(melbank).any():
+            _LOGGER.warning(
+                "NaN values detected in the melbank array and replaced with 0."
+            )
+            np.nan_to_num(melbank, copy=False)
+
+        input_length = max(len(melbank), 1)
+        if size and input_length != size:
+            result = np.interp(*_interp_linspaces(input_length, size), melbank)
+        else:
+            # slicing returns a view, so the read-only flag below
+            # leaves the melbank itself writeable
+            result = melbank[:]
+        result.flags.writeable = False
+
+        with self._melbank_cache_lock:
+            self._melbank_cache[key] = result
+        return result
+
+    def melbank_cache_stats(self):
+        """Returns the shared melbank cache hit and miss counters"""
+        with self._melbank_cache_lock:
+            hits = self.melbank_cache_hits
+            misses = self.melbank_cache_misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 3) if total else 0.0,
+        }
+
+    @_per_frame
     def pitch(self):
         # If our audio handler is returning null, then we just return 0 for midi_value and wait for the device starts sending audio.
         try:
@@ -1362,7 +1505,7 @@ class AudioAnalysisSource(AudioInputSource):
             _LOGGER.warning("%s", e)
             return 0
 
-    @lru_cache(maxsize=None)
+    @_per_frame
     def onset(self):
         try:
             return bool(self._onset(self.audio_sample(raw=True))[0])
@@ -1370,7 +1513,7 @@ class AudioAnalysisSource(AudioInputSource):
             _LOGGER.warning("%s", e)
             return 0
 
-    @lru_cache(maxsize=None)
+    @_per_frame
     def bpm_beat_now(self):
         """
         Returns True if a beat is expected now based on BPM data
@@ -1381,7 +1524,7 @@ class AudioAnalysisSource(AudioInputSource):
             _LOGGER.warning("%s", e)
             return False
 
-    @lru_cache(maxsize=None)
+    @_per_frame
     def volume_beat_now(self):
         """
         Returns True if a beat is expected now based on volume of the beat freq region
@@ -1479,7 +1622,7 @@ class AudioAnalysisSource(AudioInputSource):
         """
         return self.get_freq_power(3, filtered)
 
-    @lru_cache(maxsize=None)
+    @_per_frame
     def bar_oscillator(self):
         """
         Returns a float (0<=x<4) corresponding to the position of the beat
@@ -1530,6 +1673,266 @@ class AudioAnalysisSource(AudioInputSource):
         return self.bar_oscillator() % 1
 
 
+class NamedAudioAnalysisSource(AudioAnalysisSource):
+    """
+    An additional, independently configured audio analysis source.
+
+    The default source (ledfx.audio) keeps its stream state at class level so
+    that it survives being re-created and can follow hotplug events. A named
+    source owns its stream, analysis pipeline and melbanks per instance, so
+    several can run side by side. Each stream delivers audio on its own
+    callback thread, so one source never waits on another.
+    """
+
+    def __init__(self, ledfx, name, config):
+        self.name = name
+        self._stream = None
+        self._named_stream_active = False
+        # the volume filter is class level on the default source
+        self._volume_filter = ExpFilter(-90, alpha_decay=0.99, alpha_rise=0.99)
+        super().__init__(ledfx, config)
+
+    @staticmethod
+    def validate_config(config):
+        """Validates a named source config against the audio and analysis schemas"""
+        config = AudioInputSource.AUDIO_CONFIG_SCHEMA.fget()(config)
+        return AudioAnalysisSource.CONFIG_SCHEMA(config)
+
+    def _sync_config(self):
+        self._ledfx.config.setdefault("audio_sources", {})[
+            self.name
+        ] = self._config
+
+    def _stream_is_active(self):
+        return self._named_stream_active
+
+    def _clear_device_tracking(self):
+        # named sources are not tracked for hotplug recovery
+        pass
+
+    def _should_always_keep_active(self):
+        # sendspin always-on only applies to the default source
+        return False
+
+    def activate(self):
+        with self.lock:
+            if self._named_stream_active:
+                return
+
+            input_devices = self.query_devices()
+            hostapis = self.query_hostapis()
+            device_idx = self._config["audio_device"]
+
+            if device_idx not in self.valid_device_indexes():
+                _LOGGER.warning(
+                    "Audio source '%s': device [%s] is not available.",
+                    self.name,
+                    device_idx,
+                )
+                return
+            if (
+                hostapis[input_devices[device_idx]["hostapi"]]["name"]
+                == "WEB AUDIO"
+            ):
+                _LOGGER.warning(
+                    "Audio source '%s': web audio clients can only feed the default audio source.",
+                    self.name,
+                )
+                return
+
+            self._audio = sd
+            self._setup_pipeline()
+            try:
+                stream = self._create_stream(
+                    device_idx, input_devices, hostapis
+                )
+                stream.start()
+            except (sd.PortAudioError, OSError) as err:
+                _LOGGER.warning(
+                    "Audio source '%s': device [%s] failed: %s",
+                    self.name,
+                    device_idx,
+                    err,
+                )
+                return
+
+            self._stream = stream
+            self._named_stream_active = True
+
+    def deactivate(self):
+        # Stop the stream outside the lock, see AudioInputSource.deactivate
+        with self.lock:
+            stream_to_close = self._stream
+            self._stream = None
+            self._named_stream_active = False
+
+        if stream_to_close:
+            stream_to_close.stop()
+            stream_to_close.close()
+            _LOGGER.info("Audio source '%s' closed.", self.name)
+
+
+class AudioSources:
+    """
+    Registry of the audio analysis sources that virtuals can bind to.
+
+    "default" always refers to the global ledfx.audio source. Any other name
+    refers to an entry in the core "audio_sources" config, and is created on
+    first use. All effects bound to the same source share its melbanks and
+    analysis, which are computed once per audio frame.
+    """
+
+    def __init__(self, ledfx):
+        self._ledfx = ledfx
+        self._sources = {}
+        self._suspended = []
+        self._lock = threading.Lock()
+
+    @property
+    def configs(self):
+        return self._ledfx.config.setdefault("audio_sources", {})
+
+    @property
+    def names(self):
+        return [DEFAULT_AUDIO_SOURCE, *self.configs.keys()]
+
+    def default(self):
+        """Returns the default audio source, creating it if needed"""
+        if not self._ledfx.audio or id(AudioAnalysisSource) != id(
+            self._ledfx.audio.__class__
+        ):
+            self._ledfx.audio = AudioAnalysisSource(
+                self._ledfx, self._ledfx.config.get("audio", {})
+            )
+        return self._ledfx.audio
+
+    def get(self, name=DEFAULT_AUDIO_SOURCE):
+        """
+        Returns the audio source with the given name. Unknown names fall
+        back to the default source.
+        """
+        if name in (None, "", DEFAULT_AUDIO_SOURCE):
+            return self.default()
+        if name not in self.configs:
+            _LOGGER.warning(
+                "Audio source '%s' is not configured, using the default source.",
+                name,
+            )
+            return self.default()
+
+        with self._lock:
+            source = self._sources.get(name)
+            if source is None:
+                source = NamedAudioAnalysisSource(
+                    self._ledfx, name, self.configs[name]
+                )
+                self._sources[name] = source
+        return source
+
+    def update_source(self, name, config):
+        """
+        Creates or updates a named audio source config. A running source
+        is reconfigured in place.
+
+        Raises:
+            ValueError: if name is the default source
+            vol.Invalid: if the config is invalid
+        """
+        if name in (None, "", DEFAULT_AUDIO_SOURCE):
+            raise ValueError(
+                "The default audio source is configured through 'audio'"
+            )
+        config = {**self.configs.get(name, {}), **config}
+        if "audio_device" in config:
+            config["audio_device_name"] = AudioInputSource.input_devices().get(
+                config["audio_device"], ""
+            )
+        config = NamedAudioAnalysisSource.validate_config(config)
+
+        with self._lock:
+            source = self._sources.get(name)
+        if source is not None:
+            source.update_config(config)
+        else:
+            self.configs[name] = config
+
+    def remove_source(self, name):
+        """
+        Removes a named audio source. Virtuals bound to it fall back to the
+        default source.
+        """
+        if name not in self.configs:
+            raise KeyError(f"Audio source '{name}' does not exist")
+        del self.configs[name]
+        with self._lock:
+            source = self._sources.pop(name, None)
+        if source is not None:
+            source.deactivate()
+
+        for virtual in self._ledfx.virtuals.values():
+            if virtual.audio_source == name and isinstance(
+                virtual.active_effect, AudioReactiveEffect
+            ):
+                with virtual.lock:
+                    virtual._reactivate_effect()
+
+    def update_melbanks(self, config):
+        """Applies a melbanks config change to every running named source"""
+        with self._lock:
+            sources = list(self._sources.values())
+        for source in sources:
+            source.melbanks.update_config(config)
+
+    def suspend(self):
+        """
+        Closes the streams of all running named sources, ahead of a
+        PortAudio device list refresh
+        """
+        with self._lock:
+            sources = list(self._sources.values())
+        self._suspended = [
+            source for source in sources if source._stream_is_active()
+        ]
+        for source in self._suspended:
+            source.deactivate()
+
+    def resume(self):
+        """
+        Re-resolves the devices of sources closed by suspend() and reopens
+        their streams
+        """
+        suspended, self._suspended = self._suspended, []
+        for source in suspended:
+            source._resolve_device_from_name()
+            source.activate()
+
+    def get_stats(self):
+        """Returns a summary of every configured source"""
+        stats = {}
+        for name in self.names:
+            if name == DEFAULT_AUDIO_SOURCE:
+                source = self._ledfx.audio
+                config = self._ledfx.config.get("audio", {})
+            else:
+                with self._lock:
+                    source = self._sources.get(name)
+                config = self.configs[name]
+            stats[name] = {
+                "audio_device": config.get("audio_device"),
+                "audio_device_name": config.get("audio_device_name", ""),
+                "active": bool(source and source._stream_is_active()),
+                "subscribers": (
+                    len(source._callbacks) - source._subscriber_threshold
+                    if source
+                    else 0
+                ),
+                "melbank_cache": (
+                    source.melbank_cache_stats() if source else None
+                ),
+            }
+        return stats
+
+
 @Effect.no_registration
 class AudioReactiveEffect(Effect):
     """
@@ -1557,15 +1960,13 @@ class AudioReactiveEffect(Effect):
         _LOGGER.info("Activating AudioReactiveEffect.")
         super().activate(channel)
 
-        if not self._ledfx.audio or id(AudioAnalysisSource) != id(
-            self._ledfx.audio.__class__
-        ):
-            self._ledfx.audio = AudioAnalysisSource(
-                self._ledfx, self._ledfx.config.get("audio", {})
-            )
-
-        self.audio = self._ledfx.audio
-        self._ledfx.audio.subscribe(self._audio_data_updated)
+        audio_sources = getattr(self._ledfx, "audio_sources", None)
+        if audio_sources is None:
+            audio_sources = AudioSources(self._ledfx)
+        self.audio = audio_sources.get(
+            getattr(channel, "audio_source", DEFAULT_AUDIO_SOURCE)
+        )
+        self.audio.subscribe(self._audio_data_updated)
 
     def deactivate(self):
         _LOGGER.info("Deactivating AudioReactiveEffect.")
@@ -1609,13 +2010,10 @@ class AudioReactiveEffect(Effect):
             "_selected_melbank",
             "_melbank_min_idx",
             "_melbank_max_idx",
-            "_input_mel_length",
         ]:
             if hasattr(self, prop):
                 delattr(self, prop)
 
-        self._melbank_interp_linspaces.cache_clear()
-
     @cached_property
     def _selected_melbank(self):
         return next(
@@ -1665,38 +2063,6 @@ class AudioReactiveEffect(Effect):
         # Ensure max_idx is always at least min_idx + 1 to prevent empty slices
         return max(max_idx, self._melbank_min_idx + 1)
 
-    @cached_property
-    def _input_mel_length(self):
-        length = self._melbank_max_idx - self._melbank_min_idx
-        # Ensure we have at least 1 frequency bin to avoid crashes
-        if length < 1:
-            _LOGGER.warning(
-                "Frequency range %s-%sHz resulted in %s melbank bins. Adjusting to minimum of 1 bin. Consider using a wider frequency range.",
-                self._virtual.frequency_range.min,
-                self._virtual.frequency_range.max,
-                length,
-            )
-            return 1
-        return length
-
-    @lru_cache(maxsize=16)
-    def _melbank_interp_linspaces(self, size):
-        old = np.linspace(0, 1, self._input_mel_length)
-        new = np.linspace(0, 1, size)
-        return (new, old)
-
-    def melbank_no_nan(self, melbank):
-        # Check for NaN values in the melbank array, replace with 0 in place
-        # Difficult to determine why this happens, but it seems to be related to
-        # the audio input device.
-        # TODO: Investigate why NaNs are present in the melbank array for some people/devices
-        if np.isnan(melbank).any():
-            _LOGGER.warning(
-                "NaN values detected in the melbank array and replaced with 0."
-            )
-            # Replace NaN values with 0
-            np.nan_to_num(melbank, copy=False)
-
     @lru_cache(maxsize=None)
     def melbank(self, filtered=False, size=0):
         """
@@ -1704,24 +2070,19 @@ class AudioReactiveEffect(Effect):
         virtual (which controls the audio frequency range), and uses that
         to deliver the melbank, correctly selected and interpolated, to the effect
 
+        The result is shared with every other effect on the same audio source
+        and frequency range, so it is read-only
+
         size, int      : interpolate the melbank to the target size. value of 0 is no interpolation
         filtered, bool : melbank with smoothed attack and decay
         """
-        if filtered:
-            melbank = self.audio.melbanks.melbanks_filtered[
-                self._selected_melbank
-            ][self._melbank_min_idx : self._melbank_max_idx]
-        else:
-            melbank = self.audio.melbanks.melbanks[self._selected_melbank][
-                self._melbank_min_idx : self._melbank_max_idx
-            ]
-
-        self.melbank_no_nan(melbank)
-
-        if size and (self._input_mel_length != size):
-            return np.interp(*self._melbank_interp_linspaces(size), melbank)
-        else:
-            return melbank
+        return self.audio.melbank_slice(
+            self._selected_melbank,
+            self._melbank_min_idx,
+            self._melbank_max_idx,
+            size=size,
+            filtered=filtered,
+        )
 
     def melbank_thirds(self, **kwargs):
         """
@@ -2,81 +2,33 @@ import logging
 
 import numpy as np
 import voluptuous as vol
-from PIL import Image, ImageOps
 
 from ledfx.effects.audio import AudioReactiveEffect
+from ledfx.effects.utils.stretch import stretch_full, stretch_tile
 
 _LOGGER = logging.getLogger(__name__)
 
-# 1d horizontal stetch
-
-
-class BlendVirtual:
-    def __init__(self, virtual_id, _virtuals, fallback_shape):
-        self.target_rows = fallback_shape[0]
-        self.target_columns = fallback_shape[1]
-        # Try protection against virtual not being found is left to the caller
-
-        virtual = _virtuals.get(virtual_id)
-        self.rows = virtual.config["rows"]
-        self.columns = int(virtual.pixel_count / self.rows)
-        self.matching = (
-            self.rows == fallback_shape[0]
-            and self.columns == fallback_shape[1]
-        )
-        # Store reference to active_effect to avoid race condition where effect
-        # is deactivated between hasattr check and get_matrix() call
-        active_effect = virtual.active_effect
-        if active_effect and hasattr(active_effect, "matrix"):
-            self.matrix = active_effect.get_matrix()
-        else:
-            # Reshape the 1D pixel array into (height, width, 3) for RGB
-            reshaped_pixels = virtual.assembled_frame.reshape(
-                (self.rows, self.columns, 3)
-            )
-            # Convert the numpy array back into a Pillow image
-            self.matrix = Image.fromarray(
-                reshaped_pixels.astype(np.uint8), "RGB"
-            )
+# ITU-R 601-2 luma, as used by PIL when converting to "L"
+LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114])
 
 
-def stretch_2d_full(blend_virtual):
-    if blend_virtual.matching:
-        return blend_virtual.matrix
-
-    # use pillow to strect blend_virtual.matrix to blend_virtual.target_rows, blend_virtual.target_columns
-    resized = blend_virtual.matrix.resize(
-        (blend_virtual.target_columns, blend_virtual.target_rows)
-    )
-    return resized
+def stretch_2d_full(frame, rows, columns):
+    if frame.shape[:2] == (rows, columns):
+        return frame
+    return stretch_full(frame, rows, columns)
 
 
-def stretch_2d_tile(blend_virtual):
-    if blend_virtual.matching:
-        return blend_virtual.matrix
-
-    # Get the source image dimensions
-    src_width, src_height = blend_virtual.matrix.size
-
-    # Create a new image with the target dimensions
-    target_image = Image.new(
-        "RGB", (blend_virtual.target_columns, blend_virtual.target_rows)
-    )
+def stretch_2d_tile(frame, rows, columns):
+    if frame.shape[:2] == (rows, columns):
+        return frame
+    return stretch_tile(frame, rows, columns)
 
-    # Tile the source image to fill the new image
-    for i in range(0, blend_virtual.target_columns, src_width):
-        for j in range(0, blend_virtual.target_rows, src_height):
-            # Paste the source image at the current position
-            target_image.paste(blend_virtual.matrix, (i, j))
 
-    return target_image
-
-
-def stretch_1d_vertical(blend_virtual):
+def stretch_1d_vertical(frame, rows, columns):
     _LOGGER.warning("Stretch 1d vertical not implemented")
 
 
-def stretch_1d_horizontal(blend_virtual):
+def stretch_1d_horizontal(frame, rows, columns):
     _LOGGER.warning("Stretch 1d horizontal not implemented")
 
 
@@ -143,6 +95,8 @@ class Blender(AudioReactiveEffect):
         self.rows = self._virtual.config["rows"]
         self.columns = int(self.pixel_count / self.rows)
         self.pixels_shape = np.shape(self.pixels)
+        self._blend = None
+        self._blend_versions = None
 
     def config_updated(self, config):
         # TODO: Ensure virtual names are mangled the same as during virtual creation,
@@ -162,53 +116,60 @@ class Blender(AudioReactiveEffect):
         self.background_stretch_func = STRETCH_FUNCS_MAPPING[
             self._config["background_stretch"]
         ]
+        self._blend_versions = None
 
     def audio_data_updated(self, data):
         pass
 
-    def render(self):
-        try:
-            # if we are in race condition start up scenarios, all sorts of odd things can happen
-            # don't try to fake it, just skip this render frame until things settle down
-            blend_mask = BlendVirtual(
-                self.mask,
-                self._ledfx.virtuals._virtuals,
-                (self.rows, self.columns),
-            )
-            blend_fore = BlendVirtual(
-                self.foreground,
-                self._ledfx.virtuals._virtuals,
-                (self.rows, self.columns),
-            )
-            blend_back = BlendVirtual(
-                self.background,
-                self._ledfx.virtuals._virtuals,
-                (self.rows, self.columns),
-            )
-        except Exception as e:
-            _LOGGER.warning(
-                "Virtual %s Blender virtuals not ready %s",
-                self._virtual.name,
-                e,
-            )
-            return
-
-        mask_image = self.mask_stretch_func(blend_mask).convert("L")
-        fore_image = self.foreground_stretch_func(blend_fore)
-        back_image = self.background_stretch_func(blend_back)
-
+    def blend(self, mask, fore, back):
+        """
+        Composites foreground over background through the luminance of the
+        mask, each a (rows, columns, 3) frame already stretched to the
+        effect.
+        """
+        alpha = np.dot(mask, LUMA_WEIGHTS)
         if self.mask_cutoff < 1.0:
             cutoff = int(255 * (1 - self.mask_cutoff))
-            mask_image = mask_image.point(lambda p: 255 if p > cutoff else 0)
-
+            alpha = np.where(alpha > cutoff, 255.0, 0.0)
         if self.invert_mask:
-            mask_image = ImageOps.invert(mask_image)
+            alpha = 255 - alpha
+        alpha /= 255
+        # back + (fore - back) * alpha
+        blend = np.subtract(fore, back)
+        blend *= alpha[..., np.newaxis]
+        blend += back
+        return blend.reshape(-1, 3)
 
-        blend_image = Image.composite(fore_image, back_image, mask_image)
+    def render(self):
+        # if we are in race condition start up scenarios, sources may not have
+        # published a frame yet, don't try to fake it, just skip this render
+        # frame until things settle down
+        frame_bus = self._ledfx.frame_bus
+        sources = [
+            frame_bus.get(virtual_id)
+            for virtual_id in (self.mask, self.foreground, self.background)
+        ]
+        if any(source is None for source in sources):
+            _LOGGER.warning(
+                "Virtual %s Blender virtuals not ready", self._virtual.name
+            )
+            return
 
-        rgb_array = np.frombuffer(blend_image.tobytes(), dtype=np.uint8)
-        rgb_array = rgb_array.astype(np.float32)
-        rgb_array = rgb_array.reshape(int(rgb_array.shape[0] / 3), 3)
+        versions = tuple(source.version for source in sources)
+        if versions != self._blend_versions:
+            mask, fore, back = (
+                stretch(source.frame, self.rows, self.columns)
+                for stretch, source in zip(
+                    (
+                        self.mask_stretch_func,
+                        self.foreground_stretch_func,
+                        self.background_stretch_func,
+                    ),
+                    sources,
+                )
+            )
+            self._blend = self.blend(mask, fore, back)
+            self._blend_versions = versions
 
-        copy_length = min(self.pixels.shape[0], rgb_array.shape[0])
-        self.pixels[:copy_length, :] = rgb_array[:copy_length, :]
+        copy_length = min(self.pixels.shape[0], self._blend.shape[0])
+        self.pixels[:copy_length, :] = self._blend[:copy_length, :]
@@ -1,10 +1,11 @@
 import logging
 
 import mss
+import numpy as np
 import voluptuous as vol
-from PIL import Image
 
 from ledfx.effects.twod import Twod
+from ledfx.effects.utils.stretch import stretch_full
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -12,6 +13,7 @@ _LOGGER = logging.getLogger(__name__)
 class Clone(Twod):
     NAME = "Clone"
     CATEGORY = "Matrix"
+    NUMPY_CANVAS = True
     HIDDEN_KEYS = Twod.HIDDEN_KEYS + [
         "test",
         "background_color",
@@ -107,12 +109,14 @@ class Clone(Twod):
             self.sct = None
             return
 
-        rgb_image = Image.frombytes(
-            "RGB", frame.size, frame.bgra, "raw", "BGRX"
+        # BGRA bytes to an RGB view, then stretched into the canvas
+        bgra = np.frombuffer(frame.bgra, dtype=np.uint8).reshape(
+            frame.height, frame.width, 4
         )
-
-        self.matrix = rgb_image.resize(
-            (self.r_width, self.r_height), Image.BILINEAR
+        self.canvas.blit(
+            stretch_full(
+                bgra[..., 2::-1], self.canvas.height, self.canvas.width
+            )
         )
 
         self.fails = 0
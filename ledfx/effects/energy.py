@@ -8,6 +8,7 @@ from ledfx.effects.audio import AudioReactiveEffect
 class EnergyAudioEffect(AudioReactiveEffect):
     NAME = "Energy"
     CATEGORY = "Classic"
+    RENDER_KEYS = ["mixing_mode"]
 
     CONFIG_SCHEMA = vol.Schema(
         {
@@ -29,8 +29,12 @@ class EQAudioEffect(AudioReactiveEffect, GradientEffect):
 
     def audio_data_updated(self, data):
         # Grab the filtered melbank
-        self.r = self.melbank(filtered=True, size=self.pixel_count)
-        np.clip(self.r, 0, 1, out=self.r)
+        np.clip(
+            self.melbank(filtered=True, size=self.pixel_count),
+            0,
+            1,
+            out=self.r,
+        )
 
     def render(self):
         gradient_repeat = min(
@@ -177,8 +177,12 @@ class Equalizer2d(Twod, GradientEffect):
 
     def audio_data_updated(self, data):
         # Grab the filtered melbank
-        self.r = self.melbank(filtered=True, size=self.pixel_count)
-        np.clip(self.r, 0, 1, out=self.r)
+        np.clip(
+            self.melbank(filtered=True, size=self.pixel_count),
+            0,
+            1,
+            out=self.r,
+        )
         self.impulse = self.impulse_filter.update(
             getattr(data, self.power_func)() * self.power_multiplier
         )
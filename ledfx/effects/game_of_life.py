@@ -1,14 +1,12 @@
 import logging
-import random
-from collections import deque
 from enum import Enum
 
 import numpy as np
 import voluptuous as vol
-from PIL import Image
 
 from ledfx.effects.audio import AudioReactiveEffect
 from ledfx.effects.twod import Twod
+from ledfx.effects.utils.life import GameOfLife
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +21,9 @@ class HealthOptions(Enum):
 class GameOfLifeVisualiser(Twod):
     NAME = "Game of Life"
     CATEGORY = "Matrix"
+    NUMPY_CANVAS = True
+    # cap on generations stepped in one frame when running behind
+    MAX_GENERATIONS_PER_FRAME = 8
     # life stages are hard coded colors, dont allow pre fill background
     HIDDEN_KEYS = Twod.HIDDEN_KEYS + [
         "gradient",
@@ -159,19 +160,14 @@ class GameOfLifeVisualiser(Twod):
         self.img_array = np.zeros(
             (self.r_height, self.r_width, 3), dtype=np.uint8
         )
-        # Pre-allocate history stack array to avoid creating new arrays every frame
-        self.game._history_stack = np.zeros(
-            (self.history, self.r_height, self.r_width), dtype=bool
+        # colors indexed by [cell alive, generations alive in history]
+        self.board_colors = np.stack(
+            (self.dead_colors[self.history :: -1], self.live_colors)
         )
 
     def deactivate(self):
         """Clean up resources when effect is deactivated"""
-        if self.game:
-            self.game.board = None
-            self.game.board_history = None
-            self.game._history_buffer = None
-            self.game._history_stack = None
-            self.game = None
+        self.game = None
         self.img_array = None
         super().deactivate()
 
@@ -189,13 +185,13 @@ class GameOfLifeVisualiser(Twod):
             )
 
     def draw(self):
-        if self.test:
-            self.draw_test(self.m_draw)
-
         self.check_board_health(self.now)
         self.step_board_if_time_elapsed(self.now)
         self.update_image_with_board()
 
+        if self.test:
+            self.draw_test_canvas(self.canvas)
+
     def check_board_health(self, current_time):
         """
         Checks the health of the game board and performs necessary actions based on the health check options.
@@ -228,234 +224,28 @@ class GameOfLifeVisualiser(Twod):
         Returns:
             None
         """
-        if (
-            self.impulse > 0
-            and current_time - self.last_game_step
-            >= 1 / self.impulse / self.base_game_speed
-        ):
-            self.game.step_board()
+        if self.impulse <= 0:
+            return
+        step_time = 1 / self.impulse / self.base_game_speed
+        elapsed = current_time - self.last_game_step
+        if elapsed >= step_time:
+            # catch up on generations missed between frames
+            self.game.step_board(
+                min(int(elapsed / step_time), self.MAX_GENERATIONS_PER_FRAME)
+            )
             self.last_game_step = current_time
 
     def update_image_with_board(self):
         """
         Updates the image with the current game board using vectorization for improved performance.
         """
+        board = self.game.board
+        alive_counts = self.game.alive_counts
+        colors = self.board_colors[board, alive_counts]
 
-        # Use game board and history directly
-        current_board = self.game.board
-        # Update pre-allocated history stack in-place to avoid creating new arrays
-        for i, board in enumerate(self.game.board_history):
-            np.copyto(self.game._history_stack[i], board)
-        history_stack = self.game._history_stack
-
-        # Calculate alive and dead durations using vectorization
-        alive_durations = np.sum(history_stack, axis=0)
-        dead_durations = np.sum(~history_stack, axis=0)
-
-        # Map durations to colors using vectorized operations
-        for duration in range(len(self.live_colors)):
-            alive_mask = np.logical_and(
-                current_board, alive_durations == duration
-            )
-            self.img_array[alive_mask] = self.live_colors[duration]
-
-        for duration in range(len(self.dead_colors)):
-            # where pixel is long dead, don't draw black, allows any image
-            # behind to show through, and well as faster for all non plots
-            if duration == 5:
-                continue
-
-            dead_mask = np.logical_and(
-                ~current_board, dead_durations == duration
-            )
-            self.img_array[dead_mask] = self.dead_colors[duration]
-
-        # Clear old PIL Image reference before creating new one to help GC
-        if hasattr(self, "matrix") and self.matrix is not None:
-            old_matrix = self.matrix
-            self.matrix = None
-            del old_matrix
-
-        # Convert the reused NumPy array to PIL Image
-        self.matrix = Image.fromarray(self.img_array)
-
-
-class GameOfLife:
-    """
-    Represents the Game of Life simulation.
-
-    Attributes:
-        board_history (list): A list to store the history of the game boards.
-        board_size (array): the board height and width
-        board (np array): the matrix that stores cell values
-        last_history_clear (time): the time of the last history clear
-
-    Methods:
-        initialize_board(): Initializes the game board with random cell states.
-        step_board(board): Performs one step of the game simulation.
-        board_is_dead(): Checks if the game board has reached a dead state.
-        board_is_oscillating(lookback_generations): Checks if the game board is oscillating.
-        update_image_with_board(image, board): Updates the image with the current game board.
-        cleanup_board_history(): Clears the history of the game boards.
-        add_glider(board): Generates a glider somewhere on the board.
-        add_blinker(board): Generates a blinker somewhere on the board.
-        add_toad(board): Generates a toad somewhere on the board.
-        add_beacon(board): Generates a beacon somewhere on the board.
-        add_random_entity(board): Generates a random entity on the board.
-    """
-
-    def __init__(self, height, width, depth):
-        self.depth = depth
-        self.board_size = [height, width]
-        self.board = self.random_board()
-        # Use deque with maxlen for efficient fixed-size history (no pop(0) needed)
-        self.board_history = deque(maxlen=depth)
-        # Pre-allocate reusable array to avoid np.copy() every frame
-        self._history_buffer = np.zeros(self.board_size, dtype=bool)
-        self.empty_board_history()
-        _LOGGER.info("Universe invented 🌌")
-
-    def random_board(self):
-        """
-        Return a board with random cell states.
-
-        Returns:
-            numpy.ndarray: The random game board.
-        """
-        _LOGGER.info("Evolving life")
-        return np.random.choice([True, False], size=self.board_size)
-
-    def step_board(self):
-        """
-        Performs one step of the game simulation.
-        """
-        # Update board_history using pre-allocated buffer to avoid np.copy()
-        # Copy current board state into buffer, then append a COPY to history
-        np.copyto(self._history_buffer, self.board)
-        self.board_history.append(self._history_buffer.copy())
-        # Reuse _history_buffer for next frame (no new allocation needed)
-
-        neighbors = sum(
-            np.roll(np.roll(self.board, i, 0), j, 1)
-            for i in (-1, 0, 1)
-            for j in (-1, 0, 1)
-            if (i != 0 or j != 0)
-        )
-        self.board = (neighbors == 3) | (self.board & (neighbors == 2))
-        return self.board
-
-    def check_board_life(self):
-        """
-        Checks if the game board has reached a dead state.
-
-        Returns:
-            bool: True if the game board is dead, False otherwise.
-        """
-        if len(self.board_history) < 2:
-            return False
-        current_board = self.board_history[-2]
-        previous_board = self.board_history[-1]
-        if np.array_equal(current_board, previous_board):
-            _LOGGER.info("Board has died")
-            self.empty_board_history()
-            self.board = self.random_board()
-            return True
-        return False
-
-    def check_board_oscillating(self, lookback_generations=5):
-        """
-        Checks if the game board is oscillating.
-
-        Args:
-            lookback_generations (int): The number of previous generations to look back.
-
-        Returns:
-            bool: True if the game board is oscillating, False otherwise.
-        """
-        if len(self.board_history) < lookback_generations:
-            return False
-        # Convert deque to list for slicing (deque doesn't support negative slicing)
-        history_list = list(self.board_history)
-        lookback_boards = history_list[-lookback_generations:]
-        last_board = lookback_boards[-1]
-        for i in range(len(lookback_boards) - 1):  # Exclude the last board
-            if np.array_equal(lookback_boards[i], last_board):
-                _LOGGER.info("Board is oscillating")
-                self.empty_board_history()
-                self.board = self.random_board()
-                return True
-        return False
-
-    def empty_board_history(self):
-        """
-        Clears the board history.
-        """
-        _LOGGER.info("Erasing history of the universe")
-        self.board_history.clear()
-        # Reuse template zero array to reduce allocations
-        zero_board = np.zeros(self.board_size, dtype=bool)
-        for _ in range(self.depth):
-            self.board_history.append(zero_board.copy())
-
-    def add_glider(self):
-        """
-        Generates a glider somewhere on the board
-        """
-        glider = np.array([[0, 0, 1], [1, 0, 1], [0, 1, 1]])
-        rows, cols = self.board_size
-        start_row = np.random.randint(0, rows - 3)
-        start_col = np.random.randint(0, cols - 3)
-        self.board[start_row : start_row + 3, start_col : start_col + 3] = (
-            glider
-        )
-        _LOGGER.debug("Added glider at: %sx%s", start_row, start_col)
-
-    def add_blinker(self):
-        """
-        Generates a blinker somewhere on the board
-        """
-        blinker = np.array([[1, 1, 1]])
-        rows, cols = self.board_size
-        start_row = np.random.randint(0, rows - 1)
-        start_col = np.random.randint(0, cols - 3)
-        self.board[start_row, start_col : start_col + 3] = blinker
-        _LOGGER.debug("Added blinker at: %sx%s", start_row, start_col)
-
-    def add_toad(self):
-        """
-        Generates a toad somewhere on the board
-        """
-        toad = np.array([[0, 1, 1, 1], [1, 1, 1, 0]])
-        rows, cols = self.board_size
-        start_row = np.random.randint(0, rows - 2)
-        start_col = np.random.randint(0, cols - 4)
-        self.board[start_row : start_row + 2, start_col : start_col + 4] = toad
-        _LOGGER.debug("Added toad at: %sx%s", start_row, start_col)
-
-    def add_beacon(self):
-        """
-        Generates a beacon somewhere on the board
-        """
-        beacon = np.array(
-            [[1, 1, 0, 0], [1, 1, 0, 0], [0, 0, 1, 1], [0, 0, 1, 1]]
-        )
-        rows, cols = self.board_size
-        start_row = np.random.randint(0, rows - 4)
-        start_col = np.random.randint(0, cols - 4)
-        self.board[start_row : start_row + 4, start_col : start_col + 4] = (
-            beacon
-        )
-        _LOGGER.debug("Added beacon at: %sx%s", start_row, start_col)
+        # where pixel is long dead, don't draw black, allows any image
+        # behind to show through, and well as faster for all non plots
+        draw = board | alive_counts
+        np.copyto(self.img_array, colors, where=draw[..., np.newaxis] != 0)
 
-    def add_random_entity(self):
-        """
-        Generates a random entity on the board
-        """
-        entities = [
-            self.add_glider,
-            self.add_blinker,
-            self.add_toad,
-            self.add_beacon,
-        ]
-        random_entity = random.choice(entities)
-        random_entity()
+        self.canvas.array[:] = self.img_array
@@ -1,10 +1,13 @@
 import logging
 from enum import Enum
 
+import numpy as np
 import voluptuous as vol
 from PIL import Image
 
 from ledfx.effects import Effect
+from ledfx.libraries.frame_cache import FrameCache
+from ledfx.utils import get_frame_cache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,3 +49,70 @@ class GifBase(Effect):
         self.resize_method = self.RESIZE_METHOD_MAPPING[
             self._config["resize_method"]
         ]
+
+    def load_frames(self, gif, size=None, composite=False):
+        """
+        Decodes every frame of an open GIF into a read-only uint8 array of
+        shape (n_frames, height, width, 3), through the shared frame cache so
+        other effects and virtuals showing the same GIF reuse it.
+
+        Args:
+            gif: PIL Image from open_gif, closed by the caller
+            size: (width, height) to resize to with resize_method, or None
+            composite: Alpha composite onto black, so transparent pixels are
+                black rather than the GIF's underlying colour
+
+        Returns:
+            numpy.ndarray: The decoded frames
+        """
+        resample = self.resize_method if size else None
+        variant = "composite" if composite else "rgb"
+
+        def decode():
+            return decode_gif_frames(gif, size, resample, composite)
+
+        frame_cache = get_frame_cache()
+        if frame_cache is None:
+            return decode()
+        key = FrameCache.make_key(
+            getattr(gif, "filename", ""), size, resample, variant
+        )
+        return frame_cache.get_or_create(key, decode)
+
+
+def decode_gif_frames(gif, size=None, resample=None, composite=False):
+    """
+    Decodes every frame of a GIF into a uint8 array.
+
+    Args:
+        gif: PIL Image
+        size: (width, height) to resize each frame to, or None
+        resample: PIL resampling filter for the resize
+        composite: Alpha composite onto black before resizing
+
+    Returns:
+        numpy.ndarray: (n_frames, height, width, 3) uint8 array
+    """
+    frames = None
+    black_background = (
+        Image.new("RGBA", gif.size, (0, 0, 0)) if composite else None
+    )
+    for frame_index in range(gif.n_frames):
+        gif.seek(frame_index)
+        if composite:
+            # We need to alpha composite to change the white to black for transparent pixels
+            frame = Image.alpha_composite(
+                black_background, gif.convert("RGBA")
+            ).convert("RGB")
+        else:
+            frame = gif.convert("RGB")
+        if size:
+            frame = frame.resize(size, resample=resample)
+        frame_array = np.asarray(frame)
+        if frames is None:
+            frames = np.empty(
+                (gif.n_frames,) + frame_array.shape, dtype=np.uint8
+            )
+        frames[frame_index] = frame_array
+        frame.close()
+    return frames
@@ -2,7 +2,6 @@ import logging
 import os
 
 import voluptuous as vol
-from PIL import Image
 
 from ledfx.consts import LEDFX_ASSETS_PATH
 from ledfx.effects.gifbase import GifBase
@@ -15,6 +14,7 @@ _LOGGER = logging.getLogger(__name__)
 class GifPlayer(Twod, GifBase):
     NAME = "GIF Player"
     CATEGORY = "Matrix"
+    NUMPY_CANVAS = True
     # background color makes no sense with gifs, just hide it
     HIDDEN_KEYS = Twod.HIDDEN_KEYS + [
         "gradient",
@@ -83,7 +83,7 @@ class GifPlayer(Twod, GifBase):
 
     def draw(self):
         self.step_gif_if_time_elapsed()
-        self.matrix.paste(self.frame_data)
+        self.canvas.array[:] = self.frame_data
 
     def step_gif_if_time_elapsed(self):
         """
@@ -109,29 +109,18 @@ class GifPlayer(Twod, GifBase):
 
     def process_gif(self):
         """
-        Process the GIF frames and store them in the frames object.
+        Loads the GIF frames, alpha composited onto black and resized to the
+        matrix, into the frames object.
 
-        This method iterates over each frame of the GIF, applies necessary transformations,
-        and stores the processed frames.
+        Frames come from the shared frame cache, so only the first virtual
+        to show a GIF at a given size and resize method decodes it.
 
         Returns:
             None
         """
-        black_background = Image.new("RGBA", self.gif.size, (0, 0, 0))
-        # For every frame
-        for frame_index in range(self.gif.n_frames):
-            self.gif.seek(frame_index)
-            raw_frame_data = self.gif.convert("RGBA")
-            # We need to alpha composite to change the white to black for transparent pixels
-            composite_frame_data = Image.alpha_composite(
-                black_background, raw_frame_data
-            )
-            # Resize the gif to the matrix size
-
-            final_frame_data = composite_frame_data.resize(
-                (self.r_width, self.r_height), resample=self.resize_method
-            )
-            # Add the frame to our frames object
-            self.frames.append(final_frame_data)
+        self.frames = self.load_frames(
+            self.gif, (self.r_width, self.r_height), composite=True
+        )
         # Close image
         self.gif.close()
+        return None
@@ -1,4 +1,5 @@
 import logging
+import threading
 
 import numpy as np
 import voluptuous as vol
@@ -11,6 +12,137 @@ from ledfx.effects.temporal import TemporalEffect
 _LOGGER = logging.getLogger(__name__)
 
 
+def _ease(chunk_len, start_val, end_val, slope=1.5):
+    x = np.linspace(0, 1, chunk_len)
+    diff = end_val - start_val
+    pow_x = np.power(x, slope)
+    return diff * pow_x / (pow_x + np.power(1 - x, slope)) + start_val
+
+
+def generate_gradient_curve(gradient, gradient_length):
+    """
+    Builds the colors of a gradient string, eased between its stops.
+
+    Returns:
+        (gradient_length, 3) float array of 0-255 colors
+    """
+    _LOGGER.debug("Generating new gradient curve: %s", gradient)
+
+    try:
+        gradient = parse_gradient(gradient)
+    except ValueError:
+        gradient = RGB(0, 0, 0)
+
+    if isinstance(gradient, RGB):
+        return np.tile(gradient, (gradient_length, 1)).astype(float)
+
+    gradient_colors = gradient.colors
+
+    # fill in start and end colors if not explicitly given
+    if gradient_colors[0][1] != 0.0:
+        gradient_colors.insert(0, (gradient_colors[0][0], 0.0))
+
+    if gradient_colors[-1][1] != 1.0:
+        gradient_colors.insert(-1, (gradient_colors[-1][0], 1.0))
+
+    # split colors and splits into two separate groups
+    gradient_colors, gradient_splits = zip(*gradient_colors)
+
+    # turn splits into real indexes to split array
+    gradient_splits = [
+        int(gradient_length * position)
+        for position in gradient_splits
+        if 0 < position < 1
+    ]
+    # pair colors (1,2), (2,3), (3,4) for color transition of each segment
+    gradient_colors_paired = zip(gradient_colors, gradient_colors[1:])
+
+    # create gradient array and split it up into the segments
+    gradient = np.zeros((gradient_length, 3)).astype(float)
+    gradient_segments = np.split(gradient, gradient_splits, axis=0)
+
+    for (color_1, color_2), segment in zip(
+        gradient_colors_paired, gradient_segments
+    ):
+        segment_len = len(segment)
+        segment[:, 0] = _ease(segment_len, color_1[0], color_2[0])
+        segment[:, 1] = _ease(segment_len, color_1[1], color_2[1])
+        segment[:, 2] = _ease(segment_len, color_1[2], color_2[2])
+
+    return gradient
+
+
+class GradientLUTs:
+    """
+    Process wide registry of gradient lookup tables.
+
+    Tables are built once per (gradient, length, dtype) and shared,
+    read-only, by every effect showing that gradient. Effects acquire a
+    table and release it when they change gradient or deactivate, and a
+    table is dropped once nothing references it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tables = {}
+        self._refcounts = {}
+        self.builds = 0
+        self.hits = 0
+
+    def acquire(self, gradient, length, dtype=np.float32):
+        """
+        Takes a reference to the lookup table for a gradient.
+
+        Args:
+            gradient (str): gradient string
+            length (int): number of entries in the table
+            dtype: np.float32 for 0-255 float colors, or np.uint8
+
+        Returns:
+            (key, table): the key to release the reference with, and the
+            read-only (length, 3) table
+        """
+        key = (gradient, length, np.dtype(dtype).str)
+        with self._lock:
+            table = self._tables.get(key)
+            if table is None:
+                curve = generate_gradient_curve(gradient, length)
+                if np.dtype(dtype) == np.uint8:
+                    curve = np.clip(np.rint(curve), 0, 255)
+                table = np.ascontiguousarray(curve, dtype=dtype)
+                table.flags.writeable = False
+                self._tables[key] = table
+                self._refcounts[key] = 0
+                self.builds += 1
+            else:
+                self.hits += 1
+            self._refcounts[key] += 1
+        return key, table
+
+    def release(self, key):
+        """Drops a reference taken with acquire()"""
+        with self._lock:
+            if key not in self._refcounts:
+                return
+            self._refcounts[key] -= 1
+            if self._refcounts[key] <= 0:
+                del self._refcounts[key]
+                del self._tables[key]
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                "tables": len(self._tables),
+                "references": sum(self._refcounts.values()),
+                "bytes": sum(table.nbytes for table in self._tables.values()),
+                "builds": self.builds,
+                "hits": self.hits,
+            }
+
+
+gradient_luts = GradientLUTs()
+
+
 @Effect.no_registration
 class GradientEffect(Effect):
     """
@@ -19,6 +151,9 @@ class GradientEffect(Effect):
     colors based upon some configured color pallet.
     """
 
+    # the gradient is rolled while rendering, rolling keeps the curve
+    RENDER_KEYS = ["gradient_roll"]
+
     CONFIG_SCHEMA = vol.Schema(
         {
             vol.Optional(
@@ -34,8 +169,14 @@ class GradientEffect(Effect):
         }
     )
 
-    _gradient_curve = None
+    # shared, read-only (gradient_pixel_count, 3) table from gradient_luts
+    _gradient_lut = None
+    _gradient_lut_key = None
+    # gradient_roll is applied as an offset into the table at lookup time
+    _gradient_phase = 0
     _gradient_roll_counter = 0
+    # table indexes get_gradient() downsamples low pixel counts with
+    _gradient_indices = None
 
     def _comb(self, N, k):
         N = int(N)
@@ -59,60 +200,20 @@ class GradientEffect(Effect):
         """The Bernstein polynomial of n, i as a function of t"""
         return self._comb(n, i) * (t ** (n - i)) * (1 - t) ** i
 
-    def _ease(self, chunk_len, start_val, end_val, slope=1.5):
-        x = np.linspace(0, 1, chunk_len)
-        diff = end_val - start_val
-        pow_x = np.power(x, slope)
-        return diff * pow_x / (pow_x + np.power(1 - x, slope)) + start_val
-
     def _generate_gradient_curve(self, gradient, gradient_length):
-        _LOGGER.debug("Generating new gradient curve: %s", gradient)
-
-        try:
-            gradient = parse_gradient(gradient)
-        except ValueError:
-            gradient = RGB(0, 0, 0)
-
-        if isinstance(gradient, RGB):
-            self._gradient_curve = (
-                np.tile(gradient, (gradient_length, 1)).astype(float).T
-            )
-            return
-
-        gradient_colors = gradient.colors
-
-        # fill in start and end colors if not explicitly given
-        if gradient_colors[0][1] != 0.0:
-            gradient_colors.insert(0, (gradient_colors[0][0], 0.0))
-
-        if gradient_colors[-1][1] != 1.0:
-            gradient_colors.insert(-1, (gradient_colors[-1][0], 1.0))
-
-        # split colors and splits into two separate groups
-        gradient_colors, gradient_splits = zip(*gradient_colors)
-
-        # turn splits into real indexes to split array
-        gradient_splits = [
-            int(gradient_length * position)
-            for position in gradient_splits
-            if 0 < position < 1
-        ]
-        # pair colors (1,2), (2,3), (3,4) for color transition of each segment
-        gradient_colors_paired = zip(gradient_colors, gradient_colors[1:])
-
-        # create gradient array and split it up into the segments
-        gradient = np.zeros((gradient_length, 3)).astype(float)
-        gradient_segments = np.split(gradient, gradient_splits, axis=0)
-
-        for (color_1, color_2), segment in zip(
-            gradient_colors_paired, gradient_segments
-        ):
-            segment_len = len(segment)
-            segment[:, 0] = self._ease(segment_len, color_1[0], color_2[0])
-            segment[:, 1] = self._ease(segment_len, color_1[1], color_2[1])
-            segment[:, 2] = self._ease(segment_len, color_1[2], color_2[2])
+        self._release_gradient()
+        self._gradient_lut_key, self._gradient_lut = gradient_luts.acquire(
+            gradient, gradient_length
+        )
+        self._gradient_phase = 0
 
-        self._gradient_curve = gradient.T
+    def _release_gradient(self):
+        """Returns the gradient table to the shared registry"""
+        if self._gradient_lut_key is not None:
+            gradient_luts.release(self._gradient_lut_key)
+        self._gradient_lut_key = None
+        self._gradient_lut = None
+        self._gradient_phase = 0
 
     @property
     def gradient_pixel_count(self):
@@ -121,8 +222,8 @@ class GradientEffect(Effect):
 
     def _assert_gradient(self):
         if (
-            self._gradient_curve is None  # Uninitialized gradient
-            or len(self._gradient_curve[0])
+            self._gradient_lut is None  # Uninitialized gradient
+            or len(self._gradient_lut)
             != self.gradient_pixel_count  # Incorrect size
         ):
             self._generate_gradient_curve(
@@ -147,11 +248,17 @@ class GradientEffect(Effect):
             pixels_to_roll = np.floor(self._gradient_roll_counter)
             self._gradient_roll_counter -= pixels_to_roll
 
-            self._gradient_curve = np.roll(
-                self._gradient_curve,
-                int(pixels_to_roll),
-                axis=1,
-            )
+            # same as rolling the table forwards, without moving any data
+            self._gradient_phase = int(
+                self._gradient_phase + pixels_to_roll
+            ) % len(self._gradient_lut)
+
+    def _lookup_gradient(self, indices):
+        """Gathers table rows, offset by the roll, shape (*indices, 3)"""
+        if self._gradient_phase:
+            indices = np.subtract(indices, self._gradient_phase)
+        # np.take is a single gather, and much quicker than fancy indexing
+        return np.take(self._gradient_lut, indices, axis=0, mode="wrap")
 
     def _get_gradient_colors(self, points):
         self._assert_gradient()
@@ -162,47 +269,58 @@ class GradientEffect(Effect):
         # Calculate indices for the gradient lookup
         indices = ((self.gradient_pixel_count - 1) * points).astype(int)
 
-        # Use advanced indexing to get colors for each point
-        return self._gradient_curve[:, indices]
+        # A single gather, colors last: (*points, 3)
+        return self._lookup_gradient(indices)
 
     def get_gradient_color(self, point):
-        return self._get_gradient_colors(point)
+        # color channels first, (3, *points)
+        return np.moveaxis(self._get_gradient_colors(point), -1, 0)
 
     def get_gradient_color_vectorized2d(self, points):
-        colors = self._get_gradient_colors(points)
-
-        # Transpose and reshape to get the correct shape (height, width, color_channels)
-        return colors.transpose(1, 2, 0)
+        # (height, width, color_channels)
+        return self._get_gradient_colors(points)
 
     def get_gradient_color_vectorized1d(self, points):
-        colors = self._get_gradient_colors(points)
-
-        # Transpose and reshape to get the correct shape (length, color_channels)
-        return colors.transpose(1, 0)
+        # (length, color_channels)
+        return self._get_gradient_colors(points)
 
     def get_gradient(self):
         self._assert_gradient()
 
         # For a single pixel, take the first value from the gradient
         if self.pixel_count == 1:
-            return self._get_gradient_colors([0])
+            return self.get_gradient_color([0])
 
         # For low pixel counts, downsample the gradient
         if self.pixel_count < self.gradient_pixel_count:
-            points = np.arange(self.pixel_count) / (self.pixel_count - 1)
-            return self._get_gradient_colors(points)
+            if (
+                self._gradient_indices is None
+                or len(self._gradient_indices) != self.pixel_count
+            ):
+                points = np.arange(self.pixel_count) / (self.pixel_count - 1)
+                self._gradient_indices = (
+                    (self.gradient_pixel_count - 1) * points
+                ).astype(int)
+            return self._lookup_gradient(self._gradient_indices).T
 
         # For large pixel counts, the gradient corresponds to the number of pixels
-        return self._gradient_curve
+        if self._gradient_phase:
+            return np.roll(self._gradient_lut, self._gradient_phase, axis=0).T
+        return self._gradient_lut.T
 
     def config_updated(self, config):
         """Invalidate the gradient"""
-        self._gradient_curve = None
+        self._release_gradient()
+
+    def deactivate(self):
+        self._release_gradient()
+        super().deactivate()
 
     def apply_gradient(self, y):
         self._assert_gradient()
 
-        output = self.get_gradient() * y
+        # the shared table is float32, pixels stay float64
+        output = np.multiply(self.get_gradient(), y, dtype=np.float64)
         # Apply and roll the gradient if necessary
         self.roll_gradient()
 
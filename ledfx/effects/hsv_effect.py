@@ -61,7 +61,7 @@ class HSVEffect(GradientEffect):
 
     def config_updated(self, config):
         # forcibly invalidate the gradient
-        self._gradient_curve = None
+        self._release_gradient()
 
     def render(self):
         # update the timestep, converting ns to s
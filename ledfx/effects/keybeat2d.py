@@ -1,8 +1,8 @@
 import logging
 import os
 
+import PIL.Image as Image
 import PIL.ImageEnhance as ImageEnhance
-import PIL.ImageSequence as ImageSequence
 import voluptuous as vol
 
 from ledfx.consts import LEDFX_ASSETS_PATH
@@ -203,11 +203,10 @@ class Keybeat2d(Twod, GifBase):
                 )
                 self.force_fit = True
 
-            iterator = ImageSequence.Iterator(self.gif)
-            self.orig_frames = []
-
-            for frame in iterator:
-                self.orig_frames.append(frame.convert("RGB"))
+            self.orig_frames = [
+                Image.fromarray(frame, "RGB")
+                for frame in self.load_frames(self.gif)
+            ]
             self.gif.close()
 
         self.last_gif = self.image_location
@@ -30,6 +30,8 @@ MIC_RATE = 30000
 MAX_FREQ = MIC_RATE // 2
 MIN_FREQ = 20
 MEL_MAX_FREQS = [350, 2000, MAX_FREQ]
+# name of the audio source backed by the global ledfx.audio
+DEFAULT_AUDIO_SOURCE = "default"
 
 FrequencyRange = namedtuple("FrequencyRange", "min,max")
 
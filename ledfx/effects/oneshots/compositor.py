@@ -0,0 +1,148 @@
+import logging
+import timeit
+
+import numpy as np
+
+from ledfx.effects.oneshots.oneshot import Flash, Oneshot
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class OneshotCompositor:
+    """
+    The active oneshots of a virtual, applied to its frame once per flush.
+
+    Each Flash blends every pixel towards its colour by its envelope
+    weight, so any number of them applied in order fold into one scale and
+    one offset colour for the whole frame. The envelopes of all flashes are
+    evaluated together, and the result is applied to the frame in a single
+    pass before it is mapped to segments. Other oneshot types are updated
+    and applied in order afterwards.
+
+    At most max_oneshots are kept, adding another drops the oldest.
+    """
+
+    def __init__(self, max_oneshots=64):
+        self.max_oneshots = max_oneshots
+        self._oneshots = []
+        self._flashes = []
+        self._dirty = True
+        self._starts = np.zeros(0)
+        self._ramps = np.zeros(0)
+        self._hold_ends = np.zeros(0)
+        self._fade_ends = np.zeros(0)
+        self._colors = np.zeros((0, 3))
+        self.added = 0
+        self.dropped = 0
+        self.peak_active = 0
+        self.last_composite_ms = 0.0
+
+    @property
+    def oneshots(self):
+        return self._oneshots
+
+    def __len__(self):
+        return len(self._oneshots)
+
+    def add(self, oneshot: Oneshot):
+        """Adds an initialised oneshot, dropping the oldest if at the cap"""
+        if len(self._oneshots) >= self.max_oneshots:
+            self._oneshots.pop(0)
+            self.dropped += 1
+            _LOGGER.debug(
+                "Oneshot cap of %s reached, dropped oldest", self.max_oneshots
+            )
+        self._oneshots.append(oneshot)
+        self.added += 1
+        self.peak_active = max(self.peak_active, len(self._oneshots))
+        self._dirty = True
+
+    def clear(self):
+        self._oneshots.clear()
+        self._dirty = True
+
+    def _build(self):
+        """Gathers the envelopes of the flashes into arrays"""
+        self._flashes = [
+            oneshot for oneshot in self._oneshots if isinstance(oneshot, Flash)
+        ]
+        self._starts = np.array([f._start for f in self._flashes])
+        self._ramps = np.array([f._ramp for f in self._flashes])
+        self._hold_ends = np.array([f._hold_end for f in self._flashes])
+        self._fade_ends = np.array([f._fade_end for f in self._flashes])
+        self._colors = np.array(
+            [f._color for f in self._flashes], dtype=float
+        ).reshape(-1, 3)
+        self._dirty = False
+
+    def overlay(self, now=None):
+        """
+        Ends finished flashes and folds the rest into one blend.
+
+        Returns:
+            (scale, offset) to apply as pixels * scale + offset, or None if
+            no flash is active
+        """
+        if self._dirty:
+            self._build()
+        if not self._flashes:
+            return None
+
+        if now is None:
+            now = timeit.default_timer()
+        passed = now - self._starts
+        weights = Flash.envelope(
+            passed, self._ramps, self._hold_ends, self._fade_ends
+        )
+        for index in np.flatnonzero(passed > self._fade_ends):
+            self._flashes[index].active = False
+
+        # blending in order, each flash's colour is scaled down by every
+        # flash applied after it
+        keep = 1 - weights
+        after = np.ones_like(keep)
+        after[:-1] = np.cumprod(keep[::-1])[::-1][1:]
+        offset = (weights * after) @ self._colors
+        return float(np.prod(keep)), offset
+
+    def apply(self, pixels):
+        """
+        Applies all active oneshots to a (pixel_count, 3) frame in place and
+        drops the ones that have ended
+        """
+        # oneshots can also be deactivated from outside, such as by the API
+        self._prune()
+        if not self._oneshots:
+            return
+        start = timeit.default_timer()
+
+        blend = self.overlay(start)
+        if blend is not None:
+            scale, offset = blend
+            np.multiply(pixels, scale, pixels)
+            np.add(pixels, offset, pixels)
+
+        for oneshot in self._oneshots:
+            if not isinstance(oneshot, Flash):
+                oneshot.update()
+                if oneshot.active:
+                    oneshot.apply(pixels, 0, len(pixels))
+
+        self._prune()
+        self.last_composite_ms = (timeit.default_timer() - start) * 1000.0
+
+    def _prune(self):
+        active = [oneshot for oneshot in self._oneshots if oneshot.active]
+        if len(active) != len(self._oneshots):
+            self._oneshots[:] = active
+            self._dirty = True
+
+    def get_stats(self) -> dict:
+        return {
+            "active": len(self._oneshots),
+            "max_oneshots": self.max_oneshots,
+            "peak_active": self.peak_active,
+            "added": self.added,
+            "dropped": self.dropped,
+            "last_composite_ms": self.last_composite_ms,
+        }
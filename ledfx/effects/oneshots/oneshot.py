@@ -73,17 +73,31 @@ class Flash(Oneshot):
     def init(self):
         return
 
+    @staticmethod
+    def envelope(passed, ramp, hold_end, fade_end):
+        """
+        Weight of flashes at passed seconds since they started, for scalars
+        or arrays of flashes. 0 once the flash has ended.
+        """
+        passed = np.asarray(passed, dtype=float)
+        # a zero length ramp or fade is a step
+        ramp_weight = passed / np.maximum(ramp, 1e-9)
+        fade_weight = (fade_end - passed) / np.maximum(
+            np.subtract(fade_end, hold_end), 1e-9
+        )
+        return np.select(
+            (passed <= ramp, passed <= hold_end, passed <= fade_end),
+            (np.minimum(ramp_weight, 1.0), 1.0, fade_weight),
+            0.0,
+        )
+
     def update(self):
         passed = timeit.default_timer() - self._start
-        if passed <= self._ramp:
-            self._weight = passed / self._ramp
-        elif passed <= self._hold_end:
-            self._weight = 1.0
-        elif passed <= self._fade_end:
-            self._weight = (self._fade_end - passed) / self._fade
-        else:
+        self._weight = float(
+            self.envelope(passed, self._ramp, self._hold_end, self._fade_end)
+        )
+        if passed > self._fade_end:
             self._active = False
-            self._weight = 0.0
 
     def apply(self, seg, start, stop):
         blend = np.multiply(self._color, self._weight)
@@ -1,7 +1,6 @@
 import logging
 
 import numpy as np
-import PIL.Image as Image
 import voluptuous as vol
 
 from ledfx.effects.audio import AudioReactiveEffect
@@ -14,6 +13,7 @@ _LOGGER = logging.getLogger(__name__)
 class Plasma2d(Twod, GradientEffect):
     NAME = "Plasma2d"
     CATEGORY = "Matrix"
+    NUMPY_CANVAS = True
     HIDDEN_KEYS = Twod.HIDDEN_KEYS + [
         "background_color",
         "background_brightness",
@@ -108,15 +108,13 @@ class Plasma2d(Twod, GradientEffect):
         return plasma_normalized
 
     def draw(self):
-        if self.test:
-            self.draw_test(self.m_draw)
-
         plasma_array = self.generate_plasma(
             self.r_width, self.r_height, self.now, self.bar
         )
 
-        color_mapped_plasma = self.get_gradient_color_vectorized2d(
+        self.canvas.array[:] = self.get_gradient_color_vectorized2d(
             plasma_array
-        ).astype(np.uint8)
+        )
 
-        self.matrix = Image.fromarray(color_mapped_plasma, "RGB")
+        if self.test:
+            self.draw_test_canvas(self.canvas)
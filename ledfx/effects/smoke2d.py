@@ -3,7 +3,6 @@ import random
 
 import numpy as np
 import voluptuous as vol
-from PIL import Image
 from pyfastnoiselite import pyfastnoiselite as fnl
 
 from ledfx.effects.gradient import GradientEffect
@@ -15,6 +14,7 @@ _LOGGER = logging.getLogger(__name__)
 class Smoke2d(Twod, GradientEffect):
     NAME = "Smoke"
     CATEGORY = "Matrix"
+    NUMPY_CANVAS = True
 
     HIDDEN_KEYS = Twod.HIDDEN_KEYS + [
         "background_color",
@@ -155,7 +155,4 @@ class Smoke2d(Twod, GradientEffect):
         # (kept cheap + safe)
         np.clip(noise_norm, 0.0, 1.0, out=noise_norm)
 
-        color_array = self.get_gradient_color_vectorized2d(noise_norm).astype(
-            np.uint8
-        )
-        self.matrix = Image.fromarray(color_array, "RGB")
+        self.canvas.array[:] = self.get_gradient_color_vectorized2d(noise_norm)
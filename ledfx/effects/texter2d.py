@@ -6,7 +6,7 @@ from enum import Enum
 
 import numpy as np
 import voluptuous as vol
-from PIL import Image
+from PIL import Image, ImageDraw
 
 from ledfx.color import parse_color, validate_color
 from ledfx.effects.gradient import GradientEffect
@@ -48,6 +48,7 @@ TEXT_EFFECT_MAPPING = {
 class Texter2d(Twod, GradientEffect):
     NAME = "Texter"
     CATEGORY = "Matrix"
+    NUMPY_CANVAS = True
     # add keys you want hidden or in advanced here
     HIDDEN_KEYS = Twod.HIDDEN_KEYS + []
     ADVANCED_KEYS = Twod.ADVANCED_KEYS + ["resize_method", "deep_diag"]
@@ -210,7 +211,7 @@ class Texter2d(Twod, GradientEffect):
 
     def draw(self):
         if self.test:
-            self.draw_test(self.m_draw)
+            self.draw_test_canvas(self.canvas)
 
         if self.use_gradient:
             color_array = self.get_gradient_color_vectorized1d(
@@ -234,7 +235,7 @@ class Texter2d(Twod, GradientEffect):
         self.sentence.update(self.passed)
 
         self.sentence.render(
-            self.matrix,
+            self.canvas,
             self.resize_method,
             color_array,
             values=self.values,
@@ -244,12 +245,17 @@ class Texter2d(Twod, GradientEffect):
         self.roll_gradient()
 
         if self.deep_diag:
+            # the overlay draws with PIL, so round trip through an image
+            diag = Image.fromarray(
+                np.clip(self.canvas.array, 0, 255).astype(np.uint8), "RGB"
+            )
             self.overlay.render(
-                self.matrix,
-                self.m_draw,
+                diag,
+                ImageDraw.Draw(diag),
                 values=self.values,
                 values2=self.values2,
             )
+            self.canvas.array[:] = np.asarray(diag)
 
     ############################################################################
     # side_scroll
@@ -6,6 +6,7 @@ from PIL import Image, ImageDraw, ImageEnhance
 
 from ledfx.effects import Effect
 from ledfx.effects.audio import AudioReactiveEffect
+from ledfx.effects.utils.canvas import Canvas
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,6 +23,10 @@ class Twod(AudioReactiveEffect):
         "background_mode",
     ]
 
+    # Child classes can set this to draw into self.canvas, a persistent
+    # numpy Canvas, instead of a new PIL Image in self.matrix every frame
+    NUMPY_CANVAS = False
+
     CONFIG_SCHEMA = vol.Schema(
         {
             vol.Optional(
@@ -124,6 +129,13 @@ class Twod(AudioReactiveEffect):
             self.r_width = max(1, self.t_width)
             self.r_height = max(1, self.t_height)
 
+        if self.NUMPY_CANVAS:
+            self.matrix = None
+            self.canvas = Canvas(self.r_width, self.r_height)
+            self.canvas.set_orientation(
+                self.flip2d, self.mirror2d, self.rotate
+            )
+
         self.init = False
 
     def image_to_pixels(self):
@@ -163,7 +175,10 @@ class Twod(AudioReactiveEffect):
         if self.last_dump != self._config["dump"]:
             self.last_dump = self._config["dump"]
             # show image on screen
-            self.matrix.show()
+            if self.NUMPY_CANVAS:
+                self.get_matrix(brightness=False).show()
+            else:
+                self.matrix.show()
             _LOGGER.info(
                 "dump %sx%s R: %s F: %s M: %s",
                 self.t_width,
@@ -198,9 +213,25 @@ class Twod(AudioReactiveEffect):
             width=1,
         )
 
+    def draw_test_canvas(self, canvas):
+        """draw_test for effects using the numpy canvas"""
+        width, height = canvas.width, canvas.height
+        canvas.rectangle(0, 0, width - 1, height - 1, (255, 255, 255))
+        mid_w, mid_h = int(width / 2), int(height / 2)
+        canvas.line(0, 0, mid_w, mid_h, (255, 0, 0))
+        canvas.line(width - 1, 0, mid_w - 1, mid_h, (0, 0, 255))
+        canvas.line(0, height - 1, mid_w - 1, mid_h, (0, 255, 0))
+        canvas.line(width - 1, height - 1, mid_w, mid_h, (255, 255, 255))
+
     def get_matrix(self, brightness=True):
         with self.lock:
-            result = self.matrix.copy()
+            if self.NUMPY_CANVAS:
+                result = Image.fromarray(
+                    np.clip(self.canvas.to_array(), 0, 255).astype(np.uint8),
+                    "RGB",
+                )
+            else:
+                result = self.matrix.copy()
             if brightness and self.brightness != 1.0:
                 result = ImageEnhance.Brightness(result).enhance(
                     self.brightness
@@ -211,12 +242,17 @@ class Twod(AudioReactiveEffect):
         # this should be implemented in the child class
         # should render into self.matrix at the final size
         # for display using self.m_draw
+        # or into self.canvas when NUMPY_CANVAS is set
         pass
 
     def render(self):
         if self.init:
             self.do_once()
 
+        if self.NUMPY_CANVAS:
+            self.render_canvas()
+            return
+
         # Close old matrix before creating new one to prevent memory leak
         if hasattr(self, "matrix") and self.matrix:
             try:
@@ -237,3 +273,14 @@ class Twod(AudioReactiveEffect):
         self.image_to_pixels()
 
         self.try_dump()
+
+    def render_canvas(self):
+        if self.bg_color_use and self.background_mode == "overwrite":
+            self.canvas.clear(self._bg_color_pil)
+        else:
+            self.canvas.clear()
+
+        self.draw()
+        self.canvas.to_pixels(self.pixels)
+
+        self.try_dump()
@@ -0,0 +1,135 @@
+import numpy as np
+from numpy.typing import NDArray
+
+
+class Canvas:
+    """
+    Persistent RGB drawing surface for Twod effects, used in place of the
+    PIL Image that is otherwise created, drawn, transposed and converted on
+    every frame.
+
+    The canvas is drawn in render orientation. Flip, mirror and rotation
+    are resolved once into an index map, so to_pixels() is a single gather
+    straight into the effect's pixel array.
+    """
+
+    def __init__(self, width: int, height: int, dtype=np.float64):
+        self.width = max(1, width)
+        self.height = max(1, height)
+        # (height, width, 3), values 0-255
+        self.array = np.zeros((self.height, self.width, 3), dtype=dtype)
+        self._flat = self.array.reshape(-1, 3)
+        self.set_orientation()
+
+    def set_orientation(self, flip=False, mirror=False, rotate=0):
+        """
+        Precomputes where each output pixel is read from in the canvas.
+
+        Matches Twod.image_to_pixels: flip top to bottom, then mirror left
+        to right, then rotate counter clockwise by rotate * 90 degrees.
+
+        Args:
+            flip (bool): flip the canvas vertically
+            mirror (bool): flip the canvas horizontally
+            rotate (int): number of 90 degree counter clockwise rotations
+        """
+        index = np.arange(self.width * self.height).reshape(
+            self.height, self.width
+        )
+        if flip:
+            index = np.flipud(index)
+        if mirror:
+            index = np.fliplr(index)
+        index = np.rot90(index, rotate % 4)
+        self.output_height, self.output_width = index.shape
+        self._index_map = np.ascontiguousarray(index).ravel()
+
+    def clear(self, color=None):
+        """Fills the whole canvas with color, or black"""
+        if color is None:
+            self.array.fill(0)
+        else:
+            self.array[:] = color
+
+    def set_pixel(self, x: int, y: int, color):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.array[y, x] = color
+
+    def fill_rect(self, x0: int, y0: int, x1: int, y1: int, color):
+        """Fills the rectangle from (x0, y0) to (x1, y1) inclusive"""
+        x0, x1 = sorted((x0, x1))
+        y0, y1 = sorted((y0, y1))
+        self.array[
+            max(0, y0) : max(0, y1 + 1), max(0, x0) : max(0, x1 + 1)
+        ] = color
+
+    def rectangle(self, x0: int, y0: int, x1: int, y1: int, color):
+        """Draws the one pixel outline of a rectangle, corners inclusive"""
+        self.fill_rect(x0, y0, x1, y0, color)
+        self.fill_rect(x0, y1, x1, y1, color)
+        self.fill_rect(x0, y0, x0, y1, color)
+        self.fill_rect(x1, y0, x1, y1, color)
+
+    def line(self, x0: int, y0: int, x1: int, y1: int, color):
+        """Draws a one pixel wide line between two points, inclusive"""
+        steps = max(abs(x1 - x0), abs(y1 - y0)) + 1
+        xs = np.rint(np.linspace(x0, x1, steps)).astype(np.intp)
+        ys = np.rint(np.linspace(y0, y1, steps)).astype(np.intp)
+        inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        self.array[ys[inside], xs[inside]] = color
+
+    def blit(self, source: NDArray, x: int = 0, y: int = 0):
+        """
+        Copies a (height, width, 3) array onto the canvas with its top left
+        corner at (x, y), clipped to the canvas
+        """
+        height = min(source.shape[0], self.height - y)
+        width = min(source.shape[1], self.width - x)
+        if height > 0 and width > 0:
+            self.array[y : y + height, x : x + width] = source[:height, :width]
+
+    def blend_mask(
+        self, mask: NDArray, x: int, y: int, color=None, alpha: float = 1.0
+    ):
+        """
+        Blends color through a (height, width) uint8 coverage mask with its
+        top left corner at (x, y), clipped to the canvas.
+
+        Matches pasting the mask onto a PIL image through itself: with no
+        color the mask is drawn as grey, scaled by alpha like the coverage.
+        """
+        x0, y0 = max(0, x), max(0, y)
+        x1 = min(self.width, x + mask.shape[1])
+        y1 = min(self.height, y + mask.shape[0])
+        if x1 <= x0 or y1 <= y0:
+            return
+        coverage = mask[y0 - y : y1 - y, x0 - x : x1 - x] * (alpha / 255.0)
+        region = self.array[y0:y1, x0:x1]
+        if color is None:
+            source = (coverage * 255.0)[..., np.newaxis]
+        else:
+            source = np.asarray(color[:3], dtype=region.dtype)
+        # region + (source - region) * coverage, in place
+        delta = source - region
+        delta *= coverage[..., np.newaxis]
+        region += delta
+
+    def to_pixels(self, pixels: NDArray):
+        """
+        Writes the canvas, in output orientation, into the start of an
+        effect's (pixel_count, 3) pixel array
+        """
+        length = min(len(pixels), len(self._index_map))
+        np.take(
+            self._flat,
+            self._index_map[:length],
+            axis=0,
+            out=pixels[:length],
+            mode="clip",
+        )
+
+    def to_array(self) -> NDArray:
+        """Returns a copy of the canvas in output orientation"""
+        return self._flat[self._index_map].reshape(
+            self.output_height, self.output_width, 3
+        )
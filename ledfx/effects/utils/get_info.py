@@ -1,18 +1,16 @@
 import logging
 
-import aiohttp
+from ledfx.libraries.http_client import device_http
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def fetch_info(session, ip_address, callback):
+async def fetch_info(ip_address, callback):
     """Fetches WLED device information asynchronously."""
     url = f"http://{ip_address}/json/info"
     try:
-        timeout = aiohttp.ClientTimeout(total=0.8)
-        async with session.get(url, timeout=timeout) as response:
-            data = await response.json()
-            callback(data)
+        response = await device_http.request("GET", url, timeout=0.8)
+        callback(response.json())
     except Exception as e:
         _LOGGER.warning("Error fetching info from %s: %s", ip_address, e)
 
@@ -21,13 +19,6 @@ async def fetch_info(session, ip_address, callback):
 def get_info_async(loop, ip_address, callback):
     """Launches an asynchronous request to fetch WLED device information."""
     try:
-        loop.create_task(_start_request(ip_address, callback))
+        loop.create_task(fetch_info(ip_address, callback))
     except RuntimeError as e:
         _LOGGER.warning("Error creating task in the provided loop: %s", e)
-
-
-# Internal coroutine to be launched as a task
-async def _start_request(ip_address, callback):
-    """Internal coroutine to fetch WLED device information."""
-    async with aiohttp.ClientSession() as session:
-        await fetch_info(session, ip_address, callback)
@@ -0,0 +1,226 @@
+import hashlib
+import logging
+import random
+from collections import deque
+
+import numpy as np
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GameOfLife:
+    """
+    Represents the Game of Life simulation.
+
+    The board is a toroidal uint8 array of 0 and 1 cells. Each generation
+    is a box sum over a padded copy of the board, held in pre-allocated
+    buffers, so large boards can run many generations per frame.
+
+    Attributes:
+        board_size (array): the board height and width
+        board (np array): the uint8 matrix that stores cell values
+        board_history (np array): ring of the last depth boards
+        alive_counts (np array): generations each cell was alive for in
+            board_history
+        board_hashes (deque): hashes of past boards, for the health checks
+
+    Methods:
+        random_board(): Returns a board with random cell states.
+        step_board(generations): Performs steps of the game simulation.
+        check_board_life(): Checks if the game board has stopped changing.
+        check_board_oscillating(lookback_generations): Checks if the game board is oscillating.
+        empty_board_history(): Clears the history of the game boards.
+        add_glider(board): Generates a glider somewhere on the board.
+        add_blinker(board): Generates a blinker somewhere on the board.
+        add_toad(board): Generates a toad somewhere on the board.
+        add_beacon(board): Generates a beacon somewhere on the board.
+        add_random_entity(board): Generates a random entity on the board.
+    """
+
+    def __init__(self, height, width, depth):
+        self.depth = depth
+        self.board_size = [height, width]
+        self.board = self.random_board()
+        # board with a one cell border wrapped from the opposite edges
+        self._padded = np.zeros((height + 2, width + 2), dtype=np.uint8)
+        self._row_sums = np.zeros((height, width + 2), dtype=np.uint8)
+        self._counts = np.zeros((height, width), dtype=np.uint8)
+        self._born = np.zeros((height, width), dtype=bool)
+        self._survived = np.zeros((height, width), dtype=bool)
+        self.board_history = np.zeros((depth, height, width), dtype=np.uint8)
+        self.alive_counts = np.zeros((height, width), dtype=np.uint8)
+        self._history_index = 0
+        self.board_hashes = deque(maxlen=max(depth, 8))
+        self.empty_board_history()
+        _LOGGER.info("Universe invented 🌌")
+
+    def random_board(self):
+        """
+        Return a board with random cell states.
+
+        Returns:
+            numpy.ndarray: The random game board.
+        """
+        _LOGGER.info("Evolving life")
+        return np.random.randint(0, 2, size=self.board_size, dtype=np.uint8)
+
+    @staticmethod
+    def board_hash(board):
+        """Digest of a board, equal boards have equal digests"""
+        return hashlib.blake2b(
+            np.ascontiguousarray(board), digest_size=16
+        ).digest()
+
+    def _record_history(self):
+        slot = self.board_history[self._history_index]
+        self.alive_counts -= slot
+        np.copyto(slot, self.board)
+        self.alive_counts += slot
+        self._history_index = (self._history_index + 1) % self.depth
+        self.board_hashes.append(self.board_hash(self.board))
+
+    def step_board(self, generations=1):
+        """
+        Performs steps of the game simulation.
+
+        Args:
+            generations (int): The number of generations to step.
+
+        Returns:
+            numpy.ndarray: The game board.
+        """
+        board = self.board
+        padded = self._padded
+        row_sums = self._row_sums
+        counts = self._counts
+        for _ in range(generations):
+            self._record_history()
+
+            padded[1:-1, 1:-1] = board
+            padded[0, 1:-1] = board[-1]
+            padded[-1, 1:-1] = board[0]
+            padded[:, 0] = padded[:, -2]
+            padded[:, -1] = padded[:, 1]
+
+            # sum of each 3x3 window, the cell plus its eight neighbours
+            np.add(padded[:-2], padded[1:-1], out=row_sums)
+            row_sums += padded[2:]
+            np.add(row_sums[:, :-2], row_sums[:, 1:-1], out=counts)
+            counts += row_sums[:, 2:]
+
+            # born with 3 neighbours, survives with 2 or 3
+            np.equal(counts, 3, out=self._born)
+            np.equal(counts, 4, out=self._survived)
+            np.logical_and(self._survived, board, out=self._survived)
+            self._born |= self._survived
+            np.copyto(board, self._born)
+        return board
+
+    def check_board_life(self):
+        """
+        Checks if the game board has stopped changing.
+
+        Returns:
+            bool: True if the game board is dead, False otherwise.
+        """
+        if len(self.board_hashes) < 2:
+            return False
+        if self.board_hashes[-1] == self.board_hashes[-2]:
+            _LOGGER.info("Board has died")
+            self.empty_board_history()
+            self.board[:] = self.random_board()
+            return True
+        return False
+
+    def check_board_oscillating(self, lookback_generations=5):
+        """
+        Checks if the game board is oscillating.
+
+        Args:
+            lookback_generations (int): The number of previous generations to look back.
+
+        Returns:
+            bool: True if the game board is oscillating, False otherwise.
+        """
+        if len(self.board_hashes) < lookback_generations:
+            return False
+        hashes = list(self.board_hashes)[-lookback_generations:]
+        if hashes[-1] in hashes[:-1]:
+            _LOGGER.info("Board is oscillating")
+            self.empty_board_history()
+            self.board[:] = self.random_board()
+            return True
+        return False
+
+    def empty_board_history(self):
+        """
+        Clears the board history.
+        """
+        _LOGGER.info("Erasing history of the universe")
+        self.board_history.fill(0)
+        self.alive_counts.fill(0)
+        self._history_index = 0
+        self.board_hashes.clear()
+
+    def add_glider(self):
+        """
+        Generates a glider somewhere on the board
+        """
+        glider = np.array([[0, 0, 1], [1, 0, 1], [0, 1, 1]])
+        rows, cols = self.board_size
+        start_row = np.random.randint(0, rows - 3)
+        start_col = np.random.randint(0, cols - 3)
+        self.board[start_row : start_row + 3, start_col : start_col + 3] = (
+            glider
+        )
+        _LOGGER.debug("Added glider at: %sx%s", start_row, start_col)
+
+    def add_blinker(self):
+        """
+        Generates a blinker somewhere on the board
+        """
+        blinker = np.array([[1, 1, 1]])
+        rows, cols = self.board_size
+        start_row = np.random.randint(0, rows - 1)
+        start_col = np.random.randint(0, cols - 3)
+        self.board[start_row, start_col : start_col + 3] = blinker
+        _LOGGER.debug("Added blinker at: %sx%s", start_row, start_col)
+
+    def add_toad(self):
+        """
+        Generates a toad somewhere on the board
+        """
+        toad = np.array([[0, 1, 1, 1], [1, 1, 1, 0]])
+        rows, cols = self.board_size
+        start_row = np.random.randint(0, rows - 2)
+        start_col = np.random.randint(0, cols - 4)
+        self.board[start_row : start_row + 2, start_col : start_col + 4] = toad
+        _LOGGER.debug("Added toad at: %sx%s", start_row, start_col)
+
+    def add_beacon(self):
+        """
+        Generates a beacon somewhere on the board
+        """
+        beacon = np.array(
+            [[1, 1, 0, 0], [1, 1, 0, 0], [0, 0, 1, 1], [0, 0, 1, 1]]
+        )
+        rows, cols = self.board_size
+        start_row = np.random.randint(0, rows - 4)
+        start_col = np.random.randint(0, cols - 4)
+        self.board[start_row : start_row + 4, start_col : start_col + 4] = (
+            beacon
+        )
+        _LOGGER.debug("Added beacon at: %sx%s", start_row, start_col)
+
+    def add_random_entity(self):
+        """
+        Generates a random entity on the board
+        """
+        entities = [
+            self.add_glider,
+            self.add_blinker,
+            self.add_toad,
+            self.add_beacon,
+        ]
+        random_entity = random.choice(entities)
+        random_entity()
@@ -0,0 +1,65 @@
+from functools import lru_cache
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+def _read_only(array):
+    array.flags.writeable = False
+    return array
+
+
+@lru_cache(maxsize=256)
+def axis_taps(source: int, target: int):
+    """
+    Where each of target pixels along an axis reads from in source.
+
+    Upscaling reads the nearest source pixel. Downscaling averages every
+    source pixel that falls into the target pixel, up to a fixed number of
+    taps, so each target pixel is the mean of its taps.
+
+    Returns:
+        (taps, target) read-only intp array of source indexes
+    """
+    source = max(1, source)
+    target = max(1, target)
+    if target >= source:
+        centres = (np.arange(target) + 0.5) * (source / target)
+        index = np.minimum(centres.astype(np.intp), source - 1)
+        return _read_only(index[np.newaxis])
+    taps = -(-source // target)
+    start = np.arange(target) * source / target
+    end = np.arange(1, target + 1) * source / target
+    # spread the taps evenly over [start, end) of every target pixel
+    offsets = (np.arange(taps)[:, np.newaxis] + 0.5) / taps
+    index = start + offsets * (end - start)
+    return _read_only(np.minimum(index.astype(np.intp), source - 1))
+
+
+@lru_cache(maxsize=256)
+def tile_index(source: int, target: int):
+    """Source index of each of target pixels when repeating source"""
+    return _read_only(np.arange(max(1, target)) % max(1, source))
+
+
+def stretch_full(source: NDArray, height: int, width: int) -> NDArray:
+    """
+    Resizes a (rows, columns, channels) array to (height, width, channels)
+    with index maps cached per source and target shape.
+    """
+    rows = axis_taps(source.shape[0], height)
+    columns = axis_taps(source.shape[1], width)
+    if len(rows) == 1:
+        result = source.take(rows[0], axis=0)
+    else:
+        result = source.take(rows, axis=0).mean(axis=0)
+    if len(columns) == 1:
+        return result.take(columns[0], axis=1)
+    return result.take(columns, axis=1).mean(axis=1)
+
+
+def stretch_tile(source: NDArray, height: int, width: int) -> NDArray:
+    """Repeats a (rows, columns, channels) array to fill (height, width)"""
+    rows = tile_index(source.shape[0], height)
+    columns = tile_index(source.shape[1], width)
+    return source.take(rows, axis=0).take(columns, axis=1)
@@ -1,12 +1,14 @@
 import logging
 import math
 import os
+from functools import lru_cache
 
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 from ledfx.color import parse_color
 from ledfx.consts import LEDFX_ASSETS_PATH
+from ledfx.effects.utils.canvas import Canvas
 from ledfx.effects.utils.pose import Pose, biased_round
 
 _LOGGER = logging.getLogger(__name__)
@@ -31,6 +33,55 @@ FONT_MAPPINGS = {
 }
 
 
+@lru_cache(maxsize=16)
+def load_font(font_path, points):
+    """Shared FreeType font, Sentences are rebuilt whenever text changes"""
+    return ImageFont.truetype(font_path, points)
+
+
+@lru_cache(maxsize=256)
+def _word_image(word):
+    """
+    The greyscale mask of a word, as a PIL image just big enough to hold
+    the text. word is the (text, font_path, points, fill) tuple.
+    """
+    text, font_path, points, fill = word
+    font = load_font(font_path, points)
+    ascent, descent = font.getmetrics()
+    dummy_draw = ImageDraw.Draw(Image.new("L", (1, 1)))
+    left, top, right, bottom = dummy_draw.textbbox((0, 0), text, font=font)
+    image = Image.new("L", (right - left, ascent + descent))
+    ImageDraw.Draw(image).text((0, 0), text, font=font, fill=fill)
+    return image
+
+
+@lru_cache(maxsize=256)
+def _rotated_word(word, angle, resample):
+    """The word mask rotated by a whole number of degrees, with expand"""
+    image = _word_image(word)
+    if angle == 0:
+        return image
+    return image.rotate(angle, expand=True, resample=resample)
+
+
+@lru_cache(maxsize=1024)
+def word_bitmap(word, angle, width, height, resample):
+    """
+    Pre-rendered word mask, rotated by angle degrees then resized to
+    width x height, as a read-only uint8 array of shape (height, width).
+
+    The integer output size is the quantised scale, so every pose size
+    that rounds to the same bitmap shares one entry, and the entries are
+    shared by every Textblock showing the same word in the same font.
+    """
+    rotated = _rotated_word(word, angle, resample)
+    if rotated.size != (width, height):
+        rotated = rotated.resize((width, height), resample=resample)
+    mask = np.array(rotated, dtype=np.uint8)
+    mask.flags.writeable = False
+    return mask
+
+
 class Textblock:
     # this class is intended to establish a pillow image object with rendered text within it
     # text will be created from the passed font at the requested size
@@ -59,20 +110,16 @@ class Textblock:
         self.text = text
         self.color = color
         self.ascent, self.descent = font.getmetrics()
-        dummy_image = Image.new("L", (1, 1))
-        dummy_draw = ImageDraw.Draw(dummy_image)
-        left, top, right, bottom = dummy_draw.textbbox((0, 0), text, font=font)
-        self.width = right - left
+        # word images are greyscale masks only, shared through the cache
+        self.word = (text, font.path, font.size, color)
+        self.image = _word_image(self.word)
+        self.width = self.image.width
         self.height = self.descent + self.ascent
         self.w_width = self.width / (disp_size[0] / 2)
         self.w_height = self.height / (disp_size[0] / 2)
         self.h_width = self.width / (disp_size[1] / 2)
         self.h_height = self.height / (disp_size[1] / 2)
 
-        # word images are greyscale masks only
-        self.image = Image.new("L", (self.width, self.height))  # , "grey")
-        self.draw = ImageDraw.Draw(self.image)
-        self.draw.text((0, 0), self.text, font=font, fill=color)
         self.pose = Pose(0, 0, 0, 1, 0, 1)
 
     def update(self, dt):
@@ -125,8 +172,9 @@ class Textblock:
 
         Parameters
         ----------
-        target : Image
-            The target image to render the text block to
+        target : Image or Canvas
+            The target to render the text block to, a Canvas is blended
+            into directly with numpy
         resize_method : int
             The resampling method to use when resizing the text block
         color : tuple
@@ -151,43 +199,44 @@ class Textblock:
             e_x = round(abs(pose_x) * half_width) - c_width / 2
             e_y = round(abs(pose_y) * half_height) - c_height / 2
             if e_x < half_width and e_y < half_height:
-                resized = self.image.rotate(
-                    self.pose.ang * 360, expand=True, resample=resize_method
-                )
-                resized = resized.resize(
-                    (
-                        max(1, round(resized.width * self.pose.size)),
-                        max(1, round(resized.height * self.pose.size)),
-                    ),
-                    resample=resize_method,
+                # rotation is quantised to whole degrees, and scale to the
+                # integer bitmap size, so transformed words come from the
+                # shared bitmap cache rather than PIL on every frame
+                angle = round(self.pose.ang * 360) % 360
+                rotated = _rotated_word(self.word, angle, resize_method)
+                mask = word_bitmap(
+                    self.word,
+                    angle,
+                    max(1, round(rotated.width * self.pose.size)),
+                    max(1, round(rotated.height * self.pose.size)),
+                    resize_method,
                 )
+                height, width = mask.shape
                 # self.pos is a scalar for x and y in the range -1 to 1
                 # the pos position is for the center of the image
-                # here we will convert it to a pixel position within target which is a PIL image object
+                # here we will convert it to a pixel position within target
 
                 # biased rounding is an accepted technique to bump values off
                 # the rounding cusp and to avoid unwanted glitches visible to
                 # the end user this prevents text jumping up a line
                 # unexpoectedly it does just move the issue, but FAR less likely
                 # to express
-                x = biased_round(
-                    ((pose_x + 1) * half_width) - (resized.width / 2)
-                )
-                y = biased_round(
-                    ((pose_y + 1) * half_height) - (resized.height / 2)
-                )
+                x = biased_round(((pose_x + 1) * half_width) - (width / 2))
+                y = biased_round(((pose_y + 1) * half_height) - (height / 2))
 
                 # _LOGGER.info(
                 #     "Textblock %s x: %s y: %s %s %s ang: %s size: %s", self.text, self.pose.x, self.pose.y, x, y, self.pose.ang, self.pose.size)
 
                 capped_alpha = min(1.0, max(0.0, self.pose.alpha))
-                if capped_alpha < 1.0:
-                    img_array = np.array(resized)
-                    modified_array = np.clip(
-                        img_array * capped_alpha, 0, 255
-                    ).astype(np.uint8)
-                    resized = Image.fromarray(modified_array, mode="L")
+                if isinstance(target, Canvas):
+                    target.blend_mask(mask, x, y, color, capped_alpha)
+                    return
 
+                if capped_alpha < 1.0:
+                    mask = np.clip(mask * capped_alpha, 0, 255).astype(
+                        np.uint8
+                    )
+                resized = Image.fromarray(mask, mode="L")
                 if color is not None:
                     color_img = Image.new("RGBA", resized.size, color)
                     r, g, b, a = color_img.split()
@@ -224,7 +273,7 @@ class Sentence:
         self.font_path = FONT_MAPPINGS[font_name]
         self.points = points
         self.start_color = parse_color("white")
-        self.font = ImageFont.truetype(self.font_path, self.points)
+        self.font = load_font(self.font_path, self.points)
         self.wordblocks = []
 
         for word in self.text.split():
@@ -276,8 +325,8 @@ class Sentence:
 
         Parameters
         ----------
-        target : Image
-            The target image to render the sentence to
+        target : Image or Canvas
+            The target to render the sentence to
         resize_method : int
             The resampling method to use when resizing the text block
         color : list
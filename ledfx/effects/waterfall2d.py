@@ -172,8 +172,12 @@ class Waterfall(Twod, GradientEffect):
         Args:
             data: The audio data to process.
         """
-        self.r = self.melbank(filtered=True, size=self.pixel_count)
-        np.clip(self.r, 0, 1, out=self.r)
+        np.clip(
+            self.melbank(filtered=True, size=self.pixel_count),
+            0,
+            1,
+            out=self.r,
+        )
 
     def prep_frame_vars(self):
         """
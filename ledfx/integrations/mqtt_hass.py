@@ -11,6 +11,7 @@ from ledfx.consts import PROJECT_VERSION
 from ledfx.effects.audio import AudioInputSource
 from ledfx.events import Event
 from ledfx.integrations import Integration
+from ledfx.transitions import Transitions
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -307,18 +308,7 @@ class MQTT_HASS(Integration):
                     "stat_t": "~/state",
                     "icon": "mdi:transfer-right",
                     "entity_category": "config",
-                    "options": list(
-                        [
-                            "Add",
-                            "Dissolve",
-                            "Push",
-                            "Slide",
-                            "Iris",
-                            "Through White",
-                            "Through Black",
-                            "None",
-                        ]
-                    ),
+                    "options": list(Transitions),
                     "device": hass_device,
                 }
             ),
@@ -0,0 +1,84 @@
+"""Latest frame of every virtual, shared with effects that consume them."""
+
+import threading
+import time
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+
+class PublishedFrame(NamedTuple):
+    """A virtual's frame as published on the FrameBus"""
+
+    # increases by one on every publish from the virtual
+    version: int
+    # read-only (rows, columns, 3) array of 0-255 floats
+    frame: np.ndarray
+    # time.perf_counter() at publish
+    timestamp: float
+
+
+class FrameBus:
+    """
+    Each virtual publishes its latest frame here, after transitions and
+    before brightness, as a read-only view of the array it assembled.
+
+    Virtuals assemble every frame into a new array, so publishing and
+    reading copy nothing. Consumers such as Blender read other virtuals'
+    frames without reaching into their effects, and can use the version
+    to skip work when a source has not changed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._frames = {}
+
+    def publish(
+        self, virtual_id: str, frame: np.ndarray, rows: int = 1
+    ) -> PublishedFrame:
+        """
+        Publishes a virtual's frame.
+
+        Args:
+            virtual_id: id of the publishing virtual
+            frame: (pixel_count, 3) frame, it must not be written to after
+                publishing
+            rows: rows of the virtual, the frame is shaped to
+                (rows, pixel_count // rows, 3) with any partial row dropped
+
+        Returns:
+            The published frame
+        """
+        rows = max(1, min(rows, len(frame)))
+        columns = len(frame) // rows
+        view = frame[: rows * columns].reshape(rows, columns, -1).view()
+        view.flags.writeable = False
+        with self._lock:
+            previous = self._frames.get(virtual_id)
+            published = PublishedFrame(
+                previous.version + 1 if previous else 1,
+                view,
+                time.perf_counter(),
+            )
+            self._frames[virtual_id] = published
+        return published
+
+    def get(self, virtual_id: str) -> Optional[PublishedFrame]:
+        """Latest frame of a virtual, or None if it has not published"""
+        return self._frames.get(virtual_id)
+
+    def remove(self, virtual_id: str):
+        """Drops a virtual's frame, when the virtual is destroyed"""
+        with self._lock:
+            self._frames.pop(virtual_id, None)
+
+    def get_stats(self) -> dict:
+        """Version and shape of every published frame"""
+        frames = dict(self._frames)
+        return {
+            virtual_id: {
+                "version": published.version,
+                "shape": list(published.frame.shape),
+            }
+            for virtual_id, published in frames.items()
+        }
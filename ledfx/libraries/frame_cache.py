@@ -0,0 +1,264 @@
+"""Decoded animation frame cache for LedFx."""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import numpy as np
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FrameCache:
+    """
+    Process wide cache of decoded image frames, shared by every effect and
+    virtual showing the same image at the same size.
+
+    Frames are stored as read-only uint8 arrays of shape
+    (n_frames, height, width, channels).
+
+    Cache Policy:
+    - LRU eviction from memory when max_memory_mb is exceeded
+    - Optional disk tier: entries evicted from memory are written as .npy
+      files and memory-mapped back on the next request, LRU evicted when
+      max_disk_mb is exceeded
+    - Keys include the source file's modification time, so edited or
+      re-downloaded images are decoded again
+    """
+
+    def __init__(
+        self,
+        config_dir: str,
+        max_memory_mb: int = 256,
+        disk_tier: bool = False,
+        max_disk_mb: int = 1024,
+    ):
+        """
+        Initialize frame cache.
+
+        Args:
+            config_dir: LedFx configuration directory
+            max_memory_mb: Memory budget for decoded frames in megabytes
+            disk_tier: Keep frames evicted from memory on disk
+            max_disk_mb: Disk budget for the disk tier in megabytes
+        """
+        self.cache_dir = os.path.join(config_dir, "cache", "frames")
+        self.max_memory_bytes = max_memory_mb * 1024 * 1024
+        self.disk_tier = disk_tier
+        self.max_disk_bytes = max_disk_mb * 1024 * 1024
+        if self.disk_tier:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._memory_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        source: str, size: Optional[tuple], resample, variant: str = ""
+    ) -> Optional[tuple]:
+        """
+        Builds the cache key for a source image.
+
+        Args:
+            source: Path of the image file
+            size: Target (width, height), or None for the native size
+            resample: PIL resampling filter used for resizing
+            variant: Distinguishes different decodings of the same source
+
+        Returns:
+            Key tuple, or None if the source is not a file that can be keyed
+        """
+        if not source:
+            return None
+        try:
+            mtime = os.path.getmtime(source)
+        except OSError:
+            return None
+        return (
+            os.path.abspath(source),
+            mtime,
+            tuple(size) if size else None,
+            int(resample) if resample is not None else None,
+            variant,
+        )
+
+    def _disk_path(self, key: tuple) -> str:
+        digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.npy")
+
+    def get(self, key: tuple) -> Optional[np.ndarray]:
+        """
+        Get cached frames, checking memory then the disk tier.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Read-only frame array or None if not cached
+        """
+        with self._lock:
+            frames = self._entries.get(key)
+            if frames is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return frames
+
+        if self.disk_tier:
+            path = self._disk_path(key)
+            if os.path.exists(path):
+                try:
+                    frames = np.load(path, mmap_mode="r")
+                    os.utime(path)
+                except (OSError, ValueError) as e:
+                    _LOGGER.warning(
+                        "Failed to load cached frames %s: %s", path, e
+                    )
+                else:
+                    with self._lock:
+                        self.disk_hits += 1
+                    _LOGGER.debug("Frame cache disk hit for %s", key[0])
+                    return frames
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: tuple, frames: np.ndarray) -> np.ndarray:
+        """
+        Store decoded frames.
+
+        Args:
+            key: Key from make_key()
+            frames: uint8 array of shape (n_frames, height, width, channels)
+
+        Returns:
+            The stored, read-only frame array
+        """
+        frames = np.ascontiguousarray(frames, dtype=np.uint8)
+        frames.flags.writeable = False
+
+        evicted = []
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= previous.nbytes
+            if frames.nbytes <= self.max_memory_bytes:
+                self._entries[key] = frames
+                self._memory_bytes += frames.nbytes
+            else:
+                evicted.append((key, frames))
+            while self._memory_bytes > self.max_memory_bytes:
+                old_key, old_frames = self._entries.popitem(last=False)
+                self._memory_bytes -= old_frames.nbytes
+                evicted.append((old_key, old_frames))
+
+        for old_key, old_frames in evicted:
+            _LOGGER.debug("Evicting frames from memory: %s", old_key[0])
+            if self.disk_tier:
+                self._write_disk(old_key, old_frames)
+        return frames
+
+    def get_or_create(
+        self, key: Optional[tuple], decode: Callable[[], np.ndarray]
+    ) -> np.ndarray:
+        """
+        Get cached frames, decoding and storing them on a miss.
+
+        Args:
+            key: Key from make_key(), None disables caching
+            decode: Returns the uint8 frame array for the key
+
+        Returns:
+            Read-only frame array
+        """
+        if key is None:
+            frames = np.ascontiguousarray(decode(), dtype=np.uint8)
+            frames.flags.writeable = False
+            return frames
+        frames = self.get(key)
+        if frames is None:
+            frames = self.put(key, decode())
+        return frames
+
+    def _write_disk(self, key: tuple, frames: np.ndarray):
+        path = self._disk_path(key)
+        if os.path.exists(path):
+            return
+        try:
+            # write then rename, so readers never map a partial file
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, frames)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            _LOGGER.warning("Failed to write frame cache %s: %s", path, e)
+            return
+        self._enforce_disk_limit()
+
+    def _enforce_disk_limit(self):
+        """Evict least recently used disk entries over max_disk_mb."""
+        try:
+            files = []
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith(".npy"):
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            return
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError as e:
+                _LOGGER.warning("Failed to delete frame cache %s: %s", path, e)
+
+    def clear(self) -> dict:
+        """
+        Clear the memory cache and the disk tier.
+
+        Returns:
+            Dict with cleared_count and freed_bytes from memory
+        """
+        with self._lock:
+            cleared_count = len(self._entries)
+            freed_bytes = self._memory_bytes
+            self._entries.clear()
+            self._memory_bytes = 0
+        if self.disk_tier and os.path.isdir(self.cache_dir):
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith(".npy"):
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+        return {"cleared_count": cleared_count, "freed_bytes": freed_bytes}
+
+    def get_stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with memory usage and budget, entry count, and hit, disk
+            hit and miss counters
+        """
+        with self._lock:
+            return {
+                "memory_bytes": self._memory_bytes,
+                "max_memory_bytes": self.max_memory_bytes,
+                "entries": len(self._entries),
+                "disk_tier": self.disk_tier,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+            }
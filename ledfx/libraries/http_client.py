@@ -0,0 +1,154 @@
+"""Shared HTTP client for talking to device control APIs."""
+
+import asyncio
+import json
+import logging
+from collections.abc import Mapping
+from typing import NamedTuple
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+# connections open at once, in total and to any one device. Small
+# controllers such as WLED only serve a few sockets, so requests beyond
+# this wait for a free connection rather than being refused
+MAX_CONNECTIONS = 64
+MAX_CONNECTIONS_PER_HOST = 2
+# seconds an idle connection is kept open for the next request
+KEEPALIVE_TIMEOUT = 15
+DEFAULT_TIMEOUT = 2.0
+
+
+class DeviceHttpError(Exception):
+    """The device could not be reached or did not answer in time"""
+
+
+class DeviceResponse(NamedTuple):
+    """A fully read response, usable after the connection is released"""
+
+    status_code: int
+    headers: Mapping
+    content: bytes
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class DeviceHttpClient:
+    """
+    Pooled, non-blocking HTTP client shared by every device.
+
+    One aiohttp session keeps connections to each device alive between
+    requests, and bounds how many are open at once per device, so the
+    requests of many devices initialising or changing sync mode together
+    run concurrently without stalling the event loop or overloading any
+    one controller.
+
+    The session is created on first use in the running loop, and replaced
+    if that loop has since closed.
+    """
+
+    def __init__(
+        self,
+        limit=MAX_CONNECTIONS,
+        limit_per_host=MAX_CONNECTIONS_PER_HOST,
+        timeout=DEFAULT_TIMEOUT,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self._session = None
+        self._loop = None
+        self.requests = 0
+        self.errors = 0
+
+    def _get_session(self):
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._loop is not loop
+        ):
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._loop = loop
+        return self._session
+
+    async def request(self, method, url, timeout=None, **kwargs):
+        """
+        Sends a request and reads the whole response.
+
+        Args:
+            method: HTTP method, such as "GET" or "POST"
+            url: full url of the request
+            timeout: seconds for the whole request, including waiting for
+                a free connection
+            **kwargs: passed on to aiohttp, such as json, data or headers
+
+        Returns:
+            DeviceResponse
+
+        Raises:
+            DeviceHttpError: if the device can't be reached in time
+        """
+        session = self._get_session()
+        client_timeout = aiohttp.ClientTimeout(
+            total=self.timeout if timeout is None else timeout
+        )
+        self.requests += 1
+        try:
+            async with session.request(
+                method, url, timeout=client_timeout, **kwargs
+            ) as response:
+                content = await response.read()
+                return DeviceResponse(
+                    response.status, response.headers, content
+                )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.errors += 1
+            raise DeviceHttpError(f"{method} {url} failed: {e!r}") from e
+
+    def request_threadsafe(self, loop, method, url, timeout=None, **kwargs):
+        """
+        Schedules a request on the event loop from another thread, such
+        as a device's flush, without waiting for it.
+
+        Returns:
+            concurrent.futures.Future of the DeviceResponse
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.request(method, url, timeout, **kwargs), loop
+        )
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+    def get_stats(self):
+        connector = self._session.connector if self._session else None
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "open": connector is not None and not connector.closed,
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+        }
+
+
+device_http = DeviceHttpClient()
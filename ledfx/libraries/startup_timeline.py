@@ -0,0 +1,74 @@
+"""Timing of the steps LedFx takes to start up."""
+
+import logging
+import time
+from contextlib import contextmanager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StartupTimeline:
+    """
+    Records when each startup step began and how long it took, relative
+    to the start of the timeline, so slow devices or phases are easy to
+    spot. Steps may overlap, as devices initialise concurrently.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self.started = clock()
+        self.finished = None
+        self.events = []
+
+    def record(self, name, start, end=None, **details):
+        """Adds a step that ran from start to end, clock times"""
+        end = start if end is None else end
+        self.events.append(
+            {
+                "name": name,
+                "start_ms": round((start - self.started) * 1000, 1),
+                "duration_ms": round((end - start) * 1000, 1),
+                **details,
+            }
+        )
+
+    def mark(self, name, **details):
+        """Adds an instant, such as the first frame of a virtual"""
+        self.record(name, self._clock(), **details)
+
+    @contextmanager
+    def phase(self, name, **details):
+        """Times the body of the with block as one step"""
+        start = self._clock()
+        try:
+            yield details
+        finally:
+            self.record(name, start, self._clock(), **details)
+
+    def finish(self):
+        self.finished = self._clock()
+
+    @property
+    def total_ms(self):
+        end = self._clock() if self.finished is None else self.finished
+        return round((end - self.started) * 1000, 1)
+
+    def get_timeline(self):
+        return {
+            "complete": self.finished is not None,
+            "total_ms": self.total_ms,
+            "events": sorted(self.events, key=lambda e: e["start_ms"]),
+        }
+
+    def log_summary(self, slowest=5):
+        """Logs the total startup time and the slowest steps"""
+        _LOGGER.info("Startup took %.0f ms", self.total_ms)
+        for event in sorted(
+            self.events, key=lambda e: e["duration_ms"], reverse=True
+        )[:slowest]:
+            _LOGGER.info(
+                "  %s: %.0f ms (at %.0f ms)",
+                event["name"],
+                event["duration_ms"],
+                event["start_ms"],
+            )
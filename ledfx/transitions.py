@@ -5,23 +5,85 @@ import numpy as np
 _LOGGER = logging.getLogger(__name__)
 
 
+# Mask transitions show the outgoing effect on every pixel whose threshold
+# is above the transition weight, so each one is just a threshold map.
+# u runs across and v down the matrix, both 0 to 1. Strips only have the
+# one axis, so there v is u.
+MASK_TRANSITIONS = {
+    "Dissolve": lambda u, v: np.random.rand(len(u)),
+    "Slide": lambda u, v: 1 - u,
+    "Iris": lambda u, v: np.sqrt(((2 * u - 1) ** 2 + (2 * v - 1) ** 2) / 2),
+    "Wipe Down": lambda u, v: v,
+    "Wipe Up": lambda u, v: 1 - v,
+    "Diagonal": lambda u, v: (u + v) / 2,
+    "Diamond": lambda u, v: (np.abs(2 * u - 1) + np.abs(2 * v - 1)) / 2,
+}
+
+
+class MaskTransition:
+    """NAMED_FUNCTIONS entry for a transition in MASK_TRANSITIONS"""
+
+    def __init__(self, mode):
+        self.mode = mode
+
+    def __call__(self, transitions, x1, x2, weight):
+        transitions.mask(self.mode, x1, x2, weight)
+
+
 class IterClass(type):
     def __iter__(cls):
         yield from getattr(cls, "NAMED_FUNCTIONS").keys()
 
 
 class Transitions(metaclass=IterClass):
-    def __init__(self, pixel_count, max_brightness=1, min_brightness=0):
-        self.pixel_count = pixel_count
+    def __init__(
+        self, pixel_count, max_brightness=1, min_brightness=0, rows=1
+    ):
         self.max_brightness = max_brightness
         self.min_brightness = min_brightness
-        self.dissolve_array = np.random.rand(pixel_count)
-        i = np.linspace(1, 0, pixel_count)
-        # This monstrosity fixes the creation of an array of i+1 length for uneven arrays,
-        # breaking transitions on unevenly sized arrays
-        # [-1::-2] or [-2::-2]
-        # https://discord.com/channels/469985374052286474/785654790247546941/835507683129032725
-        self.iris_array = np.concatenate([i[::2], i[-1 + len(i) % -2 :: -2]])
+        self.rows = max(1, rows)
+        self.resize(pixel_count)
+
+    def resize(self, pixel_count):
+        """
+        Sizes the transitions for a virtual, dropping any threshold maps
+        built for the previous layout. Maps are built on first use.
+        """
+        self.pixel_count = pixel_count
+        if self.rows > 1 and pixel_count >= self.rows:
+            self.cols = pixel_count // self.rows
+        else:
+            self.cols = pixel_count
+        self._thresholds = {}
+        self._mask = np.zeros(pixel_count, dtype=bool)
+        # broadcasts the mask over the color channels in np.copyto
+        self._pixel_mask = self._mask[:, np.newaxis]
+
+    def set_rows(self, rows):
+        """Follows the virtual's rows, rebuilding maps if they change"""
+        rows = max(1, rows)
+        if rows != self.rows:
+            self.rows = rows
+            self.resize(self.pixel_count)
+
+    def _coordinates(self):
+        """Position of every pixel as (u across, v down), both 0 to 1"""
+        index = np.arange(self.pixel_count)
+        if self.cols == self.pixel_count:
+            u = index / max(1, self.pixel_count - 1)
+            return u, u
+        u = (index % self.cols) / max(1, self.cols - 1)
+        # pixels past the last full row are kept on the bottom row
+        v = np.minimum(1, (index // self.cols) / max(1, self.rows - 1))
+        return u, v
+
+    def threshold(self, mode):
+        """The threshold map of a mask transition, built once per layout"""
+        threshold = self._thresholds.get(mode)
+        if threshold is None:
+            threshold = MASK_TRANSITIONS[mode](*self._coordinates())
+            self._thresholds[mode] = threshold
+        return threshold
 
     def __getitem__(cls, mode):
         return getattr(cls, "NAMED_FUNCTIONS")[mode]
@@ -41,46 +103,62 @@ class Transitions(metaclass=IterClass):
                 np.shape(x2),
             )
             return False
+        if len(x1) != self.pixel_count:
+            self.resize(len(x1))
         return True
 
+    def _grid(self, x):
+        """(rows, cols, 3) view of the full rows of a frame"""
+        return x[: self.rows * self.cols].reshape(self.rows, self.cols, -1)
+
     def add(self, x1, x2, weight):
         """
         weighted additive blending of x1 and x2
         operates on x1 directly
         """
+        # x2 + (x1 - x2) * weight, without a temporary
+        np.subtract(x1, x2, x1)
         np.multiply(x1, weight, x1)
-        x3 = np.multiply(x2, 1 - weight)
-        np.add(x1, x3, x1)
+        np.add(x1, x2, x1)
+
+    def mask(self, mode, x1, x2, weight):
+        """
+        pixels of x1 whose threshold in the mode's map is above weight are
+        set to the value of x2
+        """
+        np.greater(self.threshold(mode), weight, out=self._mask)
+        np.copyto(x1, x2, where=self._pixel_mask)
 
     def dissolve(self, x1, x2, weight):
         """
         random indexes of x1 are set to the value of x2
         roughly proportional in quantity to weight
         """
-        indexes = np.greater(self.dissolve_array, weight)
-        x1[indexes, :] = x2[indexes, :]
+        self.mask("Dissolve", x1, x2, weight)
 
     def push(self, x1, x2, weight):
         """
         x1 "pushes" x2 to the side, proportional to weight
+        along each row of a matrix
         """
-        idx = int((1 - weight) * self.pixel_count)
-        x2 = np.roll(x2, idx, axis=0)
-        x1[:idx, :] = x2[:idx, :]
+        if self.cols == self.pixel_count:
+            idx = int((1 - weight) * self.pixel_count)
+            x1[:idx, :] = x2[self.pixel_count - idx :, :]
+        else:
+            idx = int((1 - weight) * self.cols)
+            self._grid(x1)[:, :idx] = self._grid(x2)[:, self.cols - idx :]
 
     def slide(self, x1, x2, weight):
         """
         x1 overlaps x2 from the side, proportional to weight
         """
-        idx = int((1 - weight) * self.pixel_count)
-        x1[:idx, :] = x2[:idx, :]
+        self.mask("Slide", x1, x2, weight)
 
     def iris(self, x1, x2, weight):
         """
         x2 overlaps x1 from the centre, proportional to weight
         """
-        indexes = np.greater(self.iris_array, weight)
-        x1[indexes, :] = x2[indexes, :]
+        self.mask("Iris", x1, x2, weight)
 
     def throughWhite(self, x1, x2, weight):
         """
@@ -108,5 +186,10 @@ class Transitions(metaclass=IterClass):
         "Iris": iris,
         "Through White": throughWhite,
         "Through Black": throughBlack,
+        **{
+            mode: MaskTransition(mode)
+            for mode in MASK_TRANSITIONS
+            if mode not in ("Dissolve", "Slide", "Iris")
+        },
         "None": "None",
     }
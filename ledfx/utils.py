@@ -50,6 +50,8 @@ from ledfx.config import save_config
 from ledfx.consts import LEDFX_ASSETS_PATH, PROJECT_VERSION
 from ledfx.events import ColorsUpdatedEvent
 from ledfx.libraries.cache import ImageCache
+from ledfx.libraries.frame_cache import FrameCache
+from ledfx.libraries.http_client import DeviceHttpError, device_http
 from ledfx.utilities.security_utils import (
     DOWNLOAD_TIMEOUT,
     MAX_IMAGE_SIZE_BYTES,
@@ -337,9 +339,11 @@ class WLED:
         url = f"http://{ip_address}/{endpoint}"
 
         try:
-            response = method(url, timeout=timeout, **kwargs)
+            response = await device_http.request(
+                method, url, timeout=timeout, **kwargs
+            )
 
-        except requests.exceptions.RequestException:
+        except DeviceHttpError:
             msg = f"WLED {ip_address}: Failed to connect"
             raise ValueError(msg)
 
@@ -351,9 +355,7 @@ class WLED:
 
     @staticmethod
     async def _get_sync_settings(ip_address):
-        response = await WLED._wled_request(
-            requests.get, ip_address, "json/cfg"
-        )
+        response = await WLED._wled_request("GET", ip_address, "json/cfg")
         return response.json()
 
     async def flush_sync_settings(self):
@@ -364,10 +366,10 @@ class WLED:
         # if self.reboot_flag:
         #     self.sync_settings["rb"] = True
         await WLED._wled_request(
-            requests.post,
+            "POST",
             self.ip_address,
             "json/cfg",
-            data=self.sync_settings,
+            json=self.sync_settings,
         )
         self.reboot_flag = False
 
@@ -385,7 +387,7 @@ class WLED:
             "WLED %s: Attempting to contact device...", self.ip_address
         )
         response = await WLED._wled_request(
-            requests.get, self.ip_address, "json/info"
+            "GET", self.ip_address, "json/info"
         )
 
         wled_config = response.json()
@@ -411,7 +413,7 @@ class WLED:
         """
         _LOGGER.info("WLED %s: Attempting to get nodes...", self.ip_address)
         response = await WLED._wled_request(
-            requests.get, self.ip_address, "json/nodes"
+            "GET", self.ip_address, "json/nodes"
         )
 
         wled_nodes = response.json()
@@ -430,7 +432,7 @@ class WLED:
             state, dict. Full device state
         """
         response = await WLED._wled_request(
-            requests.get, self.ip_address, "json/state"
+            "GET", self.ip_address, "json/state"
         )
 
         return response.json()
@@ -467,7 +469,7 @@ class WLED:
         """
         power = {"on": True if state else False}
         await WLED._wled_request(
-            requests.post, self.ip_address, "/json/state", data=power
+            "POST", self.ip_address, "/json/state", json=power
         )
 
         _LOGGER.info(
@@ -487,7 +489,7 @@ class WLED:
         bri = {"bri": brightness}
 
         await WLED._wled_request(
-            requests.post, self.ip_address, "/json/state", data=bri
+            "POST", self.ip_address, "/json/state", json=bri
         )
 
         _LOGGER.info(
@@ -622,11 +624,11 @@ class WLED:
         """
         reboot = {"rb": True}
         await WLED._wled_request(
-            requests.post,
+            "POST",
             self.ip_address,
             "/json/state",
             timeout=3,
-            data=reboot,
+            json=reboot,
         )
 
 
@@ -1519,6 +1521,7 @@ def clip_at_limit(numbers, limit):
 # Global image cache instance and config directory
 _image_cache = None
 _config_dir = None
+_frame_cache = None
 
 
 def init_image_cache(
@@ -1546,6 +1549,38 @@ def get_image_cache():
     return _image_cache
 
 
+def init_frame_cache(
+    config_dir: str,
+    max_memory_mb: int = 256,
+    disk_tier: bool = False,
+    max_disk_mb: int = 1024,
+):
+    """
+    Initialize global decoded frame cache.
+
+    Args:
+        config_dir: LedFx configuration directory
+        max_memory_mb: Memory budget for decoded frames in MB (default 256)
+        disk_tier: Keep frames evicted from memory on disk (default False)
+        max_disk_mb: Disk budget for the disk tier in MB (default 1024)
+    """
+    global _frame_cache
+
+    _frame_cache = FrameCache(
+        config_dir, max_memory_mb, disk_tier, max_disk_mb
+    )
+    _LOGGER.info(
+        "Frame cache initialized: max %sMB, disk tier %s",
+        max_memory_mb,
+        disk_tier,
+    )
+
+
+def get_frame_cache():
+    """Get the global decoded frame cache instance."""
+    return _frame_cache
+
+
 def validate_local_image_path(file_path: str) -> tuple[bool, str | None]:
     """
     Validate that local image file path is within allowed directories (path traversal protection).
@@ -9,13 +9,18 @@ import numpy as np
 import voluptuous as vol
 
 from ledfx.config import save_config
+from ledfx.devices.utils.frame_sync import FrameSync
+from ledfx.devices.utils.layers import BLEND_MODES
+from ledfx.devices.utils.socket_singleton import udp_sender
 from ledfx.effects import DummyEffect
 from ledfx.effects.math import CalibratorPatternCache, interpolate_pixels
 from ledfx.effects.melbank import (
+    DEFAULT_AUDIO_SOURCE,
     MAX_FREQ,
     MIN_FREQ,
     FrequencyRange,
 )
+from ledfx.effects.oneshots.compositor import OneshotCompositor
 from ledfx.effects.oneshots.oneshot import Oneshot
 from ledfx.events import (
     EffectClearedEvent,
@@ -108,6 +113,11 @@ class Virtual:
                     max=MAX_FREQ,
                 ),
             ),  # AND HERE TOO,
+            vol.Optional(
+                "audio_source",
+                description="Named audio source for this virtual's audio reactive effects",
+                default=DEFAULT_AUDIO_SOURCE,
+            ): str,
             vol.Optional(
                 "rows",
                 description="Amount of rows. > 1 if this virtual is a matrix",
@@ -119,6 +129,18 @@ class Virtual:
                 description="90 Degree rotations",
                 default=0,
             ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3)),
+            vol.Optional(
+                "layer_blend",
+                description="Render as a layer blended over the other virtuals on its devices, instead of replacing their pixels",
+            ): vol.In(BLEND_MODES),
+            vol.Optional(
+                "layer_opacity",
+                description="Opacity of the layer",
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
+            vol.Optional(
+                "sync_output",
+                description="Send to all devices together so they show each frame at the same moment, using the DDP push or E1.31 sync",
+            ): bool,
         }
     )
 
@@ -192,8 +214,9 @@ class Virtual:
         self._hl_start = 0
         self._hl_end = 0
         self._hl_step = 1
-        self._oneshots = []
+        self._oneshots = OneshotCompositor()
         self._os_active = False
+        self._frame_sync = None
         self.lock = threading.Lock()
         self.clear_handle = None
         self.fallback_effect_type = None
@@ -341,7 +364,9 @@ class Virtual:
 
     def _reactivate_effect(self):
         self.clear_transition_effect()
-        self.transitions = Transitions(self.effective_pixel_count)
+        self.transitions = Transitions(
+            self.effective_pixel_count, rows=self.rows
+        )
         if self._active_effect is not None:
             self._active_effect._deactivate()
             if self.pixel_count > 0:
@@ -940,8 +965,14 @@ class Virtual:
                 ):
                     self.clear_transition_effect()
 
-            np.multiply(frame, self._config["max_brightness"], frame)
-            np.multiply(frame, self._ledfx.config["global_brightness"], frame)
+            # the published frame is shared read-only with other virtuals,
+            # so brightness is applied into a new array
+            self._ledfx.frame_bus.publish(self.id, frame, self.rows)
+            frame = np.multiply(
+                frame,
+                self._config["max_brightness"]
+                * self._ledfx.config["global_brightness"],
+            )
         return frame
 
     def activate(self):
@@ -984,6 +1015,8 @@ class Virtual:
         if hasattr(self, "_thread"):
             self._thread.join()
         self.deactivate_segments()
+        if self._frame_sync is not None:
+            self._frame_sync.close()
         self._ledfx.events.fire_event(
             VirtualPauseEvent(self.id, not self._active)
         )
@@ -1017,20 +1050,14 @@ class Virtual:
         if pixels is None:
             pixels = self.assembled_frame
 
-        # Where we update oneshots
-        oneshot_index = 0
-        while oneshot_index < len(self._oneshots):
-            oneshot = self._oneshots[oneshot_index]
-            oneshot.update()
-            if not oneshot.active:
-                self._oneshots.remove(oneshot)
-            else:
-                oneshot_index += 1
-
         if self._config["mapping"] == "span":
             # In span mode we can calculate the final pixels once for all segments
             pixels = self._effective_to_physical_pixels(pixels)
 
+        # Where we override the frame, once for every segment and device
+        if not self._calibration:
+            self._oneshots.apply(pixels)
+
         debug_track = (
             self._active_effect
             and self._active_effect.logsec
@@ -1048,9 +1075,18 @@ class Virtual:
             and self._device_remap
             and not self._calibration
         ):
-            self._flush_complex_segments(pixels)
+            flush_segments = self._flush_complex_segments
+        else:
+            flush_segments = self._flush_simple_segments
+
+        if self._config.get("sync_output", False):
+            # devices hand their packets to the batch, sent as it closes
+            with self.frame_sync.batch():
+                flush_segments(pixels)
         else:
-            self._flush_simple_segments(pixels)
+            # the devices' UDP packets go out together as the batch closes
+            with udp_sender.batch():
+                flush_segments(pixels)
 
         if debug_track:
             flush_time = time.perf_counter() - flush_start
@@ -1092,9 +1128,6 @@ class Virtual:
                             device_end,
                         ) in segments:
                             seg = pixels[start:stop:step]
-                            # Where we override segment
-                            for oneshot in self._oneshots:
-                                oneshot.apply(seg, start, stop)
                             data.append((seg, device_start, device_end))
                     elif self._config["mapping"] == "copy":
                         for (
@@ -1119,8 +1152,6 @@ class Virtual:
                             seg = self._effective_to_physical_pixels(
                                 seg, target_physical_len
                             )
-                            for oneshot in self._oneshots:
-                                oneshot.apply(seg, start, stop)
                             data.append((seg, device_start, device_end))
                     device.update_pixels(self.id, data)
 
@@ -1140,13 +1171,6 @@ class Virtual:
                     # Extract pixels using fancy indexing
                     seg = pixels[src_indices]
 
-                    # Apply oneshots to the entire device pixel set
-                    # Virtual range spans from min to max of src_indices
-                    for oneshot in self._oneshots:
-                        virtual_start = int(src_indices.min())
-                        virtual_end = int(src_indices.max())
-                        oneshot.apply(seg, virtual_start, virtual_end)
-
                     # Use new scatter mode: send pixels with dst indices
                     data = [(seg, dst_indices)]
 
@@ -1218,7 +1242,7 @@ class Virtual:
         oneshot.pixel_count = self.pixel_count
         oneshot.init()
         with self.lock:
-            self._oneshots.append(oneshot)
+            self._oneshots.add(oneshot)
         return True
 
     @property
@@ -1257,7 +1281,32 @@ class Virtual:
 
     @property
     def oneshots(self):
-        return self._oneshots
+        return self._oneshots.oneshots
+
+    @property
+    def oneshot_stats(self):
+        return self._oneshots.get_stats()
+
+    @property
+    def frame_sync(self):
+        if self._frame_sync is None:
+            self._frame_sync = FrameSync(self.name)
+        return self._frame_sync
+
+    @property
+    def sync_stats(self):
+        """
+        Frames, errors and send skew of the synchronised output, or None if
+        the virtual flushes its devices one after another
+        """
+        if self._frame_sync is None:
+            return None
+        return self._frame_sync.get_stats()
+
+    @property
+    def stats(self):
+        """Output statistics of the virtual, for the API"""
+        return {"sync": self.sync_stats, "oneshots": self.oneshot_stats}
 
     @cached_property
     def _segments_by_device(self):
@@ -1448,6 +1497,12 @@ class Virtual:
                     ):
                         self._active_effect.clear_melbank_freq_props()
 
+            if _config["audio_source"] != self._config.get(
+                "audio_source", DEFAULT_AUDIO_SOURCE
+            ) and hasattr(self._active_effect, "audio"):
+                # rebind the audio reactive effect to the new source
+                reactivate_effect = True
+
             if self._active_effect is not None:
                 # if a virtual level config change impacts a 2d effect layout, then trigger an init
                 if (
@@ -1467,6 +1522,7 @@ class Virtual:
             _config["rotate"] = 0
 
         setattr(self, "_config", _config)
+        self.transitions.set_rows(self.rows)
 
         old_complex_segments = self.complex_segments
         self.complex_segments = _config.get("complex_segments", False)
@@ -1523,6 +1579,11 @@ class Virtual:
 
         return effective_pixels
 
+    @property
+    def audio_source(self) -> str:
+        """Name of the audio source this virtual's effects react to"""
+        return self._config.get("audio_source", DEFAULT_AUDIO_SOURCE)
+
     @property
     def rows(self) -> int:
         """
@@ -1661,6 +1722,26 @@ class Virtuals:
                 )
             )
 
+    @staticmethod
+    def device_ids_of(virtual_cfg):
+        """Ids of the devices a virtual config renders to"""
+        device_ids = {
+            segment[0] for segment in virtual_cfg.get("segments", [])
+        }
+        if virtual_cfg.get("is_device"):
+            device_ids.add(virtual_cfg["is_device"])
+        return device_ids
+
+    def reorder(self, ids):
+        """Orders the registry by ids, such as after a staggered startup"""
+        order = {id: index for index, id in enumerate(ids)}
+        self._virtuals = dict(
+            sorted(
+                self._virtuals.items(),
+                key=lambda item: order.get(item[0], len(order)),
+            )
+        )
+
     def schema(self):
         return Virtual.CONFIG_SCHEMA
 
@@ -1700,6 +1781,7 @@ class Virtuals:
                 ("Object with id '{}' does not exist.").format(id)
             )
         del self._virtuals[id]
+        self._ledfx.frame_bus.remove(id)
 
     def __iter__(self):
         return iter(self._virtuals)
@@ -0,0 +1,75 @@
+"""
+Benchmark of the Effect.get_pixels blur.
+
+Compares the previous per channel np.convolve blur with PixelBlur for
+strips and matrices. Run from the repository root:
+
+    python tests/scripts/bench_blur.py
+"""
+
+import timeit
+
+import numpy as np
+
+from ledfx.effects import PixelBlur, _gaussian_kernel1d
+
+RUNS = 2000
+
+# (pixel_count, rows, sigma)
+CASES = [
+    (60, 1, 1.0),
+    (150, 1, 3.0),
+    (300, 1, 1.0),
+    (300, 1, 3.0),
+    (1024, 1, 3.0),
+    (1024, 1, 10.0),
+    (4096, 1, 10.0),
+    (32 * 32, 32, 1.0),
+    (64 * 64, 64, 3.0),
+    (128 * 64, 64, 3.0),
+    (256 * 256, 256, 3.0),
+]
+
+
+def channel_convolve(pixels, sigma):
+    """The blur as it was done in Effect.get_pixels"""
+    kernel = _gaussian_kernel1d(sigma, 0, len(pixels))
+    pixels[:, 0] = np.convolve(pixels[:, 0], kernel, mode="same")
+    pixels[:, 1] = np.convolve(pixels[:, 1], kernel, mode="same")
+    pixels[:, 2] = np.convolve(pixels[:, 2], kernel, mode="same")
+    return pixels
+
+
+def time_us(func):
+    return timeit.timeit(func, number=RUNS) / RUNS * 1e6
+
+
+def main():
+    rng = np.random.default_rng(0)
+    blur = PixelBlur()
+    print(
+        f"{'pixels':>8} {'rows':>5} {'sigma':>6} "
+        f"{'convolve us':>12} {'PixelBlur us':>13} {'ratio':>6}"
+    )
+    for pixel_count, rows, sigma in CASES:
+        source = rng.random((pixel_count, 3)) * 255
+        pixels = source.copy()
+
+        def old():
+            pixels[:] = source
+            channel_convolve(pixels, sigma)
+
+        def new():
+            pixels[:] = source
+            blur.blur(pixels, sigma, rows=rows)
+
+        old_us = time_us(old)
+        new_us = time_us(new)
+        print(
+            f"{pixel_count:>8} {rows:>5} {sigma:>6} "
+            f"{old_us:>12.1f} {new_us:>13.1f} {old_us / new_us:>6.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Load test of the DDP and WLED realtime output paths against a farm of
+simulated controllers on loopback.
+
+Every device gets its own 127.x address on the standard port, as on a
+real network, and frames are sent at a fixed rate from one thread the
+way the device flushes are. Reports the time spent sending and what the
+receivers saw. Linux only, as it uses addresses across 127.0.0.0/8. Run
+from the repository root:
+
+    python tests/scripts/bench_device_farm.py [devices] [pixels] [fps]
+"""
+
+import asyncio
+import socket
+import sys
+import time
+
+import numpy as np
+
+from ledfx.devices.ddp import DDPDevice
+from ledfx.devices.packets import RealtimeEncoder
+from ledfx.devices.utils.simulator import SimulatorFarm, write_tag
+
+SECONDS = 5
+
+
+def send_frames(ddp, wled, pixel_count, fps):
+    """Sends SECONDS of frames to every receiver, returns flush times"""
+    rng = np.random.default_rng(0)
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    encoders = [RealtimeEncoder() for _ in wled]
+    flush_us = []
+    frame_time = 1 / fps
+    start = time.perf_counter()
+    for frame_count in range(1, int(SECONDS * fps) + 1):
+        frame = rng.integers(0, 256, (pixel_count, 3)).astype(float)
+        write_tag(frame, frame_count)
+        began = time.perf_counter()
+        for receiver in ddp:
+            receiver.sent(frame_count, began)
+            DDPDevice.send_out(
+                sock, receiver.address, receiver.port, frame, frame_count, 1
+            )
+        for receiver, encoder in zip(wled, encoders):
+            receiver.sent(frame_count, began)
+            for packet in encoder.encode(frame, 2, began):
+                sock.sendto(packet, (receiver.address, receiver.port))
+        flush_us.append((time.perf_counter() - began) * 1e6)
+        delay = start + frame_count * frame_time - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+    sock.close()
+    return np.array(flush_us)
+
+
+async def run(devices, pixel_count, fps):
+    farm = SimulatorFarm()
+    try:
+        ddp = [
+            await farm.add_ddp(f"ddp {i}", pixel_count)
+            for i in range(devices // 2)
+        ]
+        wled = [
+            await farm.add_wled(f"wled {i}", pixel_count)
+            for i in range(devices - devices // 2)
+        ]
+        flush_us = await asyncio.to_thread(
+            send_frames, ddp, wled, pixel_count, fps
+        )
+        await asyncio.sleep(0.2)
+
+        print(
+            f"{devices} devices x {pixel_count} pixels at {fps} fps "
+            f"for {SECONDS}s"
+        )
+        print(
+            f"send all devices: mean {flush_us.mean():.0f} us, "
+            f"p99 {np.percentile(flush_us, 99):.0f} us"
+        )
+        for protocol, receivers in (("DDP", ddp), ("WLED", wled)):
+            if not receivers:
+                continue
+            stats = [r.get_stats() for r in receivers]
+            latency = [
+                s["latency_avg_ms"] for s in stats if s["latency_avg_ms"]
+            ]
+            print(
+                f"{protocol:>5}: {len(receivers)} receivers, "
+                f"fps {min(s['fps'] for s in stats):.1f}"
+                f"-{max(s['fps'] for s in stats):.1f}, "
+                f"frames {sum(s['frames'] for s in stats)}, "
+                f"gaps {sum(s['gaps'] for s in stats)}, "
+                f"incomplete {sum(s['incomplete'] for s in stats)}, "
+                f"latency avg {np.mean(latency) if latency else 0:.3f} ms "
+                f"max {max(s['latency_max_ms'] for s in stats):.3f} ms"
+            )
+        print("totals:", farm.get_totals())
+    finally:
+        await farm.close()
+
+
+def main():
+    args = [int(arg) for arg in sys.argv[1:4]]
+    devices, pixel_count, fps = args + [100, 300, 60][len(args) :]
+    asyncio.run(run(devices, pixel_count, fps))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark of the Game of Life step.
+
+Compares the previous step, eight np.roll calls over a boolean board and
+a full board copy into the history, with the GameOfLife engine. Run from
+the repository root:
+
+    python tests/scripts/bench_game_of_life.py
+"""
+
+import timeit
+from collections import deque
+
+import numpy as np
+
+from ledfx.effects.utils.life import GameOfLife
+
+RUNS = 200
+
+# (height, width)
+CASES = [(16, 16), (32, 32), (64, 64), (128, 128), (256, 256), (512, 512)]
+
+
+class RollStep:
+    """The step as it was done in GameOfLife.step_board"""
+
+    def __init__(self, board, depth=5):
+        self.board = board.astype(bool)
+        self.board_history = deque(maxlen=depth)
+        self._history_buffer = np.zeros_like(self.board)
+
+    def step_board(self):
+        np.copyto(self._history_buffer, self.board)
+        self.board_history.append(self._history_buffer.copy())
+        neighbors = sum(
+            np.roll(np.roll(self.board, i, 0), j, 1)
+            for i in (-1, 0, 1)
+            for j in (-1, 0, 1)
+            if (i != 0 or j != 0)
+        )
+        self.board = (neighbors == 3) | (self.board & (neighbors == 2))
+
+
+def time_us(func):
+    return timeit.timeit(func, number=RUNS) / RUNS * 1e6
+
+
+def main():
+    print(f"{'board':>9} {'np.roll us':>11} {'engine us':>10} {'ratio':>6}")
+    for height, width in CASES:
+        game = GameOfLife(height, width, 5)
+        old = RollStep(game.board)
+        old_us = time_us(old.step_board)
+        new_us = time_us(game.step_board)
+        print(
+            f"{height:>4}x{width:<4} {old_us:>11.1f} {new_us:>10.1f} "
+            f"{old_us / new_us:>6.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
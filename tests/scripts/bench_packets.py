@@ -0,0 +1,133 @@
+"""
+Benchmark of the device packet builders.
+
+Times every builder in ledfx.devices.packets, the DDP packets and the
+LIFX HSBK conversion for a range of strip lengths, and compares the Hue,
+Nanoleaf and LIFX encoders with the per pixel loops they replaced. Run
+from the repository root:
+
+    python tests/scripts/bench_packets.py
+"""
+
+import struct
+import timeit
+
+import numpy as np
+
+from ledfx.devices import packets
+from ledfx.devices.ddp import DDPDevice
+from ledfx.devices.lifx import numpy_rgb_to_hsbk
+
+RUNS = 2000
+PIXEL_COUNTS = [20, 100, 300, 1000]
+ENTERTAINMENT_ID = "1a8d99cc-967b-44f2-9202-43f976c0fa6b"
+
+
+def hue_loop(data):
+    """HueDevice.flush as it was"""
+    pixels = [[int(r), int(g), int(b)] for r, g, b in data]
+    send_data = bytearray(b"HueStream")
+    send_data.extend((2, 0, 0, 0, 0, 0, 0))
+    send_data.extend(ENTERTAINMENT_ID.encode("utf-8"))
+    for i in range(len(pixels)):
+        send_data.append(i % 256)
+        for value in pixels[i]:
+            send_data.append(value)
+            send_data.append(value)
+    return send_data
+
+
+def nanoleaf_loop(data, panel_ids):
+    """NanoleafDevice.flush and write_udp as they were"""
+    status = {}
+    for panel_id, col in zip(panel_ids, data.astype(int).clip(0, 255)):
+        status[panel_id] = col.tolist()
+    send_data = struct.pack(">H", len(status))
+    for panel_id, (r, g, b) in status.items():
+        send_data += struct.pack(">HBBBBH", panel_id, r, g, b, 0, 0)
+    return send_data
+
+
+def hsbk_loop(rgb_array, kelvin=3500):
+    """numpy_rgb_to_hsbk as it was, building a tuple per pixel"""
+    rgb_norm = rgb_array.astype(np.float32) / 255.0
+    r, g, b = rgb_norm[:, 0], rgb_norm[:, 1], rgb_norm[:, 2]
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    delta = maxc - minc
+    v = maxc
+    s = np.zeros_like(maxc)
+    np.divide(delta, maxc, out=s, where=maxc > 0)
+    h = np.zeros_like(r)
+    mask = delta > 0
+    red_max = mask & (maxc == r)
+    h[red_max] = ((g[red_max] - b[red_max]) / delta[red_max]) % 6
+    green_max = mask & (maxc == g)
+    h[green_max] = (b[green_max] - r[green_max]) / delta[green_max] + 2
+    blue_max = mask & (maxc == b)
+    h[blue_max] = (r[blue_max] - g[blue_max]) / delta[blue_max] + 4
+    h = h / 6
+    hue_proto = (h * 65535).astype(np.uint16)
+    sat_proto = (s * 65535).astype(np.uint16)
+    bright_proto = (v * 65535).astype(np.uint16)
+    return [
+        (int(hue_proto[i]), int(sat_proto[i]), int(bright_proto[i]), kelvin)
+        for i in range(len(rgb_array))
+    ]
+
+
+def builders(pixel_count):
+    """(name, function) of every builder for a strip of pixel_count"""
+    panel_ids = list(range(1, pixel_count + 1))
+    hue = packets.HueStreamEncoder(ENTERTAINMENT_ID, pixel_count)
+    nanoleaf = packets.NanoleafUDPEncoder(panel_ids)
+    realtime = packets.RealtimeEncoder()
+    adalight = packets.AdalightEncoder(pixel_count, "GRB")
+    adalight_packet = adalight.new_packet()
+    last_frame = np.zeros((pixel_count, 3))
+    chunk = packets.RealtimeEncoder.DNRGB_CHUNK_PIXELS
+    return [
+        (
+            "WARLS",
+            lambda d: packets.build_warls_packet(d[:255], 1, last_frame[:255]),
+        ),
+        ("DRGB", lambda d: packets.build_drgb_packet(d[:490], 1)),
+        ("RGB", lambda d: packets.build_rgb_packet(d[:500])),
+        ("DRGBW", lambda d: packets.build_drgbw_packet(d[:367], 1)),
+        ("DNRGB", lambda d: packets.build_dnrgb_packet(d[:chunk], 1, 0)),
+        ("adaptive", lambda d: list(realtime.encode(d, 1))),
+        ("Adalight", lambda d: packets.build_adalight_packet(d, "GRB")),
+        ("Adalight into", lambda d: adalight.encode_into(adalight_packet, d)),
+        ("OpenRGB", lambda d: packets.build_openrgb_packet(d, 0)),
+        ("DDP", lambda d: DDPDevice.build_packets(d, 1, 1)),
+        ("Hue", hue.encode),
+        ("Hue loop", hue_loop),
+        ("Nanoleaf", nanoleaf.encode),
+        ("Nanoleaf loop", lambda d: nanoleaf_loop(d, panel_ids)),
+        ("LIFX HSBK", numpy_rgb_to_hsbk),
+        ("LIFX loop", hsbk_loop),
+    ]
+
+
+def main():
+    rng = np.random.default_rng(0)
+    names = [name for name, _ in builders(1)]
+    print(f"{'builder':>14} " + "".join(f"{n:>10}" for n in PIXEL_COUNTS))
+    results = {name: [] for name in names}
+    for pixel_count in PIXEL_COUNTS:
+        data = rng.uniform(0, 255, (pixel_count, 3))
+        for name, build in builders(pixel_count):
+            if name.startswith("LIFX"):
+                frame = data.astype(np.uint8)
+            else:
+                frame = data
+            seconds = timeit.timeit(lambda: build(frame), number=RUNS)
+            results[name].append(seconds / RUNS * 1e6)
+    for name in names:
+        print(
+            f"{name:>14} " + "".join(f"{us:>8.1f}us" for us in results[name])
+        )
+
+
+if __name__ == "__main__":
+    main()
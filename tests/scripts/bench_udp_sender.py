@@ -0,0 +1,72 @@
+"""
+Benchmark of the shared UDP sender sending a virtual's batch.
+
+Times UDPSender.send for the datagrams of one frame to several local
+receivers, handed to the kernel in one sendmmsg call against a sendto
+call per datagram, and counts the send calls made per frame. Receivers
+are drained between runs so the socket buffers never fill. Run from the
+repository root:
+
+    python tests/scripts/bench_udp_sender.py
+"""
+
+import socket
+import timeit
+
+from ledfx.devices.utils.socket_singleton import UDPSender
+
+RUNS = 2000
+RECEIVERS = 10
+PACKETS_PER_RECEIVER = [1, 3]
+PACKET_BYTES = 1400
+
+
+def drain(receivers):
+    for receiver in receivers:
+        try:
+            while True:
+                receiver.recv(PACKET_BYTES)
+        except BlockingIOError:
+            pass
+
+
+def main():
+    receivers = []
+    for _ in range(RECEIVERS):
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 22)
+        receiver.bind(("127.0.0.1", 0))
+        receiver.setblocking(False)
+        receivers.append(receiver)
+
+    print(f"{'datagrams':>10} {'mode':>8} {'per frame':>12} {'calls':>7}")
+    for packets in PACKETS_PER_RECEIVER:
+        datagrams = [
+            (bytes(PACKET_BYTES), receiver.getsockname())
+            for receiver in receivers
+            for _ in range(packets)
+        ]
+        for mode in ("sendmmsg", "sendto"):
+            sender = UDPSender()
+            if mode == "sendto":
+                sender._sendmmsg = None
+            elif sender._sendmmsg is None:
+                print(f"{len(datagrams):>10} {mode:>8} {'unsupported':>12}")
+                continue
+            seconds = timeit.timeit(
+                lambda: sender.send(datagrams), number=RUNS
+            )
+            print(
+                f"{len(datagrams):>10} {mode:>8} "
+                f"{seconds / RUNS * 1e6:>10.1f}us "
+                f"{sender.send_calls / RUNS:>7.1f}"
+            )
+            sender.close()
+            drain(receivers)
+
+    for receiver in receivers:
+        receiver.close()
+
+
+if __name__ == "__main__":
+    main()
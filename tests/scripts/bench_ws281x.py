@@ -0,0 +1,95 @@
+"""
+Benchmark of the rpi_ws281x output with the hardware stubbed out.
+
+Times RPI_WS281X.flush as it was, rounding and shifting each pixel in
+Python, against the WS281XEncoder packing with changed pixel updates,
+for RGB and RGBW strips. The strip only stores the colour words, so this
+runs on any machine and measures the work done on the output thread
+before show(). Run from the repository root:
+
+    python tests/scripts/bench_ws281x.py
+"""
+
+import timeit
+
+import numpy as np
+
+from ledfx.devices.packets import WS281XEncoder
+
+RUNS = 500
+PIXEL_COUNTS = [60, 300, 1000]
+
+
+class StubStrip:
+    def __init__(self, pixel_count):
+        self.pixels = [0] * pixel_count
+
+    def setPixelColor(self, n, color):
+        self.pixels[n] = color
+
+
+def flush_loop(strip, data):
+    """RPI_WS281X.flush as it was"""
+    if data.shape[1] == 3:
+
+        def color_func(c):
+            return (round(c[0]) << 16) | (round(c[1]) << 8) | round(c[2])
+
+    else:
+
+        def color_func(c):
+            return (
+                (round(c[3]) << 24)
+                | (round(c[0]) << 16)
+                | (round(c[1]) << 8)
+                | round(c[2])
+            )
+
+    for idx, color in enumerate(data):
+        strip.setPixelColor(idx, color_func(color))
+
+
+def flush_packed(strip, encoder, shown, data):
+    """RPI_WS281X.flush"""
+    words = encoder.encode(data)
+    changed = np.flatnonzero(words != shown[: len(words)])
+    set_pixel = strip.setPixelColor
+    for index, word in zip(changed.tolist(), words[changed].tolist()):
+        set_pixel(index, word)
+    shown[: len(words)] = words
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'strip':>22} " + "".join(f"{n:>10}" for n in PIXEL_COUNTS))
+    for channels, name in ((3, "RGB"), (4, "RGBW")):
+        results = {"loop": [], "packed": [], "packed, static": []}
+        for pixel_count in PIXEL_COUNTS:
+            frames = rng.uniform(0, 255, (2, pixel_count, channels))
+            strip = StubStrip(pixel_count)
+            encoder = WS281XEncoder(pixel_count, white=channels == 4)
+            shown = np.zeros(pixel_count, dtype=np.uint32)
+            frame = iter(range(RUNS * 2))
+
+            def changing():
+                flush_packed(strip, encoder, shown, frames[next(frame) % 2])
+
+            timings = {
+                "loop": lambda: flush_loop(strip, frames[0]),
+                "packed": changing,
+                "packed, static": lambda: flush_packed(
+                    strip, encoder, shown, frames[0]
+                ),
+            }
+            for label, flush in timings.items():
+                seconds = timeit.timeit(flush, number=RUNS)
+                results[label].append(seconds / RUNS * 1e6)
+        for label, timings in results.items():
+            print(
+                f"{name + ' ' + label:>22} "
+                + "".join(f"{us:>8.1f}us" for us in timings)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""Tests for named audio sources and the virtuals bound to them"""
+
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import ledfx.api.audio_sources as audio_sources_api
+import ledfx.effects.audio as audio
+from ledfx.api.audio_sources import AudioSourcesEndpoint
+from ledfx.effects.audio import (
+    AudioReactiveEffect,
+    AudioSources,
+    NamedAudioAnalysisSource,
+)
+
+DEVICES = (
+    {
+        "name": "Microphone",
+        "hostapi": 0,
+        "max_input_channels": 1,
+        "default_samplerate": 48000,
+    },
+    {
+        "name": "Line In",
+        "hostapi": 0,
+        "max_input_channels": 2,
+        "default_samplerate": 48000,
+    },
+)
+
+
+class FakeStream:
+    def __init__(self, **kwargs):
+        self.device = kwargs["device"]
+        self.started = False
+        self.closed = False
+
+    def start(self):
+        self.started = True
+
+    def stop(self):
+        self.started = False
+
+    def close(self):
+        self.closed = True
+
+
+class _DummyEvents:
+    def add_listener(self, *_, **__):
+        pass
+
+    def fire_event(self, *_, **__):
+        pass
+
+
+class FakeVirtual:
+    def __init__(self, audio_source, effect):
+        self.audio_source = audio_source
+        self.active_effect = effect
+        self.lock = threading.Lock()
+        self.reactivated = 0
+
+    def _reactivate_effect(self):
+        self.reactivated += 1
+
+
+@AudioReactiveEffect.no_registration
+class BoundEffect(AudioReactiveEffect):
+    NAME = "Bound"
+
+    def render(self):
+        pass
+
+
+@pytest.fixture
+def ledfx(monkeypatch):
+    monkeypatch.setattr(audio.sd, "query_devices", lambda: DEVICES)
+    monkeypatch.setattr(
+        audio.sd, "query_hostapis", lambda: ({"name": "ALSA"},)
+    )
+    monkeypatch.setattr(audio.sd, "InputStream", FakeStream)
+    monkeypatch.setattr(
+        audio.sd, "default", SimpleNamespace(device={"input": 0, "output": -1})
+    )
+    monkeypatch.setattr(audio_sources_api, "save_config", lambda **_: None)
+    ledfx = SimpleNamespace(
+        config={"audio_sources": {}},
+        config_dir="",
+        events=_DummyEvents(),
+        virtuals={},
+        audio=None,
+        dev_enabled=lambda: False,
+    )
+    ledfx.audio_sources = AudioSources(ledfx)
+    return ledfx
+
+
+def bind(ledfx, audio_source):
+    """An audio reactive effect activated on a virtual using the source"""
+    effect = BoundEffect(ledfx, {})
+    effect.activate(
+        SimpleNamespace(effective_pixel_count=10, audio_source=audio_source)
+    )
+    return effect
+
+
+class TestAudioSources:
+    def test_create_and_remove(self, ledfx):
+        sources = ledfx.audio_sources
+        sources.update_source("stage", {"audio_device": 1})
+        assert sources.names == ["default", "stage"]
+        assert ledfx.config["audio_sources"]["stage"]["audio_device_name"] == (
+            "ALSA: Line In"
+        )
+
+        source = sources.get("stage")
+        assert isinstance(source, NamedAudioAnalysisSource)
+        assert sources.get("stage") is source
+
+        sources.remove_source("stage")
+        assert sources.names == ["default"]
+        assert not source._stream_is_active()
+        with pytest.raises(KeyError):
+            sources.remove_source("stage")
+
+    def test_default_is_configured_through_audio(self, ledfx):
+        with pytest.raises(ValueError):
+            ledfx.audio_sources.update_source("default", {})
+
+    def test_virtual_binds_to_its_source(self, ledfx):
+        ledfx.audio_sources.update_source("stage", {"audio_device": 1})
+        effect = bind(ledfx, "stage")
+        source = ledfx.audio_sources.get("stage")
+
+        assert effect.audio is source
+        assert effect._audio_data_updated in source._callbacks
+        assert source._stream.device == 1
+        assert ledfx.audio_sources.get_stats()["stage"]["subscribers"] == 1
+
+    def test_closes_when_the_last_virtual_goes(self, ledfx):
+        ledfx.audio_sources.update_source("stage", {"audio_device": 1})
+        first, second = bind(ledfx, "stage"), bind(ledfx, "stage")
+        source = first.audio
+        stream = source._stream
+
+        first.deactivate()
+        source.check_and_deactivate()
+        assert source._stream_is_active()
+
+        second.deactivate()
+        source.check_and_deactivate()
+        assert not source._stream_is_active()
+        assert stream.closed
+
+    def test_suspend_and_resume(self, ledfx):
+        sources = ledfx.audio_sources
+        sources.update_source("stage", {"audio_device": 1})
+        bind(ledfx, "stage")
+        source = sources.get("stage")
+        stream = source._stream
+
+        sources.suspend()
+        assert not source._stream_is_active()
+        assert stream.closed
+
+        sources.resume()
+        assert source._stream_is_active()
+        assert source._stream is not stream
+        assert source._stream.started
+
+    def test_removed_source_rebinds_its_virtuals(self, ledfx):
+        ledfx.audio_sources.update_source("stage", {"audio_device": 1})
+        virtual = FakeVirtual("stage", bind(ledfx, "stage"))
+        ledfx.virtuals["bound"] = virtual
+        ledfx.audio_sources.remove_source("stage")
+        assert virtual.reactivated == 1
+
+    def test_melbank_updates_reach_named_sources(self, ledfx):
+        ledfx.audio_sources.update_source("stage", {"audio_device": 1})
+        source = ledfx.audio_sources.get("stage")
+        ledfx.audio_sources.update_melbanks({"samples": 12})
+        assert source.melbanks.melbanks_config["samples"] == 12
+
+    def test_analysis_is_cached_per_source(self, ledfx):
+        sources = ledfx.audio_sources
+        sources.update_source("stage", {"audio_device": 1})
+        sources.update_source("booth", {"audio_device": 1})
+        stage, booth = sources.get("stage"), sources.get("booth")
+        calls = {"stage": 0, "booth": 0}
+
+        def onset_of(name):
+            def onset(sample):
+                calls[name] += 1
+                return [1.0]
+
+            return onset
+
+        stage._onset = onset_of("stage")
+        booth._onset = onset_of("booth")
+        stage.audio_sample = booth.audio_sample = lambda raw=False: None
+
+        assert stage.onset() and booth.onset()
+        # a new frame on one source keeps the other's results
+        booth._invalidate_caches()
+        assert stage.onset() and booth.onset()
+        assert calls == {"stage": 1, "booth": 2}
+
+        stage._invalidate_caches()
+        stage.onset()
+        assert calls == {"stage": 2, "booth": 2}
+
+
+class TestAudioSourcesEndpoint:
+    @staticmethod
+    def call(coroutine):
+        response = asyncio.run(coroutine)
+        return json.loads(response.body.decode())
+
+    def test_post_get_delete(self, ledfx):
+        endpoint = AudioSourcesEndpoint(ledfx)
+
+        result = self.call(
+            endpoint.post({"name": "stage", "config": {"audio_device": 1}})
+        )
+        assert result["status"] == "success"
+
+        sources = self.call(endpoint.get())["sources"]
+        assert set(sources) == {"default", "stage"}
+        assert sources["stage"]["audio_device"] == 1
+        assert sources["stage"]["audio_device_name"] == "ALSA: Line In"
+
+        result = self.call(endpoint.delete({"name": "stage"}))
+        assert result["status"] == "success"
+        assert set(self.call(endpoint.get())["sources"]) == {"default"}
+
+    def test_invalid_requests(self, ledfx):
+        endpoint = AudioSourcesEndpoint(ledfx)
+        for coroutine in (
+            endpoint.post({"config": {}}),
+            endpoint.post({"name": "default"}),
+            endpoint.put(
+                {
+                    "name": "stage",
+                    "config": {"audio_device": 1, "min_volume": 5},
+                }
+            ),
+            endpoint.delete({"name": "missing"}),
+        ):
+            assert self.call(coroutine)["status"] == "failed"
+        assert "stage" not in ledfx.config["audio_sources"]
@@ -0,0 +1,106 @@
+"""
+Tests for the numpy Canvas used by Twod effects that set NUMPY_CANVAS
+"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from ledfx.effects.utils.canvas import Canvas
+
+ROTATIONS = {
+    1: Image.Transpose.ROTATE_90,
+    2: Image.Transpose.ROTATE_180,
+    3: Image.Transpose.ROTATE_270,
+}
+
+
+def pil_pixels(array, flip, mirror, rotate):
+    """The PIL transposes done by Twod.image_to_pixels"""
+    image = Image.fromarray(array, "RGB")
+    if flip:
+        image = image.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
+    if mirror:
+        image = image.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+    if rotate:
+        image = image.transpose(ROTATIONS[rotate])
+    return np.asarray(image).reshape(-1, 3)
+
+
+class TestCanvasOrientation:
+    @pytest.mark.parametrize("width, height", [(5, 3), (8, 8), (1, 4)])
+    @pytest.mark.parametrize("flip", [False, True])
+    @pytest.mark.parametrize("mirror", [False, True])
+    @pytest.mark.parametrize("rotate", [0, 1, 2, 3])
+    def test_matches_pil_transposes(self, width, height, flip, mirror, rotate):
+        array = np.random.default_rng(0).integers(
+            0, 256, (height, width, 3), dtype=np.uint8
+        )
+        canvas = Canvas(width, height)
+        canvas.set_orientation(flip, mirror, rotate)
+        canvas.array[:] = array
+        pixels = np.zeros((width * height, 3))
+
+        canvas.to_pixels(pixels)
+
+        np.testing.assert_array_equal(
+            pixels, pil_pixels(array, flip, mirror, rotate)
+        )
+
+    def test_pixel_count_mismatch(self):
+        canvas = Canvas(4, 2)
+        canvas.clear((1, 2, 3))
+
+        longer = np.full((10, 3), -1.0)
+        canvas.to_pixels(longer)
+        shorter = np.zeros((5, 3))
+        canvas.to_pixels(shorter)
+
+        np.testing.assert_array_equal(longer[:8], np.tile((1, 2, 3), (8, 1)))
+        np.testing.assert_array_equal(longer[8:], -1.0)
+        np.testing.assert_array_equal(shorter, np.tile((1, 2, 3), (5, 1)))
+
+    def test_to_array_is_output_orientation(self):
+        canvas = Canvas(6, 2)
+        canvas.set_orientation(rotate=1)
+
+        assert canvas.to_array().shape == (6, 2, 3)
+
+
+class TestCanvasDrawing:
+    def test_fill_rect_is_inclusive_and_clipped(self):
+        canvas = Canvas(4, 4)
+
+        canvas.fill_rect(-2, 1, 1, 2, (255, 0, 0))
+
+        filled = canvas.array[..., 0] > 0
+        expected = np.zeros((4, 4), dtype=bool)
+        expected[1:3, 0:2] = True
+        np.testing.assert_array_equal(filled, expected)
+
+    def test_rectangle_outline(self):
+        canvas = Canvas(5, 4)
+
+        canvas.rectangle(0, 0, 4, 3, (255, 255, 255))
+
+        outline = canvas.array[..., 0] > 0
+        assert outline[0].all() and outline[-1].all()
+        assert outline[:, 0].all() and outline[:, -1].all()
+        assert not outline[1:-1, 1:-1].any()
+
+    def test_line_endpoints_and_clipping(self):
+        canvas = Canvas(8, 8)
+
+        canvas.line(0, 0, 7, 7, (0, 255, 0))
+        assert (canvas.array[np.arange(8), np.arange(8), 1] == 255).all()
+
+        canvas.line(-5, 3, 20, 3, (0, 0, 255))
+        assert (canvas.array[3, :, 2] == 255).all()
+
+    def test_blit_is_clipped(self):
+        canvas = Canvas(4, 4)
+
+        canvas.blit(np.full((3, 3, 3), 7.0), x=2, y=3)
+
+        assert canvas.array[3, 2:, 0].tolist() == [7.0, 7.0]
+        assert canvas.array[:3].sum() == 0
@@ -0,0 +1,60 @@
+"""Tests for the per-device output colour correction"""
+
+import numpy as np
+
+from ledfx.devices.utils.color_correction import (
+    ColorCorrection,
+    correction_lut,
+)
+
+
+class TestColorCorrection:
+    def test_identity_rounds_to_uint8(self):
+        correction = ColorCorrection()
+        assert correction.is_identity
+        frame = np.array([[0.0, 127.6, 255.0], [300.0, -5.0, 12.4]])
+        result = correction.apply(frame)
+        assert result.dtype == np.uint8
+        np.testing.assert_array_equal(result, [[0, 128, 255], [255, 0, 12]])
+
+    def test_gamma_and_gains_match_float_math(self):
+        gains = (1.0, 0.8, 0.5)
+        correction = ColorCorrection(2.2, gains)
+        frame = np.random.rand(500, 3) * 255
+        expected = (
+            (np.rint(frame) / 255) ** 2.2 * np.array(gains) * 255
+        ).round()
+        np.testing.assert_allclose(correction.apply(frame), expected, atol=1)
+
+    def test_lut_is_shared(self):
+        a = ColorCorrection(2.2, (1.0, 0.9, 0.8))
+        b = ColorCorrection(2.2, (1.0, 0.9, 0.8))
+        assert a._lut is b._lut
+        assert not a._lut.flags.writeable
+        assert correction_lut(1.0, (1.0, 1.0, 1.0), 256).dtype == np.uint8
+
+    def test_dither_averages_to_the_corrected_level(self):
+        correction = ColorCorrection(2.2, dither=True)
+        # 40 corrects to about 4.4, between output levels 4 and 5
+        frame = np.full((64, 3), 40.0)
+        frames = np.array([correction.apply(frame) for _ in range(256)])
+        assert frames.dtype == np.uint8
+        assert set(np.unique(frames)) == {4, 5}
+        target = (40 / 255) ** 2.2 * 255
+        assert abs(frames.mean() - target) < 0.05
+
+    def test_dither_moves_a_single_pixel(self):
+        correction = ColorCorrection(2.2, dither=True)
+        frame = np.full((1, 3), 40.0)
+        frames = np.array([correction.apply(frame) for _ in range(256)])
+        assert set(np.unique(frames)) == {4, 5}
+        target = (40 / 255) ** 2.2 * 255
+        assert abs(frames.mean() - target) < 0.05
+
+    def test_dither_keeps_full_range(self):
+        correction = ColorCorrection(2.2, dither=True)
+        frame = np.array([[0.0, 255.0, 255.0]] * 8)
+        for _ in range(4):
+            result = correction.apply(frame)
+            np.testing.assert_array_equal(result[:, 0], 0)
+            np.testing.assert_array_equal(result[:, 1:], 255)
@@ -0,0 +1,131 @@
+"""Tests for compositing layer virtuals on a device"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from ledfx.devices.ddp import DDPDevice
+from ledfx.devices.utils.layers import DeviceLayer, composite
+
+PIXELS = 6
+
+
+class _DummyEvents:
+    def fire_event(self, *_, **__):
+        pass
+
+
+def make_virtual(virtual_id, **config):
+    return SimpleNamespace(
+        id=virtual_id, name=virtual_id, active=True, config=config
+    )
+
+
+def make_device(*virtuals):
+    device = DDPDevice.__new__(DDPDevice)
+    device._id = "device"
+    device._device_type = "DDP"
+    device._destination = None
+    device._config = {
+        "name": "device",
+        "pixel_count": PIXELS,
+        "center_offset": 0,
+    }
+    device._ledfx = SimpleNamespace(
+        virtuals={virtual.id: virtual for virtual in virtuals},
+        events=_DummyEvents(),
+    )
+    device._segments = []
+    device._color_correction = None
+    device._output_worker = None
+    device._pixels = np.zeros((PIXELS, 3))
+    device._layers = {}
+    device._active = True
+    device.frames = []
+    device.flush = lambda data: device.frames.append(np.copy(data))
+    # the first virtual flushes
+    device.__dict__["priority_virtual"] = virtuals[0]
+    return device
+
+
+def layer_of(pixels, start, end):
+    layer = DeviceLayer(PIXELS)
+    layer.write([(np.asarray(pixels, dtype=float), start, end)])
+    return layer
+
+
+class TestComposite:
+    base = np.full((PIXELS, 3), 100.0)
+
+    @pytest.mark.parametrize(
+        "mode, expected",
+        [
+            ("over", 200),
+            ("add", 255),
+            ("max", 200),
+            ("multiply", 100 * 200 / 255),
+        ],
+    )
+    def test_blend_modes(self, mode, expected):
+        layer = layer_of([200, 200, 200], 2, 3)
+        frame = composite(self.base, [(layer, mode, 1.0)])
+        np.testing.assert_allclose(frame[2:4], expected)
+        # pixels outside the layer and the base are untouched
+        np.testing.assert_array_equal(frame[[0, 1, 4, 5]], 100)
+        np.testing.assert_array_equal(self.base, 100)
+        np.testing.assert_array_equal(layer.pixels[2:4], 200)
+
+    def test_opacity_and_order(self):
+        red = layer_of([[255, 0, 0]] * 4, 0, 3)
+        blue = layer_of([[0, 0, 255]] * 2, 2, 3)
+        frame = composite(
+            np.zeros((PIXELS, 3)), [(red, "over", 1.0), (blue, "over", 0.5)]
+        )
+        np.testing.assert_allclose(frame[0], [255, 0, 0])
+        np.testing.assert_allclose(frame[2], [127.5, 0, 127.5])
+        np.testing.assert_allclose(frame[4], [0, 0, 0])
+
+    def test_scatter_writes(self):
+        layer = DeviceLayer(PIXELS)
+        layer.write([(np.full((2, 3), 9.0), np.array([1, 4]))])
+        assert layer.coverage.tolist() == [0, 1, 0, 0, 1, 0]
+
+
+class TestDeviceLayers:
+    def test_layers_blend_over_the_priority_virtual(self):
+        base = make_virtual("base")
+        glow = make_virtual("glow", layer_blend="add", layer_opacity=0.5)
+        device = make_device(base, glow)
+
+        device.update_pixels("glow", [(np.full((2, 3), 100.0), 4, 5)])
+        # only the priority virtual flushes
+        assert device.frames == []
+        device.update_pixels("base", [(np.full((PIXELS, 3), 50.0), 0, 5)])
+
+        frame = device.frames[-1]
+        np.testing.assert_array_equal(frame[:4], 50)
+        np.testing.assert_array_equal(frame[4:], 100)
+        # the device pixels only hold the base virtual
+        np.testing.assert_array_equal(device._pixels, 50)
+
+    def test_stopped_layer_is_dropped(self):
+        base = make_virtual("base")
+        glow = make_virtual("glow", layer_blend="over")
+        device = make_device(base, glow)
+        device.update_pixels("glow", [(np.full((1, 3), 255.0), 0, 0)])
+        glow.active = False
+        device.update_pixels("base", [(np.zeros((PIXELS, 3)), 0, 5)])
+        np.testing.assert_array_equal(device.frames[-1], 0)
+        assert device._layers == {}
+
+    def test_layers_may_overlap_other_virtuals(self):
+        base = make_virtual("base")
+        glow = make_virtual("glow", layer_blend="max")
+        other = make_virtual("other")
+        device = make_device(base, glow, other)
+        device._segments = [("base", 0, 5)]
+        device.add_segments_batch("glow", [(2, 3)])
+        assert ("glow", 2, 3) in device._segments
+        with pytest.raises(ValueError):
+            device.add_segments_batch("other", [(0, 1)])
@@ -0,0 +1,199 @@
+"""Tests for the vectorised packet builders against the per pixel loops"""
+
+import struct
+
+import numpy as np
+import pytest
+
+from ledfx.devices.lifx import numpy_rgb_to_hsbk
+from ledfx.devices.packets import (
+    AdalightEncoder,
+    HueStreamEncoder,
+    NanoleafUDPEncoder,
+    WS281XEncoder,
+    build_openrgb_packet,
+)
+
+ENTERTAINMENT_ID = "1a8d99cc-967b-44f2-9202-43f976c0fa6b"
+
+
+def random_frame(pixel_count):
+    return np.random.uniform(0, 255, (pixel_count, 3))
+
+
+def hue_loop(data, entertainment_id):
+    """HueDevice.flush as it was"""
+    pixels = [[int(r), int(g), int(b)] for r, g, b in data]
+    send_data = bytearray(b"HueStream")
+    send_data.extend((2, 0, 0, 0, 0, 0, 0))
+    send_data.extend(entertainment_id.encode("utf-8"))
+    for i in range(len(pixels)):
+        send_data.append(i)
+        for value in pixels[i]:
+            send_data.append(value)
+            send_data.append(value)
+    return bytes(send_data)
+
+
+def nanoleaf_loop(status, light_panels):
+    """NanoleafDevice.write_udp as it was"""
+    if light_panels:
+        send_data = struct.pack(">B", len(status))
+        for panel_id, (r, g, b) in status.items():
+            send_data += struct.pack(">BBBBBH", panel_id, 0, r, g, b, 1)
+    else:
+        send_data = struct.pack(">H", len(status))
+        for panel_id, (r, g, b) in status.items():
+            send_data += struct.pack(">HBBBBH", panel_id, r, g, b, 0, 0)
+    return send_data
+
+
+def adalight_loop(data, color_order):
+    """build_adalight_packet as it was, swapping the colour columns"""
+    pixel_length = len(data)
+    packet = bytearray(
+        [ord("A"), ord("d"), ord("a"), pixel_length >> 8, pixel_length & 0xFF]
+    )
+    packet.extend([packet[3] ^ packet[4] ^ 0x55])
+    byteData = data.astype(np.dtype("B"))
+    if color_order == "GRB":
+        byteData[:, [1, 0]] = byteData[:, [0, 1]]
+    elif color_order == "BGR":
+        byteData[:, [2, 0]] = byteData[:, [0, 2]]
+    elif color_order == "RBG":
+        byteData[:, [2, 1]] = byteData[:, [1, 2]]
+    elif color_order == "BRG":
+        byteData[:, [2, 0]] = byteData[:, [0, 2]]
+        byteData[:, [2, 1]] = byteData[:, [1, 2]]
+    elif color_order == "GBR":
+        byteData[:, [2, 0]] = byteData[:, [0, 2]]
+        byteData[:, [1, 0]] = byteData[:, [0, 1]]
+    packet.extend(byteData.flatten().tobytes())
+    return bytes(packet)
+
+
+def ws281x_loop(data):
+    """RPI_WS281X.flush's colour words as they were"""
+    if data.shape[1] == 3:
+        return [
+            (round(c[0]) << 16) | (round(c[1]) << 8) | round(c[2])
+            for c in data
+        ]
+    return [
+        (round(c[3]) << 24)
+        | (round(c[0]) << 16)
+        | (round(c[1]) << 8)
+        | round(c[2])
+        for c in data
+    ]
+
+
+def hsbk_loop(rgb_array, kelvin=3500):
+    """numpy_rgb_to_hsbk's per pixel colour conversion"""
+    result = []
+    for r, g, b in rgb_array.astype(np.float32) / 255.0:
+        maxc, minc = max(r, g, b), min(r, g, b)
+        delta = maxc - minc
+        s = delta / maxc if maxc > 0 else 0
+        h = 0.0
+        if delta > 0:
+            if maxc == r:
+                h = ((g - b) / delta) % 6
+            elif maxc == g:
+                h = (b - r) / delta + 2
+            else:
+                h = (r - g) / delta + 4
+        result.append(
+            (
+                int(np.float32(h / 6) * 65535),
+                int(np.float32(s) * 65535),
+                int(maxc * 65535),
+                kelvin,
+            )
+        )
+    return result
+
+
+class TestHueStreamEncoder:
+    def test_matches_the_loop(self):
+        data = random_frame(10)
+        encoder = HueStreamEncoder(ENTERTAINMENT_ID, 10)
+        assert encoder.encode(data) == hue_loop(data, ENTERTAINMENT_ID)
+        # the buffer is reused for the next frame
+        data = random_frame(10)
+        assert encoder.encode(data) == hue_loop(data, ENTERTAINMENT_ID)
+
+
+class TestNanoleafUDPEncoder:
+    def test_matches_the_loop(self):
+        panel_ids = [23, 145, 7, 200]
+        data = np.random.uniform(-20, 280, (4, 3))
+        status = {
+            panel_id: color.tolist()
+            for panel_id, color in zip(
+                panel_ids, data.astype(int).clip(0, 255)
+            )
+        }
+        for light_panels in (False, True):
+            encoder = NanoleafUDPEncoder(panel_ids, light_panels)
+            assert encoder.encode(data) == nanoleaf_loop(status, light_panels)
+
+    def test_long_frames_are_cut_to_the_layout(self):
+        encoder = NanoleafUDPEncoder([1, 2])
+        assert len(encoder.encode(random_frame(5))) == 2 + 2 * 8
+
+
+class TestAdalightEncoder:
+    @pytest.mark.parametrize(
+        "color_order", ["RGB", "RBG", "GRB", "BRG", "GBR", "BGR"]
+    )
+    def test_matches_the_loop(self, color_order):
+        data = random_frame(300)
+        encoder = AdalightEncoder(300, color_order)
+        assert encoder.encode(data) == adalight_loop(data, color_order)
+
+    def test_packets_are_reused(self):
+        encoder = AdalightEncoder(600, "GRB")
+        packet = encoder.new_packet()
+        for _ in range(3):
+            data = random_frame(600)
+            encoder.encode_into(packet, data)
+            assert packet == adalight_loop(data, "GRB")
+
+
+class TestWS281XEncoder:
+    @pytest.mark.parametrize("white", [False, True])
+    def test_matches_the_loop(self, white):
+        data = np.random.uniform(0, 255, (300, 4 if white else 3))
+        # halves round to even, like round()
+        data[:3, 0] = [0.5, 1.5, 254.5]
+        words = WS281XEncoder(300, white).encode(data)
+        assert words.tolist() == ws281x_loop(data)
+
+    def test_clipped_and_cut_to_the_strip(self):
+        encoder = WS281XEncoder(2)
+        words = encoder.encode(np.array([[300, -5, 0], [0, 0, 1], [9, 9, 9]]))
+        assert words.tolist() == [0xFF0000, 0x000001]
+
+
+class TestHSBK:
+    def test_matches_the_loop(self):
+        data = np.random.randint(0, 256, (200, 3)).astype(np.uint8)
+        data[:4] = [[0, 0, 0], [255, 255, 255], [255, 0, 0], [0, 0, 255]]
+        assert numpy_rgb_to_hsbk(data, 4000) == hsbk_loop(data, 4000)
+
+    def test_padding(self):
+        data = np.full((2, 3), 255, dtype=np.uint8)
+        hsbk = numpy_rgb_to_hsbk(data, 5000, pixel_count=4)
+        assert hsbk == [(0, 0, 65535, 5000)] * 2 + [(0, 0, 0, 3500)] * 2
+
+
+class TestOpenRGBPacket:
+    def test_layout(self):
+        data = random_frame(30)
+        packet = build_openrgb_packet(data, 2)
+        header = struct.unpack_from("ccccIIIIH", packet)
+        assert header[4:] == (2, 1050, 126, 126, 30)
+        body = np.frombuffer(packet, np.uint8, offset=22).reshape(30, 4)
+        np.testing.assert_array_equal(body[:, :3], data.astype(np.uint8))
+        assert not body[:, 3].any()
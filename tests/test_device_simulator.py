@@ -0,0 +1,258 @@
+"""Tests for the loopback device simulators"""
+
+import asyncio
+import socket
+import threading
+
+import numpy as np
+from sacn.messages.data_packet import DataPacket
+from sacn.messages.sync_packet import SyncPacket
+from stupidArtnet import StupidArtnet
+
+from ledfx.devices.artnet import ArtNetDevice
+from ledfx.devices.ddp import DDPDevice
+from ledfx.devices.openrgb import OpenRGB
+from ledfx.devices.packets import RealtimeEncoder
+from ledfx.devices.utils.simulator import (
+    SequenceTracker,
+    SimulatorFarm,
+    write_tag,
+)
+
+LOCAL = {"address": "127.0.0.1", "port": 0}
+CID = tuple(range(16))
+
+
+def random_frame(pixel_count, channels=3):
+    return np.random.randint(0, 256, (pixel_count, channels)).astype(float)
+
+
+async def settle():
+    # loopback delivery happens within a few loop iterations
+    await asyncio.sleep(0.05)
+
+
+def run_with_farm(scenario):
+    async def run():
+        farm = SimulatorFarm()
+        try:
+            return await scenario(farm)
+        finally:
+            await farm.close()
+
+    return asyncio.run(run())
+
+
+class TestSequenceTracker:
+    def test_gaps_and_reordering(self):
+        tracker = SequenceTracker(256)
+        for sequence in (254, 255, 0, 3, 2, 4):
+            tracker.check(sequence)
+        assert tracker.gaps == 2
+        assert tracker.reordered == 1
+        assert tracker.last == 4
+
+
+class TestDDPReceiver:
+    def test_multi_packet_frames(self):
+        async def scenario(farm):
+            receiver = await farm.add_ddp("ddp", 1000, **LOCAL)
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            frames = [random_frame(1000) for _ in range(3)]
+            # frame 3 is lost on the way
+            for frame_count, frame in zip((1, 2, 4), frames):
+                write_tag(frame, frame_count)
+                receiver.sent(frame_count)
+                DDPDevice.send_out(
+                    sock,
+                    receiver.address,
+                    receiver.port,
+                    frame,
+                    frame_count,
+                    1,
+                )
+            sock.close()
+            await settle()
+            return receiver, frames[-1]
+
+        receiver, last = run_with_farm(scenario)
+        np.testing.assert_array_equal(receiver.pixels, last)
+        stats = receiver.get_stats()
+        assert stats["frames"] == 3
+        assert stats["packets"] == 9
+        assert stats["gaps"] == 1
+        assert stats["incomplete"] == stats["layout_errors"] == 0
+        assert stats["latency_avg_ms"] is not None
+
+    def test_short_frame_is_incomplete(self):
+        async def scenario(farm):
+            receiver = await farm.add_ddp("ddp", 100, **LOCAL)
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            DDPDevice.send_out(
+                sock, receiver.address, receiver.port, random_frame(50), 1, 1
+            )
+            sock.sendto(b"junk", (receiver.address, receiver.port))
+            sock.close()
+            await settle()
+            return receiver.get_stats()
+
+        stats = run_with_farm(scenario)
+        assert stats["incomplete"] == 1
+        assert stats["malformed"] == 1
+
+
+class TestE131Receiver:
+    def test_universes_with_offset_and_sync(self):
+        async def scenario(farm):
+            receiver = await farm.add_e131(
+                "sacn",
+                200,
+                universe=3,
+                universe_size=510,
+                channel_offset=10,
+                sync_universe=7,
+                **LOCAL,
+            )
+            frame = random_frame(200).astype(np.uint8).ravel()
+            # 600 channels from channel 10 of universe 3, into universe 4
+            universes = {3: (10, frame[:500]), 4: (0, frame[500:])}
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            for universe, (start, data) in universes.items():
+                dmx = [0] * start + data.tolist()
+                packet = DataPacket(
+                    CID,
+                    "test",
+                    universe,
+                    tuple(dmx),
+                    sequence=5,
+                    sync_universe=7,
+                )
+                sock.sendto(
+                    bytes(packet.getBytes()), (receiver.address, receiver.port)
+                )
+            await settle()
+            assert receiver.frames == 0
+            sock.sendto(
+                bytes(SyncPacket(CID, 7, 1).getBytes()),
+                (receiver.address, receiver.port),
+            )
+            sock.close()
+            await settle()
+            return receiver, frame
+
+        receiver, frame = run_with_farm(scenario)
+        np.testing.assert_array_equal(receiver.last_frame, frame)
+        assert receiver.synced_frames == receiver.frames == 1
+        assert receiver.incomplete == 0
+
+
+class TestArtNetReceiver:
+    def test_artnet_device_flush(self):
+        async def scenario(farm):
+            receiver = await farm.add_artnet(
+                "artnet", 26, universe=1, packet_size=16, **LOCAL
+            )
+            device = ArtNetDevice.__new__(ArtNetDevice)
+            device._config = {
+                "pixel_count": 6,
+                "universe": 1,
+                "packet_size": 16,
+                "rgb_order": "RGB",
+                "white_mode": "Zero",
+                "pre_amble": "9",
+                "pixels_per_device": 3,
+            }
+            device.lock = threading.Lock()
+            device.config_use(device._config)
+            device._artnet = StupidArtnet(
+                receiver.address, 1, 16, port=receiver.port
+            )
+            device.init = True
+            data = random_frame(6)
+            device.flush(data)
+            device.flush(data)
+            device._artnet.close()
+            await settle()
+            return receiver, data
+
+        receiver, data = run_with_farm(scenario)
+        assert receiver.frames == 2
+        channels = receiver.last_frame
+        expected = np.concatenate((data, np.zeros((6, 1))), axis=1).astype(
+            np.uint8
+        )
+        assert channels[0] == 9
+        np.testing.assert_array_equal(channels[1:13], expected[:3].ravel())
+        assert channels[13] == 9
+        np.testing.assert_array_equal(channels[14:26], expected[3:].ravel())
+        assert receiver.get_stats()["gaps"] == 0
+
+
+class TestWLEDReceiver:
+    def test_adaptive_encoder_keeps_the_frame(self):
+        async def scenario(farm):
+            receiver = await farm.add_wled("wled", 1200, **LOCAL)
+            encoder = RealtimeEncoder()
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            frame = random_frame(1200)
+            changes = [frame.copy()]
+            frame[5] = 1
+            changes.append(frame.copy())
+            frame[700:800] = 2
+            changes.append(frame.copy())
+            for now, data in enumerate(changes):
+                for packet in encoder.encode(data, 2, now * 0.1):
+                    sock.sendto(packet, (receiver.address, receiver.port))
+                    await asyncio.sleep(0)
+            sock.close()
+            await settle()
+            return receiver, frame
+
+        receiver, frame = run_with_farm(scenario)
+        np.testing.assert_array_equal(receiver.pixels, frame)
+        # three chunks for the first frame, one packet for each change
+        assert receiver.frames == 3
+        assert receiver.layout_errors == 0
+
+
+class TestOpenRGBServer:
+    def test_openrgb_client_connects_and_updates(self):
+        from openrgb import OpenRGBClient
+
+        async def scenario(farm):
+            controllers = await farm.add_openrgb([10, 30], **LOCAL)
+            loop = asyncio.get_running_loop()
+            client = await loop.run_in_executor(
+                None,
+                OpenRGBClient,
+                controllers[0].address,
+                controllers[0].port,
+                "test",
+                3,
+            )
+            device = client.devices[1]
+            assert [mode.name for mode in device.modes] == ["Direct"]
+            data = random_frame(30)
+            OpenRGB.send_out(device.comms.sock, data, device.id)
+            await settle()
+            client.disconnect()
+            return controllers, data
+
+        controllers, data = run_with_farm(scenario)
+        assert controllers[0].frames == 0
+        assert controllers[1].frames == 1
+        np.testing.assert_array_equal(controllers[1].pixels[:, :3], data)
+        assert controllers[1].layout_errors == 0
+
+
+class TestSimulatorFarm:
+    def test_receivers_get_their_own_loopback_address(self):
+        async def scenario(farm):
+            first = await farm.add_ddp("a", 10)
+            second = await farm.add_ddp("b", 10)
+            return first.address, second.address, first.port, farm
+
+        first, second, port, farm = run_with_farm(scenario)
+        assert first != second
+        assert port == 4048
+        assert farm.receivers == {}
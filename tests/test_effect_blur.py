@@ -0,0 +1,86 @@
+"""
+Tests for the effect blur applied in Effect.get_pixels
+"""
+
+import numpy as np
+import pytest
+
+from ledfx.effects import PixelBlur, _gaussian_kernel1d
+
+
+def convolve_channels(pixels, kernel):
+    """The per channel np.convolve blur PixelBlur replaces"""
+    return np.stack(
+        [np.convolve(pixels[:, c], kernel, mode="same") for c in range(3)],
+        axis=1,
+    )
+
+
+class TestPixelBlur:
+    @pytest.mark.parametrize("pixel_count", [4, 5, 60, 300])
+    @pytest.mark.parametrize("sigma", [0.3, 1.0, 3.0, 10.0])
+    def test_matches_channel_convolution(self, pixel_count, sigma):
+        rng = np.random.default_rng(pixel_count)
+        pixels = rng.random((pixel_count, 3)) * 255
+        expected = convolve_channels(
+            pixels, _gaussian_kernel1d(sigma, 0, pixel_count)
+        )
+
+        result = PixelBlur().blur(pixels, sigma)
+
+        assert result is pixels
+        np.testing.assert_allclose(pixels, expected)
+
+    def test_flipped_view(self):
+        """get_pixels may hand over a flipped view"""
+        pixels = np.flipud(np.random.default_rng(0).random((64, 3)))
+        expected = convolve_channels(pixels, _gaussian_kernel1d(2.0, 0, 64))
+
+        PixelBlur().blur(pixels, 2.0)
+
+        np.testing.assert_allclose(pixels, expected)
+
+    @pytest.mark.parametrize("rows, cols", [(8, 32), (4, 200)])
+    def test_matrix_is_blurred_separably(self, rows, cols):
+        pixels = np.random.default_rng(1).random((rows * cols, 3))
+        matrix = pixels.reshape(rows, cols, 3)
+        expected = np.apply_along_axis(
+            np.convolve, 1, matrix, _gaussian_kernel1d(2.0, 0, cols), "same"
+        )
+        expected = np.apply_along_axis(
+            np.convolve, 0, expected, _gaussian_kernel1d(2.0, 0, rows), "same"
+        )
+
+        PixelBlur().blur(pixels, 2.0, rows=rows)
+
+        np.testing.assert_allclose(pixels, expected.reshape(-1, 3))
+
+    def test_matrix_impulse_spreads_to_neighbouring_rows(self):
+        rows, cols = 8, 16
+        pixels = np.zeros((rows * cols, 3))
+        pixels[4 * cols + 8] = 1.0
+
+        PixelBlur().blur(pixels, 1.0, rows=rows)
+        matrix = pixels.reshape(rows, cols, 3)
+
+        assert matrix[3, 8, 0] == pytest.approx(matrix[4, 7, 0])
+        assert matrix[5, 8, 0] == pytest.approx(matrix[4, 9, 0])
+        assert matrix[3, 8, 0] > 0
+
+    def test_uneven_rows_fall_back_to_1d(self):
+        pixels = np.random.default_rng(2).random((50, 3))
+        expected = convolve_channels(pixels, _gaussian_kernel1d(1.0, 0, 50))
+
+        PixelBlur().blur(pixels, 1.0, rows=3)
+
+        np.testing.assert_allclose(pixels, expected)
+
+    def test_buffers_are_reused(self):
+        blur = PixelBlur()
+        pixels = np.ones((100, 3))
+
+        blur.blur(pixels, 1.0, rows=10)
+        buffers = dict(blur._buffers)
+        blur.blur(pixels, 1.0, rows=10)
+
+        assert all(blur._buffers[k] is buffers[k] for k in buffers)
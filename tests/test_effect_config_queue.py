@@ -0,0 +1,150 @@
+"""Tests for queued, per-key validated effect config updates"""
+
+import numpy as np
+import pytest
+import voluptuous as vol
+
+from ledfx.effects import Effect, _config_key_validators
+from ledfx.effects.gradient import GradientEffect
+
+
+@Effect.no_registration
+class CountingEffect(Effect):
+    NAME = "Counting"
+    RENDER_KEYS = Effect.RENDER_KEYS + ["speed"]
+
+    CONFIG_SCHEMA = vol.Schema(
+        {
+            vol.Optional("speed", default=1.0): vol.All(
+                vol.Coerce(float), vol.Range(min=0.0, max=10.0)
+            ),
+            vol.Optional("size", default=4): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=100)
+            ),
+        }
+    )
+
+    def config_updated(self, config):
+        self.hook_calls = getattr(self, "hook_calls", 0) + 1
+        self.size = config["size"]
+
+    def render(self):
+        self.pixels[:] = 0
+
+
+@Effect.no_registration
+class RollingEffect(GradientEffect):
+    NAME = "Rolling"
+
+    def config_updated(self, config):
+        self.hook_calls = getattr(self, "hook_calls", 0) + 1
+
+    def render(self):
+        self.pixels[:] = self.get_gradient_color(0.5)
+
+
+def make_effect(config=None, effect_class=CountingEffect):
+    effect = effect_class(None, config or {})
+    effect.pixels = np.zeros((4, 3))
+    effect._active = True
+    return effect
+
+
+class TestQueueConfigUpdate:
+    def test_validators_are_cached_per_key(self):
+        validators = _config_key_validators(CountingEffect)
+        assert validators is _config_key_validators(CountingEffect)
+        assert {"speed", "size", "blur", "background_color"} <= set(validators)
+
+    def test_applied_at_the_next_frame(self):
+        effect = make_effect()
+        effect.queue_config_update({"size": "8"})
+
+        # not applied yet, but visible in the config
+        assert effect.size == 4
+        assert effect._config["size"] == 4
+        assert effect.config["size"] == 8
+
+        effect._render()
+        assert effect.size == 8
+        assert effect._config["size"] == 8
+        assert effect.hook_calls == 2
+
+    def test_updates_coalesce(self):
+        effect = make_effect()
+        for size in range(5, 40):
+            effect.queue_config_update({"size": size})
+        effect._render()
+        assert effect.size == 39
+        assert effect.hook_calls == 2
+
+    def test_render_keys_skip_hooks(self):
+        effect = make_effect()
+        effect.queue_config_update({"speed": 2, "brightness": 0.5})
+        effect._render()
+        assert effect._config["speed"] == 2.0
+        assert effect.brightness == 0.5
+        assert effect.hook_calls == 1
+
+    def test_blur_runs_hooks(self):
+        effect = make_effect()
+        effect.queue_config_update({"blur": 2})
+        effect._render()
+        assert effect._config["blur"] == 2.0
+        assert effect.hook_calls == 2
+
+    def test_unchanged_values_do_nothing(self):
+        effect = make_effect()
+        effect.queue_config_update({"size": 4})
+        effect._render()
+        assert effect.hook_calls == 1
+
+    def test_background_is_rebuilt(self):
+        effect = make_effect()
+        assert not effect.bg_color_use
+        effect.queue_config_update({"background_color": "#ff0000"})
+        effect._render()
+        assert effect.bg_color_use
+        assert effect._bg_color_pil == (255, 0, 0)
+
+    def test_invalid_value_is_rejected(self):
+        effect = make_effect()
+        with pytest.raises(vol.Invalid):
+            effect.queue_config_update({"size": 1000})
+        assert not effect._pending_config
+        assert effect.config["size"] == 4
+
+    def test_unknown_key_falls_back(self):
+        effect = make_effect()
+        effect.queue_config_update({"size": 6, "unknown": True})
+        assert effect.size == 6
+        assert effect.hook_calls == 2
+
+    def test_full_update_keeps_queued_order(self):
+        effect = make_effect()
+        effect.queue_config_update({"size": 6, "speed": 3})
+        effect.update_config({"size": 9})
+        effect._render()
+        assert effect._config["size"] == 9
+        assert effect._config["speed"] == 3.0
+
+    def test_base_render_keys_skip_base_hooks(self):
+        effect = make_effect(effect_class=RollingEffect)
+        effect._render()
+        lut = effect._gradient_lut
+        assert lut is not None
+        effect.queue_config_update({"gradient_roll": 2})
+        effect._render()
+        assert effect._config["gradient_roll"] == 2.0
+        assert effect._gradient_lut is lut
+        # the key is not declared on the subclass, so its hook still runs
+        assert effect.hook_calls == 2
+
+    def test_other_keys_run_base_hooks(self):
+        effect = make_effect(effect_class=RollingEffect)
+        effect._render()
+        lut = effect._gradient_lut
+        effect.queue_config_update({"gradient": "#ff0000"})
+        effect._render()
+        assert effect._gradient_lut is not lut
+        assert effect.hook_calls == 2
@@ -0,0 +1,84 @@
+"""Tests for the inter-virtual frame bus and cached stretch maps"""
+
+import numpy as np
+import pytest
+
+from ledfx.effects.utils.stretch import (
+    axis_taps,
+    stretch_full,
+    stretch_tile,
+    tile_index,
+)
+from ledfx.libraries.frame_bus import FrameBus
+
+
+class TestFrameBus:
+    def test_publish_is_a_read_only_view(self):
+        bus = FrameBus()
+        frame = np.arange(24, dtype=np.float64).reshape(8, 3)
+        published = bus.publish("matrix", frame, rows=2)
+
+        assert published.frame.shape == (2, 4, 3)
+        assert np.shares_memory(published.frame, frame)
+        with pytest.raises(ValueError):
+            published.frame[0, 0, 0] = 1
+        # the publisher's own array stays writeable
+        assert frame.flags.writeable
+
+    def test_versions_increase_per_virtual(self):
+        bus = FrameBus()
+        frame = np.zeros((4, 3))
+        assert bus.publish("a", frame).version == 1
+        assert bus.publish("a", frame).version == 2
+        assert bus.publish("b", frame).version == 1
+        assert bus.get("a").version == 2
+        assert bus.get_stats()["a"] == {"version": 2, "shape": [1, 4, 3]}
+
+    def test_partial_rows_are_dropped(self):
+        bus = FrameBus()
+        published = bus.publish("a", np.zeros((10, 3)), rows=3)
+        assert published.frame.shape == (3, 3, 3)
+
+    def test_remove(self):
+        bus = FrameBus()
+        bus.publish("a", np.zeros((4, 3)))
+        bus.remove("a")
+        bus.remove("missing")
+        assert bus.get("a") is None
+
+
+class TestStretch:
+    def test_index_maps_are_cached(self):
+        assert axis_taps(8, 32) is axis_taps(8, 32)
+        assert tile_index(3, 10) is tile_index(3, 10)
+        assert not axis_taps(8, 32).flags.writeable
+
+    def test_upscale_is_nearest(self):
+        source = np.arange(2 * 2 * 3, dtype=np.float64).reshape(2, 2, 3)
+        result = stretch_full(source, 4, 4)
+        assert result.shape == (4, 4, 3)
+        np.testing.assert_array_equal(
+            result, source.repeat(2, axis=0).repeat(2, axis=1)
+        )
+
+    def test_downscale_averages_blocks(self):
+        source = np.random.rand(8, 6, 3)
+        result = stretch_full(source, 4, 3)
+        expected = source.reshape(4, 2, 3, 2, 3).mean(axis=(1, 3))
+        np.testing.assert_allclose(result, expected)
+
+    def test_mixed_scaling(self):
+        source = np.random.rand(8, 2, 3)
+        result = stretch_full(source, 2, 6)
+        assert result.shape == (2, 6, 3)
+        np.testing.assert_allclose(
+            result[:, 0], source[:, 0].reshape(2, 4, 3).mean(axis=1)
+        )
+
+    def test_tile(self):
+        source = np.random.rand(2, 3, 3)
+        result = stretch_tile(source, 5, 7)
+        assert result.shape == (5, 7, 3)
+        np.testing.assert_array_equal(
+            result, np.tile(source, (3, 3, 1))[:5, :7]
+        )
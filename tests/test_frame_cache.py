@@ -0,0 +1,179 @@
+"""
+Test cases for the decoded frame cache.
+
+Tests cache operations: hit/miss, LRU eviction under the memory budget,
+the memory-mapped disk tier and GIF frame decoding.
+"""
+
+import os
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from ledfx.effects.gifbase import decode_gif_frames
+from ledfx.libraries.frame_cache import FrameCache
+
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def temp_cache_dir(tmp_path):
+    """Create a temporary cache directory."""
+    cache_dir = os.path.join(str(tmp_path), "test_cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    """A two frame GIF on disk."""
+    path = os.path.join(str(tmp_path), "two_frames.gif")
+    frames = [
+        Image.new("RGB", (8, 4), color="red"),
+        Image.new("RGB", (8, 4), color="blue"),
+    ]
+    frames[0].save(path, save_all=True, append_images=frames[1:])
+    return path
+
+
+def half_mb_frames(value=0):
+    """uint8 frames of exactly half a megabyte."""
+    return np.full((4, 256, 512, 1), value, dtype=np.uint8)
+
+
+class TestFrameCacheKeys:
+    """Test cache key generation."""
+
+    def test_key_includes_size_resample_and_variant(self, source_file):
+        key = FrameCache.make_key(source_file, (8, 4), Image.BICUBIC, "rgb")
+
+        assert key != FrameCache.make_key(source_file, (4, 2), 3, "rgb")
+        assert key != FrameCache.make_key(source_file, (8, 4), 0, "rgb")
+        assert key != FrameCache.make_key(source_file, (8, 4), 3, "comp")
+
+    def test_key_changes_with_mtime(self, source_file):
+        key = FrameCache.make_key(source_file, None, None)
+        stat = os.stat(source_file)
+        os.utime(source_file, (stat.st_atime, stat.st_mtime + 10))
+
+        assert FrameCache.make_key(source_file, None, None) != key
+
+    def test_unkeyable_sources(self):
+        assert FrameCache.make_key("", None, None) is None
+        assert FrameCache.make_key("/no/such/file.gif", None, None) is None
+
+
+class TestFrameCacheMemory:
+    """Test the in memory LRU tier."""
+
+    def test_hit_and_miss(self, temp_cache_dir):
+        cache = FrameCache(temp_cache_dir, max_memory_mb=2)
+        calls = []
+
+        def decode():
+            calls.append(1)
+            return half_mb_frames()
+
+        first = cache.get_or_create(("a",), decode)
+        second = cache.get_or_create(("a",), decode)
+
+        assert first is second
+        assert len(calls) == 1
+        assert not first.flags.writeable
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["memory_bytes"] == MB // 2
+
+    def test_lru_eviction_under_budget(self, temp_cache_dir):
+        cache = FrameCache(temp_cache_dir, max_memory_mb=1)
+
+        cache.put(("a",), half_mb_frames())
+        cache.put(("b",), half_mb_frames())
+        cache.get(("a",))  # a is now most recently used
+        cache.put(("c",), half_mb_frames())
+
+        assert cache.get(("a",)) is not None
+        assert cache.get(("b",)) is None
+        assert cache.get(("c",)) is not None
+        assert cache.get_stats()["memory_bytes"] <= MB
+
+    def test_entry_larger_than_budget_is_not_kept(self, temp_cache_dir):
+        cache = FrameCache(temp_cache_dir, max_memory_mb=0)
+
+        frames = cache.get_or_create(("a",), half_mb_frames)
+
+        assert frames.shape == (4, 256, 512, 1)
+        assert cache.get_stats()["entries"] == 0
+
+    def test_uncached_key(self, temp_cache_dir):
+        cache = FrameCache(temp_cache_dir)
+
+        frames = cache.get_or_create(None, half_mb_frames)
+
+        assert not frames.flags.writeable
+        assert cache.get_stats()["entries"] == 0
+
+    def test_clear(self, temp_cache_dir):
+        cache = FrameCache(temp_cache_dir)
+        cache.put(("a",), half_mb_frames())
+
+        result = cache.clear()
+
+        assert result == {"cleared_count": 1, "freed_bytes": MB // 2}
+        assert cache.get(("a",)) is None
+
+
+class TestFrameCacheDiskTier:
+    """Test the memory-mapped disk tier."""
+
+    def test_evicted_frames_are_memory_mapped(self, temp_cache_dir):
+        cache = FrameCache(temp_cache_dir, max_memory_mb=1, disk_tier=True)
+
+        cache.put(("a",), half_mb_frames(1))
+        cache.put(("b",), half_mb_frames(2))
+        cache.put(("c",), half_mb_frames(3))
+
+        frames = cache.get(("a",))
+
+        assert isinstance(frames, np.memmap)
+        assert (frames == 1).all()
+        assert cache.get_stats()["disk_hits"] == 1
+
+    def test_disk_budget(self, temp_cache_dir):
+        cache = FrameCache(
+            temp_cache_dir, max_memory_mb=0, disk_tier=True, max_disk_mb=1
+        )
+
+        for name in "abc":
+            cache.put((name,), half_mb_frames())
+
+        sizes = [
+            entry.stat().st_size
+            for entry in os.scandir(cache.cache_dir)
+            if entry.name.endswith(".npy")
+        ]
+        assert 0 < sum(sizes) <= MB
+
+
+class TestDecodeGifFrames:
+    """Test GIF decoding into frame arrays."""
+
+    def test_decode_native_size(self, source_file):
+        with Image.open(source_file) as gif:
+            frames = decode_gif_frames(gif)
+
+        assert frames.shape == (2, 4, 8, 3)
+        assert frames.dtype == np.uint8
+        assert tuple(frames[0, 0, 0]) == (255, 0, 0)
+        assert tuple(frames[1, 0, 0]) == (0, 0, 255)
+
+    def test_decode_resized_composite(self, source_file):
+        with Image.open(source_file) as gif:
+            frames = decode_gif_frames(
+                gif, (4, 2), Image.NEAREST, composite=True
+            )
+
+        assert frames.shape == (2, 2, 4, 3)
+        assert tuple(frames[1, 1, 3]) == (0, 0, 255)
@@ -0,0 +1,179 @@
+"""Tests for synchronised output across devices"""
+
+import asyncio
+import socket
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import sacn
+
+from ledfx.devices.ddp import DDPDevice
+from ledfx.devices.e131 import E131Device
+from ledfx.devices.utils.frame_sync import FrameSync
+from ledfx.devices.utils.simulator import SimulatorFarm
+
+LOCAL = {"address": "127.0.0.1", "port": 0}
+
+
+def random_frame(pixel_count):
+    return np.random.randint(0, 256, (pixel_count, 3)).astype(float)
+
+
+async def settle():
+    await asyncio.sleep(0.05)
+
+
+def run_with_farm(scenario):
+    async def run():
+        farm = SimulatorFarm()
+        try:
+            return await scenario(farm)
+        finally:
+            await farm.close()
+
+    return asyncio.run(run())
+
+
+def make_ddp(receiver, pixel_count):
+    device = DDPDevice.__new__(DDPDevice)
+    device._config = {"name": receiver.name, "pixel_count": pixel_count}
+    device._id = receiver.name
+    device._destination = receiver.address
+    device._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    device.destination_port = receiver.port
+    device.destination_id = 1
+    device.frame_count = 0
+    return device
+
+
+def make_e131(receiver, pixel_count, sync_universe):
+    device = E131Device.__new__(E131Device)
+    device._config = {
+        "name": receiver.name,
+        "ip_address": receiver.address,
+        "pixel_count": pixel_count,
+        "channel_count": pixel_count * 3,
+        "universe": 1,
+        "universe_size": 510,
+        "universe_end": 2,
+        "channel_offset": 0,
+        "sync_universe": sync_universe,
+    }
+    device._id = receiver.name
+    device._cid = tuple(range(16))
+    device._sync_sequence = 0
+    device.device_lock = threading.Lock()
+    device._sacn = sacn.sACNsender(
+        bind_address="127.0.0.1",
+        bind_port=0,
+        source_name=receiver.name,
+        cid=device._cid,
+    )
+    for universe in (1, 2):
+        device._sacn.activate_output(universe)
+        device._sacn[universe].destination = receiver.address
+    return device
+
+
+class Unsupported:
+    id = name = "unsupported"
+
+    def sync_packets(self, data):
+        return None
+
+
+class TestDDPSyncPackets:
+    def test_push_is_a_separate_packet(self):
+        receiver = SimpleNamespace(name="ddp", address="127.0.0.1", port=4048)
+        device = make_ddp(receiver, 1000)
+        packets, latches = device.sync_packets(random_frame(1000))
+        assert len(packets) == 3
+        assert all(packet[0] == DDPDevice.VER1 for packet, _ in packets)
+        assert latches[0][0][0] == DDPDevice.VER1 | DDPDevice.PUSH
+        assert len(latches[0][0]) == DDPDevice.HEADER_LEN
+        device._sock.close()
+
+    def test_build_packets_matches_send_out_layout(self):
+        frame = random_frame(500).astype(np.uint8)
+        packets = DDPDevice.build_packets(frame, 3, 1)
+        assert [len(p) for p in packets] == [10 + 1440, 10 + 60]
+        assert packets[-1][0] == DDPDevice.VER1 | DDPDevice.PUSH
+        joined = b"".join(p[10:] for p in packets)
+        assert joined == frame.tobytes()
+
+
+class TestFrameSync:
+    def test_devices_latch_after_all_data_is_sent(self):
+        async def scenario(farm):
+            ddp = [
+                await farm.add_ddp(f"ddp {i}", 600, **LOCAL) for i in (1, 2)
+            ]
+            # E1.31 always goes to the standard port, on its own address
+            e131 = await farm.add_e131("sacn", 200, sync_universe=9)
+            devices = [make_ddp(r, 600) for r in ddp]
+            devices.append(make_e131(e131, 200, 9))
+            frames = [random_frame(600), random_frame(600), random_frame(200)]
+
+            frame_sync = FrameSync("wall")
+            with frame_sync.batch() as batch:
+                assert FrameSync.current() is batch
+                for device, frame in zip(devices, frames):
+                    assert batch.add(device, frame)
+                assert not batch.add(Unsupported(), frames[0])
+                await settle()
+                # nothing is sent until the batch closes
+                assert all(r.packets == 0 for r in (*ddp, e131))
+            assert FrameSync.current() is None
+            await settle()
+
+            for device in devices[:2]:
+                device._sock.close()
+            # sacn only closes its socket when the thread was started
+            devices[2]._sacn.start()
+            devices[2]._sacn.stop()
+            frame_sync.close()
+            return ddp, e131, frames, frame_sync.get_stats()
+
+        ddp, e131, frames, stats = run_with_farm(scenario)
+        for receiver, frame in zip(ddp, frames):
+            np.testing.assert_array_equal(receiver.pixels, frame)
+            assert receiver.frames == 1
+            assert receiver.incomplete == receiver.malformed == 0
+        np.testing.assert_array_equal(e131.pixels, frames[2])
+        assert e131.synced_frames == e131.frames == 1
+        assert stats["frames"] == 1
+        assert stats["devices"] == 3
+        assert stats["errors"] == 0
+        assert stats["max_skew_us"] >= stats["last_skew_us"] >= 0
+
+    def test_data_without_latch_is_not_shown(self):
+        async def scenario(farm):
+            receiver = await farm.add_ddp("ddp", 600, **LOCAL)
+            device = make_ddp(receiver, 600)
+            packets, _ = device.sync_packets(random_frame(600))
+            for payload, address in packets:
+                device._sock.sendto(payload, address)
+            device._sock.close()
+            await settle()
+            return receiver
+
+        receiver = run_with_farm(scenario)
+        assert receiver.packets == 2
+        assert receiver.frames == 0
+
+    def test_send_errors_are_counted(self):
+        class Failing:
+            id = name = "failing"
+
+            def sync_packets(self, data):
+                # port 0 can't be sent to
+                return [(b"x", ("127.0.0.1", 0))], [(b"y", ("127.0.0.1", 0))]
+
+        frame_sync = FrameSync("wall")
+        with frame_sync.batch() as batch:
+            batch.add(Failing(), None)
+        frame_sync.close()
+        stats = frame_sync.get_stats()
+        assert stats["errors"] == 1
+        assert stats["frames"] == 1
@@ -0,0 +1,96 @@
+"""
+Tests for the Game of Life automaton engine
+"""
+
+import numpy as np
+import pytest
+
+from ledfx.effects.utils.life import GameOfLife
+
+
+def roll_step(board):
+    """The eight np.roll neighbour count the engine replaces"""
+    neighbors = sum(
+        np.roll(np.roll(board, i, 0), j, 1)
+        for i in (-1, 0, 1)
+        for j in (-1, 0, 1)
+        if (i != 0 or j != 0)
+    )
+    return (neighbors == 3) | (board & (neighbors == 2))
+
+
+def empty_game(height, width, depth=5):
+    game = GameOfLife(height, width, depth)
+    game.board[:] = 0
+    return game
+
+
+class TestGameOfLifeStep:
+    @pytest.mark.parametrize(
+        "height, width", [(1, 1), (2, 3), (7, 5), (32, 64)]
+    )
+    def test_matches_rolled_neighbour_count(self, height, width):
+        game = GameOfLife(height, width, 5)
+        expected = game.board.astype(bool)
+
+        for _ in range(10):
+            expected = roll_step(expected)
+            game.step_board()
+
+        np.testing.assert_array_equal(game.board, expected)
+        assert game.board.dtype == np.uint8
+
+    def test_many_generations_in_one_call(self):
+        game = GameOfLife(16, 16, 5)
+        expected = game.board.astype(bool)
+        for _ in range(8):
+            expected = roll_step(expected)
+
+        board = game.step_board(8)
+
+        assert board is game.board
+        np.testing.assert_array_equal(board, expected)
+
+    def test_alive_counts_track_history(self):
+        game = GameOfLife(12, 12, 5)
+        history = []
+
+        for _ in range(9):
+            history.append(game.board.copy())
+            game.step_board()
+
+        np.testing.assert_array_equal(
+            game.alive_counts, np.sum(history[-5:], axis=0)
+        )
+
+
+class TestGameOfLifeHealth:
+    def test_still_life_is_dead(self):
+        game = empty_game(8, 8)
+        game.board[2:4, 2:4] = 1  # block
+
+        game.step_board(2)
+
+        assert game.check_board_life()
+        assert len(game.board_hashes) == 0
+        assert not game.alive_counts.any()
+
+    def test_blinker_is_oscillating(self):
+        game = empty_game(8, 8)
+        game.board[3, 2:5] = 1
+
+        game.step_board(4)
+        assert not game.check_board_oscillating()
+        game.step_board()
+
+        assert not game.check_board_life()
+        assert game.check_board_oscillating()
+
+    def test_glider_is_healthy(self):
+        game = empty_game(16, 16)
+        game.board[0:3, 0:3] = [[0, 0, 1], [1, 0, 1], [0, 1, 1]]
+
+        game.step_board(10)
+
+        assert not game.check_board_life()
+        assert not game.check_board_oscillating()
@@ -0,0 +1,125 @@
+"""
+Tests for the shared gradient lookup tables used by GradientEffect
+"""
+
+import numpy as np
+import pytest
+
+from ledfx.effects import Effect
+from ledfx.effects.gradient import (
+    GradientEffect,
+    GradientLUTs,
+    generate_gradient_curve,
+    gradient_luts,
+)
+
+RAINBOW = (
+    "linear-gradient(90deg, rgb(255, 0, 0) 0%, rgb(0, 255, 0) 50%, "
+    "rgb(0, 0, 255) 100%)"
+)
+
+
+@Effect.no_registration
+class PlainGradient(GradientEffect):
+    pass
+
+
+def gradient_effect(pixel_count, gradient=RAINBOW, gradient_roll=0):
+    effect = PlainGradient(
+        None, {"gradient": gradient, "gradient_roll": gradient_roll}
+    )
+    effect.pixels = np.zeros((pixel_count, 3))
+    return effect
+
+
+class TestGradientLUTs:
+    def test_tables_are_shared_and_reference_counted(self):
+        luts = GradientLUTs()
+
+        key, table = luts.acquire(RAINBOW, 256)
+        other_key, other_table = luts.acquire(RAINBOW, 256)
+
+        assert other_table is table
+        assert not table.flags.writeable
+        assert table.shape == (256, 3) and table.dtype == np.float32
+        assert luts.get_stats()["builds"] == 1
+
+        luts.release(key)
+        assert luts.get_stats()["tables"] == 1
+        luts.release(other_key)
+        assert luts.get_stats() == {
+            "tables": 0,
+            "references": 0,
+            "bytes": 0,
+            "builds": 1,
+            "hits": 1,
+        }
+
+    def test_uint8_tables(self):
+        luts = GradientLUTs()
+
+        _, table = luts.acquire(RAINBOW, 300, np.uint8)
+
+        expected = np.rint(generate_gradient_curve(RAINBOW, 300))
+        assert table.dtype == np.uint8
+        np.testing.assert_array_equal(table, expected)
+
+    def test_invalid_gradient_is_black(self):
+        _, table = GradientLUTs().acquire("not a gradient", 256)
+
+        assert not table.any()
+
+
+class TestGradientEffectLookups:
+    def test_effects_share_one_table(self):
+        first = gradient_effect(64)
+        second = gradient_effect(128)
+        first.get_gradient()
+        second.get_gradient()
+
+        assert first._gradient_lut is second._gradient_lut
+
+        refs = gradient_luts.get_stats()["references"]
+        first.deactivate()
+        assert gradient_luts.get_stats()["references"] == refs - 1
+        second.config_updated({})
+        assert gradient_luts.get_stats()["references"] == refs - 2
+
+    def test_shapes(self):
+        effect = gradient_effect(100)
+
+        assert effect.get_gradient().shape == (3, 100)
+        assert effect.get_gradient_color(0.5).shape == (3,)
+        assert effect.get_gradient_color(np.zeros(7)).shape == (3, 7)
+        assert effect.get_gradient_color_vectorized1d(np.zeros(7)).shape == (
+            7,
+            3,
+        )
+        assert effect.get_gradient_color_vectorized2d(
+            np.zeros((4, 5))
+        ).shape == (4, 5, 3)
+        assert effect.apply_gradient(np.ones(100)).dtype == np.float64
+
+        effect.pixels = np.zeros((150, 3))
+        assert effect.get_gradient().shape == (3, 150)
+
+    @pytest.mark.parametrize("pixel_count", [100, 400])
+    def test_roll_matches_rolling_the_table(self, pixel_count):
+        effect = gradient_effect(pixel_count, gradient_roll=5)
+        length = effect.gradient_pixel_count
+        table = generate_gradient_curve(RAINBOW, length).astype(np.float32)
+        points = np.random.default_rng(0).random((6, 9))
+        indices = ((length - 1) * points).astype(int)
+
+        for _ in range(7):
+            effect.roll_gradient()
+        rolled = np.roll(table, effect._gradient_phase, axis=0)
+
+        assert effect._gradient_phase != 0
+        np.testing.assert_array_equal(
+            effect.get_gradient_color_vectorized2d(points), rolled[indices]
+        )
+        gradient = effect.get_gradient()
+        if pixel_count < length:
+            rolled = rolled[effect._gradient_indices]
+        np.testing.assert_array_equal(gradient, rolled.T)
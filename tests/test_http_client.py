@@ -0,0 +1,196 @@
+"""Tests for the shared device HTTP client"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from aiohttp import web
+
+from ledfx.devices import Devices
+from ledfx.libraries.http_client import (
+    DeviceHttpClient,
+    DeviceHttpError,
+    device_http,
+)
+from ledfx.utils import WLED
+
+
+async def start_app(routes):
+    app = web.Application()
+    app.add_routes(routes)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f"127.0.0.1:{port}"
+
+
+class TestDeviceHttpClient:
+    def test_reads_json_and_status(self):
+        async def run():
+            async def info(request):
+                return web.json_response({"brand": "WLED"})
+
+            async def missing(request):
+                return web.Response(status=404)
+
+            runner, host = await start_app(
+                [web.get("/json/info", info), web.get("/gone", missing)]
+            )
+            client = DeviceHttpClient()
+            try:
+                ok = await client.request("GET", f"http://{host}/json/info")
+                gone = await client.request("GET", f"http://{host}/gone")
+            finally:
+                await client.close()
+                await runner.cleanup()
+            return ok, gone
+
+        ok, gone = asyncio.run(run())
+        assert ok.ok and ok.json() == {"brand": "WLED"}
+        assert not gone.ok and gone.status_code == 404
+
+    def test_per_host_concurrency_is_bounded(self):
+        async def run():
+            active = 0
+            peak = 0
+
+            async def slow(request):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.05)
+                active -= 1
+                return web.json_response({})
+
+            runner, host = await start_app([web.get("/", slow)])
+            client = DeviceHttpClient(limit_per_host=2)
+            try:
+                start = time.monotonic()
+                await asyncio.gather(
+                    *(
+                        client.request("GET", f"http://{host}/")
+                        for _ in range(6)
+                    )
+                )
+                elapsed = time.monotonic() - start
+            finally:
+                await client.close()
+                await runner.cleanup()
+            return peak, elapsed
+
+        peak, elapsed = asyncio.run(run())
+        assert peak == 2
+        # six requests two at a time, not one after the other
+        assert 0.14 < elapsed < 0.3
+
+    def test_unreachable_device_raises(self):
+        async def run():
+            client = DeviceHttpClient()
+            try:
+                with pytest.raises(DeviceHttpError):
+                    await client.request(
+                        "GET", "http://127.0.0.1:9/", timeout=0.5
+                    )
+            finally:
+                await client.close()
+            return client.get_stats()
+
+        stats = asyncio.run(run())
+        assert stats["requests"] == 1
+        assert stats["errors"] == 1
+
+
+class TestWLEDRequests:
+    def test_sync_settings_round_trip_as_json(self):
+        async def run():
+            received = []
+
+            async def get_cfg(request):
+                return web.json_response({"if": {"live": {"port": 5568}}})
+
+            async def post_cfg(request):
+                received.append(await request.json())
+                return web.json_response({"success": True})
+
+            runner, host = await start_app(
+                [
+                    web.get("/json/cfg", get_cfg),
+                    web.post("/json/cfg", post_cfg),
+                ]
+            )
+            try:
+                wled = WLED(host)
+                await wled.get_sync_settings()
+                wled.sync_settings["if"]["live"]["port"] = 4048
+                await wled.flush_sync_settings()
+            finally:
+                await device_http.close()
+                await runner.cleanup()
+            return received
+
+        assert asyncio.run(run()) == [{"if": {"live": {"port": 4048}}}]
+
+    def test_api_error_is_a_value_error(self):
+        async def run():
+            runner, host = await start_app([])
+            try:
+                with pytest.raises(ValueError, match="API Error - 404"):
+                    await WLED(host).get_state()
+            finally:
+                await device_http.close()
+                await runner.cleanup()
+
+        asyncio.run(run())
+
+    def test_sync_mode_is_set_concurrently(self):
+        class FakeWLED:
+            active = 0
+            peak = 0
+
+            def __init__(self, fail=False):
+                self.fail = fail
+                self.mode = None
+
+            def set_sync_mode(self, mode):
+                self.mode = mode
+
+            async def flush_sync_settings(self):
+                FakeWLED.active += 1
+                FakeWLED.peak = max(FakeWLED.peak, FakeWLED.active)
+                await asyncio.sleep(0.02)
+                FakeWLED.active -= 1
+                if self.fail:
+                    raise ValueError("offline")
+
+        def make_wled(device_id, fail=False, pixel_count=600):
+            device = SimpleNamespace(
+                id=device_id,
+                name=device_id,
+                type="wled",
+                pixel_count=pixel_count,
+                config={"sync_mode": "UDP"},
+                wled=FakeWLED(fail),
+            )
+            device.update_config = device.config.update
+            return device
+
+        devices = [make_wled(f"wled-{i}") for i in range(5)]
+        devices += [
+            make_wled("offline", fail=True),
+            make_wled("small", pixel_count=100),
+        ]
+        registry = Devices.__new__(Devices)
+        registry._objects = {device.id: device for device in devices}
+
+        asyncio.run(registry.set_wleds_sync_mode("DDP"))
+
+        assert FakeWLED.peak == 6
+        modes = {device.id: device.config["sync_mode"] for device in devices}
+        assert modes == {
+            **{f"wled-{i}": "DDP" for i in range(5)},
+            "offline": "UDP",
+            "small": "UDP",
+        }
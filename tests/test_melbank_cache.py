@@ -0,0 +1,80 @@
+"""
+Tests for the per audio frame melbank slice cache shared by audio effects.
+"""
+
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from ledfx.effects.audio import AudioAnalysisSource
+
+
+@pytest.fixture
+def source():
+    """An analysis source with fake melbanks and no audio stream"""
+    src = object.__new__(AudioAnalysisSource)
+    src._melbank_cache = {}
+    src._melbank_cache_lock = threading.Lock()
+    src.melbank_cache_hits = 0
+    src.melbank_cache_misses = 0
+    src.melbanks = SimpleNamespace(
+        melbanks=[np.linspace(0, 1, 24)],
+        melbanks_filtered=[np.linspace(1, 0, 24)],
+    )
+    return src
+
+
+class TestMelbankSliceCache:
+    def test_same_key_is_shared(self, source):
+        first = source.melbank_slice(0, 2, 10, size=30)
+        second = source.melbank_slice(0, 2, 10, size=30)
+
+        assert first is second
+        assert len(first) == 30
+        assert source.melbank_cache_hits == 1
+        assert source.melbank_cache_misses == 1
+
+    def test_results_are_read_only(self, source):
+        interpolated = source.melbank_slice(0, 2, 10, size=30)
+        sliced = source.melbank_slice(0, 2, 10)
+
+        assert not interpolated.flags.writeable
+        assert not sliced.flags.writeable
+        # the melbank itself stays writeable for the next audio frame
+        assert source.melbanks.melbanks[0].flags.writeable
+
+    def test_filtered_is_a_separate_entry(self, source):
+        raw = source.melbank_slice(0, 0, 24)
+        filtered = source.melbank_slice(0, 0, 24, filtered=True)
+
+        np.testing.assert_array_equal(raw, source.melbanks.melbanks[0])
+        np.testing.assert_array_equal(
+            filtered, source.melbanks.melbanks_filtered[0]
+        )
+        assert source.melbank_cache_misses == 2
+
+    def test_no_interpolation_when_size_matches(self, source):
+        result = source.melbank_slice(0, 4, 12, size=8)
+
+        np.testing.assert_array_equal(
+            result, source.melbanks.melbanks[0][4:12]
+        )
+
+    def test_nan_values_are_zeroed(self, source):
+        source.melbanks.melbanks[0][5] = np.nan
+
+        result = source.melbank_slice(0, 0, 24)
+
+        assert not np.isnan(result).any()
+        assert result[5] == 0
+
+    def test_stats(self, source):
+        source.melbank_slice(0, 0, 24, size=48)
+        source.melbank_slice(0, 0, 24, size=48)
+        source.melbank_slice(0, 0, 24, size=48)
+
+        stats = source.melbank_cache_stats()
+
+        assert stats == {"hits": 2, "misses": 1, "hit_rate": 0.667}
@@ -0,0 +1,105 @@
+"""Tests for compositing oneshots into a single overlay"""
+
+import timeit
+
+import numpy as np
+
+from ledfx.effects.oneshots.compositor import OneshotCompositor
+from ledfx.effects.oneshots.oneshot import Flash, Oneshot
+
+
+def make_flash(color, ramp=100, hold=200, fade=300, brightness=1.0, age=0):
+    flash = Flash(color, ramp, hold, fade, brightness)
+    flash._start = timeit.default_timer() - age
+    return flash
+
+
+class Invert(Oneshot):
+    def init(self):
+        pass
+
+    def update(self):
+        pass
+
+    def apply(self, seg, start, stop):
+        np.subtract(255, seg, seg)
+
+
+class TestFlashEnvelope:
+    def test_scalar_matches_phases(self):
+        envelope = Flash.envelope
+        assert envelope(0.05, 0.1, 0.3, 0.6) == 0.5
+        assert envelope(0.2, 0.1, 0.3, 0.6) == 1.0
+        assert np.isclose(envelope(0.45, 0.1, 0.3, 0.6), 0.5)
+        assert envelope(0.7, 0.1, 0.3, 0.6) == 0.0
+
+    def test_zero_ramp_and_fade(self):
+        assert Flash.envelope(0.0, 0.0, 0.1, 0.1) == 0.0
+        assert Flash.envelope(0.05, 0.0, 0.1, 0.1) == 1.0
+        assert Flash.envelope(0.2, 0.0, 0.1, 0.1) == 0.0
+
+
+class TestOneshotCompositor:
+    def test_overlay_matches_sequential_apply(self):
+        ages = [0.05, 0.2, 0.45, 0.15]
+        colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (10, 20, 30)]
+        compositor = OneshotCompositor()
+        for color, age in zip(colors, ages):
+            compositor.add(make_flash(color, age=age))
+
+        pixels = np.random.rand(16, 3) * 255
+        expected = pixels.copy()
+        now = timeit.default_timer()
+        for flash in compositor.oneshots:
+            flash._weight = Flash.envelope(
+                now - flash._start,
+                flash._ramp,
+                flash._hold_end,
+                flash._fade_end,
+            )
+            flash.apply(expected, 0, len(expected))
+
+        scale, offset = compositor.overlay(now)
+        np.testing.assert_allclose(pixels * scale + offset, expected)
+
+    def test_apply_drops_ended_flashes(self):
+        compositor = OneshotCompositor()
+        compositor.add(make_flash((255, 255, 255), age=1.0))
+        compositor.add(make_flash((255, 255, 255), age=0.2))
+        pixels = np.zeros((8, 3))
+        compositor.apply(pixels)
+
+        assert len(compositor) == 1
+        np.testing.assert_allclose(pixels, 255)
+
+    def test_externally_deactivated_flash_is_skipped(self):
+        compositor = OneshotCompositor()
+        flash = make_flash((255, 0, 0), age=0.2)
+        compositor.add(flash)
+        flash.active = False
+        pixels = np.zeros((4, 3))
+        compositor.apply(pixels)
+
+        assert len(compositor) == 0
+        np.testing.assert_array_equal(pixels, 0)
+
+    def test_other_oneshots_apply_after_flashes(self):
+        compositor = OneshotCompositor()
+        compositor.add(Invert())
+        compositor.add(make_flash((100, 100, 100), age=0.2))
+        pixels = np.zeros((4, 3))
+        compositor.apply(pixels)
+        np.testing.assert_allclose(pixels, 155)
+
+    def test_cap_drops_oldest(self):
+        compositor = OneshotCompositor(max_oneshots=3)
+        flashes = [make_flash((i, i, i)) for i in range(5)]
+        for flash in flashes:
+            compositor.add(flash)
+
+        assert compositor.oneshots == flashes[2:]
+        stats = compositor.get_stats()
+        assert stats["active"] == 3
+        assert stats["added"] == 5
+        assert stats["dropped"] == 2
+        assert stats["peak_active"] == 3
@@ -0,0 +1,129 @@
+"""Tests for the output statistics reported through the API"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import numpy as np
+
+from ledfx.api.devices import DevicesEndpoint
+from ledfx.api.output_stats import OutputStatsEndpoint
+from ledfx.devices import packets
+from ledfx.devices.adalight import AdalightDevice
+from ledfx.devices.ddp import DDPDevice
+from ledfx.devices.udp import UDPRealtimeDevice
+from ledfx.devices.utils.frame_sync import FrameSync
+from ledfx.devices.utils.output_worker import OutputWorker
+from ledfx.devices.utils.serial_writer import SerialWriter
+from ledfx.devices.utils.socket_singleton import udp_sender
+from ledfx.virtuals import Virtual
+
+# nothing can be sent to port 0
+UNREACHABLE = ("127.0.0.1", 0)
+
+
+def make_ddp(device_id):
+    device = DDPDevice.__new__(DDPDevice)
+    device._id = device_id
+    device._config = {"name": device_id, "port": UNREACHABLE[1]}
+    device._destination = UNREACHABLE[0]
+    device._output_worker = None
+    return device
+
+
+def make_realtime(device_id):
+    device = UDPRealtimeDevice.__new__(UDPRealtimeDevice)
+    device._id = device_id
+    device._type = "udp"
+    device._config = {"name": device_id, "port": UNREACHABLE[1]}
+    device._destination = UNREACHABLE[0]
+    device._online = True
+    device._segments = []
+    device._output_worker = None
+    device._encoder = packets.RealtimeEncoder()
+    return device
+
+
+def make_adalight(device_id, pixel_count):
+    device = AdalightDevice.__new__(AdalightDevice)
+    device._id = device_id
+    device._type = "adalight"
+    device._config = {"name": device_id, "pixel_count": pixel_count}
+    device._online = True
+    device._segments = []
+    device._output_worker = None
+    device._writer = None
+    return device
+
+
+def make_virtual(virtual_id):
+    virtual = Virtual.__new__(Virtual)
+    virtual._id = virtual_id
+    virtual._frame_sync = None
+    virtual._oneshots = SimpleNamespace(get_stats=lambda: {"active": 0})
+    return virtual
+
+
+def make_ledfx(devices=(), virtuals=()):
+    return SimpleNamespace(
+        devices={device.id: device for device in devices},
+        virtuals={virtual.id: virtual for virtual in virtuals},
+    )
+
+
+def get(endpoint):
+    response = asyncio.run(endpoint.get())
+    return json.loads(response.body.decode())
+
+
+class TestOutputStats:
+    def test_device_stats(self):
+        device = make_ddp("wall")
+        udp_sender.forget(UNREACHABLE)
+        assert device.stats == {"output": None, "udp": None}
+
+        udp_sender.send([(b"x", UNREACHABLE)])
+        device._output_worker = OutputWorker("wall", lambda frame: None)
+        stats = device.stats
+        udp_sender.forget(UNREACHABLE)
+        assert stats["udp"]["errors"] == 1
+        assert stats["output"]["sent"] == 0
+
+    def test_realtime_encoder_stats(self):
+        device = make_realtime("strip")
+        list(device._encoder.encode(np.zeros((10, 3)), 1))
+        ledfx = make_ledfx([device])
+        stats = get(DevicesEndpoint(ledfx))["devices"]["strip"]["stats"]
+        assert stats["encoder"]["frames"] == 1
+        assert stats["encoder"]["formats"]["DRGB"] == 1
+
+    def test_adalight_serial_stats(self):
+        device = make_adalight("desk", 10)
+        written = []
+        writer = device._writer = SerialWriter(
+            "desk", written.append, packets.AdalightEncoder(10, "RGB")
+        )
+        writer.start()
+        device.flush(np.zeros((10, 3)))
+        writer.stop()
+        assert len(written) == 1
+
+        ledfx = make_ledfx([device])
+        stats = get(DevicesEndpoint(ledfx))["devices"]["desk"]["stats"]
+        assert stats["output"]["sent"] == 1
+        assert stats["output"]["bytes_sent"] == len(written[0])
+        assert {"bytes_per_second", "fps"} <= set(stats["output"])
+
+    def test_virtual_stats(self):
+        virtual = make_virtual("wall")
+        assert virtual.stats == {"sync": None, "oneshots": {"active": 0}}
+        virtual._frame_sync = FrameSync("wall")
+        assert virtual.stats["sync"]["frames"] == 0
+
+    def test_endpoint(self):
+        ledfx = make_ledfx([make_ddp("wall")], [make_virtual("wall")])
+        stats = get(OutputStatsEndpoint(ledfx))
+        assert set(stats) == {"udp", "devices", "virtuals"}
+        assert "destinations" in stats["udp"]
+        assert stats["devices"]["wall"]["output"] is None
+        assert stats["virtuals"]["wall"]["oneshots"] == {"active": 0}
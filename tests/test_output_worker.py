@@ -0,0 +1,163 @@
+"""Tests for the per-device output worker"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from ledfx.devices.ddp import DDPDevice
+from ledfx.devices.nanoleaf import NanoleafDevice
+from ledfx.devices.utils.output_worker import OutputWorker
+from ledfx.devices.utils.socket_singleton import udp_sender
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.001)
+
+
+def make_nanoleaf():
+    device = NanoleafDevice.__new__(NanoleafDevice)
+    device._id = "nanoleaf"
+    device._config = {
+        "name": "nanoleaf",
+        "ip_address": "127.0.0.1",
+        "udp_port": 60222,
+        "sync_mode": "UDP",
+        "async_output": True,
+    }
+    device._ledfx = SimpleNamespace()
+    device._sock = udp_sender
+    device._pixels = np.zeros((1, 3))
+    device._active = True
+    return device
+
+
+class TestOutputWorker:
+    def test_sends_on_its_own_thread(self):
+        threads = []
+        worker = OutputWorker(
+            "test", lambda frame: threads.append(threading.current_thread())
+        )
+        worker.start()
+        try:
+            worker.submit("frame")
+            wait_for(lambda: worker.sent == 1)
+        finally:
+            worker.stop()
+        assert threads[0] is not threading.current_thread()
+        assert not worker.running
+
+    def test_latest_frame_wins(self):
+        release = threading.Event()
+        started = threading.Event()
+        sent = []
+
+        def send(frame):
+            started.set()
+            release.wait(2)
+            sent.append(frame)
+
+        worker = OutputWorker("slow", send)
+        worker.start()
+        try:
+            worker.submit(0)
+            started.wait(2)
+            # the device is busy with frame 0, only the last of these is kept
+            for frame in range(1, 6):
+                worker.submit(frame)
+            release.set()
+            wait_for(lambda: worker.sent == 2)
+        finally:
+            worker.stop()
+
+        assert sent == [0, 5]
+        stats = worker.get_stats()
+        assert stats["submitted"] == 6
+        assert stats["dropped"] == 4
+        assert stats["max_send_ms"] > 0
+
+    def test_errors_are_counted(self):
+        def send(frame):
+            raise OSError("unreachable")
+
+        worker = OutputWorker("broken", send)
+        worker.start()
+        try:
+            worker.submit(1)
+            wait_for(lambda: worker.errors == 1)
+        finally:
+            worker.stop()
+        assert worker.sent == 0
+        assert worker.get_stats()["avg_send_ms"] == 0
+
+    def test_stop_sends_waiting_frame(self):
+        started = threading.Event()
+        sent = []
+
+        def send(frame):
+            started.set()
+            time.sleep(0.03)
+            sent.append(frame)
+
+        worker = OutputWorker("stopped", send)
+        worker.start()
+        worker.submit("lit")
+        started.wait(2)
+        # cleared while the lit frame is still being sent
+        worker.submit("black")
+        worker.stop()
+        assert sent == ["lit", "black"]
+        assert not worker.running
+
+        worker.submit("late")
+        time.sleep(0.01)
+        assert "late" not in sent
+
+    def test_current(self):
+        workers = []
+        worker = OutputWorker(
+            "current", lambda frame: workers.append(OutputWorker.current())
+        )
+        worker.start()
+        worker.submit("frame")
+        worker.stop()
+        assert workers == [worker]
+        assert OutputWorker.current() is None
+
+
+class TestDeviceOutputWorker:
+    def test_waiting_frame_goes_out_before_the_transport_closes(self):
+        device = make_nanoleaf()
+        sockets = []
+        device.flush = lambda data: sockets.append(device._sock)
+        device._update_output_worker()
+        device._output_worker.submit(np.zeros((1, 3)))
+        device.deactivate()
+        assert sockets == [udp_sender]
+        assert device._output_worker is None
+
+    def test_flush_on_the_worker_does_not_activate(self):
+        device = DDPDevice.__new__(DDPDevice)
+        device._config = {"name": "ddp", "async_output": True}
+        device._sock = None
+        device._destination = "127.0.0.1"
+        device.frame_count = 0
+        device.destination_port = 4048
+        device.destination_id = 1
+        activated = []
+        device.activate = lambda: activated.append(True)
+        device._update_output_worker()
+        worker = device._output_worker
+        worker.submit(np.zeros((1, 3)))
+        device._stop_output_worker()
+        assert activated == []
+        assert worker.errors == 1
+
+        # flushed on the rendering thread, the device is activated again
+        device.flush(np.zeros((1, 3)))
+        assert activated == [True]
@@ -0,0 +1,91 @@
+"""Tests for the adaptive WLED realtime packet encoder"""
+
+import numpy as np
+
+from ledfx.devices import packets
+from ledfx.devices.packets import RealtimeEncoder
+
+
+def encode(encoder, data, now, timeout=2):
+    return [bytes(packet) for packet in encoder.encode(data, timeout, now)]
+
+
+def random_frame(pixel_count):
+    return np.random.randint(0, 256, (pixel_count, 3)).astype(float)
+
+
+class TestRealtimeEncoder:
+    def test_first_frame_is_drgb(self):
+        encoder = RealtimeEncoder()
+        data = random_frame(100)
+        assert encode(encoder, data, 0.0) == [
+            bytes(packets.build_drgb_packet(data, 2))
+        ]
+        assert encoder.full_frame
+
+    def test_long_strip_full_frame_is_dnrgb_chunks(self):
+        encoder = RealtimeEncoder()
+        data = random_frame(1000)
+        expected = [
+            bytes(
+                packets.build_dnrgb_packet(data[start : start + 489], 2, start)
+            )
+            for start in (0, 489, 978)
+        ]
+        assert encode(encoder, data, 0.0) == expected
+
+    def test_few_changes_on_a_short_strip_use_warls(self):
+        encoder = RealtimeEncoder()
+        data = random_frame(200)
+        encode(encoder, data, 0.0)
+        previous = data.copy()
+        data[[3, 150]] = 7
+
+        result = encode(encoder, data, 0.1)
+
+        assert result == [bytes(packets.build_warls_packet(data, 2, previous))]
+        assert encoder.get_stats()["formats"]["WARLS"] == 1
+
+    def test_changed_span_on_a_long_strip_uses_dnrgb(self):
+        encoder = RealtimeEncoder()
+        data = random_frame(2000)
+        encode(encoder, data, 0.0)
+        data[1000:1100] = 1
+
+        result = encode(encoder, data, 0.1)
+
+        assert result == [
+            bytes(packets.build_dnrgb_packet(data[1000:1100], 2, 1000))
+        ]
+        assert encoder.last_bytes == 4 + 300
+
+    def test_unchanged_frame_sends_a_keepalive_pixel(self):
+        encoder = RealtimeEncoder()
+        data = random_frame(1000)
+        encode(encoder, data, 0.0)
+        result = encode(encoder, data, 0.1)
+        assert result == [bytes(packets.build_dnrgb_packet(data[:1], 2, 0))]
+        assert encoder.changed == 0
+
+    def test_many_changes_send_the_full_frame(self):
+        encoder = RealtimeEncoder()
+        encode(encoder, random_frame(200), 0.0)
+        data = random_frame(200)
+        assert encode(encoder, data, 0.1) == [
+            bytes(packets.build_drgb_packet(data, 2))
+        ]
+        assert not encoder.full_frame
+
+    def test_full_frame_is_resent_periodically(self):
+        encoder = RealtimeEncoder()
+        data = random_frame(200)
+        encode(encoder, data, 0.0)
+        encode(encoder, data, 0.5)
+        assert not encoder.full_frame
+        encode(encoder, data, 1.5)
+        assert encoder.full_frame
+
+        stats = encoder.get_stats()
+        assert stats["frames"] == 3
+        assert stats["formats"]["DRGB"] == 2
+        assert stats["bytes_total"] == 2 * (2 + 600) + 2
@@ -0,0 +1,128 @@
+"""Tests for OutputMode conversion into wire order buffers"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from ledfx.devices.artnet import ArtNetDevice
+from ledfx.devices.utils.rgbw_conversion import (
+    RGB_MAPPING,
+    WHITE_FUNCS_MAPPING,
+    OutputMode,
+)
+
+
+class TestApplyInto:
+    @pytest.mark.parametrize("white_mode", list(WHITE_FUNCS_MAPPING))
+    @pytest.mark.parametrize("rgb_order", RGB_MAPPING)
+    def test_matches_apply(self, rgb_order, white_mode):
+        output_mode = OutputMode(rgb_order, white_mode)
+        rgb = np.random.rand(50, 3) * 255
+        out = np.empty((50, output_mode.channels_per_pixel), dtype=np.uint8)
+
+        result = output_mode.apply_into(rgb, out)
+
+        assert result is out
+        np.testing.assert_array_equal(
+            out, output_mode.apply(rgb).astype(np.uint8)
+        )
+
+    def test_writes_into_strided_views(self):
+        output_mode = OutputMode("GRB", "Accurate")
+        rgb = np.random.rand(2, 4, 3) * 255
+        packet = np.full((2, 20), 7, dtype=np.uint8)
+        view = packet[:, 2:18].reshape(2, 4, 4)
+
+        output_mode.apply_into(rgb, view)
+
+        np.testing.assert_array_equal(packet[:, :2], 7)
+        np.testing.assert_array_equal(packet[:, 18:], 7)
+        np.testing.assert_array_equal(
+            view.reshape(8, 4),
+            output_mode.apply(rgb.reshape(8, 3)).astype(np.uint8),
+        )
+
+    def test_plan_follows_the_pixel_shape(self):
+        output_mode = OutputMode("RGB", "Brighter")
+        output_mode.apply_into(
+            np.zeros((4, 3)), np.empty((4, 4), dtype=np.uint8)
+        )
+        plan = output_mode._plan
+        output_mode.apply_into(
+            np.zeros((4, 3)), np.empty((4, 4), dtype=np.uint8)
+        )
+        assert output_mode._plan is plan
+        out = np.empty((6, 4), dtype=np.uint8)
+        output_mode.apply_into(np.full((6, 3), 9.0), out)
+        np.testing.assert_array_equal(out, 9)
+
+
+class FakeArtnet:
+    def __init__(self):
+        self.packets = []
+        self.universe = None
+
+    def set_universe(self, universe):
+        self.universe = universe
+
+    def set(self, packet):
+        self.packet = packet
+
+    def show(self):
+        self.packets.append((self.universe, bytes(self.packet)))
+
+
+class TestArtNetLayout:
+    def make_device(self, **config):
+        device = ArtNetDevice.__new__(ArtNetDevice)
+        device._config = {
+            "pixel_count": 6,
+            "universe": 1,
+            "packet_size": 16,
+            "rgb_order": "RGB",
+            "white_mode": "Zero",
+            **config,
+        }
+        device.lock = threading.Lock()
+        device.config_use(device._config)
+        device._artnet = FakeArtnet()
+        device.init = True
+        return device
+
+    def test_packets(self):
+        device = self.make_device(
+            pre_amble="1",
+            post_amble="2,3",
+            pixels_per_device=3,
+            dmx_start_address=2,
+        )
+        data = np.arange(18, dtype=np.float64).reshape(6, 3) + 100
+        device.flush(data)
+
+        pixels = np.concatenate((data, np.zeros((6, 1))), axis=1).astype(
+            np.uint8
+        )
+        expected = np.concatenate(
+            (
+                [0],
+                [1],
+                pixels[:3].ravel(),
+                [2, 3],
+                [1],
+                pixels[3:].ravel(),
+                [2, 3],
+            )
+        ).astype(np.uint8)
+        wire = b"".join(packet for _, packet in device._artnet.packets)
+
+        assert [u for u, _ in device._artnet.packets] == [1, 2]
+        assert wire[: len(expected)] == expected.tobytes()
+        assert wire[len(expected) :] == bytes(32 - len(expected))
+
+        # a second flush reuses the same buffers
+        dmx_data = device.dmx_data
+        device.flush(data * 0)
+        assert device.dmx_data is dmx_data
+        assert device.dmx_data[1] == 1
+        assert not device.dmx_data[2:14].any()
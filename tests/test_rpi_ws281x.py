@@ -0,0 +1,79 @@
+"""Tests for the rpi_ws281x output with the strip stubbed out"""
+
+import threading
+import time
+
+import numpy as np
+
+from ledfx.devices.packets import WS281XEncoder
+from ledfx.devices.rpi_ws281x import RPI_WS281X
+from ledfx.devices.utils.output_worker import OutputWorker
+from ledfx.devices.utils.rgbw_conversion import OutputMode
+
+
+class StubStrip:
+    """Records what PixelStrip would send to the LEDs"""
+
+    def __init__(self, pixel_count, show_seconds=0):
+        self.pixels = [0] * pixel_count
+        self.shown = list(self.pixels)
+        self.show_seconds = show_seconds
+        self.showing = threading.Event()
+        self.set_calls = 0
+        self.shows = 0
+
+    def setPixelColor(self, n, color):
+        self.pixels[n] = color
+        self.set_calls += 1
+
+    def show(self):
+        self.showing.set()
+        time.sleep(self.show_seconds)
+        self.shown = list(self.pixels)
+        self.shows += 1
+
+
+def make_device(pixel_count, color_order="RGB", white_mode="None"):
+    device = RPI_WS281X.__new__(RPI_WS281X)
+    device.white_mode = white_mode
+    device.output_mode = OutputMode(color_order, white_mode)
+    device.strip = StubStrip(pixel_count)
+    device._encoder = WS281XEncoder(pixel_count, white_mode != "None")
+    device._shown = np.zeros(pixel_count, dtype=np.uint32)
+    return device
+
+
+class TestRPIWS281X:
+    def test_flush_sets_the_colour_words(self):
+        device = make_device(3, "GRB", "Brighter")
+        device.flush(np.array([[255, 0, 0], [10, 20, 30], [0, 0, 0]]))
+        # W, G, R, B after the GRB reorder
+        assert device.strip.pixels == [0x00FF00, 0x0A140A1E, 0]
+        assert device.strip.shows == 1
+
+    def test_only_changed_pixels_are_set(self):
+        device = make_device(100)
+        frame = np.zeros((100, 3))
+        device.flush(frame)
+        assert device.strip.set_calls == 0
+
+        frame[[3, 50]] = 255
+        device.flush(frame)
+        device.flush(frame)
+        assert device.strip.set_calls == 2
+        assert device.strip.pixels[3] == device.strip.pixels[50] == 0xFFFFFF
+        assert device.strip.shows == 3
+
+    def test_clear_reaches_the_strip_from_the_worker(self):
+        device = make_device(300)
+        device.strip = StubStrip(300, show_seconds=0.03)
+        assert RPI_WS281X.ASYNC_OUTPUT
+        device._output_worker = OutputWorker("strip", device.flush)
+        device._output_worker.start()
+
+        device._output_worker.submit(np.full((300, 3), 255.0))
+        device.strip.showing.wait(2)
+        # cleared and deactivated while the lit frame is still showing
+        device._output_worker.submit(np.zeros((300, 3)))
+        device._stop_output_worker()
+        assert device.strip.shown == [0] * 300
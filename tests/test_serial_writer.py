@@ -0,0 +1,142 @@
+"""Tests for the serial device writer thread"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from ledfx.devices.packets import AdalightEncoder
+from ledfx.devices.utils.serial_writer import SerialWriter
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.001)
+
+
+def frame(value, pixel_count=10):
+    return np.full((pixel_count, 3), float(value))
+
+
+class TestSerialWriter:
+    def test_latest_frame_wins(self):
+        release = threading.Event()
+        started = threading.Event()
+        written = []
+
+        def write(packet):
+            started.set()
+            release.wait(2)
+            written.append(bytes(packet))
+
+        encoder = AdalightEncoder(10)
+        writer = SerialWriter("slow", write, encoder)
+        writer.start()
+        try:
+            writer.submit(frame(0))
+            started.wait(2)
+            # the port is busy with frame 0, only the last of these is kept
+            for value in range(1, 6):
+                writer.submit(frame(value))
+            release.set()
+            wait_for(lambda: writer.sent == 2)
+        finally:
+            writer.stop()
+
+        assert written == [encoder.encode(frame(0)), encoder.encode(frame(5))]
+        stats = writer.get_stats()
+        assert stats["submitted"] == 6
+        assert stats["dropped"] == 4
+        assert stats["bytes_sent"] == 2 * encoder.packet_size
+        assert stats["max_write_ms"] > 0
+
+    def test_stop_writes_waiting_packet(self):
+        started = threading.Event()
+        written = []
+
+        def write(packet):
+            started.set()
+            time.sleep(0.03)
+            written.append(bytes(packet))
+
+        encoder = AdalightEncoder(10)
+        writer = SerialWriter("stopped", write, encoder)
+        writer.start()
+        writer.submit(frame(255))
+        started.wait(2)
+        # cleared while the lit frame is still being written
+        writer.submit(frame(0))
+        writer.stop()
+        assert written == [
+            encoder.encode(frame(255)),
+            encoder.encode(frame(0)),
+        ]
+        assert not writer.running
+
+    def test_packet_being_written_is_not_overwritten(self):
+        release = threading.Event()
+        started = threading.Event()
+        written = []
+
+        def write(packet):
+            started.set()
+            before = bytes(packet)
+            release.wait(2)
+            # frames submitted during the write went to the other packet
+            written.append(bytes(packet) == before)
+
+        writer = SerialWriter("busy", write, AdalightEncoder(10))
+        writer.start()
+        try:
+            writer.submit(frame(1))
+            started.wait(2)
+            for value in range(2, 10):
+                writer.submit(frame(value))
+            release.set()
+            wait_for(lambda: writer.sent == 2)
+        finally:
+            writer.stop()
+        assert written == [True, True]
+
+    def test_throughput(self):
+        writer = SerialWriter("fast", lambda packet: None, AdalightEncoder(10))
+        writer.RATE_INTERVAL = 0.05
+        writer.start()
+        try:
+            while writer.fps == 0:
+                writer.submit(frame(1))
+                time.sleep(0.001)
+            stats = writer.get_stats()
+        finally:
+            writer.stop()
+        assert stats["fps"] > 0
+        assert stats["bytes_per_second"] == pytest.approx(stats["fps"] * 36)
+
+        # the rates fall once the writes stop
+        time.sleep(writer.RATE_INTERVAL * 20)
+        idle = writer.get_stats()
+        assert idle["fps"] < stats["fps"] / 5
+        assert idle["bytes_per_second"] == pytest.approx(idle["fps"] * 36)
+
+    def test_errors_go_to_the_handler(self):
+        errors = []
+
+        def write(packet):
+            raise OSError("unplugged")
+
+        writer = SerialWriter(
+            "broken", write, AdalightEncoder(10), on_error=errors.append
+        )
+        writer.start()
+        try:
+            writer.submit(frame(1))
+            wait_for(lambda: errors)
+        finally:
+            writer.stop()
+        assert writer.errors == 1
+        assert writer.sent == 0
+        assert isinstance(errors[0], OSError)
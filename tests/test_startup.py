@@ -0,0 +1,230 @@
+"""Tests for concurrent device startup, the device cache and the timeline"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import ledfx.devices
+from ledfx.devices import Devices
+from ledfx.devices.utils.metadata_cache import DeviceMetadataCache
+from ledfx.devices.wled import WLEDDevice
+from ledfx.libraries.startup_timeline import StartupTimeline
+from ledfx.utils import WLED
+from ledfx.virtuals import Virtuals
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 10.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestStartupTimeline:
+    def test_phases_are_relative_to_the_start(self):
+        clock = FakeClock()
+        timeline = StartupTimeline(clock)
+        clock.now += 0.5
+        with timeline.phase("devices", count=3):
+            clock.now += 1.25
+        timeline.mark("first frame")
+        timeline.finish()
+        clock.now += 5
+
+        result = timeline.get_timeline()
+        assert result["complete"]
+        assert result["total_ms"] == 1750
+        assert result["events"] == [
+            {
+                "name": "devices",
+                "start_ms": 500,
+                "duration_ms": 1250,
+                "count": 3,
+            },
+            {"name": "first frame", "start_ms": 1750, "duration_ms": 0},
+        ]
+
+
+class TestDeviceMetadataCache:
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "device_cache.json"
+        cache = DeviceMetadataCache(str(path))
+        cache.update("wled", "wled.local", destination="10.0.0.5")
+        cache.update("gone", "10.0.0.9", destination="10.0.0.9")
+        cache.save(["wled"])
+
+        loaded = DeviceMetadataCache(str(path))
+        assert loaded.get("wled", "wled.local") == {
+            "ip_address": "wled.local",
+            "destination": "10.0.0.5",
+        }
+        assert loaded.get("gone", "10.0.0.9") == {}
+
+    def test_entry_is_dropped_when_the_address_changes(self):
+        cache = DeviceMetadataCache()
+        cache.update("wled", "10.0.0.5", destination="10.0.0.5")
+        assert cache.get("wled", "10.0.0.6") == {}
+        cache.update("wled", "10.0.0.6", destination="10.0.0.6")
+        assert cache.get("wled", "10.0.0.6")["destination"] == "10.0.0.6"
+
+    def test_cache_file_is_json(self, tmp_path):
+        path = tmp_path / "device_cache.json"
+        cache = DeviceMetadataCache(str(path))
+        cache.update("wled", "10.0.0.5", wled={"pixel_count": 60})
+        cache.save()
+        entry = json.loads(path.read_text())["wled"]
+        assert entry["wled"] == {"pixel_count": 60}
+
+    def test_unchanged_cache_is_not_rewritten(self, tmp_path):
+        path = tmp_path / "device_cache.json"
+        cache = DeviceMetadataCache(str(path))
+        cache.save()
+        assert not path.exists()
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        path = tmp_path / "device_cache.json"
+        path.write_text("{not json")
+        assert DeviceMetadataCache(str(path)).get("wled", "x") == {}
+
+
+class SlowDevice:
+    type = "slow"
+    active = 0
+    peak = 0
+
+    def __init__(self, id, delay, fail=False):
+        self.id = id
+        self.delay = delay
+        self.fail = fail
+
+    async def async_initialize(self):
+        SlowDevice.active += 1
+        SlowDevice.peak = max(SlowDevice.peak, SlowDevice.active)
+        await asyncio.sleep(self.delay)
+        SlowDevice.active -= 1
+        if self.fail:
+            raise ValueError(f"{self.id} offline")
+
+
+class LocalDevice:
+    type = "local"
+
+    def __init__(self, id):
+        self.id = id
+
+
+def make_devices(*devices):
+    registry = Devices.__new__(Devices)
+    registry._objects = {device.id: device for device in devices}
+    registry.metadata_cache = DeviceMetadataCache()
+    return registry
+
+
+class TestInitializeDevices:
+    def test_fan_out_is_bounded_and_devices_report_when_ready(self):
+        SlowDevice.peak = 0
+        registry = make_devices(
+            *(SlowDevice(f"slow-{i}", 0.02) for i in range(6)),
+            SlowDevice("offline", 0.01, fail=True),
+            LocalDevice("local"),
+        )
+        ready = []
+        timeline = StartupTimeline()
+
+        asyncio.run(
+            registry.async_initialize_devices(
+                on_ready=lambda device: ready.append(device.id),
+                timeline=timeline,
+                max_concurrent=3,
+            )
+        )
+
+        assert SlowDevice.peak == 3
+        assert sorted(ready) == sorted(registry._objects)
+        # devices without anything to initialise are ready first
+        assert ready[0] == "local"
+        # a failed device is still reported so its virtuals are created
+        assert "offline" in ready
+        names = {event["name"] for event in timeline.events}
+        assert names == {f"device {id}" for id in registry._objects}
+
+
+def make_wled(ledfx):
+    device = WLEDDevice.__new__(WLEDDevice)
+    device._id = "wled"
+    device._ledfx = ledfx
+    device._config = {"name": "wled", "ip_address": "wled.local"}
+    device.subdevice = None
+    device.wled = None
+    # the sync mode devices are not under test
+    device.setup_subdevice = lambda: None
+    return device
+
+
+class TestWLEDWarmStart:
+    def test_cached_config_is_checked_at_the_resolved_address(
+        self, monkeypatch
+    ):
+        async def resolve_destination(loop, executor, address):
+            await asyncio.sleep(0.01)
+            return "10.0.0.6"
+
+        requested = []
+
+        async def get_config(wled):
+            requested.append(wled.ip_address)
+            raise ValueError("offline")
+
+        monkeypatch.setattr(
+            ledfx.devices, "resolve_destination", resolve_destination
+        )
+        monkeypatch.setattr(WLED, "get_config", get_config)
+
+        async def scenario():
+            cache = DeviceMetadataCache()
+            cache.update(
+                "wled",
+                "wled.local",
+                destination="10.0.0.5",
+                wled={"name": "wled", "pixel_count": 60, "rgbw_led": False},
+            )
+            core = SimpleNamespace(
+                loop=asyncio.get_running_loop(),
+                thread_executor=None,
+                devices=SimpleNamespace(metadata_cache=cache),
+            )
+            device = make_wled(core)
+            await device.async_initialize()
+            # started on the cached address and config
+            assert device.wled.ip_address == "10.0.0.5"
+            assert device._config["pixel_count"] == 60
+            for _ in range(100):
+                if requested:
+                    break
+                await asyncio.sleep(0.01)
+            return device
+
+        device = asyncio.run(scenario())
+        assert device._destination == "10.0.0.6"
+        assert device.wled.ip_address == "10.0.0.6"
+        # the refresh waited for the lookup
+        assert requested == ["10.0.0.6"]
+
+
+class TestVirtualDeviceIds:
+    def test_device_ids_of(self):
+        assert Virtuals.device_ids_of(
+            {
+                "is_device": False,
+                "segments": [["a", 0, 9, False], ["b", 0, 9, False]],
+            }
+        ) == {"a", "b"}
+        assert Virtuals.device_ids_of({"is_device": "a"}) == {"a"}
+
+    def test_reorder(self):
+        virtuals = SimpleNamespace(
+            _virtuals={"c": 3, "a": 1, "new": 4, "b": 2}
+        )
+        Virtuals.reorder(virtuals, ["a", "b", "c"])
+        assert list(virtuals._virtuals) == ["a", "b", "c", "new"]
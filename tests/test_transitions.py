@@ -0,0 +1,142 @@
+"""
+Tests for the virtual effect transitions
+"""
+
+import numpy as np
+import pytest
+
+from ledfx.transitions import MASK_TRANSITIONS, Transitions
+
+
+def frames(pixel_count):
+    rng = np.random.default_rng(pixel_count)
+    return rng.random((pixel_count, 3)) * 255, rng.random((pixel_count, 3))
+
+
+def transition(transitions, mode, x1, x2, weight):
+    transitions[mode](transitions, x1, x2, weight)
+
+
+class TestTransitionModes:
+    def test_every_mode_is_named(self):
+        modes = list(Transitions)
+
+        for mode in MASK_TRANSITIONS:
+            assert mode in modes
+        assert modes[-1] == "None"
+
+    @pytest.mark.parametrize("mode", [m for m in Transitions if m != "None"])
+    @pytest.mark.parametrize("rows", [1, 4])
+    def test_weight_one_is_the_new_effect(self, mode, rows):
+        transitions = Transitions(64, rows=rows)
+        x1, x2 = frames(64)
+        expected = x1.copy()
+
+        transition(transitions, mode, x1, x2, 1)
+
+        np.testing.assert_allclose(x1, expected)
+
+
+class TestStripTransitions:
+    def test_add(self):
+        x1, x2 = frames(30)
+        expected = x1 * 0.3 + x2 * 0.7
+
+        transition(Transitions(30), "Add", x1, x2, 0.3)
+
+        np.testing.assert_allclose(x1, expected)
+
+    @pytest.mark.parametrize("weight", [0.0, 0.25, 0.5, 0.9])
+    def test_push_matches_roll(self, weight):
+        x1, x2 = frames(30)
+        expected = x1.copy()
+        idx = int((1 - weight) * 30)
+        expected[:idx] = np.roll(x2, idx, axis=0)[:idx]
+
+        transition(Transitions(30), "Push", x1, x2, weight)
+
+        np.testing.assert_array_equal(x1, expected)
+
+    def test_slide_reveals_from_the_end(self):
+        x1, x2 = frames(10)
+        new = x1.copy()
+
+        transition(Transitions(10), "Slide", x1, x2, 0.45)
+
+        np.testing.assert_array_equal(x1[:5], x2[:5])
+        np.testing.assert_array_equal(x1[6:], new[6:])
+
+    def test_iris_opens_from_the_centre(self):
+        x1, x2 = frames(21)
+        new = x1.copy()
+
+        transition(Transitions(21), "Iris", x1, x2, 0.2)
+
+        np.testing.assert_array_equal(x1[8:13], new[8:13])
+        np.testing.assert_array_equal(x1[:6], x2[:6])
+        np.testing.assert_array_equal(x1[-6:], x2[-6:])
+
+    def test_dissolve_map_is_kept(self):
+        transitions = Transitions(100)
+
+        threshold = transitions.threshold("Dissolve")
+
+        assert transitions.threshold("Dissolve") is threshold
+        x1, x2 = frames(100)
+        old = threshold > 0.5
+        transition(transitions, "Dissolve", x1, x2, 0.5)
+        np.testing.assert_array_equal(x1[old], x2[old])
+
+
+class TestMatrixTransitions:
+    def test_push_moves_along_rows(self):
+        rows, cols = 4, 10
+        x1, x2 = frames(rows * cols)
+        expected = x1.reshape(rows, cols, 3).copy()
+        idx = int(0.6 * cols)
+        expected[:, :idx] = x2.reshape(rows, cols, 3)[:, cols - idx :]
+
+        transition(Transitions(rows * cols, rows=rows), "Push", x1, x2, 0.4)
+
+        np.testing.assert_array_equal(x1, expected.reshape(-1, 3))
+
+    def test_iris_is_radial(self):
+        rows, cols = 9, 9
+        threshold = Transitions(rows * cols, rows=rows).threshold("Iris")
+
+        grid = threshold.reshape(rows, cols)
+        assert grid[4, 4] == 0
+        np.testing.assert_allclose(grid, grid.T)
+        np.testing.assert_allclose(grid[[0, 0, -1, -1], [0, -1, 0, -1]], 1)
+
+    def test_wipe_down(self):
+        rows, cols = 5, 6
+        x1, x2 = frames(rows * cols)
+        new = x1.copy()
+
+        transition(
+            Transitions(rows * cols, rows=rows), "Wipe Down", x1, x2, 0.5
+        )
+
+        np.testing.assert_array_equal(x1[: 3 * cols], new[: 3 * cols])
+        np.testing.assert_array_equal(x1[3 * cols :], x2[3 * cols :])
+
+    def test_set_rows_rebuilds_maps(self):
+        transitions = Transitions(36)
+        strip = transitions.threshold("Wipe Down")
+
+        transitions.set_rows(6)
+
+        matrix = transitions.threshold("Wipe Down")
+        assert not np.array_equal(strip, matrix)
+        assert len(np.unique(matrix)) == 6
+
+    def test_pre_validate_follows_pixel_count(self):
+        transitions = Transitions(0)
+        x1, x2 = frames(12)
+
+        assert transitions.pre_validate(x1, x2)
+        transition(transitions, "Iris", x1, x2, 0.5)
+
+        assert transitions.pixel_count == 12
+        assert not transitions.pre_validate(x1, x2[:6])
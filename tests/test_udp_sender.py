@@ -0,0 +1,271 @@
+"""Tests for the shared UDP output socket"""
+
+import asyncio
+import socket
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+
+from ledfx.devices.ddp import DDPDevice
+from ledfx.devices.nanoleaf import NanoleafDevice
+from ledfx.devices.open_pixel_control import OpenPixelControl
+from ledfx.devices.utils.simulator import SimulatorFarm
+from ledfx.devices.utils.socket_singleton import UDPSender, udp_sender
+
+LOCAL = {"address": "127.0.0.1", "port": 0}
+# nothing can be sent to port 0
+UNREACHABLE = ("127.0.0.1", 0)
+# the platform sends a batch in one sendmmsg call
+SENDMMSG = UDPSender()._sendmmsg is not None
+
+
+class _Events:
+    def __init__(self):
+        self.fired = []
+
+    def fire_event(self, event):
+        self.fired.append(event)
+
+
+def make_opc():
+    device = OpenPixelControl.__new__(OpenPixelControl)
+    device._id = "opc"
+    device._device_type = "OpenPixelControl"
+    device._config = {"name": "opc", "ip_address": "127.0.0.1"}
+    device._destination = "127.0.0.1"
+    device._online = True
+    device._ledfx = SimpleNamespace(events=_Events())
+    return device
+
+
+def make_nanoleaf():
+    device = NanoleafDevice.__new__(NanoleafDevice)
+    device._id = "nanoleaf"
+    device._device_type = "Nanoleaf"
+    device._config = {
+        "name": "nanoleaf",
+        "ip_address": "127.0.0.2",
+        "udp_port": 60222,
+        "sync_mode": "UDP",
+    }
+    device._online = True
+    device._ledfx = SimpleNamespace(events=_Events())
+    return device
+
+
+def run_with_farm(scenario):
+    async def run():
+        farm = SimulatorFarm()
+        try:
+            return await scenario(farm)
+        finally:
+            await farm.close()
+
+    return asyncio.run(run())
+
+
+class TestUDPSender:
+    def test_batch_sends_when_it_closes(self):
+        async def scenario(farm):
+            receivers = [
+                await farm.add_ddp(f"ddp {i}", 600, **LOCAL) for i in range(3)
+            ]
+            sender = UDPSender()
+            frame = np.random.randint(0, 256, (600, 3)).astype(float)
+            with sender.batch():
+                with sender.batch():
+                    # nested batches send with the outer one
+                    for receiver in receivers:
+                        DDPDevice.send_out(
+                            sender,
+                            receiver.address,
+                            receiver.port,
+                            frame,
+                            1,
+                            1,
+                        )
+                await asyncio.sleep(0.05)
+                assert all(r.packets == 0 for r in receivers)
+            await asyncio.sleep(0.05)
+            sender.close()
+            return receivers, frame, sender.get_stats()
+
+        receivers, frame, stats = run_with_farm(scenario)
+        for receiver in receivers:
+            assert receiver.frames == 1
+            np.testing.assert_array_equal(receiver.pixels, frame)
+        assert stats["batches"] == 1
+        assert stats["max_batch"] == stats["packets"] == 6
+        assert stats["errors"] == 0
+        assert len(stats["destinations"]) == 3
+        # one sendmmsg call for the batch where the platform has it
+        assert stats["send_calls"] == (1 if SENDMMSG else 6)
+
+    def test_queued_datagrams_are_copied(self):
+        sender = UDPSender()
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.bind(("127.0.0.1", 0))
+        buffer = bytearray(b"first")
+        with sender.batch():
+            sender.sendto(memoryview(buffer), receiver.getsockname())
+            buffer[:] = b"reuse"
+        assert receiver.recv(16) == b"first"
+        sender.close()
+        receiver.close()
+
+    def test_errors_are_tracked_per_destination(self):
+        sender = UDPSender()
+        changes = []
+        sender.add_listener(lambda address, error: changes.append(error))
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.bind(("127.0.0.1", 0))
+        reachable = receiver.getsockname()
+
+        sender.sendto(b"data", reachable)
+        sender.sendto(b"data", UNREACHABLE)
+        sender.sendto(b"data", UNREACHABLE)
+        assert sender.is_failing(UNREACHABLE)
+        assert not sender.is_failing(reachable)
+        # only the first error of a failing destination is reported
+        assert len(changes) == 1 and isinstance(changes[0], OSError)
+
+        stats = sender.get_stats()
+        assert stats["errors"] == 2
+        assert stats["failing"] == ["127.0.0.1:0"]
+        assert stats["destinations"]["127.0.0.1:0"]["errors"] == 2
+
+        sender.forget(UNREACHABLE)
+        assert not sender.is_failing(UNREACHABLE)
+        assert sender.send([(b"data", UNREACHABLE)]) is not None
+        sender.close()
+        receiver.close()
+
+    def test_batch_carries_on_after_a_failed_datagram(self):
+        for batched in (True, False):
+            sender = UDPSender()
+            if not batched:
+                sender._sendmmsg = None
+            receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            receiver.bind(("127.0.0.1", 0))
+            receiver.settimeout(1)
+            reachable = receiver.getsockname()
+            error = sender.send(
+                [
+                    (b"one", reachable),
+                    (bytearray(b"two"), reachable),
+                    (b"lost", UNREACHABLE),
+                    (memoryview(b"three"), reachable),
+                    (b"four", reachable),
+                ]
+            )
+            assert isinstance(error, OSError)
+            assert [receiver.recv(16) for _ in range(4)] == [
+                b"one",
+                b"two",
+                b"three",
+                b"four",
+            ]
+            assert sender.is_failing(UNREACHABLE)
+            stats = sender.get_stats()
+            assert stats["packets"] == 4 and stats["errors"] == 1
+            # sendmmsg stops at the failed datagram and goes on after it
+            assert stats["send_calls"] == (3 if batched and SENDMMSG else 5)
+            sender.close()
+            receiver.close()
+
+    def test_message_batches_follow_the_data(self):
+        sender = UDPSender()
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(1)
+        address = receiver.getsockname()
+        for frame in (b"ab", b"cd", b"longer"):
+            sender.send([(frame, address), (frame[::-1], address)])
+            assert receiver.recv(16) == frame
+            assert receiver.recv(16) == frame[::-1]
+        if SENDMMSG:
+            # kept for the same destinations, rebuilt for the new sizes
+            assert len(sender._message_batches) == 1
+        sender.close()
+        receiver.close()
+
+    def test_hostnames_are_sent_one_by_one(self):
+        sender = UDPSender()
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(1)
+        port = receiver.getsockname()[1]
+        assert sender.send([(b"a", ("localhost", port))] * 2) is None
+        assert receiver.recv(16) == b"a"
+        assert sender.get_stats()["send_calls"] == 2
+        sender.close()
+        receiver.close()
+
+    def test_recovery_is_reported(self):
+        sender = UDPSender()
+        changes = []
+        sender.add_listener(lambda *change: changes.append(change))
+        address = ("127.0.0.1", 9)
+        sender._record(address, 4, OSError("unreachable"))
+        sender._record(address, 4, None)
+        sender._record(address, 4, None)
+        assert [error is None for _, error in changes] == [False, True]
+
+    def test_stats_are_read_while_sending(self):
+        sender = UDPSender()
+        sends = 2000
+
+        def record(port):
+            for _ in range(sends):
+                sender._record(("127.0.0.1", port), 4, None)
+
+        threads = [
+            threading.Thread(target=record, args=(port,))
+            for port in range(1, 5)
+        ]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            # new destinations are added while the stats are copied
+            sender.get_stats()
+        for thread in threads:
+            thread.join()
+        stats = sender.get_stats()
+        assert stats["packets"] == 4 * sends
+        assert len(stats["destinations"]) == 4
+
+    def test_send_buffer(self):
+        sender = UDPSender(send_buffer=256 * 1024)
+        sender.sendto(b"data", UNREACHABLE)
+        size = sender._sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
+        # linux reports double the requested size
+        assert size >= 256 * 1024
+        sender.close()
+
+
+class TestNetworkedDevices:
+    def test_devices_follow_their_udp_address(self):
+        for device in (make_opc(), make_nanoleaf()):
+            address = device.udp_address
+            device._start_udp_sender()
+            try:
+                udp_sender._record(address, 4, OSError("unreachable"))
+                assert not device.online
+                assert device.stats["udp"]["failing"] == "unreachable"
+                udp_sender._record(address, 4, None)
+                assert device.online
+                assert len(device._ledfx.events.fired) == 2
+            finally:
+                device._stop_udp_sender()
+            # stopping drops the listener and the counters
+            udp_sender._record(address, 4, OSError("unreachable"))
+            assert device.online
+            udp_sender.forget(address)
+            assert device._sock is None
+
+    def test_nanoleaf_tcp_mode_sends_no_udp(self):
+        device = make_nanoleaf()
+        device._config["sync_mode"] = "TCP"
+        assert device.udp_address is None
+        assert device.stats["udp"] is None
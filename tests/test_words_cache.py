@@ -0,0 +1,86 @@
+"""
+Tests for the pre-rendered word bitmap cache and numpy canvas text blending
+"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from ledfx.effects.utils.canvas import Canvas
+from ledfx.effects.utils.words import Sentence, word_bitmap
+
+COLORS = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+
+
+def posed_sentence(ang=0.0, size=1.0, alpha=1.0):
+    sentence = Sentence("Hello big world", "Press Start 2P", 12, (64, 32))
+    for idx, word in enumerate(sentence.wordblocks):
+        word.pose.set_vectors(-0.8 + idx * 0.8, 0.1 * idx, 0, 1, 10)
+        word.pose.ang = ang * idx
+        word.pose.size = size
+        word.pose.alpha = alpha
+    return sentence
+
+
+class TestWordBitmapCache:
+    def test_bitmaps_are_shared_and_read_only(self):
+        first = posed_sentence()
+        second = posed_sentence()
+
+        first.render(Canvas(64, 32), Image.BILINEAR, COLORS)
+        info = word_bitmap.cache_info()
+        second.render(Canvas(64, 32), Image.BILINEAR, COLORS)
+
+        assert word_bitmap.cache_info().hits == info.hits + 3
+        assert word_bitmap.cache_info().misses == info.misses
+        word = first.wordblocks[0].word
+        width, height = first.wordblocks[0].image.size
+        mask = word_bitmap(word, 0, width, height, Image.BILINEAR)
+        assert not mask.flags.writeable
+
+    def test_sizes_rounding_to_the_same_bitmap_share_an_entry(self):
+        sentence = posed_sentence(size=0.5)
+        sentence.render(Canvas(64, 32), Image.NEAREST, COLORS)
+        info = word_bitmap.cache_info()
+
+        for word in sentence.wordblocks:
+            word.pose.size = 0.5001
+        sentence.render(Canvas(64, 32), Image.NEAREST, COLORS)
+
+        assert word_bitmap.cache_info().misses == info.misses
+
+
+class TestCanvasTextRendering:
+    @pytest.mark.parametrize("ang", [0.0, 0.13])
+    @pytest.mark.parametrize("size", [1.0, 0.7])
+    @pytest.mark.parametrize("alpha", [1.0, 0.4])
+    def test_matches_pil_paste(self, ang, size, alpha):
+        image = Image.new("RGB", (64, 32), (10, 20, 30))
+        canvas = Canvas(64, 32)
+        canvas.clear((10, 20, 30))
+
+        posed_sentence(ang, size, alpha).render(image, Image.BILINEAR, COLORS)
+        posed_sentence(ang, size, alpha).render(canvas, Image.BILINEAR, COLORS)
+
+        expected = np.asarray(image, dtype=np.float64)
+        assert expected.sum() > (10 + 20 + 30) * 64 * 32
+        # PIL quantises the faded mask and the blend to 8 bits
+        np.testing.assert_allclose(canvas.array, expected, atol=2.0)
+
+    def test_blend_mask_is_clipped(self):
+        canvas = Canvas(4, 4)
+        mask = np.full((3, 3), 255, dtype=np.uint8)
+
+        canvas.blend_mask(mask, -2, 2, (0, 0, 255), alpha=0.5)
+
+        assert canvas.array[2:, :1, 2].tolist() == [[127.5], [127.5]]
+        assert canvas.array[:2].sum() == 0
+        assert canvas.array[:, 1:].sum() == 0
+
+    def test_blend_mask_without_color_is_grey(self):
+        canvas = Canvas(2, 1)
+        canvas.clear((100, 100, 100))
+
+        canvas.blend_mask(np.array([[255, 0]], dtype=np.uint8), 0, 0)
+
+        assert canvas.array.tolist() == [[[255] * 3, [100] * 3]]